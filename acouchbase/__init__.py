@@ -16,13 +16,28 @@
 import asyncio
 import selectors
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def is_uvloop(evloop):
+    """
+    **INTERNAL**
+    """
+    return uvloop is not None and isinstance(evloop, uvloop.Loop)
+
 
 class LoopValidator:
     REQUIRED_METHODS = {'add_reader', 'remove_reader',
                         'add_writer', 'remove_writer'}
 
     @staticmethod
-    def _get_working_loop():
+    def _get_working_loop(use_uvloop=False):
+        if use_uvloop:
+            return LoopValidator._get_uvloop()
+
         evloop = asyncio.get_event_loop()
         gen_new_loop = not LoopValidator._is_valid_loop(evloop)
         if gen_new_loop:
@@ -34,10 +49,24 @@ class LoopValidator:
 
         return evloop
 
+    @staticmethod
+    def _get_uvloop():
+        if uvloop is None:
+            raise RuntimeError('uvloop was requested, but it is not installed.')
+        evloop = asyncio.get_event_loop()
+        if is_uvloop(evloop) and not evloop.is_closed():
+            return evloop
+        new_loop = uvloop.new_event_loop()
+        asyncio.set_event_loop(new_loop)
+        return new_loop
+
     @staticmethod
     def _is_valid_loop(evloop):
         if not evloop:
             return False
+        # uvloop implements the full AbstractEventLoop API, no need to inspect it
+        if is_uvloop(evloop):
+            return True
         for meth in LoopValidator.REQUIRED_METHODS:
             abs_meth, actual_meth = (
                 getattr(asyncio.AbstractEventLoop, meth), getattr(evloop.__class__, meth))
@@ -46,10 +75,10 @@ class LoopValidator:
         return True
 
     @staticmethod
-    def get_event_loop(evloop):
+    def get_event_loop(evloop, use_uvloop=False):
         if LoopValidator._is_valid_loop(evloop):
             return evloop
-        return LoopValidator._get_working_loop()
+        return LoopValidator._get_working_loop(use_uvloop=use_uvloop)
 
     @staticmethod
     def close_loop():
@@ -59,6 +88,7 @@ class LoopValidator:
 
 def get_event_loop(
     evloop=None,  # type: asyncio.AbstractEventLoop
+    use_uvloop=False,  # type: bool
 ):
     """
     Get an event loop compatible with acouchbase.
@@ -66,8 +96,13 @@ def get_event_loop(
     loop for Python 3.8 on Windows) are not compatible with acouchbase as
     they don't implement all members in the abstract base class.
 
+    uvloop (https://github.com/MagicStack/uvloop) is supported.  If uvloop is
+    installed, pass use_uvloop=True to get (or create) a uvloop event loop.
+
     :param evloop: preferred event loop
+    :param use_uvloop: If no compatible evloop is provided, return a uvloop
+    event loop.  Raises RuntimeError if uvloop is not installed.
     :return: The preferred event loop, if compatible, otherwise, a compatible
     alternative event loop.
     """
-    return LoopValidator.get_event_loop(evloop)
+    return LoopValidator.get_event_loop(evloop, use_uvloop=use_uvloop)
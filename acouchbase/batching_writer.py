@@ -0,0 +1,201 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    Optional)
+
+from couchbase.logic.batching_writer import BatchingWriterLogic, PendingWrite
+from couchbase.options import ReplaceOptions, UpsertOptions
+
+if TYPE_CHECKING:
+    from acouchbase.collection import AsyncCollection
+    from couchbase.transcoder import Transcoder
+
+
+class AsyncBatchingWriter(BatchingWriterLogic):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Write-behind batching of upserts and replaces to an :class:`~acouchbase.collection.AsyncCollection`.  Writes are
+    queued and coalesced per key (the last write wins) and are flushed together every ``flush_interval``, or once
+    the batch reaches ``max_batch_size`` keys or ``max_batch_bytes`` encoded bytes.  Each write returns an
+    ``asyncio.Future``, shared by the writes to the same key within a batch, that resolves with the key's
+    :class:`~couchbase.result.MutationResult` (or the exception its write failed with).
+
+    The asyncio API has no multi operations, a batch's writes are issued concurrently on the event loop.  The
+    coalesced write of a key is an upsert if any of its writes was an upsert, a replace otherwise.  Values are
+    encoded when the write is queued.  The pending writes are flushed when the writer is closed (explicitly, when
+    leaving its context or when its cluster is closed).
+
+    Args:
+        collection (:class:`~acouchbase.collection.AsyncCollection`): The collection to write to.
+        max_batch_size (int, optional): The number of pending keys that triggers a flush.  Defaults to 1000.
+        max_batch_bytes (int, optional): The number of pending encoded bytes that triggers a flush.  Defaults to
+            4 MiB.
+        flush_interval (timedelta, optional): How often the pending writes are flushed.  Set to None to only flush
+            once a size threshold is reached (or explicitly).  Defaults to 100 milliseconds.
+        transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): The transcoder used to encode the values.
+            Defaults to the collection's default transcoder.
+        expiry (timedelta, optional): The expiry of the written documents.
+        timeout (timedelta, optional): The timeout of the write operations.  Defaults to global key-value operation
+            timeout.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If an invalid threshold or transcoder is provided.
+
+    Examples:
+
+        Batch the updates of frequently updated documents::
+
+            from acouchbase.batching_writer import BatchingWriter
+
+            # ... other code ...
+
+            collection = bucket.default_collection()
+            async with BatchingWriter(collection, max_batch_size=500) as writer:
+                futures = [writer.upsert(event.key, event.doc) for event in events]
+            for res in await asyncio.gather(*futures):
+                print(f'CAS: {res.cas}')
+
+    """
+
+    def __init__(self,
+                 collection,  # type: AsyncCollection
+                 max_batch_size=1000,  # type: Optional[int]
+                 max_batch_bytes=4 * 1024 * 1024,  # type: Optional[int]
+                 flush_interval=timedelta(milliseconds=100),  # type: Optional[timedelta]
+                 transcoder=None,  # type: Optional[Transcoder]
+                 expiry=None,  # type: Optional[timedelta]
+                 timeout=None,  # type: Optional[timedelta]
+                 ):
+        super().__init__(collection,
+                         max_batch_size=max_batch_size,
+                         max_batch_bytes=max_batch_bytes,
+                         flush_interval=flush_interval,
+                         transcoder=transcoder,
+                         expiry=expiry,
+                         timeout=timeout)
+        self._loop = collection.loop
+        self._flush_handle = None  # type: Optional[asyncio.TimerHandle]
+        self._flush_tasks = set()
+        collection._scope._bucket._cluster._write_buffers.add(self)
+
+    def upsert(self,
+               key,  # type: str
+               value,  # type: Any
+               ) -> asyncio.Future:
+        """Queues an upsert of the document specified by the key.
+
+        Args:
+            key (str): The key of the document.
+            value (Any): The value of the document.
+
+        Returns:
+            ``asyncio.Future``: Resolves with the key's :class:`~couchbase.result.MutationResult` once the write has
+            been flushed.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        return self._write(key, value, True)
+
+    def replace(self,
+                key,  # type: str
+                value,  # type: Any
+                ) -> asyncio.Future:
+        """Queues a replace of the document specified by the key.  The replace fails if the document does not exist
+        (unless it is coalesced with an upsert of the same key).
+
+        Args:
+            key (str): The key of the document.
+            value (Any): The value of the document.
+
+        Returns:
+            ``asyncio.Future``: Resolves with the key's :class:`~couchbase.result.MutationResult` once the write has
+            been flushed.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        return self._write(key, value, False)
+
+    async def flush(self) -> None:
+        """Flushes the pending writes, returning once they (and any flush in progress) have been applied.
+        """
+        self._start_flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Stops the background flushes and flushes the pending writes.  Further writes raise.
+        """
+        self._closed = True
+        await self.flush()
+
+    def _write(self, key, value, is_upsert):
+        had_pending = len(self._pending) > 0
+        fut, full = self._queue_write(key, value, is_upsert, self._loop.create_future)
+        if full:
+            self._start_flush()
+        elif not had_pending and self._flush_interval is not None:
+            self._flush_handle = self._loop.call_later(self._flush_interval.total_seconds(), self._start_flush)
+        return fut
+
+    def _start_flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = self._take_batch()
+        if not batch:
+            return
+        task = self._loop.create_task(self._apply(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _apply(self, batch  # type: Dict[str, PendingWrite]
+                     ) -> None:
+        upserts, replaces = self._split_batch(batch)
+        keys = list(upserts.keys()) + list(replaces.keys())
+        upsert_opts = UpsertOptions(**self._op_opts)
+        replace_opts = ReplaceOptions(**self._op_opts)
+        ops = [self._collection.upsert(k, v, upsert_opts) for k, v in upserts.items()]
+        ops.extend(self._collection.replace(k, v, replace_opts) for k, v in replaces.items())
+        results = await asyncio.gather(*ops, return_exceptions=True)
+        for key, result in zip(keys, results):
+            fut = batch[key].future
+            if fut.done():
+                # cancelled by the application
+                continue
+            if isinstance(result, Exception):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return f'AsyncBatchingWriter(pending={len(self._pending)}, closed={self._closed})'
+
+
+BatchingWriter = AsyncBatchingWriter
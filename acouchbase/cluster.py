@@ -16,18 +16,22 @@
 from __future__ import annotations
 
 import asyncio
+import weakref
 from asyncio import AbstractEventLoop
 from datetime import timedelta
 from time import perf_counter
 from typing import (TYPE_CHECKING,
                     Any,
                     Awaitable,
-                    Dict)
+                    Dict,
+                    Iterable,
+                    Optional,
+                    Union)
 
 from acouchbase import get_event_loop
 from acouchbase.analytics import AnalyticsQuery, AsyncAnalyticsRequest
 from acouchbase.bucket import AsyncBucket
-from acouchbase.logic import AsyncWrapper
+from acouchbase.logic import AsyncWrapper, check_loop
 from acouchbase.management.analytics import AnalyticsIndexManager
 from acouchbase.management.buckets import BucketManager
 from acouchbase.management.eventing import EventingFunctionManager
@@ -38,9 +42,10 @@ from acouchbase.n1ql import AsyncN1QLRequest, N1QLQuery
 from acouchbase.search import AsyncFullTextSearchRequest, SearchQueryBuilder
 from acouchbase.transactions import Transactions
 from couchbase.diagnostics import ClusterState, ServiceType
-from couchbase.exceptions import UnAmbiguousTimeoutException
+from couchbase.exceptions import CouchbaseException, UnAmbiguousTimeoutException
 from couchbase.logic.cluster import ClusterLogic
 from couchbase.options import PingOptions, forward_args
+from couchbase.prepared_statements import prepare_statement_query, prepared_statement_name
 from couchbase.result import (AnalyticsResult,
                               ClusterInfoResult,
                               DiagnosticsResult,
@@ -101,6 +106,8 @@ class AsyncCluster(ClusterLogic):
         super().__init__(connstr, *options, **kwargs)
 
         self._close_ftr = None
+        # batching writers, flushed when the cluster is closed
+        self._write_buffers = weakref.WeakSet()
         self._connect_ftr = self._connect()
 
     @property
@@ -117,6 +124,8 @@ class AsyncCluster(ClusterLogic):
         if not loop.is_running():
             raise RuntimeError("Event loop is not running.")
 
+        # all operations are issued from (and completed on) the loop's thread, catch cross-loop use up front
+        check_loop(loop)
         return loop
 
     @property
@@ -173,6 +182,8 @@ class AsyncCluster(ClusterLogic):
 
         """
         if self.connected and not self._close_ftr:
+            for write_buffer in list(self._write_buffers):
+                await write_buffer.close()
             self._close_ftr = self._close()
             self._connect_ftr = None
 
@@ -428,7 +439,8 @@ class AsyncCluster(ClusterLogic):
         """
 
         request_args = dict(default_serialize=self.default_serializer,
-                            streaming_timeout=self.streaming_timeouts.get('query_timeout', None))
+                            streaming_timeout=self.streaming_timeouts.get('query_timeout', None),
+                            prepared_cache=self.prepared_statement_cache)
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
@@ -438,6 +450,64 @@ class AsyncCluster(ClusterLogic):
                                                                   query.params,
                                                                   **request_args))
 
+    async def prepare_statements(self,
+                                 statements,  # type: Iterable[str]
+                                 query_context=None,  # type: Optional[str]
+                                 timeout=None,  # type: Optional[timedelta]
+                                 max_concurrency=16,  # type: Optional[int]
+                                 ) -> Dict[str, Union[str, CouchbaseException]]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Prepares statements, in parallel, and adds them to the cluster's :attr:`.prepared_statement_cache`.  Typically
+        called at startup, so the first prepared queries (:class:`~couchbase.options.QueryOptions` ``adhoc=False``) of
+        the statements do not pay for their planning.
+
+        Args:
+            statements (Iterable[str]): The statements to prepare, exactly as they will be given to :meth:`.query`.
+            query_context (str, optional): The query context the statements are executed in.  Scope-level queries
+                are executed in the ```bucket`.`scope``` query context.
+            timeout (timedelta, optional): The timeout of each ``PREPARE`` query.  Defaults to global query timeout.
+            max_concurrency (int, optional): The maximum number of statements prepared concurrently.  Defaults to 16.
+
+        Returns:
+            Dict[str, Union[str, :class:`~couchbase.exceptions.CouchbaseException`]]: The name of each statement's
+            prepared statement, or the exception its ``PREPARE`` query failed with.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If a statement is not a non-empty str or
+                max_concurrency is not a positive int.
+
+        Examples:
+            Prepare the application's statements at startup::
+
+                statements = ['SELECT * FROM `travel-sample` WHERE type=$type LIMIT 10;']
+                prepared = await cluster.prepare_statements(statements)
+                for statement, res in prepared.items():
+                    if isinstance(res, Exception):
+                        print(f'Unable to prepare {statement}: {res}')
+
+                q_res = cluster.query(statements[0], QueryOptions(adhoc=False, named_parameters={'type': 'hotel'}))
+
+        """
+        statements, query_opts = self._get_prepare_statements_args(statements,
+                                                                   query_context=query_context,
+                                                                   timeout=timeout,
+                                                                   max_concurrency=max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _prepare(statement):
+            async with semaphore:
+                rows = await self.query(prepare_statement_query(statement), **query_opts).execute()
+            name = prepared_statement_name(rows)
+            self.prepared_statement_cache._add(statement, query_context, name)
+            return name
+
+        results = await asyncio.gather(*[_prepare(statement) for statement in statements], return_exceptions=True)
+        for res in results:
+            if isinstance(res, Exception) and not isinstance(res, CouchbaseException):
+                raise res
+        return dict(zip(statements, results))
+
     def analytics_query(self,  # type: Cluster
                         statement,  # type: str
                         *options,  # type: AnalyticsOptions
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import (TYPE_CHECKING,
                     Any,
                     Awaitable,
@@ -31,6 +32,15 @@ from acouchbase.kv_range_scan import AsyncRangeScanRequest
 from acouchbase.logic import AsyncWrapper
 from acouchbase.management.queries import CollectionQueryIndexManager
 from couchbase.logic.collection import CollectionLogic
+from couchbase.logic.options import (GetAllReplicasOptionsBase,
+                                     GetAndLockOptionsBase,
+                                     GetAndTouchOptionsBase,
+                                     GetAnyReplicaOptionsBase,
+                                     GetOptionsBase,
+                                     LookupInAllReplicasOptionsBase,
+                                     LookupInAnyReplicaOptionsBase,
+                                     LookupInOptionsBase,
+                                     ScanOptionsBase)
 from couchbase.options import forward_args
 from couchbase.result import (CounterResult,
                               ExistsResult,
@@ -41,6 +51,7 @@ from couchbase.result import (CounterResult,
                               MutateInResult,
                               MutationResult,
                               ScanResultIterable)
+from couchbase.timings import timed_operation
 
 if TYPE_CHECKING:
     from datetime import timedelta
@@ -84,6 +95,7 @@ class AsyncCollection(CollectionLogic):
         """
         return self._loop
 
+    @timed_operation
     def get(self,
             key,  # type: str
             *opts,  # type: GetOptions
@@ -126,15 +138,59 @@ class AsyncCollection(CollectionLogic):
                 res = await collection.get('airline_10', GetOptions(timeout=timedelta(seconds=2)))
                 print(f'Document value: {res.content_as[dict]}')
 
+            Hedged get operation, read from a replica if the active copy has not answered in 20ms::
+
+                from datetime import timedelta
+                from couchbase.options import GetOptions
+
+                # ... other code ...
+
+                res = await collection.get('airline_10', GetOptions(hedge_after=timedelta(milliseconds=20)))
+                print(f'Document value: {res.content_as[dict]}, read from replica: {res.is_replica}')
+
         """
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
         final_args['transcoder'] = transcoder
 
+        hedge_after, replica_args = self._get_hedged_read_args(final_args)
+        if hedge_after is not None:
+            return self.loop.create_task(self._get_hedged_internal(key, hedge_after, replica_args, **final_args))
+
         return self._get_internal(key, **final_args)
 
+    async def _get_hedged_internal(
+        self,
+        key,  # type: str
+        hedge_after,  # type: float
+        replica_args,  # type: Dict[str, Any]
+        **kwargs,  # type: Dict[str, Any]
+    ) -> GetResult:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`AsyncCollection.get` instead.
+        """
+        active_ft = self._get_internal(key, **kwargs)
+        done, _ = await asyncio.wait((active_ft,), timeout=hedge_after)
+        if done:
+            return active_ft.result()
+
+        pending = {active_ft, self._get_any_replica_internal(key, **replica_args)}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for ft in done:
+                if ft.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    # a replica read answers w/ a GetReplicaResult, hand back a GetResult either way
+                    res = ft.result()
+                    return res if isinstance(res, GetResult) else GetResult(res._orig)
+
+        # every request failed, the active read's error is the most relevant
+        raise active_ft.exception()
+
     @AsyncWrapper.inject_callbacks_and_decode(GetResult)
     def _get_internal(
         self,
@@ -147,6 +203,7 @@ class AsyncCollection(CollectionLogic):
         """
         super().get(key, **kwargs)
 
+    @timed_operation
     def get_any_replica(self,
                         key,  # type: str
                         *opts,  # type: GetAnyReplicaOptions
@@ -194,7 +251,7 @@ class AsyncCollection(CollectionLogic):
 
         """  # noqa: E501
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAnyReplicaOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -281,7 +338,7 @@ class AsyncCollection(CollectionLogic):
 
         """
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAllReplicasOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -628,6 +685,7 @@ class AsyncCollection(CollectionLogic):
         """
         super().touch(key, expiry, *opts, **kwargs)
 
+    @timed_operation
     def get_and_touch(self,
                       key,  # type: str
                       expiry,  # type: timedelta
@@ -683,7 +741,7 @@ class AsyncCollection(CollectionLogic):
         """
         # add to kwargs for conversion to int
         kwargs["expiry"] = expiry
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAndTouchOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -702,6 +760,7 @@ class AsyncCollection(CollectionLogic):
         """
         super().get_and_touch(key, **kwargs)
 
+    @timed_operation
     def get_and_lock(
         self,
         key,  # type: str
@@ -758,7 +817,7 @@ class AsyncCollection(CollectionLogic):
         """
         # add to kwargs for conversion to int
         kwargs["lock_time"] = lock_time
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAndLockOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -822,6 +881,7 @@ class AsyncCollection(CollectionLogic):
         """
         super().unlock(key, cas, *opts, **kwargs)
 
+    @timed_operation
     def lookup_in(
         self,
         key,  # type: str
@@ -880,7 +940,7 @@ class AsyncCollection(CollectionLogic):
                 print(f'Hotel {key} coordinates: {res.content_as[dict](0)}')
 
         """
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=LookupInOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -901,6 +961,7 @@ class AsyncCollection(CollectionLogic):
         """
         super().lookup_in(key, spec, **kwargs)
 
+    @timed_operation
     def lookup_in_any_replica(
         self,
         key,  # type: str
@@ -961,7 +1022,7 @@ class AsyncCollection(CollectionLogic):
                 print(f'Hotel {key} coordinates: {res.content_as[dict](0)}')
 
         """
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=LookupInAnyReplicaOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -1065,7 +1126,7 @@ class AsyncCollection(CollectionLogic):
                         break
 
         """  # noqa: E501
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=LookupInAllReplicasOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -1191,7 +1252,7 @@ class AsyncCollection(CollectionLogic):
 
 
         """  # noqa: E501
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=ScanOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             final_args['transcoder'] = self.default_transcoder
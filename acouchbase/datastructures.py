@@ -14,7 +14,6 @@
 #  limitations under the License.
 
 import asyncio
-import time
 from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
@@ -31,13 +30,16 @@ from couchbase.exceptions import (CasMismatchException,
                                   PathNotFoundException,
                                   QueueEmpty,
                                   UnAmbiguousTimeoutException)
+from couchbase.logic.datastructures import CasRetryBackoff
 from couchbase.options import MutateInOptions
+from couchbase.result import LookupInResult
 from couchbase.subdocument import (array_addunique,
                                    array_append,
                                    array_prepend,
                                    count)
 from couchbase.subdocument import exists as subdoc_exists
 from couchbase.subdocument import get as subdoc_get
+from couchbase.subdocument import get_full as subdoc_get_full
 from couchbase.subdocument import (remove,
                                    replace,
                                    upsert)
@@ -420,6 +422,13 @@ class CouchbaseSet:
         """
         return await self._collection.get(self._key)
 
+    @AsyncWrapper.datastructure_op(create_type=list)
+    async def _get_for_update(self) -> LookupInResult:
+        """
+        Get the entire set (and its CAS) w/ a sub-document lookup.
+        """
+        return await self._collection.lookup_in(self._key, (subdoc_get_full(),))
+
     @AsyncWrapper.datastructure_op(create_type=list)
     async def add(self, value  # type: Any
                   ) -> None:
@@ -449,17 +458,10 @@ class CouchbaseSet:
         .. seealso:: :meth:`set_add`, :meth:`map_add`
         """
 
-        if timeout is None:
-            timeout = timedelta(seconds=10)
-
-        timeout_millis = timeout.total_seconds() * 1000
-
-        interval_millis = float(50)
-        start = time.perf_counter()
-        time_left = timeout_millis
+        backoff = CasRetryBackoff(timeout)
         while True:
-            sd_res = await self._get()
-            list_ = sd_res.content_as[list]
+            sd_res = await self._get_for_update()
+            list_ = sd_res.value[0].get('value', None) or []
             val_idx = -1
             for idx, v in enumerate(list_):
                 if v == value:
@@ -476,18 +478,11 @@ class CouchbaseSet:
             else:
                 break
 
-            interval_millis += 500
-            if interval_millis > 1000:
-                interval_millis = 1000
-
-            time_left = timeout_millis - ((time.perf_counter() - start) * 1000)
-            if interval_millis > time_left:
-                interval_millis = time_left
-
-            if time_left <= 0:
+            delay = backoff.next_delay()
+            if delay is None:
                 raise UnAmbiguousTimeoutException(message=f"Unable to remove {value} from the CouchbaseSet.")
 
-            await asyncio.sleep(interval_millis / 1000)
+            await asyncio.sleep(delay)
 
     @AsyncWrapper.datastructure_op(create_type=list)
     async def contains(self, value  # type: Any
@@ -581,14 +576,7 @@ class CouchbaseQueue:
         .. seealso:: :meth:`set_add`, :meth:`map_add`
         """
 
-        if timeout is None:
-            timeout = timedelta(seconds=10)
-
-        timeout_millis = timeout.total_seconds() * 1000
-
-        interval_millis = float(50)
-        start = time.perf_counter()
-        time_left = timeout_millis
+        backoff = CasRetryBackoff(timeout)
         while True:
             try:
                 op = subdoc_get('[-1]')
@@ -602,18 +590,11 @@ class CouchbaseQueue:
                 except CasMismatchException:
                     pass
 
-                interval_millis += 500
-                if interval_millis > 1000:
-                    interval_millis = 1000
-
-                time_left = timeout_millis - ((time.perf_counter() - start) * 1000)
-                if interval_millis > time_left:
-                    interval_millis = time_left
-
-                if time_left <= 0:
+                delay = backoff.next_delay()
+                if delay is None:
                     raise UnAmbiguousTimeoutException(message="Unable to pop from the CouchbaseQueue.")
 
-                await asyncio.sleep(interval_millis / 1000)
+                await asyncio.sleep(delay)
             except PathNotFoundException:
                 raise QueueEmpty('No items to remove from the queue')
 
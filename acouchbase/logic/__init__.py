@@ -15,3 +15,5 @@
 
 from .wrappers import AsyncWrapper  # noqa: F401
 from .wrappers import call_async_fn  # noqa: F401
+from .wrappers import check_loop  # noqa: F401
+from .wrappers import get_completion_queue  # noqa: F401
@@ -15,8 +15,13 @@
 
 from __future__ import annotations
 
+from asyncio import _get_running_loop
+from collections import deque
 from functools import partial, wraps
+from threading import Lock
+from weakref import WeakKeyDictionary
 
+from acouchbase import is_uvloop
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   CouchbaseException,
                                   DocumentExistsException,
@@ -25,7 +30,115 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   ExceptionMap,
                                   MissingConnectionException,
                                   ServiceUnavailableException)
-from couchbase.logic import decode_replicas, decode_value
+from couchbase.logic import (attach_timings,
+                             decode_replicas,
+                             decode_value)
+
+
+class CompletionQueue:
+    """
+    **INTERNAL**
+
+    Hands operation completions from the C++ client's IO thread to the event loop.  Completions are queued and the
+    loop is only woken (``loop.call_soon_threadsafe()`` writes to the loop's self-pipe) when the queue goes from
+    empty to non-empty.  All futures completed in the meantime are then resolved in a single loop callback.
+    """
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._pending = deque()
+        self._lock = Lock()
+        self._scheduled = False
+
+    def set_result(self, ft, result):
+        self._submit(ft, result, False)
+
+    def set_exception(self, ft, exc):
+        self._submit(ft, exc, True)
+
+    def _submit(self, ft, value, is_exc):
+        with self._lock:
+            self._pending.append((ft, value, is_exc))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._scheduled = False
+                    return
+                batch = self._pending
+                self._pending = deque()
+            for ft, value, is_exc in batch:
+                self._complete(ft, value, is_exc)
+
+    @staticmethod
+    def _complete(ft, value, is_exc):
+        # the future could have been cancelled while the operation was in flight
+        if ft.done():
+            return
+        if is_exc:
+            ft.set_exception(value)
+        else:
+            ft.set_result(value)
+
+
+class UvloopCompletionQueue(CompletionQueue):
+    """
+    **INTERNAL**
+
+    uvloop's ``call_soon_threadsafe()`` signals a libuv async handle, which coalesces wakeups on its own and does
+    not cost a syscall when a wakeup is already pending.  So, rather than serializing producers on a lock, a racing
+    producer is allowed to schedule a redundant (empty) drain.  ``deque.append()``/``deque.popleft()`` are atomic.
+    """
+
+    def _submit(self, ft, value, is_exc):
+        self._pending.append((ft, value, is_exc))
+        if not self._scheduled:
+            self._scheduled = True
+            self._loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self):
+        # clear the flag *before* draining, anything appended after this point either gets picked up below or
+        # schedules another drain
+        self._scheduled = False
+        pending = self._pending
+        while pending:
+            ft, value, is_exc = pending.popleft()
+            self._complete(ft, value, is_exc)
+
+
+_COMPLETION_QUEUES = WeakKeyDictionary()
+
+
+def get_completion_queue(loop):
+    """
+    **INTERNAL**
+    """
+    queue = _COMPLETION_QUEUES.get(loop, None)
+    if queue is None:
+        queue_cls = UvloopCompletionQueue if is_uvloop(loop) else CompletionQueue
+        queue = _COMPLETION_QUEUES.setdefault(loop, queue_cls(loop))
+    return queue
+
+
+def check_loop(loop):
+    """
+    **INTERNAL**
+
+    Operations must be issued from the thread running the event loop the cluster was created with.  Futures are
+    created on, and completions are delivered to, that loop; an operation issued from any other thread (or loop)
+    would never be safely resolved.
+
+    Raises:
+        RuntimeError: If the calling thread is not running the provided event loop.
+    """
+    if _get_running_loop() is not loop:
+        raise RuntimeError(('acouchbase operations must be issued from the thread running the event loop '
+                            'the cluster was created with.'))
 
 
 def call_async_fn(ft, self, fn, *args, **kwargs):
@@ -50,15 +163,17 @@ class AsyncWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                check_loop(self.loop)
                 ft = self.loop.create_future()
+                completions = get_completion_queue(self.loop)
 
                 def on_ok(res):
                     self._set_connection(res)
-                    self.loop.call_soon_threadsafe(ft.set_result, True)
+                    completions.set_result(ft, True)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.set_exception(ft, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
@@ -76,14 +191,16 @@ class AsyncWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                check_loop(self.loop)
                 ft = self.loop.create_future()
+                completions = get_completion_queue(self.loop)
 
                 def on_ok(_):
-                    self.loop.call_soon_threadsafe(ft.set_result, True)
+                    completions.set_result(ft, True)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.set_exception(ft, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
@@ -118,15 +235,17 @@ class AsyncWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                check_loop(self.loop)
                 ft = self.loop.create_future()
+                completions = get_completion_queue(self.loop)
 
                 def on_ok(_):
                     self._set_connected(True)
-                    self.loop.call_soon_threadsafe(ft.set_result, True)
+                    completions.set_result(ft, True)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.set_exception(ft, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
@@ -172,7 +291,9 @@ class AsyncWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                check_loop(self.loop)
                 ft = self.loop.create_future()
+                completions = get_completion_queue(self.loop)
 
                 def on_ok(res):
                     if return_cls is None:
@@ -185,14 +306,14 @@ class AsyncWrapper:
                     if set_cluster_info is True:
                         self._cluster_info = retval
 
-                    self.loop.call_soon_threadsafe(ft.set_result, retval)
+                    completions.set_result(ft, retval)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
                     if isinstance(excptn, ServiceUnavailableException) and fn.__name__ == '_get_cluster_info':
                         excptn._message = ('If using Couchbase Server < 6.6, '
                                            'a bucket needs to be opened prior to cluster level operations')
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.set_exception(ft, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
@@ -225,21 +346,36 @@ class AsyncWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                check_loop(self.loop)
                 ft = self.loop.create_future()
+                completions = get_completion_queue(self.loop)
+                recorder = getattr(self, '_operation_timings', None)
+                timings = token = None
+                if recorder is not None:
+                    timings, token = recorder.start()
 
                 def on_ok(res):
+                    if timings is not None:
+                        timings.mark_completed()
                     if return_cls is None:
                         retval = None
                     elif return_cls is True:
                         retval = res
                     else:
+                        if timings is not None:
+                            attach_timings(res, timings)
                         retval = return_cls(res)
+                    if timings is not None:
+                        recorder.record(timings)
 
-                    self.loop.call_soon_threadsafe(ft.set_result, retval)
+                    completions.set_result(ft, retval)
 
                 def on_err(exc):
+                    if timings is not None:
+                        timings.mark_completed()
+                        recorder.record(timings)
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.set_exception(ft, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
@@ -257,6 +393,8 @@ class AsyncWrapper:
                 else:
                     call_async_fn(ft, self, fn, *args, **kwargs)
 
+                if token is not None:
+                    recorder.end(token)
                 return ft
 
             return wrapped_fn
@@ -269,10 +407,18 @@ class AsyncWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                check_loop(self.loop)
                 ft = self.loop.create_future()
+                completions = get_completion_queue(self.loop)
                 transcoder = kwargs.pop('transcoder')
+                recorder = getattr(self, '_operation_timings', None)
+                timings = token = None
+                if recorder is not None:
+                    timings, token = recorder.start()
 
                 def on_ok(res):
+                    if timings is not None:
+                        timings.mark_completed()
                     try:
                         is_subdoc = fn.__name__ in [
                             '_lookup_in_internal', '_lookup_in_any_replica_internal', '_lookup_in_all_replicas_internal'
@@ -290,6 +436,8 @@ class AsyncWrapper:
                         flags = res.raw_result.get('flags', None)
 
                         res.raw_result['value'] = decode_value(transcoder, value, flags, is_subdoc=is_subdoc)
+                        if timings is not None:
+                            attach_timings(res, timings)
 
                         if return_cls is None:
                             retval = None
@@ -297,17 +445,22 @@ class AsyncWrapper:
                             retval = res
                         else:
                             retval = return_cls(res)
-                        self.loop.call_soon_threadsafe(ft.set_result, retval)
+                        if timings is not None:
+                            recorder.record(timings)
+                        completions.set_result(ft, retval)
                     except CouchbaseException as e:
-                        self.loop.call_soon_threadsafe(ft.set_exception, e)
+                        completions.set_exception(ft, e)
                     except Exception as ex:
                         exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
                         excptn = exc_cls(message=str(ex))
-                        self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                        completions.set_exception(ft, excptn)
 
                 def on_err(exc):
+                    if timings is not None:
+                        timings.mark_completed()
+                        recorder.record(timings)
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.set_exception(ft, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
@@ -325,6 +478,8 @@ class AsyncWrapper:
                 else:
                     call_async_fn(ft, self, fn, *args, **kwargs)
 
+                if token is not None:
+                    recorder.end(token)
                 return ft
 
             return wrapped_fn
@@ -53,6 +53,7 @@ class AsyncScope:
     def __init__(self, bucket, scope_name):
         self._bucket = bucket
         self._set_connection()
+        bucket._fork_dependents.add(self)
         self._scope_name = scope_name
 
     @property
@@ -122,6 +123,12 @@ class AsyncScope:
         """
         self._connection = self._bucket.connection
 
+    def _after_fork_in_child(self):
+        """
+        **INTERNAL**
+        """
+        self._connection = None
+
     def query(self,
               statement,  # type: str
               *options,  # type: QueryOptions
@@ -201,7 +208,7 @@ class AsyncScope:
                 opt = o
                 opts.remove(o)
 
-        request_args = dict()
+        request_args = dict(prepared_cache=self._bucket._cluster.prepared_statement_cache)
         num_workers = kwargs.pop('num_workers', None)
         if num_workers:
             request_args['num_workers'] = num_workers
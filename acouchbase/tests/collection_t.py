@@ -21,6 +21,7 @@ import pytest
 import pytest_asyncio
 
 import couchbase.subdocument as SD
+from acouchbase.batching_writer import BatchingWriter
 from acouchbase.cluster import get_event_loop
 from couchbase.diagnostics import ServiceType
 from couchbase.exceptions import (CasMismatchException,
@@ -43,6 +44,7 @@ from couchbase.result import (ExistsResult,
                               GetReplicaResult,
                               GetResult,
                               MutationResult)
+from couchbase.timeouts import RequestBudget
 from tests.mock_server import MockServerType
 
 from ._test_utils import (CollectionType,
@@ -166,6 +168,24 @@ class CollectionTests:
         assert isinstance(result, ExistsResult)
         assert result.exists is False
 
+    @pytest.mark.asyncio
+    async def test_get_request_budget_outlived(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        key = default_kvp.key
+        release = asyncio.Event()
+
+        async def get_after_block():
+            await release.wait()
+            return await cb.get(key)
+
+        async with RequestBudget(timedelta(seconds=5)) as budget:
+            # the task copies the context, including the budget, but outlives the block
+            task = asyncio.create_task(get_after_block())
+        assert budget.remaining is None
+        release.set()
+        result = await task
+        assert result.content_as[dict] == default_kvp.value
+
     @pytest.mark.asyncio
     async def test_get(self, cb_env, default_kvp):
         cb = cb_env.collection
@@ -178,6 +198,36 @@ class CollectionTests:
         assert result.expiry_time is None
         assert result.content_as[dict] == value
 
+    @pytest.mark.asyncio
+    async def test_get_concurrent(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        key = default_kvp.key
+        value = default_kvp.value
+        # completions are delivered to the loop in batches, make sure each future still gets its own result
+        results = await asyncio.gather(*[cb.get(key) for _ in range(50)])
+        assert len(results) == 50
+        assert all(map(lambda r: isinstance(r, GetResult), results)) is True
+        assert all(map(lambda r: r.content_as[dict] == value, results)) is True
+
+    @pytest.mark.asyncio
+    async def test_get_from_other_thread_fails(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        key = default_kvp.key
+        loop = asyncio.get_running_loop()
+        with pytest.raises(RuntimeError):
+            await loop.run_in_executor(None, cb.get, key)
+
+    @pytest.mark.asyncio
+    async def test_get_hedged(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        key = default_kvp.key
+        value = default_kvp.value
+        # hedge right away, either copy can answer
+        result = await cb.get(key, GetOptions(hedge_after=timedelta(microseconds=1)))
+        assert isinstance(result, GetResult)
+        assert isinstance(result.is_replica, bool)
+        assert result.content_as[dict] == value
+
     @pytest.mark.asyncio
     async def test_get_options(self, cb_env, default_kvp):
         cb = cb_env.collection
@@ -282,6 +332,34 @@ class CollectionTests:
         for field in project:
             assert res_dict.get(field) is not None
 
+    @pytest.mark.asyncio
+    async def test_batching_writer(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        key = default_kvp.key
+        value = default_kvp.value
+        with pytest.raises(InvalidArgumentException):
+            BatchingWriter(cb, max_batch_size=0)
+        writer = BatchingWriter(cb, flush_interval=None, max_batch_size=None, max_batch_bytes=None)
+        futures = [writer.upsert(key, dict(value, batch_idx=i)) for i in range(5)]
+        assert all(f is futures[0] for f in futures)
+        missing = writer.replace(self.NO_KEY, value)
+        assert sorted(writer.pending()) == sorted([key, self.NO_KEY])
+        await writer.flush()
+        assert writer.pending() == []
+        result = await futures[0]
+        assert isinstance(result, MutationResult)
+        g_result = await cb.get(key)
+        assert g_result.content_as[dict]['batch_idx'] == 4
+        with pytest.raises(DocumentNotFoundException):
+            await missing
+
+        async with BatchingWriter(cb, flush_interval=timedelta(milliseconds=10)) as writer:
+            result = await writer.replace(key, value)
+            assert isinstance(result, MutationResult)
+        assert writer.closed is True
+        with pytest.raises(RuntimeError):
+            writer.upsert(key, value)
+
     @pytest.mark.asyncio
     async def test_upsert(self, cb_env, default_kvp):
         cb = cb_env.collection
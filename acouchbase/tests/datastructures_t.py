@@ -13,6 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+from datetime import timedelta
+
 import pytest
 import pytest_asyncio
 
@@ -214,3 +217,16 @@ class DatastructuresTests:
         await cb_queue.clear()
 
         assert 0 == await cb_queue.size()
+
+    @pytest.mark.usefixtures("remove_ds")
+    @pytest.mark.asyncio
+    async def test_queue_concurrent_pop(self, cb_env):
+        cb_queue = cb_env.collection.couchbase_queue(self.TEST_DS_KEY)
+        num_items = 20
+        for i in range(num_items):
+            await cb_queue.push(i)
+
+        popped = await asyncio.gather(*[cb_queue.pop(timeout=timedelta(seconds=30)) for _ in range(num_items)])
+        assert sorted(popped) == list(range(num_items))
+        with pytest.raises(QueueEmpty):
+            await cb_queue.pop()
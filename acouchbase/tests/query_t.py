@@ -197,6 +197,7 @@ class QueryTestSuite:
         'test_simple_query',
         'test_simple_query_explain',
         'test_simple_query_prepared',
+        'test_simple_query_prepared_cache',
         'test_simple_query_with_named_params',
         'test_simple_query_with_named_params_in_options',
         'test_simple_query_with_positional_params',
@@ -455,6 +456,32 @@ class QueryTestSuite:
         assert result.metadata().metrics() is not None
         assert result._request.params.get('adhoc', None) is False
 
+    @pytest.mark.asyncio
+    async def test_simple_query_prepared_cache(self, cb_env):
+        # @TODO(CXXCBC-174)
+        if cb_env.server_version_short < 6.5:
+            pytest.skip(f'Skipped on server versions < 6.5 (using {cb_env.server_version_short}). Pending CXXCBC-174')
+        statement = f"SELECT * FROM `{cb_env.bucket.name}` LIMIT 2"
+        cache = cb_env.cluster.prepared_statement_cache
+        cache.evict(statement)
+        res = await cb_env.cluster.prepare_statements([statement])
+        assert isinstance(res[statement], str)
+        assert statement in [e.statement for e in cache.entries()]
+
+        result = cb_env.cluster.query(statement, QueryOptions(adhoc=False))
+        await cb_env.assert_rows(result, 2)
+        assert result.metadata().prepared_cache_hit() is True
+        stats = result.metadata().prepared_cache_stats()
+        assert stats.hits >= 1
+        assert stats.size == len(cache)
+
+        assert cache.evict(statement) is True
+        result = cb_env.cluster.query(statement, QueryOptions(adhoc=False))
+        await cb_env.assert_rows(result, 2)
+        assert result.metadata().prepared_cache_hit() is False
+        assert result._request.params.get('adhoc', None) is False
+        assert cache.stats().misses >= 1
+
     @pytest.mark.asyncio
     async def test_simple_query_with_named_params(self, cb_env):
         result = cb_env.cluster.query(f"SELECT * FROM `{cb_env.bucket.name}` WHERE batch LIKE $batch LIMIT 2",
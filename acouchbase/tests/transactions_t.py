@@ -58,11 +58,13 @@ class TransactionTestSuite:
         'test_expiration_time',
         'test_get',
         'test_get_lambda_raises_doc_not_found',
+        'test_get_multi',
         'test_get_inner_exc_doc_not_found',
         'test_get_replica_from_preferred_server_group_unretrievable',
         'test_get_replica_from_preferred_server_group_propagate_unretrievable_exc',
         'test_insert',
         'test_insert_lambda_raises_doc_exists',
+        'test_insert_multi',
         'test_insert_inner_exc_doc_exists',
         'test_max_parallelism',
         'test_metadata_collection',
@@ -85,6 +87,7 @@ class TransactionTestSuite:
         'test_remove_fail_bad_cas',
         'test_replace',
         'test_replace_fail_bad_cas',
+        'test_replace_multi',
         'test_rollback',
         'test_rollback_eating_exceptions',
         'test_scan_consistency',
@@ -297,6 +300,19 @@ class TransactionTestSuite:
 
         assert num_attempts == 1
 
+    @pytest.mark.asyncio
+    async def test_get_multi(self, cb_env):
+        keys_and_docs = dict(cb_env.get_existing_doc() for _ in range(5))
+
+        async def txn_logic(ctx):
+            res = await ctx.get_multi(cb_env.collection, list(keys_and_docs.keys()))
+            assert len(res) == len(keys_and_docs)
+            for k, v in res.items():
+                assert v.id == k
+                assert v.content_as[dict] == keys_and_docs[k]
+
+        await cb_env.cluster.transactions.run(txn_logic)
+
     @pytest.mark.asyncio
     @pytest.mark.usefixtures('check_server_groups_supported')
     async def test_get_replica_from_preferred_server_group_unretrievable(self, cb_env):
@@ -390,6 +406,19 @@ class TransactionTestSuite:
 
         assert num_attempts == 1
 
+    @pytest.mark.asyncio
+    async def test_insert_multi(self, cb_env):
+        keys_and_docs = dict(cb_env.get_new_doc() for _ in range(5))
+
+        async def txn_logic(ctx):
+            res = await ctx.insert_multi(cb_env.collection, keys_and_docs)
+            assert set(res.keys()) == set(keys_and_docs.keys())
+
+        await cb_env.cluster.transactions.run(txn_logic)
+        for k, v in keys_and_docs.items():
+            get_result = await cb_env.collection.get(k)
+            assert get_result.content_as[dict] == v
+
     def test_max_parallelism(self):
         max = 100
         cfg = TransactionQueryOptions(max_parallelism=max)
@@ -698,6 +727,24 @@ class TransactionTestSuite:
         res = await cb_env.collection.get(key)
         assert res.content_as[dict] == value
 
+    @pytest.mark.asyncio
+    async def test_replace_multi(self, cb_env):
+        keys_and_docs = dict(cb_env.get_existing_doc() for _ in range(5))
+        new_value = {'some': 'thing else'}
+
+        async def txn_logic(ctx):
+            get_res = await ctx.get_multi(cb_env.collection, list(keys_and_docs.keys()))
+            replace_res = await ctx.replace_multi([(r, new_value) for r in get_res.values()])
+            assert len(replace_res) == len(keys_and_docs)
+            for old, new in zip(get_res.values(), replace_res):
+                assert old.id == new.id
+                assert old.cas != new.cas
+
+        await cb_env.cluster.transactions.run(txn_logic)
+        for k in keys_and_docs.keys():
+            result = await cb_env.collection.get(k)
+            assert result.content_as[dict] == new_value
+
     @pytest.mark.asyncio
     async def test_rollback(self, cb_env):
         key, value = cb_env.get_new_doc()
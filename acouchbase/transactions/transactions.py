@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import logging
 from functools import wraps
 from typing import (TYPE_CHECKING,
@@ -21,7 +22,10 @@ from typing import (TYPE_CHECKING,
                     Callable,
                     Coroutine,
                     Dict,
-                    Optional)
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
 
 from couchbase.exceptions import ErrorMapper
 from couchbase.exceptions import exception as BaseCouchbaseException
@@ -319,6 +323,114 @@ class AttemptContext(AttemptContextLogic):
             kwargs['transcoder'] = options.get('transcoder', None)
         return self._replace(txn_get_result, value, **kwargs)
 
+    async def _stage_multi(self,
+                           ftrs,  # type: List[Awaitable[TransactionGetResult]]
+                           ) -> List[TransactionGetResult]:
+        """
+        **INTERNAL**
+
+        Waits for all the provided (already issued) operations to complete.  If any of the operations failed, the
+        first failure is raised once all the operations have completed.
+        """
+        results = await asyncio.gather(*ftrs, return_exceptions=True)
+        for res in results:
+            if isinstance(res, BaseException):
+                raise res
+        return results
+
+    async def get_multi(self,
+                        coll,  # type: AsyncCollection
+                        keys,  # type: Iterable[str]
+                        options=None,  # type: Optional[TransactionGetOptions]
+                        **kwargs  # type: Dict[str, Any]
+                        ) -> Dict[str, TransactionGetResult]:
+        """
+        Get multiple documents within this transaction.  The documents are fetched concurrently.
+
+        Args:
+            coll (:class:`couchbase.collection.Collection`): Collection to use to find the documents.
+            keys (Iterable[str]): The keys of the documents to get.
+            options (:class:`~couchbase.options.TransactionGetOptions`): Optional parameters for the operations.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TransactionGetOptions`
+
+        Returns:
+            Dict[str, :class:`couchbase.transactions.TransactionGetResult`]: The documents, keyed by document key, in a
+            form useful for passing to other transaction operations.
+        Raises:
+            :class:`couchbase.exceptions.TransactionOperationFailed`: If any of the operations failed.  In practice,
+            there is no need to handle the exception, as the transaction will rollback regardless.
+        """
+        if 'transcoder' not in kwargs and isinstance(options, TransactionGetOptions):
+            kwargs['transcoder'] = options.get('transcoder', None)
+        if kwargs.get('transcoder', None) is None:
+            kwargs.pop('transcoder', None)
+        keys = list(keys)
+        results = await self._stage_multi([self._get(coll, k, **kwargs) for k in keys])
+        return dict(zip(keys, results))
+
+    async def insert_multi(self,
+                           coll,  # type: AsyncCollection
+                           keys_and_docs,  # type: Dict[str, JSONType]
+                           options=None,  # type: Optional[TransactionInsertOptions]
+                           **kwargs  # type: Dict[str, Any]
+                           ) -> Dict[str, TransactionGetResult]:
+        """
+        Insert multiple new documents within a transaction.  The documents are staged concurrently.
+
+        Args:
+            coll (:class:`couchbase.collection.Collection`): Collection to insert the documents into.
+            keys_and_docs (Dict[str, :class:`couchbase._utils.JSONType`]): The documents to insert, keyed by document
+                key.
+            options (:class:`~couchbase.options.TransactionInsertOptions`): Optional parameters for the operations.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TransactionInsertOptions`
+
+        Returns:
+            Dict[str, :class:`couchbase.transactions.TransactionGetResult`]: The inserted documents, keyed by document
+            key, in a form useful for passing to other transaction operations.
+        Raises:
+            :class:`couchbase.exceptions.TransactionOperationFailed`: If any of the operations failed.  In practice,
+            there is no need to handle the exception, as the transaction will rollback regardless.
+        """
+        if 'transcoder' not in kwargs and isinstance(options, TransactionInsertOptions):
+            kwargs['transcoder'] = options.get('transcoder', None)
+        if kwargs.get('transcoder', None) is None:
+            kwargs.pop('transcoder', None)
+        keys = list(keys_and_docs.keys())
+        results = await self._stage_multi([self._insert(coll, k, keys_and_docs[k], **kwargs) for k in keys])
+        return dict(zip(keys, results))
+
+    async def replace_multi(self,
+                            replacements,  # type: Iterable[Tuple[TransactionGetResult, JSONType]]
+                            options=None,  # type: Optional[TransactionReplaceOptions]
+                            **kwargs  # type: Dict[str, Any]
+                            ) -> List[TransactionGetResult]:
+        """
+        Replace the contents of multiple documents within a transaction.  The replacements are staged concurrently.
+
+        Args:
+            replacements (Iterable[Tuple[:class:`couchbase.transactions.TransactionGetResult`, :class:`couchbase._utils.JSONType`]]):
+                The documents to replace, gotten from previous calls to other transaction operations, paired with
+                their new contents.
+            options (:class:`~couchbase.options.TransactionReplaceOptions`): Optional parameters for the operations.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TransactionReplaceOptions`
+
+        Returns:
+           List[:class:`couchbase.transactions.TransactionGetResult`]: The replaced documents, in the same order as the
+            provided replacements, in a form useful for passing to other transaction operations.
+        Raises:
+            :class:`couchbase.exceptions.TransactionOperationFailed`: If any of the operations failed.  In practice,
+            there is no need to handle the exception, as the transaction will rollback regardless.
+        """  # noqa: E501
+        if 'transcoder' not in kwargs and isinstance(options, TransactionReplaceOptions):
+            kwargs['transcoder'] = options.get('transcoder', None)
+        if kwargs.get('transcoder', None) is None:
+            kwargs.pop('transcoder', None)
+        return await self._stage_multi([self._replace(txn_get_result, value, **kwargs)
+                                        for txn_get_result, value in replacements])
+
     @AsyncWrapper.inject_callbacks(None)
     def remove(self,
                txn_get_result,
@@ -0,0 +1,109 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Measures the cost of handing operation completions from the C++ client's IO thread(s) to the event loop, for the
+default asyncio loop and for uvloop (if installed).  No cluster is required, a pool of "IO" threads completes
+futures through the same completion queue acouchbase uses for KV operations.
+
+    python benchmarks/acouchbase_event_loop.py --ops 200000 --io-threads 2
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+from time import perf_counter
+
+from acouchbase import get_event_loop, uvloop
+from acouchbase.logic import get_completion_queue
+
+
+async def run_completions(num_ops, num_threads, concurrency):
+    loop = asyncio.get_running_loop()
+    completions = get_completion_queue(loop)
+    work = []
+    work_ready = threading.Condition()
+    stopped = False
+
+    def io_thread():
+        while True:
+            with work_ready:
+                while not work and not stopped:
+                    work_ready.wait()
+                if stopped and not work:
+                    return
+                ft = work.pop()
+            completions.set_result(ft, True)
+
+    threads = [threading.Thread(target=io_thread, daemon=True) for _ in range(num_threads)]
+    for t in threads:
+        t.start()
+
+    async def issue(count):
+        for _ in range(count):
+            ft = loop.create_future()
+            with work_ready:
+                work.append(ft)
+                work_ready.notify()
+            await ft
+
+    start = perf_counter()
+    per_task = num_ops // concurrency
+    await asyncio.gather(*[issue(per_task) for _ in range(concurrency)])
+    elapsed = perf_counter() - start
+
+    with work_ready:
+        stopped = True
+        work_ready.notify_all()
+    for t in threads:
+        t.join()
+
+    return per_task * concurrency, elapsed
+
+
+def run_benchmark(name, loop, args):
+    asyncio.set_event_loop(loop)
+    try:
+        ops, elapsed = loop.run_until_complete(run_completions(args.ops, args.io_threads, args.concurrency))
+    finally:
+        loop.close()
+    return {'loop': name,
+            'ops': ops,
+            'elapsed_secs': round(elapsed, 4),
+            'ops_per_sec': round(ops / elapsed, 1),
+            'usecs_per_op': round(elapsed * 1e6 / ops, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='acouchbase event loop completion benchmark')
+    parser.add_argument('--ops', type=int, default=200000, help='number of operations to complete')
+    parser.add_argument('--io-threads', type=int, default=2, help='number of threads completing operations')
+    parser.add_argument('--concurrency', type=int, default=128, help='number of in-flight operations')
+    args = parser.parse_args()
+
+    results = [run_benchmark('asyncio', asyncio.new_event_loop(), args)]
+    if uvloop is not None:
+        results.append(run_benchmark('uvloop', get_event_loop(use_uvloop=True), args))
+        results[-1]['speedup'] = round(results[0]['elapsed_secs'] / results[-1]['elapsed_secs'], 2)
+    else:
+        print('uvloop is not installed, only the default asyncio loop was benchmarked.')
+
+    for r in results:
+        print(json.dumps(r))
+
+
+if __name__ == '__main__':
+    main()
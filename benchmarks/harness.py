@@ -0,0 +1,168 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Measurement helpers shared by the benchmark suite (see benchmarks/suite.py).
+
+Each benchmark is timed over a number of operations, after a number of untimed warmup operations, and reports:
+
+    ops_per_sec             throughput of the timed operations
+    p50_usecs, p99_usecs    operation latency percentiles
+    alloc_bytes_per_op      mean peak memory allocated (as traced by tracemalloc) while an operation is in flight
+
+Allocations are measured in a separate, untimed, pass so tracing does not skew the timings.  Only allocations made
+through Python's allocators are traced, memory the C++ client allocates for itself is not included.
+"""
+
+import asyncio
+import gc
+import tracemalloc
+from time import perf_counter
+
+
+def percentile(samples, pct):
+    """Returns the pct percentile of the (sorted) samples."""
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def summarize(name, api, latencies, elapsed, allocations=None):
+    """Builds the (JSON serializable) result of a benchmark from its latencies (in seconds)."""
+    latencies = sorted(latencies)
+    ops = len(latencies)
+    result = {'benchmark': name,
+              'api': api,
+              'ops': ops,
+              'elapsed_secs': round(elapsed, 4),
+              'ops_per_sec': round(ops / elapsed, 1),
+              'p50_usecs': round(percentile(latencies, 50) * 1e6, 3),
+              'p99_usecs': round(percentile(latencies, 99) * 1e6, 3)}
+    if allocations is not None:
+        result.update(allocations)
+    return result
+
+
+class AllocationTracker:
+    """Tracks the memory allocated by the operations run between start() and stop()."""
+
+    def __init__(self):
+        self._ops = 0
+        self._peak_bytes = 0
+        self._op_base = 0
+        # tracemalloc.reset_peak() is only available w/ Python 3.9+
+        self._track_peak = hasattr(tracemalloc, 'reset_peak')
+
+    def start(self):
+        gc.collect()
+        tracemalloc.start()
+
+    def op_start(self):
+        if self._track_peak:
+            tracemalloc.reset_peak()
+            self._op_base = tracemalloc.get_traced_memory()[0]
+
+    def op_end(self):
+        self._ops += 1
+        if self._track_peak:
+            self._peak_bytes += tracemalloc.get_traced_memory()[1] - self._op_base
+
+    def stop(self):
+        tracemalloc.stop()
+        ops = max(1, self._ops)
+        return {'alloc_bytes_per_op': round(self._peak_bytes / ops, 1) if self._track_peak else None}
+
+
+def run_sync(op, ops, warmup, alloc_ops=0):
+    """Times the blocking op.
+
+    Returns:
+        Tuple[List[float], float, Optional[Dict[str, float]]]: The latencies, the elapsed time and the allocations.
+    """
+    for _ in range(warmup):
+        op()
+
+    latencies = [0.0] * ops
+    start = perf_counter()
+    for i in range(ops):
+        op_start = perf_counter()
+        op()
+        latencies[i] = perf_counter() - op_start
+    elapsed = perf_counter() - start
+
+    allocations = None
+    if alloc_ops > 0:
+        tracker = AllocationTracker()
+        tracker.start()
+        for _ in range(alloc_ops):
+            tracker.op_start()
+            op()
+            tracker.op_end()
+        allocations = tracker.stop()
+
+    return latencies, elapsed, allocations
+
+
+async def _run_awaitable(op, ops, warmup, concurrency, alloc_ops, gather):
+    for _ in range(warmup):
+        await op()
+
+    latencies = []
+
+    async def worker(count):
+        for _ in range(count):
+            op_start = perf_counter()
+            await op()
+            latencies.append(perf_counter() - op_start)
+
+    concurrency = max(1, min(concurrency, ops))
+    per_worker = ops // concurrency
+    start = perf_counter()
+    await gather([worker(per_worker) for _ in range(concurrency)])
+    elapsed = perf_counter() - start
+
+    allocations = None
+    if alloc_ops > 0:
+        # allocations are measured one operation at a time, so the peak is that of a single operation
+        tracker = AllocationTracker()
+        tracker.start()
+        for _ in range(alloc_ops):
+            tracker.op_start()
+            await op()
+            tracker.op_end()
+        allocations = tracker.stop()
+
+    return latencies, elapsed, allocations
+
+
+async def _asyncio_gather(coros):
+    await asyncio.gather(*coros)
+
+
+async def run_async(op, ops, warmup, concurrency=1, alloc_ops=0):
+    """Times the asyncio op (a callable returning an awaitable), w/ concurrency operations in flight."""
+    return await _run_awaitable(op, ops, warmup, concurrency, alloc_ops, _asyncio_gather)
+
+
+def run_twisted(op, ops, warmup, concurrency=1, alloc_ops=0):
+    """Times the Twisted op (a callable returning a Deferred or coroutine), w/ concurrency operations in flight.
+
+    Returns:
+        Deferred: Fires w/ the same tuple as run_sync().
+    """
+    from twisted.internet import defer
+
+    def _gather(coros):
+        return defer.gatherResults([defer.ensureDeferred(c) for c in coros], consumeErrors=True)
+
+    return defer.ensureDeferred(_run_awaitable(op, ops, warmup, concurrency, alloc_ops, _gather))
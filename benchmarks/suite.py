@@ -0,0 +1,397 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Benchmark suite for the blocking (couchbase), asyncio (acouchbase) and Twisted (txcouchbase) APIs.
+
+Covers single document KV operations, multi-ops, sub-document operations, range scans, query streaming and the
+transcoders.  Each result is written to stdout as a line of JSON (see benchmarks/harness.py for the metrics).
+
+The cluster benchmarks run against the cluster given by --connstr.  Without --connstr, the cluster configured in
+tests/test_config.ini is used, which by default is the GoCAVES mock server.  Each API is benchmarked in its own
+process.  Benchmarks the cluster does not support (i.e. query against the mock server) report an error instead of
+failing the run.  The transcoder benchmarks do not need a cluster, use --offline to only run those.
+
+Use --fake-core to run the cluster benchmarks against the SDK's in-process fake cluster (see couchbase.testing)
+instead of a server.  The results then measure the Python layers of the SDK, without any network or C++ client
+overhead.
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --api acouchbase --benchmark 'kv.*' --ops 20000 --concurrency 32
+    python -m benchmarks.suite --offline --output bench_output.json
+    python -m benchmarks.suite --fake-core --api couchbase --benchmark 'kv.*'
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from benchmarks.harness import (run_async,
+                                run_sync,
+                                run_twisted,
+                                summarize)
+
+CLUSTER_APIS = ('couchbase', 'acouchbase', 'txcouchbase')
+
+# name -> (apis, builder), a builder returns the operation to benchmark.  Offline benchmarks have an api of None.
+BENCHMARKS = {}
+
+
+def benchmark(name, apis=CLUSTER_APIS):
+    def decorator(fn):
+        BENCHMARKS[name] = (apis, fn)
+        return fn
+    return decorator
+
+
+class BenchmarkContext:
+    def __init__(self, api, args, cluster=None, collection=None):
+        self.api = api
+        self.args = args
+        self.cluster = cluster
+        self.collection = collection
+        self.key_prefix = f'pycbc-bench-{api}-'
+        self.keys = [f'{self.key_prefix}{i}' for i in range(max(1, args.batch_size))]
+        num_fields = max(1, args.subdoc_paths)
+        field_size = max(1, args.doc_size // num_fields)
+        self.doc = {f'field{i}': 'x' * field_size for i in range(num_fields)}
+
+
+@benchmark('kv.get')
+def kv_get(ctx):
+    key = ctx.keys[0]
+    return lambda: ctx.collection.get(key)
+
+
+@benchmark('kv.upsert')
+def kv_upsert(ctx):
+    key, doc = ctx.keys[0], ctx.doc
+    return lambda: ctx.collection.upsert(key, doc)
+
+
+# the acouchbase API does not provide multi-ops
+@benchmark('multi.get', apis=('couchbase', 'txcouchbase'))
+def multi_get(ctx):
+    keys = ctx.keys
+    return lambda: ctx.collection.get_multi(keys)
+
+
+@benchmark('multi.upsert', apis=('couchbase', 'txcouchbase'))
+def multi_upsert(ctx):
+    docs = {k: ctx.doc for k in ctx.keys}
+    return lambda: ctx.collection.upsert_multi(docs)
+
+
+@benchmark('subdoc.lookup_in')
+def subdoc_lookup_in(ctx):
+    import couchbase.subdocument as SD
+    key = ctx.keys[0]
+    specs = [SD.get(path) for path in ctx.doc]
+    return lambda: ctx.collection.lookup_in(key, specs)
+
+
+@benchmark('subdoc.mutate_in')
+def subdoc_mutate_in(ctx):
+    import couchbase.subdocument as SD
+    key = ctx.keys[0]
+    specs = [SD.upsert(path, 'value') for path in ctx.doc]
+    return lambda: ctx.collection.mutate_in(key, specs)
+
+
+@benchmark('scan.prefix')
+def scan_prefix(ctx):
+    from couchbase.kv_range_scan import PrefixScan
+    scan_type = PrefixScan(ctx.key_prefix)
+    if ctx.api == 'couchbase':
+        return lambda: list(ctx.collection.scan(scan_type))
+
+    if ctx.api == 'acouchbase':
+        async def op():
+            return [r async for r in ctx.collection.scan(scan_type)]
+        return op
+
+    async def op():
+        res = ctx.collection.scan(scan_type)
+        rows = []
+        batch = await res.next_batch()
+        while batch:
+            rows.extend(batch)
+            batch = await res.next_batch()
+        return rows
+    return op
+
+
+@benchmark('query.stream')
+def query_stream(ctx):
+    statement = ctx.args.query
+    if ctx.api == 'txcouchbase':
+        async def op():
+            res = await ctx.cluster.query(statement)
+            return list(res.rows())
+        return op
+
+    return lambda: ctx.cluster.query(statement).execute()
+
+
+@benchmark('transcoder.json.encode', apis=(None,))
+def json_encode(ctx):
+    from couchbase.transcoder import JSONTranscoder
+    tc, doc = JSONTranscoder(), ctx.doc
+    return lambda: tc.encode_value(doc)
+
+
+@benchmark('transcoder.json.decode', apis=(None,))
+def json_decode(ctx):
+    from couchbase.transcoder import JSONTranscoder
+    tc = JSONTranscoder()
+    value, flags = tc.encode_value(ctx.doc)
+    return lambda: tc.decode_value(value, flags)
+
+
+@benchmark('transcoder.json.decode_values', apis=(None,))
+def json_decode_values(ctx):
+    from couchbase.transcoder import JSONTranscoder
+    tc = JSONTranscoder()
+    values = [tc.encode_value(ctx.doc) for _ in ctx.keys]
+    return lambda: tc.decode_values(values)
+
+
+@benchmark('transcoder.subdoc.decode', apis=(None,))
+def subdoc_decode(ctx):
+    from couchbase.constants import FMT_JSON
+    from couchbase.logic.wrappers import decode_value
+    from couchbase.subdocument import SubDocOp
+    from couchbase.transcoder import JSONTranscoder
+    tc = JSONTranscoder()
+    fragments = [(path, json.dumps(value).encode('utf-8')) for path, value in ctx.doc.items()]
+
+    def op():
+        # sub-document values are decoded in place, so each operation needs its own specs
+        specs = [{'opcode': SubDocOp.GET, 'status': 0, 'path': p, 'value': v} for p, v in fragments]
+        return decode_value(tc, specs, FMT_JSON, is_subdoc=True)
+    return op
+
+
+def select_benchmarks(api, patterns):
+    return [name for name, (apis, _) in BENCHMARKS.items()
+            if api in apis and (not patterns or any(fnmatch.fnmatch(name, p) for p in patterns))]
+
+
+def emit(result, results=None):
+    print(json.dumps(result), flush=True)
+    if results is not None:
+        results.append(result)
+
+
+def error_result(name, api, ex):
+    # Twisted wraps the failure of a concurrent operation in a FirstError
+    ex = getattr(getattr(ex, 'subFailure', None), 'value', ex)
+    return {'benchmark': name, 'api': api, 'error': f'{type(ex).__name__}: {ex}'}
+
+
+def get_cluster_options(args):
+    from couchbase.auth import PasswordAuthenticator
+    from couchbase.options import ClusterOptions
+    return ClusterOptions(PasswordAuthenticator(args.username, args.password))
+
+
+def run_offline(args, results):
+    ctx = BenchmarkContext(None, args)
+    for name in select_benchmarks(None, args.benchmark):
+        try:
+            res = run_sync(BENCHMARKS[name][1](ctx), args.ops, args.warmup, args.alloc_ops)
+            emit(summarize(name, None, *res), results)
+        except Exception as ex:
+            emit(error_result(name, None, ex), results)
+
+
+def run_couchbase(args):
+    from couchbase.cluster import Cluster
+    cluster = Cluster.connect(args.connstr, get_cluster_options(args))
+    collection = cluster.bucket(args.bucket).default_collection()
+    ctx = BenchmarkContext('couchbase', args, cluster, collection)
+    for key in ctx.keys:
+        collection.upsert(key, ctx.doc)
+
+    for name in select_benchmarks('couchbase', args.benchmark):
+        try:
+            res = run_sync(BENCHMARKS[name][1](ctx), args.ops, args.warmup, args.alloc_ops)
+            emit(summarize(name, 'couchbase', *res))
+        except Exception as ex:
+            emit(error_result(name, 'couchbase', ex))
+    cluster.close()
+
+
+async def run_acouchbase(args):
+    from acouchbase.cluster import Cluster
+    cluster = await Cluster.connect(args.connstr, get_cluster_options(args))
+    bucket = cluster.bucket(args.bucket)
+    await bucket.on_connect()
+    collection = bucket.default_collection()
+    ctx = BenchmarkContext('acouchbase', args, cluster, collection)
+    for key in ctx.keys:
+        await collection.upsert(key, ctx.doc)
+
+    for name in select_benchmarks('acouchbase', args.benchmark):
+        try:
+            res = await run_async(BENCHMARKS[name][1](ctx), args.ops, args.warmup, args.concurrency, args.alloc_ops)
+            emit(summarize(name, 'acouchbase', *res))
+        except Exception as ex:
+            emit(error_result(name, 'acouchbase', ex))
+    await cluster.close()
+
+
+def run_txcouchbase(args):
+    # txcouchbase needs to be imported first so that it can install the asyncio reactor
+    from txcouchbase.cluster import TxCluster
+    from twisted.internet import defer, task
+
+    async def main(_reactor):
+        cluster = TxCluster(args.connstr, get_cluster_options(args))
+        await cluster.on_connect()
+        bucket = cluster.bucket(args.bucket)
+        await bucket.on_connect()
+        collection = bucket.default_collection()
+        ctx = BenchmarkContext('txcouchbase', args, cluster, collection)
+        for key in ctx.keys:
+            await collection.upsert(key, ctx.doc)
+
+        for name in select_benchmarks('txcouchbase', args.benchmark):
+            try:
+                res = await run_twisted(BENCHMARKS[name][1](ctx), args.ops, args.warmup,
+                                        args.concurrency, args.alloc_ops)
+                emit(summarize(name, 'txcouchbase', *res))
+            except Exception as ex:
+                emit(error_result(name, 'txcouchbase', ex))
+        await cluster.close()
+
+    task.react(lambda reactor: defer.ensureDeferred(main(reactor)))
+
+
+def run_child(args):
+    if args.child == 'couchbase':
+        run_couchbase(args)
+    elif args.child == 'acouchbase':
+        asyncio.run(run_acouchbase(args))
+    else:
+        run_txcouchbase(args)
+
+
+def get_child_args(args, api):
+    child_args = [sys.executable, '-m', 'benchmarks.suite', '--child', api,
+                  '--connstr', args.connstr, '--username', args.username, '--password', args.password,
+                  '--bucket', args.bucket, '--ops', str(args.ops), '--warmup', str(args.warmup),
+                  '--alloc-ops', str(args.alloc_ops), '--concurrency', str(args.concurrency),
+                  '--batch-size', str(args.batch_size), '--doc-size', str(args.doc_size),
+                  '--subdoc-paths', str(args.subdoc_paths), '--query', args.query]
+    for pattern in args.benchmark:
+        child_args.extend(['--benchmark', pattern])
+    return child_args
+
+
+def run_cluster_benchmarks(args, results):
+    config = None
+    if args.connstr is None:
+        from tests.couchbase_config import CouchbaseConfig
+        config = CouchbaseConfig.load_config()
+        args.connstr = config.get_connection_string()
+        args.username, args.password = config.get_username_and_pw()
+        args.bucket = config.bucket_name
+
+    try:
+        for api in args.api or CLUSTER_APIS:
+            if api == 'txcouchbase' and importlib.util.find_spec('twisted') is None:
+                print('Twisted is not installed, skipping the txcouchbase benchmarks.', file=sys.stderr)
+                continue
+            if not select_benchmarks(api, args.benchmark):
+                continue
+            proc = subprocess.run(get_child_args(args, api), stdout=subprocess.PIPE, universal_newlines=True)
+            for line in proc.stdout.splitlines():
+                if line.startswith('{'):
+                    emit(json.loads(line), results)
+            if proc.returncode != 0:
+                emit({'benchmark': None, 'api': api, 'error': f'exited w/ code {proc.returncode}'}, results)
+    finally:
+        if config is not None:
+            config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='couchbase, acouchbase and txcouchbase benchmark suite')
+    parser.add_argument('--api', action='append', choices=CLUSTER_APIS,
+                        help='API to benchmark, can be repeated (default: all)')
+    parser.add_argument('--benchmark', '-b', action='append', default=[],
+                        help="glob of the benchmarks to run, can be repeated (i.e. 'kv.*')")
+    parser.add_argument('--offline', action='store_true', help='only run the benchmarks that do not need a cluster')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks and exit')
+    parser.add_argument('--fake-core', action='store_true',
+                        help='run the cluster benchmarks against the in-process fake cluster (PYCBC_FAKE_CORE)')
+    parser.add_argument('--connstr', help='connection string (default: the cluster in tests/test_config.ini)')
+    parser.add_argument('--username', default='Administrator')
+    parser.add_argument('--password', default='password')
+    parser.add_argument('--bucket', default='default')
+    parser.add_argument('--ops', type=int, default=10000, help='number of timed operations per benchmark')
+    parser.add_argument('--warmup', type=int, default=500, help='number of untimed operations per benchmark')
+    parser.add_argument('--alloc-ops', type=int, default=500,
+                        help='number of operations to measure allocations over, 0 to disable')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='number of in-flight operations for the acouchbase and txcouchbase APIs')
+    parser.add_argument('--batch-size', type=int, default=16, help='number of documents per multi-op')
+    parser.add_argument('--doc-size', type=int, default=1024, help='approximate document size, in bytes')
+    parser.add_argument('--subdoc-paths', type=int, default=16,
+                        help='number of fields per document, i.e. the paths per sub-document operation')
+    parser.add_argument('--query', default='SELECT RAW i FROM ARRAY_RANGE(0, 100) AS i',
+                        help='statement for the query benchmark')
+    parser.add_argument('--output', help='also write the results, w/ environment details, to this JSON file')
+    parser.add_argument('--child', choices=CLUSTER_APIS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.fake_core:
+        # must be set before couchbase is imported, the child processes inherit it
+        os.environ['PYCBC_FAKE_CORE'] = '1'
+        if args.connstr is None:
+            args.connstr = 'couchbase://localhost'
+
+    if args.child:
+        run_child(args)
+        return
+
+    if args.list:
+        for name, (apis, _) in BENCHMARKS.items():
+            print(f"{name}: {', '.join(api or 'offline' for api in apis)}")
+        return
+
+    results = []
+    if args.api is None or args.offline:
+        run_offline(args, results)
+    if not args.offline:
+        run_cluster_benchmarks(args, results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'implementation': platform.python_implementation(),
+                       'platform': platform.platform(),
+                       'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -130,6 +130,9 @@ def pytest_addoption(parser):
     parser.addoption(
         "--txcouchbase", action="store_true", default=False, help="run txcouchbase tests"
     )
+    parser.addoption(
+        "--uvloop", action="store_true", default=False, help="run acouchbase tests w/ the uvloop event loop"
+    )
 
 
 def pytest_collection_modifyitems(items):  # noqa: C901
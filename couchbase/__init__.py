@@ -14,11 +14,22 @@
 #  limitations under the License.
 
 import platform
+from datetime import timedelta
 from functools import partial, partialmethod
-from typing import (List,
+from typing import (Dict,
+                    List,
                     Optional,
                     Tuple)
 
+import os  # nopep8 # isort:skip # noqa: E402
+import sys  # nopep8 # isort:skip # noqa: E402
+
+# PYCBC_FAKE_CORE runs the SDK on top of an in-process, pure-Python stand-in for the C++ client (see
+# couchbase.testing), i.e. for offline load testing.  It has to be installed before anything imports pycbc_core.
+if os.getenv('PYCBC_FAKE_CORE', '').lower() in ('1', 'true', 'on'):
+    from couchbase.testing import fake_core as _fake_core  # nopep8 # isort:skip # noqa: E402
+    sys.modules['couchbase.pycbc_core'] = _fake_core
+
 try:
     # Importing the ssl package allows us to utilize some Python voodoo to find OpenSSL.
     # This is particularly helpful on M1 macs (PYCBC-1386).
@@ -88,6 +99,8 @@ def _pycbc_teardown(**kwargs):
     if (_PYCBC_LOGGER
         and isinstance(_PYCBC_LOGGER, pycbc_logger)
             and not (_PYCBC_LOGGER.is_console_logger() or _PYCBC_LOGGER.is_file_logger())):
+        # a buffered sink hands its queued records to Python's logging module prior to shutting down
+        _PYCBC_LOGGER.close_logging_sink()
         shutdown_logger()
         _PYCBC_LOGGER = None
 
@@ -152,7 +165,46 @@ def configure_console_logger():
         logging.getLogger().debug(get_metadata(as_str=True))
 
 
-def configure_logging(name, level=logging.INFO, parent_logger=None):
+def configure_logging(name,  # type: str
+                      level=logging.INFO,  # type: Optional[int]
+                      parent_logger=None,  # type: Optional[logging.Logger]
+                      buffered=False,  # type: Optional[bool]
+                      max_queued_records=None,  # type: Optional[int]
+                      flush_interval=None,  # type: Optional[timedelta]
+                      rate_limit=None,  # type: Optional[int]
+                      sample_rates=None,  # type: Optional[Dict[int, float]]
+                      ):
+    """
+    Forwards the underlying couchbase++ library's log records to Python's logging module.
+
+    By default each record is handed to the logger as it is logged, acquiring the GIL for every record.  At debug or
+    trace level this can slow down the SDK considerably, set ``buffered`` to queue the records in C++ and hand them
+    to the logger in batches from a background thread instead.  Records logged while the queue is full are dropped.
+
+    Args:
+        name (str): The name of the logger.
+        level (int, optional): The couchbase++ library's log level.  Defaults to ``logging.INFO``.
+        parent_logger (``logging.Logger``, optional): If provided, the logger is a child of this logger.
+        buffered (bool, optional): **VOLATILE** Set to True to hand the records to the logger in batches, from a
+            background thread.  Defaults to False.
+        max_queued_records (int, optional): **VOLATILE** If buffered, the max number of queued records.  Defaults to
+            10000.
+        flush_interval (timedelta, optional): **VOLATILE** If buffered, how often the queued records are handed to
+            the logger (they are also handed over once the queue is half full).  Defaults to 100 milliseconds.
+        rate_limit (int, optional): **VOLATILE** The max number of records per second, per category (the
+            couchbase++ source file that logged the record).  Records over the limit are dropped.  Defaults to None
+            (unlimited).
+        sample_rates (Dict[int, float], optional): **VOLATILE** The fraction of the records kept, per level (i.e.
+            ``{logging.DEBUG: 0.1}`` keeps one debug record out of ten).  Defaults to None (all records are kept).
+
+    .. note::
+        The threshold logging tracer's reports (see the cluster's ``threshold_reports()``) are logged as warnings,
+        they are never sampled nor rate limited.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If a sample rate is not between 0 and 1.
+        RuntimeError: If the couchbase++ library's logger has already been initialized.
+    """
     if parent_logger:
         name = f'{parent_logger.name}.{name}'
     logger = logging.getLogger(name)
@@ -160,10 +212,44 @@ def configure_logging(name, level=logging.INFO, parent_logger=None):
         raise RuntimeError(('Cannot create logger.  Another logger has already been '
                             'initialized. Make sure the PYCBC_LOG_LEVEL and PYCBC_LOG_FILE env '
                             'variable are not set if using configure_logging.'))
-    _PYCBC_LOGGER.configure_logging_sink(logger, level)
+    sink_opts = {}
+    if buffered:
+        sink_opts['buffered'] = True
+        if max_queued_records is not None:
+            sink_opts['max_queued_records'] = int(max_queued_records)
+        if flush_interval is not None:
+            sink_opts['flush_interval_ms'] = max(1, int(flush_interval.total_seconds() * 1000))
+    if rate_limit is not None:
+        sink_opts['rate_limit'] = int(rate_limit)
+    if sample_rates:
+        from couchbase.exceptions import InvalidArgumentException
+        for lvl, rate in sample_rates.items():
+            if not isinstance(rate, (int, float)) or not 0 <= rate <= 1:
+                raise InvalidArgumentException(message=f'Invalid sample rate for level {lvl}: {rate}.  '
+                                               'Sample rates must be between 0 and 1.')
+        sink_opts['sample_rates'] = {int(lvl): float(rate) for lvl, rate in sample_rates.items()}
+    _PYCBC_LOGGER.configure_logging_sink(logger, level, **sink_opts)
+    from couchbase.threshold_reports import attach_threshold_report_filter
+    attach_threshold_report_filter(logger)
     logger.debug(get_metadata(as_str=True))
 
 
+def logging_dropped_records() -> Dict[str, int]:
+    """
+    **VOLATILE** This API is subject to change at any time.
+
+    Returns the number of the couchbase++ library's log records dropped by the sink configured via
+    :func:`.configure_logging`.
+
+    Returns:
+        Dict[str, int]: The number of records dropped because the queue was full (``queue_full``), over the rate
+        limit (``rate_limited``) or not sampled (``sampled``).
+    """
+    if _PYCBC_LOGGER is None:
+        return {'queue_full': 0, 'rate_limited': 0, 'sampled': 0}
+    return _PYCBC_LOGGER.dropped_records()
+
+
 def enable_protocol_logger_to_save_network_traffic_to_file(filename  # type: str
                                                            ):
     """
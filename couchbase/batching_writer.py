@@ -0,0 +1,238 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future
+from datetime import timedelta
+from threading import (Event,
+                       Lock,
+                       Thread)
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    List,
+                    Optional)
+
+from couchbase.exceptions import CouchbaseException
+from couchbase.logic.batching_writer import BatchingWriterLogic, PendingWrite
+from couchbase.options import ReplaceMultiOptions, UpsertMultiOptions
+
+if TYPE_CHECKING:
+    from couchbase.collection import Collection
+    from couchbase.transcoder import Transcoder
+
+log = logging.getLogger(__name__)
+
+
+class BatchingWriter(BatchingWriterLogic):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Write-behind batching of upserts and replaces to a :class:`~couchbase.collection.Collection`.  Writes are queued
+    and coalesced per key (the last write wins) and are flushed with a single
+    :meth:`~couchbase.collection.Collection.upsert_multi` (and :meth:`~couchbase.collection.Collection.replace_multi`)
+    every ``flush_interval``, or once the batch reaches ``max_batch_size`` keys or ``max_batch_bytes`` encoded
+    bytes.  Each write returns a ``concurrent.futures.Future``, shared by the writes to the same key within a batch,
+    that resolves with the key's :class:`~couchbase.result.MutationResult` (or the exception its write failed with).
+
+    The coalesced write of a key is an upsert if any of its writes was an upsert, a replace otherwise.  Values are
+    encoded when the write is queued.  The pending writes are flushed when the writer is closed (explicitly, when
+    leaving its context or when its cluster is closed).
+
+    Args:
+        collection (:class:`~couchbase.collection.Collection`): The collection to write to.
+        max_batch_size (int, optional): The number of pending keys that triggers a flush.  Defaults to 1000.
+        max_batch_bytes (int, optional): The number of pending encoded bytes that triggers a flush.  Defaults to
+            4 MiB.
+        flush_interval (timedelta, optional): How often the pending writes are flushed.  Set to None to only flush
+            once a size threshold is reached (or explicitly).  Defaults to 100 milliseconds.
+        transcoder (:class:`~couchbase.transcoder.Transcoder`, optional): The transcoder used to encode the values.
+            Defaults to the collection's default transcoder.
+        expiry (timedelta, optional): The expiry of the written documents.
+        timeout (timedelta, optional): The timeout of the flush operations.  Defaults to global key-value operation
+            timeout.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If an invalid threshold or transcoder is provided.
+
+    Examples:
+
+        Batch the updates of frequently updated documents::
+
+            from couchbase.batching_writer import BatchingWriter
+
+            # ... other code ...
+
+            collection = bucket.default_collection()
+            with BatchingWriter(collection, max_batch_size=500) as writer:
+                futures = [writer.upsert(event.key, event.doc) for event in events]
+            for fut in futures:
+                print(f'CAS: {fut.result().cas}')
+
+    """
+
+    def __init__(self,
+                 collection,  # type: Collection
+                 max_batch_size=1000,  # type: Optional[int]
+                 max_batch_bytes=4 * 1024 * 1024,  # type: Optional[int]
+                 flush_interval=timedelta(milliseconds=100),  # type: Optional[timedelta]
+                 transcoder=None,  # type: Optional[Transcoder]
+                 expiry=None,  # type: Optional[timedelta]
+                 timeout=None,  # type: Optional[timedelta]
+                 ):
+        super().__init__(collection,
+                         max_batch_size=max_batch_size,
+                         max_batch_bytes=max_batch_bytes,
+                         flush_interval=flush_interval,
+                         transcoder=transcoder,
+                         expiry=expiry,
+                         timeout=timeout)
+        self._lock = Lock()
+        # serializes flushes, so a flush returns once all of the writes pending when it was called are applied
+        self._flush_lock = Lock()
+        self._wake = Event()
+        self._flusher = None  # type: Optional[Thread]
+        collection._scope._bucket._cluster._write_buffers.add(self)
+
+    def upsert(self,
+               key,  # type: str
+               value,  # type: Any
+               ) -> Future:
+        """Queues an upsert of the document specified by the key.
+
+        Args:
+            key (str): The key of the document.
+            value (Any): The value of the document.
+
+        Returns:
+            ``concurrent.futures.Future``: Resolves with the key's :class:`~couchbase.result.MutationResult` once
+            the write has been flushed.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        return self._write(key, value, True)
+
+    def replace(self,
+                key,  # type: str
+                value,  # type: Any
+                ) -> Future:
+        """Queues a replace of the document specified by the key.  The replace fails if the document does not exist
+        (unless it is coalesced with an upsert of the same key).
+
+        Args:
+            key (str): The key of the document.
+            value (Any): The value of the document.
+
+        Returns:
+            ``concurrent.futures.Future``: Resolves with the key's :class:`~couchbase.result.MutationResult` once
+            the write has been flushed.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        return self._write(key, value, False)
+
+    def pending(self) -> List[str]:
+        """Returns the keys whose writes have not been flushed yet.
+
+        Returns:
+            List[str]: The pending keys.
+        """
+        with self._lock:
+            return super().pending()
+
+    def flush(self) -> None:
+        """Flushes the pending writes, blocking until they have been applied.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = self._take_batch()
+            self._apply(batch)
+
+    def close(self) -> None:
+        """Stops the background flushes and flushes the pending writes.  Further writes raise.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            flusher = self._flusher
+        self._wake.set()
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+
+    def _write(self, key, value, is_upsert):
+        with self._lock:
+            fut, full = self._queue_write(key, value, is_upsert, Future)
+            if self._flusher is None:
+                self._flusher = Thread(target=self._run, name='pycbc-batching-writer', daemon=True)
+                self._flusher.start()
+        if full:
+            self._wake.set()
+        return fut
+
+    def _run(self):
+        timeout = self._flush_interval.total_seconds() if self._flush_interval is not None else None
+        while True:
+            self._wake.wait(timeout)
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception:  # nosec
+                log.exception('Unable to flush the batching writer.')
+
+    def _apply(self, batch  # type: Dict[str, PendingWrite]
+               ) -> None:
+        if not batch:
+            return
+        upserts, replaces = self._split_batch(batch)
+        for docs, fn, opts_type in ((upserts, self._collection.upsert_multi, UpsertMultiOptions),
+                                    (replaces, self._collection.replace_multi, ReplaceMultiOptions)):
+            if not docs:
+                continue
+            try:
+                res = fn(docs, opts_type(return_exceptions=True, **self._op_opts))
+            except CouchbaseException as ex:
+                for key in docs:
+                    self._set_future(batch[key].future, exception=ex)
+                continue
+            for key, result in res.results.items():
+                self._set_future(batch[key].future, result=result)
+            for key, ex in res.exceptions.items():
+                self._set_future(batch[key].future, exception=ex)
+
+    @staticmethod
+    def _set_future(fut, result=None, exception=None):
+        if fut.done():
+            # cancelled by the application
+            return
+        if exception is not None:
+            fut.set_exception(exception)
+        else:
+            fut.set_result(result)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'BatchingWriter(pending={len(self._pending)}, closed={self._closed})'
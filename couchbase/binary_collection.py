@@ -14,12 +14,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
                     List,
+                    Optional,
                     Union)
 
+from couchbase.counter_buffer import CounterBuffer
 from couchbase.result import (CounterResult,
                               MultiCounterResult,
                               MultiMutationResult,
@@ -33,7 +36,8 @@ if TYPE_CHECKING:
                                    IncrementMultiOptions,
                                    IncrementOptions,
                                    PrependMultiOptions,
-                                   PrependOptions)
+                                   PrependOptions,
+                                   SignedInt64)
 
 
 class BinaryCollection:
@@ -607,3 +611,59 @@ class BinaryCollection:
 
         """
         return self._collection._decrement_multi(keys, *opts, **kwargs)
+
+    def buffered_counters(self,
+                          flush_interval=timedelta(seconds=1),  # type: Optional[timedelta]
+                          flush_threshold=10000,  # type: Optional[int]
+                          initial=None,  # type: Optional[SignedInt64]
+                          timeout=None,  # type: Optional[timedelta]
+                          ) -> CounterBuffer:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Creates a :class:`~couchbase.counter_buffer.CounterBuffer`, coalescing increments and decrements of counter
+        documents per key on the client and applying them in batches via :meth:`.increment_multi` and
+        :meth:`.decrement_multi`.  Useful for hot counters, updated much more often than their value is read.
+
+        Args:
+            flush_interval (timedelta, optional): How often the pending deltas are flushed.  Set to None to only
+                flush once ``flush_threshold`` is reached (or explicitly).  Defaults to 1 second.
+            flush_threshold (int, optional): The number of pending increments/decrements that triggers a flush.
+                Set to None to only flush every ``flush_interval`` (or explicitly).  Defaults to 10000.
+            initial (:class:`~couchbase.options.SignedInt64`, optional): The initial value to use for counter
+                documents that do not already exist.  Unlike :meth:`.increment_multi`, the flushed delta is not lost
+                when a counter is created: a missing counter is created as ``initial + delta`` (``max(initial -
+                delta, 0)`` for a net decrement).  A negative initial value means missing counters are not created.
+            timeout (timedelta, optional): The timeout of the flush operations.  Defaults to global key-value
+                operation timeout.
+
+        Returns:
+            :class:`~couchbase.counter_buffer.CounterBuffer`: The counter buffer.  Its pending deltas are flushed
+            when it is closed, or when the cluster is closed.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If an invalid flush interval, flush threshold
+                or initial value is provided.
+
+        Examples:
+
+            Buffer the increments of hot counters::
+
+                from datetime import timedelta
+
+                from couchbase.options import SignedInt64
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                with collection.binary().buffered_counters(flush_interval=timedelta(milliseconds=500),
+                                                           initial=SignedInt64(0)) as counters:
+                    for event in events:
+                        counters.increment(f'counter::{event.kind}')
+                    print(f'Pending deltas: {counters.pending()}')
+
+        """
+        return CounterBuffer(self,
+                             flush_interval=flush_interval,
+                             flush_threshold=flush_threshold,
+                             initial=initial,
+                             timeout=timeout)
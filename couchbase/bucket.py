@@ -68,6 +68,17 @@ class Bucket(BucketLogic):
         super()._open_or_close_bucket(open_bucket=False, **kwargs)
         self._destroy_connection()
 
+    def _reconnect_after_fork_in_child(self):
+        """**INTERNAL**
+
+        Reopens the bucket, on its first use in a child process after ``fork()``, using the cluster's new connection.
+        """
+        # the bucket has been closed
+        if not hasattr(self, '_cluster'):
+            return
+        self._connection = self._cluster.connection
+        self._open_bucket()
+
     def close(self):
         """Shuts down this bucket instance. Cleaning up all resources associated with it.
 
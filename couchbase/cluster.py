@@ -16,15 +16,22 @@
 from __future__ import annotations
 
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
-                    Dict)
+                    Dict,
+                    Iterable,
+                    Optional,
+                    Union)
 
 from couchbase.analytics import AnalyticsQuery, AnalyticsRequest
 from couchbase.bucket import Bucket
 from couchbase.diagnostics import ClusterState, ServiceType
-from couchbase.exceptions import ErrorMapper, UnAmbiguousTimeoutException
+from couchbase.exceptions import (CouchbaseException,
+                                  ErrorMapper,
+                                  UnAmbiguousTimeoutException)
 from couchbase.exceptions import exception as BaseCouchbaseException
 from couchbase.logic import BlockingWrapper
 from couchbase.logic.cluster import ClusterLogic
@@ -37,6 +44,7 @@ from couchbase.management.search import SearchIndexManager
 from couchbase.management.users import UserManager
 from couchbase.n1ql import N1QLQuery, N1QLRequest
 from couchbase.options import PingOptions, forward_args
+from couchbase.prepared_statements import prepare_statement_query, prepared_statement_name
 from couchbase.result import (AnalyticsResult,
                               ClusterInfoResult,
                               DiagnosticsResult,
@@ -98,6 +106,8 @@ class Cluster(ClusterLogic):
                  ) -> Cluster:
 
         super().__init__(connstr, *options, **kwargs)
+        # counter buffers and batching writers, flushed when the cluster is closed
+        self._write_buffers = weakref.WeakSet()
         self._connect()
 
     @BlockingWrapper.block(True)
@@ -112,6 +122,14 @@ class Cluster(ClusterLogic):
         super()._close_cluster()
         super()._destroy_connection()
 
+    def _reconnect_after_fork_in_child(self):
+        """**INTERNAL**
+
+        Reconnects the cluster on its first use in a child process after ``fork()``.  Open buckets are reopened on
+        their own first use.
+        """
+        self._connect()
+
     @property
     def transactions(self) -> Transactions:
         """
@@ -132,6 +150,8 @@ class Cluster(ClusterLogic):
 
         """
         if self.connected:
+            for write_buffer in list(self._write_buffers):
+                write_buffer.close()
             self._close_cluster()
 
     def bucket(self, bucket_name) -> Bucket:
@@ -391,7 +411,69 @@ class Cluster(ClusterLogic):
         return QueryResult(N1QLRequest.generate_n1ql_request(self.connection,
                                                              query.params,
                                                              default_serializer=self.default_serializer,
-                                                             streaming_timeout=streaming_timeout))
+                                                             streaming_timeout=streaming_timeout,
+                                                             prepared_cache=self.prepared_statement_cache))
+
+    def prepare_statements(self,
+                           statements,  # type: Iterable[str]
+                           query_context=None,  # type: Optional[str]
+                           timeout=None,  # type: Optional[timedelta]
+                           max_concurrency=16,  # type: Optional[int]
+                           ) -> Dict[str, Union[str, CouchbaseException]]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Prepares statements, in parallel, and adds them to the cluster's :attr:`.prepared_statement_cache`.  Typically
+        called at startup, so the first prepared queries (:class:`~couchbase.options.QueryOptions` ``adhoc=False``) of
+        the statements do not pay for their planning.
+
+        Args:
+            statements (Iterable[str]): The statements to prepare, exactly as they will be given to :meth:`.query`.
+            query_context (str, optional): The query context the statements are executed in.  Scope-level queries
+                are executed in the ```bucket`.`scope``` query context.
+            timeout (timedelta, optional): The timeout of each ``PREPARE`` query.  Defaults to global query timeout.
+            max_concurrency (int, optional): The maximum number of statements prepared concurrently.  Defaults to 16.
+
+        Returns:
+            Dict[str, Union[str, :class:`~couchbase.exceptions.CouchbaseException`]]: The name of each statement's
+            prepared statement, or the exception its ``PREPARE`` query failed with.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If a statement is not a non-empty str or
+                max_concurrency is not a positive int.
+
+        Examples:
+            Prepare the application's statements at startup::
+
+                statements = ['SELECT * FROM `travel-sample` WHERE type=$type LIMIT 10;']
+                for statement, res in cluster.prepare_statements(statements).items():
+                    if isinstance(res, Exception):
+                        print(f'Unable to prepare {statement}: {res}')
+
+                q_res = cluster.query(statements[0], QueryOptions(adhoc=False, named_parameters={'type': 'hotel'}))
+
+        """
+        statements, query_opts = self._get_prepare_statements_args(statements,
+                                                                   query_context=query_context,
+                                                                   timeout=timeout,
+                                                                   max_concurrency=max_concurrency)
+
+        def _prepare(statement):
+            rows = self.query(prepare_statement_query(statement), **query_opts).execute()
+            name = prepared_statement_name(rows)
+            self.prepared_statement_cache._add(statement, query_context, name)
+            return name
+
+        results = {}
+        if not statements:
+            return results
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(statements))) as executor:
+            futures = {statement: executor.submit(_prepare, statement) for statement in statements}
+        for statement, future in futures.items():
+            try:
+                results[statement] = future.result()
+            except CouchbaseException as ex:
+                results[statement] = ex
+        return results
 
     def analytics_query(self,  # type: Cluster
                         statement,  # type: str
@@ -22,7 +22,6 @@ from typing import (TYPE_CHECKING,
                     Iterable,
                     List,
                     Optional,
-                    Tuple,
                     Union)
 
 from couchbase.binary_collection import BinaryCollection
@@ -38,8 +37,9 @@ from couchbase.exceptions import (DocumentExistsException,
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.kv_range_scan import RangeScanRequest
 from couchbase.logic import (BlockingWrapper,
-                             decode_replicas,
-                             decode_value)
+                             HedgedRead,
+                             decode_multi_values,
+                             decode_replicas)
 from couchbase.logic.collection import CollectionLogic
 from couchbase.logic.supportability import Supportability
 from couchbase.management.queries import CollectionQueryIndexManager
@@ -60,8 +60,7 @@ from couchbase.options import (AppendMultiOptions,
                                TouchMultiOptions,
                                UnlockMultiOptions,
                                UpsertMultiOptions,
-                               forward_args,
-                               get_valid_multi_args)
+                               forward_args)
 from couchbase.pycbc_core import (binary_multi_operation,
                                   kv_multi_operation,
                                   operations)
@@ -88,7 +87,7 @@ from couchbase.subdocument import get as subdoc_get
 from couchbase.subdocument import remove as subdoc_remove
 from couchbase.subdocument import replace
 from couchbase.subdocument import upsert as subdoc_upsert
-from couchbase.transcoder import Transcoder
+from couchbase.timings import timed_operation
 
 if TYPE_CHECKING:
     from datetime import timedelta
@@ -108,8 +107,6 @@ if TYPE_CHECKING:
                                    LookupInAnyReplicaOptions,
                                    LookupInOptions,
                                    MutateInOptions,
-                                   MutationMultiOptions,
-                                   NoValueMultiOptions,
                                    PrependOptions,
                                    RemoveOptions,
                                    ReplaceOptions,
@@ -125,6 +122,7 @@ class Collection(CollectionLogic):
     def __init__(self, scope, name):
         super().__init__(scope, name)
 
+    @timed_operation
     def get(self,
             key,  # type: str
             *opts,  # type: GetOptions
@@ -166,16 +164,57 @@ class Collection(CollectionLogic):
                 res = collection.get('airline_10', GetOptions(timeout=timedelta(seconds=2)))
                 print(f'Document value: {res.content_as[dict]}')
 
+            Hedged get operation, read from a replica if the active copy has not answered in 20ms::
+
+                from datetime import timedelta
+                from couchbase.options import GetOptions
+
+                # ... other code ...
+
+                res = collection.get('airline_10', GetOptions(hedge_after=timedelta(milliseconds=20)))
+                print(f'Document value: {res.content_as[dict]}, read from replica: {res.is_replica}')
+
         """
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
         final_args['transcoder'] = transcoder
 
+        hedge_after, replica_args = self._get_hedged_read_args(final_args)
+        if hedge_after is not None:
+            return self._get_hedged_internal(key, hedge_after, replica_args, **final_args)
+
         return self._get_internal(key, **final_args)
 
+    @BlockingWrapper.block_and_decode(GetResult)
+    def _get_hedged_internal(
+        self,
+        key,  # type: str
+        hedge_after,  # type: float
+        replica_args,  # type: Dict[str, Any]
+        **kwargs,  # type: Dict[str, Any]
+    ) -> GetResult:
+        """ **Internal Operation**
+
+        Internal use only.  Use :meth:`Collection.get` instead.
+        """
+        replica_args.pop('transcoder', None)
+        hedged_read = HedgedRead()
+        ret = super().get(key, callback=hedged_read.on_ok, errback=hedged_read.on_active_err, **kwargs)
+        if isinstance(ret, CouchbaseBaseException):
+            return ret
+        if not hedged_read.wait(hedge_after) and hedged_read.hedge():
+            ret = super().get_any_replica(key,
+                                          callback=hedged_read.on_ok,
+                                          errback=hedged_read.on_replica_err,
+                                          **replica_args)
+            if isinstance(ret, CouchbaseBaseException):
+                hedged_read.on_replica_err(ret)
+
+        return hedged_read.result()
+
     @BlockingWrapper.block_and_decode(GetResult)
     def _get_internal(
         self,
@@ -188,6 +227,7 @@ class Collection(CollectionLogic):
         """
         return super().get(key, **kwargs)
 
+    @timed_operation
     def get_any_replica(self,
                         key,  # type: str
                         *opts,  # type: GetAnyReplicaOptions
@@ -234,7 +274,7 @@ class Collection(CollectionLogic):
 
         """  # noqa: E501
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAnyReplicaOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -319,7 +359,7 @@ class Collection(CollectionLogic):
 
         """
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAllReplicasOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -659,6 +699,7 @@ class Collection(CollectionLogic):
         """
         return super().touch(key, expiry, *opts, **kwargs)
 
+    @timed_operation
     def get_and_touch(self,
                       key,  # type: str
                       expiry,  # type: timedelta
@@ -713,7 +754,7 @@ class Collection(CollectionLogic):
         """
         # add to kwargs for conversion to int
         kwargs["expiry"] = expiry
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAndTouchOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -733,6 +774,7 @@ class Collection(CollectionLogic):
         """
         return super().get_and_touch(key, **kwargs)
 
+    @timed_operation
     def get_and_lock(
         self,
         key,  # type: str
@@ -788,7 +830,7 @@ class Collection(CollectionLogic):
         """
         # add to kwargs for conversion to int
         kwargs["lock_time"] = lock_time
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=GetAndLockOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -850,6 +892,7 @@ class Collection(CollectionLogic):
         """
         return super().unlock(key, cas, *opts, **kwargs)
 
+    @timed_operation
     def lookup_in(
         self,
         key,  # type: str
@@ -907,7 +950,7 @@ class Collection(CollectionLogic):
                 print(f'Hotel {key} coordinates: {res.content_as[dict](0)}')
 
         """
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=LookupInOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -928,6 +971,7 @@ class Collection(CollectionLogic):
         """
         return super().lookup_in(key, spec, **kwargs)
 
+    @timed_operation
     def lookup_in_any_replica(
         self,
         key,  # type: str
@@ -987,7 +1031,7 @@ class Collection(CollectionLogic):
                 print(f'Hotel {key} coordinates: {res.content_as[dict](0)}')
 
         """  # noqa: E501
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=LookupInAnyReplicaOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -1091,7 +1135,7 @@ class Collection(CollectionLogic):
                         break
 
         """
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=LookupInAllReplicasOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             transcoder = self.default_transcoder
@@ -1216,7 +1260,7 @@ class Collection(CollectionLogic):
 
 
         """  # noqa: E501
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=ScanOptionsBase)
         transcoder = final_args.get('transcoder', None)
         if not transcoder:
             final_args['transcoder'] = self.default_transcoder
@@ -1864,79 +1908,6 @@ class Collection(CollectionLogic):
         """
         return self.list_size(key)
 
-    def _get_multi_mutation_transcoded_op_args(
-        self,
-        keys_and_docs,  # type: Dict[str, JSONType]
-        *opts,  # type: MutationMultiOptions
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool]:
-
-        if not isinstance(keys_and_docs, dict):
-            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
-
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
-
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-        per_key_args = final_args.pop('per_key_options', None)
-        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
-        op_args = {}
-        for key, value in keys_and_docs.items():
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                key_transcoder = per_key_args.pop('transcoder', op_transcoder)
-                op_args[key].update(per_key_args[key])
-                transcoded_value = key_transcoder.encode_value(value)
-            else:
-                transcoded_value = op_transcoder.encode_value(value)
-            op_args[key]['value'] = transcoded_value
-
-        if isinstance(opts_type, ReplaceMultiOptions):
-            for k, v in op_args.items():
-                expiry = v.get('expiry', None)
-                preserve_expiry = v.get('preserve_expiry', False)
-                if expiry and preserve_expiry is True:
-                    raise InvalidArgumentException(
-                        message=("The expiry and preserve_expiry options cannot "
-                                 f"both be set for replace operations.  Multi-op key: {k}.")
-                    )
-
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions
-
-    def _get_multi_op_args(
-        self,
-        keys,  # type: List[str]
-        *opts,  # type: NoValueMultiOptions
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool, Dict[str, Transcoder]]:
-        if not isinstance(keys, list):
-            raise InvalidArgumentException(message='Expected keys to be a list.')
-
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
-
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
-        per_key_args = final_args.pop('per_key_options', None)
-        op_args = {}
-        key_transcoders = {}
-        for key in keys:
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                key_transcoder = per_key_args.pop('transcoder', op_transcoder)
-                key_transcoders[key] = key_transcoder
-                op_args[key].update(per_key_args[key])
-            else:
-                key_transcoders[key] = op_transcoder
-
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions, key_transcoders
-
     def get_multi(self,
                   keys,  # type: List[str]
                   *opts,  # type: GetMultiOptions
@@ -2010,15 +1981,7 @@ class Collection(CollectionLogic):
             op_type=op_type,
             op_args=op_args
         )
-        for k, v in res.raw_result.items():
-            if k == 'all_okay':
-                continue
-            if isinstance(v, CouchbaseBaseException):
-                continue
-            value = v.raw_result.get('value', None)
-            flags = v.raw_result.get('flags', None)
-            tc = transcoders[k]
-            v.raw_result['value'] = decode_value(tc, value, flags)
+        decode_multi_values(transcoders, res)
 
         return MultiGetResult(res, return_exceptions)
 
@@ -2074,6 +2037,24 @@ class Collection(CollectionLogic):
                     else:
                         print(f'Active doc {k} has value: {v.content_as[dict]}')
 
+            Read each key from the preferred server group, falling back to any copy after 50ms::
+
+                from datetime import timedelta
+
+                from couchbase.options import GetAnyReplicaMultiOptions
+                from couchbase.replica_reads import ReadPreference
+
+                # ... other code ...
+
+                collection = bucket.default_collection()
+                keys = ['doc1', 'doc2', 'doc3']
+                opts = GetAnyReplicaMultiOptions(read_preference=ReadPreference.SELECTED_SERVER_GROUP,
+                                                 server_group_timeout=timedelta(milliseconds=50))
+                res = collection.get_any_replica_multi(keys, opts)
+                for k, v in res.results.items():
+                    if not v.from_preferred_server_group:
+                        print(f'Doc {k} was read from outside of the preferred server group.')
+
             Simple get_any_replica_multi operation, individual key options::
 
                 from datetime import timedelta
@@ -2099,20 +2080,22 @@ class Collection(CollectionLogic):
                                                                           opts_type=GetAnyReplicaMultiOptions,
                                                                           **kwargs)
         op_type = operations.GET_ANY_REPLICA.value
+        fallback_args = self._get_server_group_fallback_args(op_args)
         res = kv_multi_operation(
             **self._get_connection_args(),
             op_type=op_type,
             op_args=op_args
         )
-        for k, v in res.raw_result.items():
-            if k == 'all_okay':
-                continue
-            if isinstance(v, CouchbaseBaseException):
-                continue
-            value = v.raw_result.get('value', None)
-            flags = v.raw_result.get('flags', None)
-            tc = transcoders[k]
-            v.raw_result['value'] = decode_value(tc, value, flags)
+        if fallback_args:
+            retry_args = self._get_server_group_retry_args(res, fallback_args)
+            if retry_args:
+                retry_res = kv_multi_operation(
+                    **self._get_connection_args(),
+                    op_type=op_type,
+                    op_args=retry_args
+                )
+                self._merge_server_group_retry(res, retry_res)
+        decode_multi_values(transcoders, res)
 
         return MultiGetReplicaResult(res, return_exceptions)
 
@@ -2309,15 +2292,7 @@ class Collection(CollectionLogic):
             op_type=op_type,
             op_args=op_args
         )
-        for k, v in res.raw_result.items():
-            if k == 'all_okay':
-                continue
-            if isinstance(v, CouchbaseBaseException):
-                continue
-            value = v.raw_result.get('value', None)
-            flags = v.raw_result.get('flags', None)
-            tc = transcoders[k]
-            v.raw_result['value'] = decode_value(tc, value, flags)
+        decode_multi_values(transcoders, res)
 
         return MultiGetResult(res, return_exceptions)
 
@@ -2833,86 +2808,6 @@ class Collection(CollectionLogic):
 
         return output
 
-    def _get_multi_counter_op_args(
-        self,
-        keys,  # type: List[str]
-        *opts,  # type: Union[IncrementMultiOptions, DecrementMultiOptions]
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool]:
-        if not isinstance(keys, list):
-            raise InvalidArgumentException(message='Expected keys to be a list.')
-
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
-
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-
-        global_delta, global_initial = self._get_and_validate_delta_initial(final_args)
-        final_args['delta'] = int(global_delta)
-        final_args['initial'] = int(global_initial)
-
-        per_key_args = final_args.pop('per_key_options', None)
-        op_args = {}
-        for key in keys:
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                # need to validate delta/initial if provided per key
-                delta = per_key_args[key].get('delta', None)
-                initial = per_key_args[key].get('initial', None)
-                self._validate_delta_initial(delta=delta, initial=initial)
-                if delta:
-                    per_key_args[key]['delta'] = int(delta)
-                if initial:
-                    per_key_args[key]['initial'] = int(initial)
-                op_args[key].update(per_key_args[key])
-
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions
-
-    def _get_multi_binary_mutation_op_args(
-        self,
-        keys_and_docs,  # type: Dict[str, Union[str, bytes, bytearray]]
-        *opts,  # type: Union[AppendMultiOptions, PrependMultiOptions]
-        **kwargs,  # type: Any
-    ) -> Tuple[Dict[str, Any], bool]:
-
-        if not isinstance(keys_and_docs, dict):
-            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
-
-        opts_type = kwargs.pop('opts_type', None)
-        if not opts_type:
-            raise InvalidArgumentException(message='Expected options type is missing.')
-
-        parsed_keys_and_docs = {}
-        for k, v in keys_and_docs.items():
-            if isinstance(v, str):
-                value = v.encode("utf-8")
-            elif isinstance(v, bytearray):
-                value = bytes(v)
-            else:
-                value = v
-
-            if not isinstance(value, bytes):
-                raise ValueError(
-                    "The value provided must of type str, bytes or bytearray.")
-
-            parsed_keys_and_docs[k] = value
-
-        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
-        per_key_args = final_args.pop('per_key_options', None)
-        op_args = {}
-        for key, value in parsed_keys_and_docs.items():
-            op_args[key] = copy(final_args)
-            # per key args override global args
-            if per_key_args and key in per_key_args:
-                op_args[key].update(per_key_args[key])
-            op_args[key]['value'] = value
-
-        return_exceptions = final_args.pop('return_exceptions', True)
-        return op_args, return_exceptions
-
     def _append_multi(
         self,
         keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
@@ -3024,11 +2919,14 @@ from couchbase.logic.options import GetAnyReplicaOptionsBase  # nopep8 # isort:s
 from couchbase.logic.options import GetOptionsBase    # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import IncrementOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import InsertOptionsBase  # nopep8 # isort:skip # noqa: E402
+from couchbase.logic.options import LookupInAllReplicasOptionsBase  # nopep8 # isort:skip # noqa: E402
+from couchbase.logic.options import LookupInAnyReplicaOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import LookupInOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import OptionsTimeoutBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import PrependOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import RemoveOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import ReplaceOptionsBase  # nopep8 # isort:skip # noqa: E402
+from couchbase.logic.options import ScanOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import TouchOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import UnlockOptionsBase  # nopep8 # isort:skip # noqa: E402
 from couchbase.logic.options import UpsertOptionsBase  # nopep8 # isort:skip # noqa: E402
@@ -0,0 +1,252 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from threading import (Event,
+                       Lock,
+                       Thread)
+from typing import (TYPE_CHECKING,
+                    Dict,
+                    Optional,
+                    Union)
+
+from couchbase.exceptions import CouchbaseException, InvalidArgumentException
+from couchbase.options import (DecrementMultiOptions,
+                               DecrementOptions,
+                               DeltaValue,
+                               IncrementMultiOptions,
+                               IncrementOptions,
+                               SignedInt64)
+from couchbase.result import CounterResult
+
+if TYPE_CHECKING:
+    from couchbase.binary_collection import BinaryCollection
+
+log = logging.getLogger(__name__)
+
+
+class CounterBuffer:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Coalesces increments and decrements of counter documents on the client, per key, and applies the net delta of
+    each key with a single :meth:`~couchbase.binary_collection.BinaryCollection.increment_multi` (and
+    :meth:`~couchbase.binary_collection.BinaryCollection.decrement_multi`) every ``flush_interval``, or once
+    ``flush_threshold`` increments/decrements are pending.  Use
+    :meth:`~couchbase.binary_collection.BinaryCollection.buffered_counters` to create one.
+
+    The pending deltas are flushed when the buffer is closed (explicitly, when leaving its context or when its cluster
+    is closed).  Deltas not yet flushed are lost if the process exits without closing the buffer, and the deltas
+    of keys whose flush failed are not retried (the failure is logged, see :meth:`.flush`).
+
+    .. note::
+        Counter values are only updated on the server when the buffer is flushed, the values returned by other reads
+        in the meantime do not include the pending deltas (see :meth:`.pending`).
+    """
+
+    def __init__(self,
+                 binary_collection,  # type: BinaryCollection
+                 flush_interval=timedelta(seconds=1),  # type: Optional[timedelta]
+                 flush_threshold=10000,  # type: Optional[int]
+                 initial=None,  # type: Optional[SignedInt64]
+                 timeout=None,  # type: Optional[timedelta]
+                 ):
+        if flush_interval is not None and (not isinstance(flush_interval, timedelta)
+                                           or flush_interval.total_seconds() <= 0):
+            raise InvalidArgumentException(message='Expected flush_interval to be a positive timedelta.')
+        if flush_threshold is not None and (not isinstance(flush_threshold, int) or flush_threshold < 1):
+            raise InvalidArgumentException(message='Expected flush_threshold to be a positive int.')
+        if initial is not None and not isinstance(initial, SignedInt64):
+            raise InvalidArgumentException(message='Expected initial to be a SignedInt64.')
+        self._binary_collection = binary_collection
+        self._flush_interval = flush_interval
+        self._flush_threshold = flush_threshold
+        # a missing counter is created with the initial value and the delta is ignored, so the initial value of
+        # each key is offset by its delta in order not to lose the deltas flushed into missing counters
+        self._initial = int(initial) if initial is not None else 0
+        self._op_opts = {}
+        if initial is not None:
+            self._op_opts['initial'] = initial
+        if timeout is not None:
+            self._op_opts['timeout'] = timeout
+        self._pending = {}  # type: Dict[str, int]
+        self._pending_ops = 0
+        self._lock = Lock()
+        # serializes flushes, so a flush returns once all of the deltas pending when it was called are applied
+        self._flush_lock = Lock()
+        self._wake = Event()
+        self._closed = False
+        self._flusher = None  # type: Optional[Thread]
+        binary_collection._collection._scope._bucket._cluster._write_buffers.add(self)
+
+    @property
+    def closed(self) -> bool:
+        """
+            bool: True if the buffer has been closed.
+        """
+        return self._closed
+
+    def increment(self,
+                  key,  # type: str
+                  delta=1,  # type: Optional[int]
+                  ) -> None:
+        """Adds a delta to the counter document specified by the key, applied on the next flush.
+
+        Args:
+            key (str): The key of the counter document.
+            delta (int, optional): The amount to increment the counter by.  Defaults to 1.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the delta is not a non-negative int.
+            RuntimeError: If the buffer has been closed.
+        """
+        if not isinstance(delta, int) or delta < 0:
+            raise InvalidArgumentException(message='Expected delta to be a non-negative int.')
+        self._add(key, delta)
+
+    def decrement(self,
+                  key,  # type: str
+                  delta=1,  # type: Optional[int]
+                  ) -> None:
+        """Subtracts a delta from the counter document specified by the key, applied on the next flush.
+
+        Args:
+            key (str): The key of the counter document.
+            delta (int, optional): The amount to decrement the counter by.  Defaults to 1.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the delta is not a non-negative int.
+            RuntimeError: If the buffer has been closed.
+        """
+        if not isinstance(delta, int) or delta < 0:
+            raise InvalidArgumentException(message='Expected delta to be a non-negative int.')
+        self._add(key, -delta)
+
+    def pending(self) -> Dict[str, int]:
+        """Returns the deltas that have not been flushed yet.
+
+        Returns:
+            Dict[str, int]: The net pending delta, per key (negative if the counter is to be decremented).
+        """
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> Dict[str, Union[CounterResult, CouchbaseException]]:
+        """Applies the pending deltas, blocking until they have been applied.
+
+        Keys whose net delta is zero are not sent to the server.
+
+        Returns:
+            Dict[str, Union[:class:`~couchbase.result.CounterResult`, :class:`~couchbase.exceptions.CouchbaseException`]]:
+            The result of each key that was flushed, or the exception its flush failed with.
+        """  # noqa: E501
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending
+                self._pending = {}
+                self._pending_ops = 0
+            return self._apply(pending)
+
+    def close(self) -> None:
+        """Stops the background flushes and flushes the pending deltas.  Further increments/decrements raise.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            flusher = self._flusher
+        self._wake.set()
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+
+    def _add(self, key, delta):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Cannot update a closed CounterBuffer.')
+            self._pending[key] = self._pending.get(key, 0) + delta
+            self._pending_ops += 1
+            if self._flusher is None:
+                self._flusher = Thread(target=self._run, name='pycbc-counter-buffer', daemon=True)
+                self._flusher.start()
+            wake = self._flush_threshold is not None and self._pending_ops >= self._flush_threshold
+        if wake:
+            self._wake.set()
+
+    def _run(self):
+        timeout = self._flush_interval.total_seconds() if self._flush_interval is not None else None
+        while True:
+            self._wake.wait(timeout)
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception:  # nosec
+                log.exception('Unable to flush the counter buffer.')
+
+    def _apply(self,
+               pending,  # type: Dict[str, int]
+               ) -> Dict[str, Union[CounterResult, CouchbaseException]]:
+        results = {}
+        increments = {k: v for k, v in pending.items() if v > 0}
+        decrements = {k: -v for k, v in pending.items() if v < 0}
+        for deltas, fn, multi_opts, key_opts in ((increments,
+                                                  self._binary_collection.increment_multi,
+                                                  IncrementMultiOptions,
+                                                  IncrementOptions),
+                                                 (decrements,
+                                                  self._binary_collection.decrement_multi,
+                                                  DecrementMultiOptions,
+                                                  DecrementOptions)):
+            if not deltas:
+                continue
+            per_key_options = {k: self._key_options(key_opts, v, key_opts is IncrementOptions)
+                               for k, v in deltas.items()}
+            try:
+                res = fn(list(deltas.keys()),
+                         multi_opts(per_key_options=per_key_options, return_exceptions=True, **self._op_opts))
+            except CouchbaseException as ex:
+                results.update({k: ex for k in deltas})
+                continue
+            results.update(res.results)
+            results.update(res.exceptions)
+        failed = {k: pending[k] for k, v in results.items() if isinstance(v, Exception)}
+        if failed:
+            log.warning('Unable to flush the deltas of %d counter(s): %s', len(failed), failed)
+        return results
+
+    def _key_options(self,
+                     key_opts,  # type: type
+                     delta,  # type: int
+                     is_increment,  # type: bool
+                     ) -> Union[IncrementOptions, DecrementOptions]:
+        if self._initial < 0:
+            # a negative initial value means missing counters are not created
+            return key_opts(delta=DeltaValue(delta))
+        # counters are unsigned, decrementing a counter stops at 0
+        initial = self._initial + delta if is_increment else max(self._initial - delta, 0)
+        return key_opts(delta=DeltaValue(delta), initial=SignedInt64(initial))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'CounterBuffer(pending={len(self._pending)}, closed={self._closed})'
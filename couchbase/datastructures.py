@@ -29,14 +29,17 @@ from couchbase.exceptions import (CasMismatchException,
                                   PathNotFoundException,
                                   QueueEmpty,
                                   UnAmbiguousTimeoutException)
+from couchbase.logic.datastructures import CasRetryBackoff
 from couchbase.logic.wrappers import BlockingWrapper
 from couchbase.options import MutateInOptions
+from couchbase.result import LookupInResult
 from couchbase.subdocument import (array_addunique,
                                    array_append,
                                    array_prepend,
                                    count)
 from couchbase.subdocument import exists as subdoc_exists
 from couchbase.subdocument import get as subdoc_get
+from couchbase.subdocument import get_full as subdoc_get_full
 from couchbase.subdocument import (remove,
                                    replace,
                                    upsert)
@@ -393,6 +396,13 @@ class CouchbaseSet:
         """
         return self._collection.get(self._key)
 
+    @BlockingWrapper.datastructure_op(create_type=list)
+    def _get_for_update(self) -> LookupInResult:
+        """
+        Get the entire set (and its CAS) w/ a sub-document lookup.
+        """
+        return self._collection.lookup_in(self._key, (subdoc_get_full(),))
+
     @BlockingWrapper.datastructure_op(create_type=list)
     def add(self,
             value  # type: Any
@@ -427,17 +437,10 @@ class CouchbaseSet:
 
         """
 
-        if timeout is None:
-            timeout = timedelta(seconds=10)
-
-        timeout_millis = timeout.total_seconds() * 1000
-
-        interval_millis = float(50)
-        start = time.perf_counter()
-        time_left = timeout_millis
+        backoff = CasRetryBackoff(timeout)
         while True:
-            sd_res = self._get()
-            list_ = sd_res.content_as[list]
+            sd_res = self._get_for_update()
+            list_ = sd_res.value[0].get('value', None) or []
             val_idx = -1
             for idx, v in enumerate(list_):
                 if v == value:
@@ -454,18 +457,11 @@ class CouchbaseSet:
             else:
                 break
 
-            interval_millis += 500
-            if interval_millis > 1000:
-                interval_millis = 1000
-
-            time_left = timeout_millis - ((time.perf_counter() - start) * 1000)
-            if interval_millis > time_left:
-                interval_millis = time_left
-
-            if time_left <= 0:
+            delay = backoff.next_delay()
+            if delay is None:
                 raise UnAmbiguousTimeoutException(message=f"Unable to remove {value} from the CouchbaseSet.")
 
-            time.sleep(interval_millis / 1000)
+            time.sleep(delay)
 
     @BlockingWrapper.datastructure_op(create_type=list)
     def contains(self,
@@ -568,14 +564,7 @@ class CouchbaseQueue:
             Any: The value that was removed from the front of the queue.
         """
 
-        if timeout is None:
-            timeout = timedelta(seconds=10)
-
-        timeout_millis = timeout.total_seconds() * 1000
-
-        interval_millis = float(50)
-        start = time.perf_counter()
-        time_left = timeout_millis
+        backoff = CasRetryBackoff(timeout)
         while True:
             try:
                 op = subdoc_get('[-1]')
@@ -589,18 +578,11 @@ class CouchbaseQueue:
                 except CasMismatchException:
                     pass
 
-                interval_millis += 500
-                if interval_millis > 1000:
-                    interval_millis = 1000
-
-                time_left = timeout_millis - ((time.perf_counter() - start) * 1000)
-                if interval_millis > time_left:
-                    interval_millis = time_left
-
-                if time_left <= 0:
+                delay = backoff.next_delay()
+                if delay is None:
                     raise UnAmbiguousTimeoutException(message="Unable to pop from the CouchbaseQueue.")
 
-                time.sleep(interval_millis / 1000)
+                time.sleep(delay)
             except PathNotFoundException:
                 raise QueueEmpty('No items to remove from the queue')
 
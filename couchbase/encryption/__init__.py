@@ -18,4 +18,5 @@ from .decrypter import Decrypter  # noqa: F401
 from .encrypter import Encrypter  # noqa: F401
 from .encryption_result import EncryptionResult  # noqa: F401
 from .key import Key  # noqa: F401
+from .keyring import CachingKeyring  # noqa: F401
 from .keyring import Keyring  # noqa: F401
@@ -14,7 +14,9 @@
 #  limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import (List,
+                    Optional,
+                    Union)
 
 
 class CryptoManager(ABC):
@@ -61,6 +63,47 @@ class CryptoManager(ABC):
         """
         pass
 
+    def encrypt_many(self,
+                     plaintexts,  # type: List[Union[str, bytes, bytearray]]
+                     encrypter_alias=None,  # type: Optional[str]
+                     ) -> List[dict]:
+        """Encrypts each of the given plaintexts using the given encrypter alias.
+
+        The default implementation calls :meth:`encrypt` for each plaintext.  Implementations can override this
+        method in order to encrypt all the plaintexts in a single pass (i.e. resolving the encrypter and key once).
+
+        Args:
+            plaintexts (List[Union[str, bytes, bytearray]]): Inputs to be encrypted
+            encrypter_alias (str, optional):  Alias of encrypter to use, if None, default alias is used.
+
+        Returns:
+            List[Dict]: A :class:`~couchbase.encryption.EncryptionResult` as a dict for each plaintext, in the same
+            order as the provided plaintexts.
+
+        Raises:
+            :class:`~couchbase.exceptions.EncryptionFailureException`
+        """
+        return [self.encrypt(p, encrypter_alias) for p in plaintexts]
+
+    def decrypt_many(self,
+                     encrypted,  # type: List[dict]
+                     ) -> List[bytes]:
+        """Decrypts each of the given encrypted results.
+
+        The default implementation calls :meth:`decrypt` for each encrypted result.  Implementations can override
+        this method in order to decrypt all the encrypted results in a single pass.
+
+        Args:
+            encrypted (List[Dict]): Dicts containing encryption information, each must have an 'alg' key.
+
+        Returns:
+            List[bytes]: The decrypted results, in the same order as the provided encrypted results.
+
+        Raises:
+            :class:`~couchbase.exceptions.DecryptionFailureException`
+        """
+        return [self.decrypt(e) for e in encrypted]
+
     @abstractmethod
     def mangle(self,
                field_name,  # type: str
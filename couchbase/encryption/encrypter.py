@@ -13,10 +13,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from couchbase.encryption import EncryptionResult, Keyring
+if TYPE_CHECKING:
+    from couchbase.encryption import EncryptionResult, Keyring
 
 
 class Encrypter(ABC):
@@ -13,10 +13,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import annotations
+
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from threading import Lock
+from typing import (TYPE_CHECKING,
+                    Dict,
+                    Optional,
+                    Tuple)
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+
     from couchbase.encryption import Key
 
 
@@ -37,3 +46,65 @@ class Keyring(ABC):
         Raises:
             :raises :class:`~couchbase.exceptions.CryptoKeyNotFoundException`
         """
+
+
+class CachingKeyring(Keyring):
+    """A :class:`~couchbase.encryption.Keyring` that caches the keys returned by another keyring.
+
+    Looking up (or deriving) a key can be expensive, for example when the underlying keyring reads keys from a
+    key management service.  The CachingKeyring only asks the wrapped keyring for a key the first time the key
+    is requested, or once the cached key has expired.
+
+    Args:
+        keyring (:class:`~couchbase.encryption.Keyring`): The keyring to retrieve keys from.
+        ttl (timedelta, optional): How long a key is cached for.  If not provided, keys are cached until
+            :meth:`clear` is called.
+    """
+
+    def __init__(self,
+                 keyring,  # type: Keyring
+                 ttl=None,  # type: Optional[timedelta]
+                 ):
+        self._keyring = keyring
+        self._ttl = ttl.total_seconds() if ttl is not None else None
+        self._keys = {}  # type: Dict[str, Tuple[Key, Optional[float]]]
+        self._lock = Lock()
+
+    def get_key(self,
+                key_id,  # type: str
+                ) -> Key:
+        """Returns requested key, retrieving it from the wrapped keyring if it is not cached.
+
+        Args:
+            keyid (str): Key ID to retrieve
+
+        Returns:
+            :class:`~couchbase.encryption.Key`: The corresponding :class:`~couchbase.encryption.Key`
+            of the provided key_id.
+
+        Raises:
+            :raises :class:`~couchbase.exceptions.CryptoKeyNotFoundException`
+        """
+        cached = self._keys.get(key_id, None)
+        if cached is not None and (cached[1] is None or cached[1] > time.monotonic()):
+            return cached[0]
+
+        key = self._keyring.get_key(key_id)
+        expires = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._keys[key_id] = (key, expires)
+        return key
+
+    def clear(self,
+              key_id=None,  # type: Optional[str]
+              ) -> None:
+        """Removes keys from the cache.
+
+        Args:
+            key_id (str, optional): The ID of the key to remove.  If not provided, all keys are removed.
+        """
+        with self._lock:
+            if key_id is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(key_id, None)
@@ -1762,8 +1762,8 @@ class CryptoException(CouchbaseException):
                  message="Generic Cryptography exception", **kwargs):
         params = params or {}
         param_dict = params.get("objextra") or defaultdict(lambda: "unknown")
-        params["message"] = Template(message).safe_substitute(**param_dict)
-        super(CryptoException, self).__init__(params=params, **kwargs)
+        message = Template(message).safe_substitute(**param_dict)
+        super(CryptoException, self).__init__(message=message, **kwargs)
 
 
 class EncryptionFailureException(CryptoException):
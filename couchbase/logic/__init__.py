@@ -14,5 +14,8 @@
 #  limitations under the License.
 
 from .wrappers import BlockingWrapper  # noqa: F401
+from .wrappers import HedgedRead  # noqa: F401
+from .wrappers import attach_timings  # noqa: F401
+from .wrappers import decode_multi_values  # noqa: F401
 from .wrappers import decode_replicas  # noqa: F401
 from .wrappers import decode_value  # noqa: F401
@@ -0,0 +1,177 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import (Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import InvalidArgumentException
+from couchbase.transcoder import Transcoder
+
+
+class EncodedValueTranscoder(Transcoder):
+    """**INTERNAL**
+
+    Passes through the (value, flags) tuples the batching writers encode when a write is queued, so each value is
+    only encoded once (and its encoded size counts towards the batch's bytes).  Decoding is delegated to the
+    transcoder the values were encoded with.
+    """
+
+    def __init__(self,
+                 transcoder,  # type: Transcoder
+                 ):
+        self._transcoder = transcoder
+
+    def encode_value(self,
+                     value  # type: Tuple[bytes, int]
+                     ) -> Tuple[bytes, int]:
+        return value
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags  # type: int
+                     ) -> Any:
+        return self._transcoder.decode_value(value, flags)
+
+
+class PendingWrite:
+    """**INTERNAL**
+
+    The coalesced write of a key:  the latest value and the future shared by all of the writes to the key since
+    the last flush.  The write is an upsert if any of the coalesced writes was an upsert.
+    """
+
+    __slots__ = ('value', 'is_upsert', 'future')
+
+    def __init__(self,
+                 value,  # type: Tuple[bytes, int]
+                 is_upsert,  # type: bool
+                 future,  # type: Any
+                 ):
+        self.value = value
+        self.is_upsert = is_upsert
+        self.future = future
+
+
+class BatchingWriterLogic:
+    """**INTERNAL**
+
+    Coalesces the writes of a batching writer, per key, and tracks the batch's thresholds.  Not thread safe, the
+    blocking writer serializes access to it.
+    """
+
+    def __init__(self,
+                 collection,  # type: Any
+                 max_batch_size=1000,  # type: Optional[int]
+                 max_batch_bytes=4 * 1024 * 1024,  # type: Optional[int]
+                 flush_interval=timedelta(milliseconds=100),  # type: Optional[timedelta]
+                 transcoder=None,  # type: Optional[Transcoder]
+                 expiry=None,  # type: Optional[timedelta]
+                 timeout=None,  # type: Optional[timedelta]
+                 ):
+        if max_batch_size is not None and (not isinstance(max_batch_size, int) or max_batch_size < 1):
+            raise InvalidArgumentException(message='Expected max_batch_size to be a positive int.')
+        if max_batch_bytes is not None and (not isinstance(max_batch_bytes, int) or max_batch_bytes < 1):
+            raise InvalidArgumentException(message='Expected max_batch_bytes to be a positive int.')
+        if flush_interval is not None and (not isinstance(flush_interval, timedelta)
+                                           or flush_interval.total_seconds() <= 0):
+            raise InvalidArgumentException(message='Expected flush_interval to be a positive timedelta.')
+        if transcoder is not None and not isinstance(transcoder, Transcoder):
+            raise InvalidArgumentException(message='Expected transcoder to be a Transcoder.')
+        self._collection = collection
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._flush_interval = flush_interval
+        self._transcoder = transcoder or collection.default_transcoder
+        self._op_opts = {'transcoder': EncodedValueTranscoder(self._transcoder)}
+        if expiry is not None:
+            self._op_opts['expiry'] = expiry
+        if timeout is not None:
+            self._op_opts['timeout'] = timeout
+        self._pending = {}  # type: Dict[str, PendingWrite]
+        self._pending_bytes = 0
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """
+            bool: True if the writer has been closed.
+        """
+        return self._closed
+
+    def pending(self) -> List[str]:
+        """Returns the keys whose writes have not been flushed yet.
+
+        Returns:
+            List[str]: The pending keys.
+        """
+        return list(self._pending.keys())
+
+    def _queue_write(self,
+                     key,  # type: str
+                     value,  # type: Any
+                     is_upsert,  # type: bool
+                     create_future,  # type: Any
+                     ) -> Tuple[Any, bool]:
+        """**INTERNAL**
+
+        Queues the write, returning the key's future and whether the batch reached one of its size thresholds.
+        """
+        if self._closed:
+            raise RuntimeError('Cannot write through a closed batching writer.')
+        if not isinstance(key, str):
+            raise InvalidArgumentException(message='Expected key to be a str.')
+        encoded = self._transcoder.encode_value(value)
+        write = self._pending.get(key, None)
+        if write is None:
+            write = PendingWrite(encoded, is_upsert, create_future())
+            self._pending[key] = write
+        else:
+            self._pending_bytes -= len(write.value[0])
+            write.value = encoded
+            write.is_upsert = write.is_upsert or is_upsert
+        self._pending_bytes += len(encoded[0])
+        full = ((self._max_batch_size is not None and len(self._pending) >= self._max_batch_size)
+                or (self._max_batch_bytes is not None and self._pending_bytes >= self._max_batch_bytes))
+        return write.future, full
+
+    def _take_batch(self) -> Dict[str, PendingWrite]:
+        """**INTERNAL**
+        """
+        batch = self._pending
+        self._pending = {}
+        self._pending_bytes = 0
+        return batch
+
+    @staticmethod
+    def _split_batch(batch  # type: Dict[str, PendingWrite]
+                     ) -> Tuple[Dict[str, Tuple[bytes, int]], Dict[str, Tuple[bytes, int]]]:
+        """**INTERNAL**
+
+        Splits the batch into its upserts and its replaces.
+        """
+        upserts = {}
+        replaces = {}
+        for key, write in batch.items():
+            if write.is_upsert:
+                upserts[key] = write.value
+            else:
+                replaces[key] = write.value
+        return upserts, replaces
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import weakref
 from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
@@ -20,6 +21,7 @@ from typing import (TYPE_CHECKING,
 
 from couchbase.diagnostics import ServiceType
 from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.options import PingOptionsBase
 from couchbase.options import forward_args
 from couchbase.pycbc_core import (diagnostics_operation,
                                   open_or_close_bucket,
@@ -33,11 +35,17 @@ if TYPE_CHECKING:
 
 
 class BucketLogic:
+
+    _native_connection = None
+    _reopen_pending = False
+
     def __init__(self, cluster, bucket_name):
         self._cluster = cluster
         self._connection = cluster.connection
         self._bucket_name = bucket_name
         self._connected = False
+        self._fork_dependents = weakref.WeakSet()
+        cluster._fork_dependents.add(self)
 
     @property
     def connection(self):
@@ -46,6 +54,26 @@ class BucketLogic:
         """
         return self._connection
 
+    @property
+    def _connection(self):
+        # a bucket inherited by a child process via fork() is reopened on first use
+        if self._reopen_pending is True:
+            self._reopen_pending = False
+            try:
+                self._reconnect_after_fork_in_child()
+            except Exception:
+                self._reopen_pending = True
+                raise
+        return self._native_connection
+
+    @_connection.setter
+    def _connection(self, conn):
+        self._native_connection = conn
+
+    @_connection.deleter
+    def _connection(self):
+        self.__dict__.pop('_native_connection', None)
+
     @property
     def streaming_timeouts(self):
         """
@@ -100,6 +128,24 @@ class BucketLogic:
         del self._cluster
         del self._connection
 
+    def _after_fork_in_child(self):
+        """**INTERNAL**
+
+        Called in a child process after ``fork()``, the inherited connection is owned by the cluster.  Clears the
+        connection cached by the bucket and its dependents and, if the cluster reconnects after fork, marks the bucket
+        to be reopened on its first use.
+        """
+        self._connection = None
+        self._reopen_pending = hasattr(self, '_cluster') and self._cluster._reconnect_after_fork is True
+        for dependent in list(self._fork_dependents):
+            dependent._after_fork_in_child()
+
+    def _reconnect_after_fork_in_child(self):
+        """**INTERNAL**
+
+        Reopens the bucket after ``fork()``.  Only supported by the blocking API.
+        """
+
     def ping(self,
              *opts,  # type: PingOptions
              **kwargs  # type: Dict[str,Any]
@@ -118,7 +164,7 @@ class BucketLogic:
         if errback:
             ping_kwargs['errback'] = errback
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=PingOptionsBase)
         service_types = final_args.get("service_types", None)
         if not service_types:
             service_types = list(
@@ -16,10 +16,14 @@
 from __future__ import annotations
 
 import logging
+import os
 import warnings
+import weakref
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
                     Dict,
+                    Iterable,
                     List,
                     Optional,
                     Tuple,
@@ -30,6 +34,7 @@ from couchbase import USER_AGENT_EXTRA
 from couchbase.auth import CertificateAuthenticator, PasswordAuthenticator
 from couchbase.diagnostics import ServiceType
 from couchbase.exceptions import InvalidArgumentException
+from couchbase.logic.options import DiagnosticsOptionsBase, PingOptionsBase
 from couchbase.options import (ClusterOptions,
                                ClusterTimeoutOptions,
                                ClusterTracingOptions,
@@ -37,6 +42,7 @@ from couchbase.options import (ClusterOptions,
                                TransactionConfig,
                                forward_args,
                                get_valid_args)
+from couchbase.prepared_statements import DEFAULT_MAX_SIZE, PreparedStatementCache
 from couchbase.pycbc_core import (close_connection,
                                   cluster_mgmt_operations,
                                   create_connection,
@@ -49,16 +55,66 @@ from couchbase.result import (ClusterInfoResult,
                               DiagnosticsResult,
                               PingResult)
 from couchbase.serializer import DefaultJsonSerializer, Serializer
+from couchbase.threshold_reports import (ThresholdReport,
+                                         ThresholdReportCollector,
+                                         subscribe_threshold_reports)
+from couchbase.timeouts import DEFAULT_KV_DURABLE_TIMEOUT, DEFAULT_KV_TIMEOUT
+from couchbase.timings import OperationTimingsRecorder
 from couchbase.transcoder import JSONTranscoder, Transcoder
 
 if TYPE_CHECKING:
+    from datetime import timedelta
+
     from couchbase.options import DiagnosticsOptions, PingOptions
 
 log = logging.getLogger(__name__)
 
 
+class ForkHandler:
+    """**INTERNAL**
+
+    Handles cluster instances that have been inherited by a child process via ``fork()``.
+
+    The C++ client's IO threads do not survive ``fork()``, so any native state inherited from the parent cannot be
+    used, closed or destroyed in the child (closing a connection waits on its IO threads).  Instead, the inherited
+    native state is orphaned for the lifetime of the child process and, if enabled via the ``reconnect_after_fork``
+    cluster option, the cluster is marked to reconnect, using its already parsed configuration, on its first use in
+    the child.  Nothing blocking is done in the ``fork()`` hook itself.
+    """
+
+    _clusters = weakref.WeakSet()
+    _inherited_native_state = []
+    _registered = False
+
+    @classmethod
+    def register(cls, cluster  # type: ClusterLogic
+                 ) -> None:
+        if not hasattr(os, 'register_at_fork'):
+            return
+        if cls._registered is False:
+            os.register_at_fork(after_in_child=cls._after_fork_in_child)
+            cls._registered = True
+        cls._clusters.add(cluster)
+
+    @classmethod
+    def orphan(cls, *native_state  # type: Any
+               ) -> None:
+        cls._inherited_native_state.extend(s for s in native_state if s is not None)
+
+    @classmethod
+    def _after_fork_in_child(cls) -> None:
+        for cluster in list(cls._clusters):
+            try:
+                cluster._after_fork_in_child()
+            except Exception:
+                log.exception('Unable to reinitialize cluster after fork.')
+
+
 class ClusterLogic:
 
+    _native_connection = None
+    _reconnect_pending = False
+
     _LEGACY_CONNSTR_QUERY_ARGS = {
         'ssl': {'tls_verify': TLSVerifyMode.to_str},
         'certpath': {'cert_path': lambda x: x},
@@ -155,9 +211,23 @@ class ClusterLogic:
         if not self._default_transcoder:
             self._default_transcoder = JSONTranscoder()
 
+        self._reconnect_after_fork = cluster_opts.pop('reconnect_after_fork', False)
+        self._adaptive_timeouts = cluster_opts.pop('adaptive_timeouts', None)
+        self._operation_timings = None
+        if cluster_opts.pop('enable_operation_timings', False):
+            self._operation_timings = OperationTimingsRecorder()
+        self._threshold_reports = None
+        if cluster_opts.pop('enable_threshold_reports', False):
+            self._enable_threshold_reports()
+        self._prepared_statement_cache = PreparedStatementCache(
+            cluster_opts.pop('prepared_statement_cache_size', DEFAULT_MAX_SIZE))
+        self._fork_dependents = weakref.WeakSet()
+
         cluster_opts['user_agent_extra'] = USER_AGENT_EXTRA
 
         self._cluster_opts = cluster_opts
+        self._kv_timeouts = (timeout_opts.get('key_value_timeout', DEFAULT_KV_TIMEOUT),
+                             timeout_opts.get('key_value_durable_timeout', DEFAULT_KV_DURABLE_TIMEOUT))
         self._streaming_timeouts = dict(
             analytics_timeout=timeout_opts.get('analytics_timeout', None),
             query_timeout=timeout_opts.get('query_timeout', None),
@@ -167,6 +237,7 @@ class ClusterLogic:
         self._connection = None
         self._cluster_info = None
         self._server_version = None
+        ForkHandler.register(self)
 
     def __del__(self):
         self._destroy_connection()
@@ -176,10 +247,24 @@ class ClusterLogic:
         """
         **INTERNAL**
         """
-        if not hasattr(self, "_connection"):
-            self._connection = None
         return self._connection
 
+    @property
+    def _connection(self):
+        # a cluster inherited by a child process via fork() reconnects on first use
+        if self._reconnect_pending is True:
+            self._reconnect_pending = False
+            try:
+                self._reconnect_after_fork_in_child()
+            except Exception:
+                self._reconnect_pending = True
+                raise
+        return self._native_connection
+
+    @_connection.setter
+    def _connection(self, conn):
+        self._native_connection = conn
+
     @property
     def default_transcoder(self) -> Optional[Transcoder]:
         """
@@ -248,6 +333,114 @@ class ClusterLogic:
         """
         return self._streaming_timeouts
 
+    @property
+    def prepared_statement_cache(self) -> PreparedStatementCache:
+        """**VOLATILE** This API is subject to change at any time.
+
+            :class:`~couchbase.prepared_statements.PreparedStatementCache`: The cache of the statements prepared via
+            :meth:`.prepare_statements`, used by the prepared queries (:class:`~couchbase.options.QueryOptions`
+            ``adhoc=False``) issued through this cluster and its scopes.
+        """
+        return self._prepared_statement_cache
+
+    def operation_timings(self,
+                          reset=False,  # type: Optional[bool]
+                          ) -> Dict[str, Dict[str, Any]]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Returns the client-side latency breakdown of the key-value operations issued through this cluster,
+        aggregated per operation.  Requires :class:`~couchbase.options.ClusterOptions` ``enable_operation_timings``,
+        otherwise no operations are timed and an empty dict is returned.
+
+        Each operation maps to its ``count`` and, for each phase it went through (see
+        :class:`~couchbase.timings.OperationTimings`), the phase's ``mean_us`` and ``max_us``.
+
+        Args:
+            reset (bool, optional): Set to True to reset the aggregates once they have been returned.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The aggregated timings, keyed by operation.
+        """
+        if self._operation_timings is None:
+            return {}
+        return self._operation_timings.summary(reset=reset)
+
+    def threshold_reports(self,
+                          clear=True,  # type: Optional[bool]
+                          ) -> List[ThresholdReport]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Returns the threshold logging tracer's reports received since the last call, oldest first.  Requires
+        :class:`~couchbase.options.ClusterOptions` ``enable_threshold_reports`` (or a callback registered via
+        :meth:`.on_threshold_report`), otherwise no reports are collected and an empty list is returned.
+
+        .. note::
+            The C++ client only emits its reports through its logger, so logging must be configured via
+            :func:`couchbase.configure_logging` at ``logging.WARNING`` or below.  The reports are process-wide,
+            each cluster collecting them receives all of them.  They are never dropped by the logger's
+            ``rate_limit`` or ``sample_rates``, but a buffered logger drops them, like any record, while its queue is
+            full.
+
+        Args:
+            clear (bool, optional): Set to False to keep the returned reports queued.
+
+        Returns:
+            List[:class:`~couchbase.threshold_reports.ThresholdReport`]: The queued reports.
+        """
+        if self._threshold_reports is None:
+            return []
+        return self._threshold_reports.reports(clear=clear)
+
+    def on_threshold_report(self,
+                            callback,  # type: Callable[[ThresholdReport], None]
+                            ) -> None:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Registers a callback called with each :class:`~couchbase.threshold_reports.ThresholdReport` as it is
+        emitted, enabling report collection if needed.  The callback is called from the C++ client's logging
+        thread and must not block.
+
+        Args:
+            callback (Callable[[:class:`~couchbase.threshold_reports.ThresholdReport`], None]): The callback.
+
+        Raises:
+            :class:`~couchbase.exceptions.InvalidArgumentException`: If the callback is not callable.
+        """
+        if not callable(callback):
+            raise InvalidArgumentException(message='The threshold report callback must be callable.')
+        self._enable_threshold_reports().add_callback(callback)
+
+    def _get_prepare_statements_args(self,
+                                     statements,  # type: Iterable[str]
+                                     query_context=None,  # type: Optional[str]
+                                     timeout=None,  # type: Optional[timedelta]
+                                     max_concurrency=16,  # type: Optional[int]
+                                     ) -> Tuple[List[str], Dict[str, Any]]:
+        """**INTERNAL**
+
+        Validates the arguments of ``prepare_statements()``, returning the (deduplicated) statements and the options
+        of their ``PREPARE`` queries.
+        """
+        if isinstance(statements, str):
+            statements = [statements]
+        statements = list(dict.fromkeys(statements))
+        if not all(isinstance(s, str) and s.strip() for s in statements):
+            raise InvalidArgumentException(message='Expected statements to be non-empty str.')
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise InvalidArgumentException(message='Expected max_concurrency to be a positive int.')
+        query_opts = {'adhoc': True}
+        if query_context is not None:
+            query_opts['query_context'] = query_context
+        if timeout is not None:
+            query_opts['timeout'] = timeout
+        return statements, query_opts
+
+    def _enable_threshold_reports(self) -> ThresholdReportCollector:
+        if self._threshold_reports is None:
+            self._threshold_reports = ThresholdReportCollector()
+            subscribe_threshold_reports(self._threshold_reports)
+        return self._threshold_reports
+
     def _parse_connection_string(self, connection_str  # type: str
                                  ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
         """Parse the provided connection string
@@ -437,6 +630,30 @@ class ClusterLogic:
         if hasattr(self, '_connection'):
             self._connection = None
 
+    def _after_fork_in_child(self):
+        """**INTERNAL**
+
+        Called in a child process after ``fork()``.  Orphans the native state inherited from the parent, clears the
+        connection cached by each dependent (buckets, scopes and collections) and, if enabled, marks the cluster to
+        reconnect on its first use.
+        """
+        if self._native_connection is None:
+            return
+
+        ForkHandler.orphan(self._native_connection, self._transactions)
+        self._connection = None
+        self._transactions = None
+        self._reconnect_pending = self._reconnect_after_fork is True
+        for dependent in list(self._fork_dependents):
+            dependent._after_fork_in_child()
+
+    def _reconnect_after_fork_in_child(self):
+        """**INTERNAL**
+
+        Reconnects the cluster on its first use after ``fork()``.  Only supported by the blocking API.
+        """
+        log.warning('Reconnecting after fork is not supported by this API. The cluster has been disconnected.')
+
     def _get_cluster_info(self, **kwargs) -> Optional[ClusterInfoResult]:
 
         cluster_info_kwargs = {
@@ -496,7 +713,7 @@ class ClusterLogic:
         if errback:
             ping_kwargs['errback'] = errback
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=PingOptionsBase)
         service_types = final_args.get("service_types", None)
         if not service_types:
             service_types = list(
@@ -531,6 +748,6 @@ class ClusterLogic:
         if errback:
             diagnostics_kwargs['errback'] = errback
 
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=DiagnosticsOptionsBase)
         diagnostics_kwargs.update(final_args)
         return diagnostics_operation(**diagnostics_kwargs)
@@ -13,26 +13,54 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+from copy import copy
 from datetime import timedelta
+from time import perf_counter
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
                     Dict,
                     Iterable,
+                    List,
                     Optional,
+                    Tuple,
                     Union)
 
 from couchbase._utils import timedelta_as_microseconds
-from couchbase.exceptions import InvalidArgumentException
+from couchbase.exceptions import (AmbiguousTimeoutException,
+                                  DocumentUnretrievableException,
+                                  ErrorMapper,
+                                  InvalidArgumentException,
+                                  TimeoutException,
+                                  UnAmbiguousTimeoutException)
+from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.kv_range_scan import (PrefixScan,
                                      RangeScan,
                                      SamplingScan)
-from couchbase.logic.options import DeltaValueBase, SignedInt64Base
+from couchbase.logic.options import (AppendOptionsBase,
+                                     DecrementOptionsBase,
+                                     DeltaValueBase,
+                                     ExistsOptionsBase,
+                                     IncrementOptionsBase,
+                                     InsertOptionsBase,
+                                     MutateInOptionsBase,
+                                     PrependOptionsBase,
+                                     RemoveOptionsBase,
+                                     ReplaceOptionsBase,
+                                     SignedInt64Base,
+                                     TouchOptionsBase,
+                                     UnlockOptionsBase,
+                                     UpsertOptionsBase)
 from couchbase.mutation_state import MutationState
-from couchbase.options import forward_args
+from couchbase.options import (ReplaceMultiOptions,
+                               forward_args,
+                               get_valid_multi_args)
 from couchbase.pycbc_core import (binary_operation,
-                                  kv_operation,
+                                  create_keyspace,
+                                  kv_keyspace_operation,
                                   operations,
                                   subdoc_operation)
+from couchbase.replica_reads import ReadPreference
 from couchbase.result import (CounterResult,
                               ExistsResult,
                               GetReplicaResult,
@@ -44,23 +72,38 @@ from couchbase.result import (CounterResult,
 from couchbase.subdocument import (Spec,
                                    StoreSemantics,
                                    SubDocOp)
+from couchbase.timeouts import RequestBudget
+from couchbase.timings import current_timings
 from couchbase.transcoder import Transcoder
 
 if TYPE_CHECKING:
     from couchbase._utils import JSONType
-    from couchbase.options import (AppendOptions,
+    from couchbase.options import (AppendMultiOptions,
+                                   AppendOptions,
+                                   DecrementMultiOptions,
                                    DecrementOptions,
                                    ExistsOptions,
+                                   IncrementMultiOptions,
                                    IncrementOptions,
                                    InsertOptions,
                                    MutateInOptions,
+                                   MutationMultiOptions,
                                    MutationOptions,
+                                   NoValueMultiOptions,
+                                   PrependMultiOptions,
                                    PrependOptions,
                                    RemoveOptions,
                                    ReplaceOptions,
                                    TouchOptions,
                                    UnlockOptions,
                                    UpsertOptions)
+    from couchbase.pycbc_core import result
+
+# errors that mean the preferred server group's copy did not answer (or does not exist)
+SERVER_GROUP_FALLBACK_EXCEPTIONS = (DocumentUnretrievableException,
+                                    TimeoutException,
+                                    AmbiguousTimeoutException,
+                                    UnAmbiguousTimeoutException)
 
 
 class CollectionLogic:
@@ -72,6 +115,12 @@ class CollectionLogic:
         self._scope = scope
         self._collection_name = name
         self._connection = scope.connection
+        self._keyspace = None
+        cluster = scope._bucket._cluster
+        self._adaptive_timeouts = cluster._adaptive_timeouts
+        self._kv_timeouts = cluster._kv_timeouts
+        self._operation_timings = cluster._operation_timings
+        scope._bucket._fork_dependents.add(self)
 
     @property
     def connection(self):
@@ -96,8 +145,20 @@ class CollectionLogic:
         **INTERNAL**
         """
         self._connection = self._scope.connection
+        self._keyspace = None
+
+    def _after_fork_in_child(self):
+        """**INTERNAL**
+
+        Called in a child process after ``fork()``, drops the inherited connection and keyspace.  Both are resolved
+        again, through the scope and bucket, on the collection's next operation.
+        """
+        self._connection = None
+        self._keyspace = None
 
     def _get_connection_args(self) -> Dict[str, Any]:
+        if self._connection is None:
+            self._set_connection()
         return {
             "conn": self._connection,
             "bucket": self._scope.bucket_name,
@@ -105,20 +166,92 @@ class CollectionLogic:
             "collection_name": self.name
         }
 
+    def _get_keyspace(self) -> Any:
+        """**INTERNAL**
+
+        Returns the collection's native keyspace (connection, bucket, scope and collection names), creating it on
+        first use so that KV operations do not need to pass and convert the keyspace on every call.
+        """
+        if self._keyspace is None:
+            self._keyspace = create_keyspace(**self._get_connection_args())
+        return self._keyspace
+
     def _get_mutation_options(self,
                               *opts,  # type: MutationOptions
+                              options_type=None,  # type: Optional[type]
                               **kwargs  # type: Dict[str, Any]
                               ) -> Dict[str, Any]:
         """**INTERNAL**
         Parses the mutaiton operation options.  If synchronous durability has been set and no timeout provided, the
         default timeout will be set to the default KV durable timeout (10 seconds).
         """
-        args = forward_args(kwargs, *opts)
+        args = forward_args(kwargs, *opts, options_type=options_type)
         if 'durability' in args and isinstance(args['durability'], int) and 'timeout' not in args:
             args['timeout'] = timedelta_as_microseconds(timedelta(seconds=10))
 
         return args
 
+    def _mark_options_parsed(self) -> None:
+        """**INTERNAL**
+
+        If operation timings are enabled, marks the end of the current operation's options parsing (i.e. the start
+        of encoding its value).
+        """
+        if self._operation_timings is not None:
+            timings = current_timings()
+            if timings is not None:
+                timings.mark_options_parsed()
+
+    def _execute_kv_op(
+        self,
+        kv_op_type,  # type: int
+        kv_op_args,  # type: Dict[str, Any]
+        kv_fn,  # type: Callable[..., Any]
+        *args,  # type: Any
+        **kwargs,  # type: Any
+    ) -> Any:
+        """**INTERNAL**
+
+        Executes a single document KV operation.  If the operation is issued within a
+        :class:`~couchbase.timeouts.RequestBudget` its timeout is capped to the remaining budget.  If adaptive timeouts
+        are enabled, an operation without an explicit timeout is given the adapted timeout and the operation's latency
+        is recorded.  If operation timings are enabled, marks the hand-off of the operation to the C++ client.
+        """
+        if self._operation_timings is not None:
+            timings = current_timings()
+            if timings is not None:
+                timings.mark_submitted(operations(kv_op_type).name.lower())
+
+        budget = RequestBudget.current()
+        adaptive_timeouts = self._adaptive_timeouts
+        if budget is None and adaptive_timeouts is None:
+            return kv_fn(*args, **kwargs)
+
+        is_durable = 'durability' in kv_op_args
+        default_timeout = self._kv_timeouts[1] if is_durable else self._kv_timeouts[0]
+        if adaptive_timeouts is not None and not is_durable and 'timeout' not in kv_op_args:
+            timeout = adaptive_timeouts.get_timeout(kv_op_type, default_timeout)
+            if timeout is not None:
+                kv_op_args['timeout'] = timeout
+        if budget is not None:
+            budget.apply(kv_op_args, default_timeout)
+        if adaptive_timeouts is None:
+            return kv_fn(*args, **kwargs)
+
+        # only successful operations are recorded, the latency of a failed (i.e. timed out) operation says nothing
+        # about how long the operation takes
+        start = perf_counter()
+        callback = kv_op_args.get('callback', None)
+        if callback is not None:
+            # the async APIs complete the operation via callbacks
+            kv_op_args['callback'] = adaptive_timeouts.timed_callback(kv_op_type, start, callback)
+            return kv_fn(*args, **kwargs)
+
+        res = kv_fn(*args, **kwargs)
+        if not isinstance(res, CouchbaseBaseException):
+            adaptive_timeouts.record(kv_op_type, perf_counter() - start)
+        return res
+
     def get(
         self,
         key,  # type: str
@@ -138,10 +271,25 @@ class CollectionLogic:
             :class:`~.exceptions.DocumentNotFoundException`: If the provided document key does not exist.
         """
         op_type = operations.GET.value
-        return kv_operation(**self._get_connection_args(),
-                            key=key,
-                            op_type=op_type,
-                            op_args=kwargs)
+        return self._execute_kv_op(op_type, kwargs, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, kwargs)
+
+    def _get_hedged_read_args(
+        self,
+        final_args,  # type: Dict[str, Any]
+    ) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+        """**INTERNAL**
+
+        Pops the hedge_after option from a get operation's args.  Returns the delay (in seconds) before a
+        get_any_replica is issued alongside the get and the args for the replica read.  Returns (None, None)
+        if the get should not be hedged; projections and expiry cannot be read from a replica.
+        """
+        hedge_after = final_args.pop('hedge_after', None)
+        if hedge_after is None or final_args.get('project', None) or final_args.get('with_expiry', False):
+            return None, None
+
+        replica_args = {k: v for k, v in final_args.items() if k in ('timeout', 'span', 'transcoder')}
+        return hedge_after / 1e6, replica_args
 
     def get_any_replica(
         self,
@@ -162,10 +310,8 @@ class CollectionLogic:
             :class:`~.exceptions.DocumentNotFoundException`: If the provided document key does not exist.
         """
         op_type = operations.GET_ANY_REPLICA.value
-        return kv_operation(**self._get_connection_args(),
-                            key=key,
-                            op_type=op_type,
-                            op_args=kwargs)
+        return self._execute_kv_op(op_type, kwargs, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, kwargs)
 
     def get_all_replicas(
         self,
@@ -186,10 +332,7 @@ class CollectionLogic:
             :class:`~.exceptions.DocumentNotFoundException`: If the provided document key does not exist.
         """
         op_type = operations.GET_ALL_REPLICAS.value
-        return kv_operation(**self._get_connection_args(),
-                            key=key,
-                            op_type=op_type,
-                            op_args=kwargs)
+        return kv_keyspace_operation(self._get_keyspace(), key, op_type, None, kwargs)
 
     def exists(
         self,
@@ -198,9 +341,9 @@ class CollectionLogic:
         **kwargs,  # type: Any
     ) -> Optional[ExistsResult]:
         op_type = operations.EXISTS.value
-        return kv_operation(
-            **self._get_connection_args(), key=key, op_type=op_type, op_args=forward_args(kwargs, *opts)
-        )
+        final_args = forward_args(kwargs, *opts, options_type=ExistsOptionsBase)
+        return self._execute_kv_op(op_type, final_args, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, final_args)
 
     def insert(
         self,
@@ -209,17 +352,13 @@ class CollectionLogic:
         *opts,  # type: InsertOptions
         **kwargs,  # type: Any
     ) -> Optional[MutationResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=InsertOptionsBase, **kwargs)
         transcoder = final_args.pop('transcoder', self.default_transcoder)
+        self._mark_options_parsed()
         transcoded_value = transcoder.encode_value(value)
         op_type = operations.INSERT.value
-        return kv_operation(
-            **self._get_connection_args(),
-            key=key,
-            value=transcoded_value,
-            op_type=op_type,
-            op_args=final_args
-        )
+        return self._execute_kv_op(op_type, final_args, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, transcoded_value, final_args)
 
     def upsert(
         self,
@@ -228,18 +367,14 @@ class CollectionLogic:
         *opts,  # type: UpsertOptions
         **kwargs,  # type: Any
     ) -> Optional[MutationResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=UpsertOptionsBase, **kwargs)
         transcoder = final_args.pop('transcoder', self.default_transcoder)
+        self._mark_options_parsed()
         transcoded_value = transcoder.encode_value(value)
 
         op_type = operations.UPSERT.value
-        return kv_operation(
-            **self._get_connection_args(),
-            key=key,
-            value=transcoded_value,
-            op_type=op_type,
-            op_args=final_args
-        )
+        return self._execute_kv_op(op_type, final_args, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, transcoded_value, final_args)
 
     def replace(self,
                 key,  # type: str
@@ -247,7 +382,7 @@ class CollectionLogic:
                 *opts,  # type: ReplaceOptions
                 **kwargs,  # type: Any
                 ) -> Optional[MutationResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=ReplaceOptionsBase, **kwargs)
         expiry = final_args.get("expiry", None)
         preserve_expiry = final_args.get("preserve_expiry", False)
         if expiry and preserve_expiry is True:
@@ -256,27 +391,22 @@ class CollectionLogic:
             )
 
         transcoder = final_args.pop('transcoder', self.default_transcoder)
+        self._mark_options_parsed()
         transcoded_value = transcoder.encode_value(value)
 
         op_type = operations.REPLACE.value
-        return kv_operation(
-            **self._get_connection_args(),
-            key=key,
-            value=transcoded_value,
-            op_type=op_type,
-            op_args=final_args
-        )
+        return self._execute_kv_op(op_type, final_args, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, transcoded_value, final_args)
 
     def remove(self,
                key,  # type: str
                *opts,  # type: RemoveOptions
                **kwargs,  # type: Any
                ) -> Optional[MutationResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=RemoveOptionsBase, **kwargs)
         op_type = operations.REMOVE.value
-        return kv_operation(
-            **self._get_connection_args(), key=key, op_type=op_type, op_args=final_args
-        )
+        return self._execute_kv_op(op_type, final_args, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, final_args)
 
     def touch(self,
               key,  # type: str
@@ -286,27 +416,25 @@ class CollectionLogic:
               ) -> Optional[MutationResult]:
         kwargs["expiry"] = expiry
         op_type = operations.TOUCH.value
-        return kv_operation(
-            **self._get_connection_args(), key=key, op_type=op_type, op_args=forward_args(kwargs, *opts)
-        )
+        final_args = forward_args(kwargs, *opts, options_type=TouchOptionsBase)
+        return self._execute_kv_op(op_type, final_args, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, final_args)
 
     def get_and_touch(self,
                       key,  # type: str
                       **kwargs,  # type: Any
                       ) -> Optional[GetResult]:
         op_type = operations.GET_AND_TOUCH.value
-        return kv_operation(
-            **self._get_connection_args(), key=key, op_type=op_type, op_args=kwargs
-        )
+        return self._execute_kv_op(op_type, kwargs, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, kwargs)
 
     def get_and_lock(self,
                      key,  # type: str
                      **kwargs,  # type: Any
                      ) -> Optional[GetResult]:
         op_type = operations.GET_AND_LOCK.value
-        return kv_operation(
-            **self._get_connection_args(), key=key, op_type=op_type, op_args=kwargs
-        )
+        return self._execute_kv_op(op_type, kwargs, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, kwargs)
 
     def unlock(self,
                key,  # type: str
@@ -315,14 +443,10 @@ class CollectionLogic:
                **kwargs,  # type: Any
                ) -> None:
         op_type = operations.UNLOCK.value
-        final_args = forward_args(kwargs, *opts)
+        final_args = forward_args(kwargs, *opts, options_type=UnlockOptionsBase)
         final_args['cas'] = cas
-        return kv_operation(
-            **self._get_connection_args(),
-            key=key,
-            op_type=op_type,
-            op_args=final_args
-        )
+        return self._execute_kv_op(op_type, final_args, kv_keyspace_operation,
+                                   self._get_keyspace(), key, op_type, None, final_args)
 
     def lookup_in(self,
                   key,  # type: str
@@ -330,13 +454,12 @@ class CollectionLogic:
                   **kwargs,  # type: Any
                   ) -> Optional[LookupInResult]:
         op_type = operations.LOOKUP_IN.value
-        return subdoc_operation(
-            **self._get_connection_args(),
-            key=key,
-            spec=spec,
-            op_type=op_type,
-            op_args=kwargs
-        )
+        return self._execute_kv_op(op_type, kwargs, subdoc_operation,
+                                   **self._get_connection_args(),
+                                   key=key,
+                                   spec=spec,
+                                   op_type=op_type,
+                                   op_args=kwargs)
 
     def lookup_in_all_replicas(self,
                                key,  # type: str
@@ -358,13 +481,12 @@ class CollectionLogic:
                               **kwargs,  # type: Any
                               ) -> Optional[LookupInReplicaResult]:
         op_type = operations.LOOKUP_IN_ANY_REPLICA.value
-        return subdoc_operation(
-            **self._get_connection_args(),
-            key=key,
-            spec=spec,
-            op_type=op_type,
-            op_args=kwargs
-        )
+        return self._execute_kv_op(op_type, kwargs, subdoc_operation,
+                                   **self._get_connection_args(),
+                                   key=key,
+                                   spec=spec,
+                                   op_type=op_type,
+                                   op_args=kwargs)
 
     def mutate_in(   # noqa: C901
         self,
@@ -374,7 +496,7 @@ class CollectionLogic:
         **kwargs,  # type: Any
     ) -> Optional[MutateInResult]:   # noqa: C901
         # no tc for sub-doc, use default JSON
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=MutateInOptionsBase, **kwargs)
         transcoder = final_args.pop('transcoder', self.default_transcoder)
 
         expiry = final_args.get('expiry', None)
@@ -414,6 +536,7 @@ class CollectionLogic:
         if replace_semantics is not None:
             final_args["store_semantics"] = StoreSemantics.REPLACE
 
+        self._mark_options_parsed()
         final_spec = []
         allowed_multi_ops = [SubDocOp.ARRAY_PUSH_FIRST,
                              SubDocOp.ARRAY_PUSH_LAST,
@@ -434,13 +557,12 @@ class CollectionLogic:
                 final_spec.append(s)
 
         op_type = operations.MUTATE_IN.value
-        return subdoc_operation(
-            **self._get_connection_args(),
-            key=key,
-            spec=final_spec,
-            op_type=op_type,
-            op_args=final_args
-        )
+        return self._execute_kv_op(op_type, final_args, subdoc_operation,
+                                   **self._get_connection_args(),
+                                   key=key,
+                                   spec=final_spec,
+                                   op_type=op_type,
+                                   op_args=final_args)
 
     def _validate_delta_initial(self, delta=None, initial=None) -> None:
         # @TODO: remove deprecation next .minor
@@ -470,7 +592,7 @@ class CollectionLogic:
         *opts,  # type: IncrementOptions
         **kwargs,  # type: Any
     ) -> Optional[CounterResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=IncrementOptionsBase, **kwargs)
         if not final_args.get('initial', None):
             final_args['initial'] = SignedInt64Base(0)
         if not final_args.get('delta', None):
@@ -487,10 +609,11 @@ class CollectionLogic:
             # Negative 'initial' means no initial value
             del final_args['initial']
 
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                op_args=final_args)
+        return self._execute_kv_op(op_type, final_args, binary_operation,
+                                   **self._get_connection_args(),
+                                   key=key,
+                                   op_type=op_type,
+                                   op_args=final_args)
 
     def decrement(
         self,
@@ -498,7 +621,7 @@ class CollectionLogic:
         *opts,  # type: DecrementOptions
         **kwargs,  # type: Any
     ) -> Optional[CounterResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=DecrementOptionsBase, **kwargs)
         if not final_args.get('initial', None):
             final_args['initial'] = SignedInt64Base(0)
         if not final_args.get('delta', None):
@@ -515,10 +638,11 @@ class CollectionLogic:
             # Negative 'initial' means no initial value
             del final_args['initial']
 
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                op_args=final_args)
+        return self._execute_kv_op(op_type, final_args, binary_operation,
+                                   **self._get_connection_args(),
+                                   key=key,
+                                   op_type=op_type,
+                                   op_args=final_args)
 
     def append(
         self,
@@ -527,7 +651,7 @@ class CollectionLogic:
         *opts,  # type: AppendOptions
         **kwargs,  # type: Any
     ) -> Optional[MutationResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=AppendOptionsBase, **kwargs)
         if isinstance(value, str):
             value = value.encode("utf-8")
         elif isinstance(value, bytearray):
@@ -538,11 +662,12 @@ class CollectionLogic:
                 "The value provided must of type str, bytes or bytearray.")
 
         op_type = operations.APPEND.value
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                value=value,
-                                op_args=final_args)
+        return self._execute_kv_op(op_type, final_args, binary_operation,
+                                   **self._get_connection_args(),
+                                   key=key,
+                                   op_type=op_type,
+                                   value=value,
+                                   op_args=final_args)
 
     def prepend(
         self,
@@ -551,7 +676,7 @@ class CollectionLogic:
         *opts,  # type: PrependOptions
         **kwargs,  # type: Any
     ) -> Optional[MutationResult]:
-        final_args = self._get_mutation_options(*opts, **kwargs)
+        final_args = self._get_mutation_options(*opts, options_type=PrependOptionsBase, **kwargs)
         if isinstance(value, str):
             value = value.encode("utf-8")
         elif isinstance(value, bytearray):
@@ -562,11 +687,12 @@ class CollectionLogic:
                 "The value provided must of type str, bytes or bytearray.")
 
         op_type = operations.PREPEND.value
-        return binary_operation(**self._get_connection_args(),
-                                key=key,
-                                op_type=op_type,
-                                value=value,
-                                op_args=final_args)
+        return self._execute_kv_op(op_type, final_args, binary_operation,
+                                   **self._get_connection_args(),
+                                   key=key,
+                                   op_type=op_type,
+                                   value=value,
+                                   op_args=final_args)
 
     def build_scan_args(self,  # noqa: C901
                         scan_type,  # type: Union[RangeScan, PrefixScan, SamplingScan]
@@ -628,3 +754,225 @@ class CollectionLogic:
         }
         return_args.update(**self._get_connection_args())
         return return_args
+
+    def _get_multi_mutation_transcoded_op_args(
+        self,
+        keys_and_docs,  # type: Dict[str, JSONType]
+        *opts,  # type: MutationMultiOptions
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+
+        if not isinstance(keys_and_docs, dict):
+            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+        per_key_args = final_args.pop('per_key_options', None)
+        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
+        op_args = {}
+        for key, value in keys_and_docs.items():
+            op_args[key] = copy(final_args)
+            # per key args override global args
+            if per_key_args and key in per_key_args:
+                key_transcoder = per_key_args.pop('transcoder', op_transcoder)
+                op_args[key].update(per_key_args[key])
+                transcoded_value = key_transcoder.encode_value(value)
+            else:
+                transcoded_value = op_transcoder.encode_value(value)
+            op_args[key]['value'] = transcoded_value
+
+        if isinstance(opts_type, ReplaceMultiOptions):
+            for k, v in op_args.items():
+                expiry = v.get('expiry', None)
+                preserve_expiry = v.get('preserve_expiry', False)
+                if expiry and preserve_expiry is True:
+                    raise InvalidArgumentException(
+                        message=("The expiry and preserve_expiry options cannot "
+                                 f"both be set for replace operations.  Multi-op key: {k}.")
+                    )
+
+        return_exceptions = final_args.pop('return_exceptions', True)
+        return op_args, return_exceptions
+
+    def _get_multi_op_args(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: NoValueMultiOptions
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool, Dict[str, Transcoder]]:
+        if not isinstance(keys, list):
+            raise InvalidArgumentException(message='Expected keys to be a list.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+        op_transcoder = final_args.pop('transcoder', self.default_transcoder)
+        per_key_args = final_args.pop('per_key_options', None)
+        op_args = {}
+        key_transcoders = {}
+        for key in keys:
+            op_args[key] = copy(final_args)
+            # per key args override global args
+            if per_key_args and key in per_key_args:
+                key_transcoder = per_key_args.pop('transcoder', op_transcoder)
+                key_transcoders[key] = key_transcoder
+                op_args[key].update(per_key_args[key])
+            else:
+                key_transcoders[key] = op_transcoder
+
+        return_exceptions = final_args.pop('return_exceptions', True)
+        return op_args, return_exceptions, key_transcoders
+
+    def _get_server_group_fallback_args(
+        self,
+        op_args,  # type: Dict[str, Any]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """**INTERNAL**
+
+        Finds the keys of a multi replica read that prefer the copy in the configured server group.  If a key
+        provides a server_group_timeout, its initial read is limited to that timeout and the returned args are
+        used to re-read the key from any copy should the server group's copy not answer.  Otherwise the returned
+        args for the key are None (no fallback).
+        """
+        selected_group = ReadPreference.SELECTED_SERVER_GROUP.value
+        fallback_args = {}
+        for key, key_args in op_args.items():
+            server_group_timeout = key_args.pop('server_group_timeout', None)
+            if key_args.get('read_preference', None) != selected_group:
+                continue
+            if server_group_timeout is None:
+                fallback_args[key] = None
+                continue
+            key_fallback_args = copy(key_args)
+            key_fallback_args['read_preference'] = ReadPreference.NO_PREFERENCE.value
+            fallback_args[key] = key_fallback_args
+            key_args['timeout'] = server_group_timeout
+
+        return fallback_args
+
+    def _get_server_group_retry_args(
+        self,
+        res,  # type: result
+        fallback_args,  # type: Dict[str, Optional[Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """**INTERNAL**
+
+        Flags which keys were answered by the copy in the preferred server group and returns the args needed to
+        re-read (from any copy) the keys that the server group could not answer in time.
+        """
+        retry_args = {}
+        for key, key_fallback_args in fallback_args.items():
+            value = res.raw_result.get(key, None)
+            if value is None:
+                continue
+            if not isinstance(value, CouchbaseBaseException):
+                value.raw_result['from_preferred_server_group'] = True
+            elif (key_fallback_args is not None
+                    and isinstance(ErrorMapper.build_exception(value), SERVER_GROUP_FALLBACK_EXCEPTIONS)):
+                retry_args[key] = key_fallback_args
+
+        return retry_args
+
+    def _merge_server_group_retry(
+        self,
+        res,  # type: result
+        retry_res,  # type: result
+    ) -> None:
+        """**INTERNAL**
+
+        Replaces the server group misses in a multi replica read result with the results of the fallback reads.
+        """
+        for key, value in retry_res.raw_result.items():
+            if key == 'all_okay':
+                continue
+            if not isinstance(value, CouchbaseBaseException):
+                value.raw_result['from_preferred_server_group'] = False
+            res.raw_result[key] = value
+
+        res.raw_result['all_okay'] = not any(isinstance(v, CouchbaseBaseException)
+                                             for k, v in res.raw_result.items() if k != 'all_okay')
+
+    def _get_multi_counter_op_args(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: Union[IncrementMultiOptions, DecrementMultiOptions]
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+        if not isinstance(keys, list):
+            raise InvalidArgumentException(message='Expected keys to be a list.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+
+        global_delta, global_initial = self._get_and_validate_delta_initial(final_args)
+        final_args['delta'] = int(global_delta)
+        final_args['initial'] = int(global_initial)
+
+        per_key_args = final_args.pop('per_key_options', None)
+        op_args = {}
+        for key in keys:
+            op_args[key] = copy(final_args)
+            # per key args override global args
+            if per_key_args and key in per_key_args:
+                # need to validate delta/initial if provided per key
+                delta = per_key_args[key].get('delta', None)
+                initial = per_key_args[key].get('initial', None)
+                self._validate_delta_initial(delta=delta, initial=initial)
+                if delta:
+                    per_key_args[key]['delta'] = int(delta)
+                if initial:
+                    per_key_args[key]['initial'] = int(initial)
+                op_args[key].update(per_key_args[key])
+
+        return_exceptions = final_args.pop('return_exceptions', True)
+        return op_args, return_exceptions
+
+    def _get_multi_binary_mutation_op_args(
+        self,
+        keys_and_docs,  # type: Dict[str, Union[str, bytes, bytearray]]
+        *opts,  # type: Union[AppendMultiOptions, PrependMultiOptions]
+        **kwargs,  # type: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+
+        if not isinstance(keys_and_docs, dict):
+            raise InvalidArgumentException(message='Expected keys_and_docs to be a dict.')
+
+        opts_type = kwargs.pop('opts_type', None)
+        if not opts_type:
+            raise InvalidArgumentException(message='Expected options type is missing.')
+
+        parsed_keys_and_docs = {}
+        for k, v in keys_and_docs.items():
+            if isinstance(v, str):
+                value = v.encode("utf-8")
+            elif isinstance(v, bytearray):
+                value = bytes(v)
+            else:
+                value = v
+
+            if not isinstance(value, bytes):
+                raise ValueError(
+                    "The value provided must of type str, bytes or bytearray.")
+
+            parsed_keys_and_docs[k] = value
+
+        final_args = get_valid_multi_args(opts_type, kwargs, *opts)
+        per_key_args = final_args.pop('per_key_options', None)
+        op_args = {}
+        for key, value in parsed_keys_and_docs.items():
+            op_args[key] = copy(final_args)
+            # per key args override global args
+            if per_key_args and key in per_key_args:
+                op_args[key].update(per_key_args[key])
+            op_args[key]['value'] = value
+
+        return_exceptions = final_args.pop('return_exceptions', True)
+        return op_args, return_exceptions
@@ -0,0 +1,56 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import random
+import time
+from datetime import timedelta
+from typing import Optional
+
+
+class CasRetryBackoff:
+    """
+    **INTERNAL**
+
+    Tracks the time remaining for a datastructure operation that is retried when the underlying document has
+    been modified concurrently (i.e. a CAS mismatch) and provides the delay to wait before the next attempt.
+
+    The delay grows exponentially and is fully jittered so that many clients contending on the same document
+    spread out their retries instead of retrying in lock-step.
+    """
+    INITIAL_INTERVAL_MILLIS = 10
+    MAX_INTERVAL_MILLIS = 1000
+
+    def __init__(self,
+                 timeout=None  # type: Optional[timedelta]
+                 ) -> None:
+        if timeout is None:
+            timeout = timedelta(seconds=10)
+        self._timeout_millis = timeout.total_seconds() * 1000
+        self._start = time.perf_counter()
+        self._attempt = 0
+
+    def next_delay(self) -> Optional[float]:
+        """
+        Returns the amount of time (in seconds) to wait prior to the next attempt or None if the operation
+        has timed out.
+        """
+        time_left = self._timeout_millis - ((time.perf_counter() - self._start) * 1000)
+        if time_left <= 0:
+            return None
+
+        max_interval = min(self.MAX_INTERVAL_MILLIS, self.INITIAL_INTERVAL_MILLIS * (2 ** min(self._attempt, 16)))
+        self._attempt += 1
+        interval = random.uniform(0, max_interval)  # nosec
+        return min(interval, time_left) / 1000
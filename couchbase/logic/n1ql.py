@@ -38,6 +38,7 @@ from couchbase.tracing import CouchbaseSpan
 
 if TYPE_CHECKING:
     from couchbase.mutation_state import MutationState  # noqa: F401
+    from couchbase.prepared_statements import PreparedStatementCacheStats
 
 
 class QueryScanConsistency(Enum):
@@ -222,8 +223,12 @@ class QueryMetrics(object):
 
 
 class QueryMetaData:
-    def __init__(self, raw  # type: Dict[str, Any]
+    def __init__(self, raw,  # type: Dict[str, Any]
+                 prepared_cache_hit=None,  # type: Optional[bool]
+                 prepared_cache_stats=None,  # type: Optional[PreparedStatementCacheStats]
                  ) -> None:
+        self._prepared_cache_hit = prepared_cache_hit
+        self._prepared_cache_stats = prepared_cache_stats
         if raw is not None:
             self._raw = raw.get('metadata', None)
             sig = self._raw.get('signature', None)
@@ -305,6 +310,30 @@ class QueryMetaData:
         """
         return self._raw.get("profile", None)
 
+    def prepared_cache_hit(self) -> Optional[bool]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Get whether the query executed a prepared statement of the cluster's
+        :class:`~couchbase.prepared_statements.PreparedStatementCache`.
+
+        Returns:
+            Optional[bool]: True if the statement was cached, False if it was not, None if the query was not a
+            prepared query (:class:`~couchbase.options.QueryOptions` ``adhoc=False``).
+        """
+        return self._prepared_cache_hit
+
+    def prepared_cache_stats(self) -> Optional[PreparedStatementCacheStats]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Get the counters of the cluster's :class:`~couchbase.prepared_statements.PreparedStatementCache` at the
+        time the query was issued (including the query's own hit or miss).
+
+        Returns:
+            Optional[:class:`~couchbase.prepared_statements.PreparedStatementCacheStats`]: The cache's counters, None
+            if the query was not a prepared query.
+        """
+        return self._prepared_cache_stats
+
     def __repr__(self):
         return "QueryMetaData:{}".format(self._raw)
 
@@ -749,6 +778,19 @@ class QueryRequestLogic:
         self._default_serializer = kwargs.pop('default_serializer', DefaultJsonSerializer())
         self._serializer = None
         self._streaming_timeout = kwargs.pop('streaming_timeout', None)
+        self._prepared_cache = kwargs.pop('prepared_cache', None)
+        self._prepared_cache_key = None
+        self._prepared_cache_hit = None
+        self._prepared_cache_stats = None
+        # the original prepared query, retried once if its cached prepared statement is no longer known
+        self._prepared_retry_params = None
+        if self._prepared_cache is not None and query_params.get('adhoc', True) is False:
+            self._prepared_cache_key = (query_params['statement'], query_params.get('query_context', None))
+            (self._query_params,
+             self._prepared_cache_hit,
+             self._prepared_cache_stats) = self._prepared_cache._apply(query_params)
+            if self._prepared_cache_hit:
+                self._prepared_retry_params = query_params
 
     @property
     def params(self) -> Dict[str, Any]:
@@ -780,9 +822,44 @@ class QueryRequestLogic:
 
     def _set_metadata(self, query_response):
         if isinstance(query_response, CouchbaseBaseException):
-            raise ErrorMapper.build_exception(query_response)
+            raise self._build_exception(query_response)
+
+        self._metadata = QueryMetaData(query_response.raw_result.get('value', None),
+                                       prepared_cache_hit=self._prepared_cache_hit,
+                                       prepared_cache_stats=self._prepared_cache_stats)
+
+    def _build_exception(self, query_response):
+        ex = ErrorMapper.build_exception(query_response)
+        if self._prepared_cache_hit:
+            # the query service no longer knows the prepared statement, let the next query prepare it again
+            if not self._prepared_cache._invalidate(*self._prepared_cache_key, ex):
+                self._prepared_retry_params = None
+        return ex
+
+    def _retry_prepared(self) -> bool:
+        """**INTERNAL**
 
-        self._metadata = QueryMetaData(query_response.raw_result.get('value', None))
+        Resubmits, once, a query whose cached prepared statement is no longer known by the query service.  The
+        original prepared query (``adhoc=False``) is resubmitted so that the C++ client prepares the statement again.
+        Only called before any rows have been streamed.
+
+        Returns:
+            bool: True if the query was resubmitted.
+        """
+        retry_params = self._prepared_retry_params
+        if retry_params is None:
+            return False
+        self._prepared_retry_params = None
+        self._query_params = retry_params
+        self._prepared_cache_hit = False
+        self._submit_query()
+        return True
+
+    def _row_streamed(self) -> None:
+        """**INTERNAL**
+        """
+        # once a row has been streamed, the query cannot be retried
+        self._prepared_retry_params = None
 
     def _submit_query(self, **kwargs):
         if self.done_streaming:
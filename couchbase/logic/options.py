@@ -25,6 +25,7 @@ from typing import (TYPE_CHECKING,
                     Iterable,
                     List,
                     Optional,
+                    Tuple,
                     Union,
                     overload)
 
@@ -53,6 +54,7 @@ if TYPE_CHECKING:
                                   Sort)
     from couchbase.serializer import Serializer
     from couchbase.subdocument import StoreSemantics
+    from couchbase.timeouts import AdaptiveTimeouts
     from couchbase.tracing import CouchbaseTracer
     from couchbase.transcoder import Transcoder
     from couchbase.vector_search import VectorQueryCombination
@@ -121,6 +123,7 @@ VALID_MULTI_OPTS = {
     'delta': lambda x: x,
     'initial': lambda x: x,
     'read_preference': lambda x: x.value,
+    'server_group_timeout': timedelta_as_microseconds,
     'per_key_options': lambda x: x,
     'return_exceptions': validate_bool
 }
@@ -172,6 +175,16 @@ def get_valid_multi_args(
     *options  # type: OptionsBase
 ) -> Dict[str, Any]:
 
+    if options and isinstance(options[0], PreparedOptions):
+        prepared = options[0]
+        prepared.validate_options_type(opt_type)
+        final_opts = prepared.as_args()
+        arg_vars = copy.copy(arg_vars) if arg_vars else {}
+        arg_vars.update(arg_vars.pop('kwargs', {}))
+        if arg_vars:
+            final_opts.update(get_valid_multi_args(opt_type, arg_vars))
+        return final_opts
+
     temp_options = _get_temp_opts(arg_vars, *options)
     valid_opt_keys = opt_type.get_valid_keys()
 
@@ -190,6 +203,131 @@ def get_valid_multi_args(
     return final_opts
 
 
+class PreparedOptions(dict):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Options that have already been validated and converted into the form the C++ client expects.  Instances are
+    created via an options object's ``compile()`` method and can be passed to the associated operation in place
+    of the original options object, skipping the per-call options parsing.
+
+    Expiry options are validated when compiled, but are converted per call as an expiry of 30 days or greater is
+    sent to the server as an absolute timestamp.
+
+    .. note::
+        A :class:`PreparedOptions` instance should be treated as immutable.  Keyword arguments provided to an
+        operation alongside a :class:`PreparedOptions` instance are still parsed and override the compiled options.
+    """
+
+    # options whose converted value depends on when the operation is executed
+    _DEFERRED_OPTS = {
+        'expiry': timedelta_as_timestamp
+    }
+
+    def __init__(self,
+                 options_type,  # type: type
+                 final_args,  # type: Dict[str, Any]
+                 deferred_args=None,  # type: Optional[Dict[str, Any]]
+                 deferred_key_args=None,  # type: Optional[Dict[str, Dict[str, Any]]]
+                 ) -> None:
+        super().__init__(final_args)
+        self._options_type = options_type
+        self._deferred_args = deferred_args or {}
+        self._deferred_key_args = deferred_key_args or {}
+
+    @property
+    def options_type(self) -> type:
+        """
+            type: The options class these options were compiled from.
+        """
+        return self._options_type
+
+    def validate_options_type(self,
+                              options_type,  # type: type
+                              ) -> None:
+        """**INTERNAL**
+
+        Raises if these options were not compiled from the options class the operation expects.
+        """
+        if not issubclass(self._options_type, options_type):
+            # the operations check against the *OptionsBase classes, name the public options class instead
+            expected = options_type.__name__
+            if expected.endswith('Base'):
+                expected = expected[:-len('Base')]
+            raise InvalidArgumentException(message=(f'Expected options to be compiled from {expected}, '
+                                                    f'not {self._options_type.__name__}.'))
+
+    def as_args(self) -> Dict[str, Any]:
+        """**INTERNAL**
+
+        Returns a copy of the compiled options that is safe for an operation to modify.
+        """
+        final_args = dict(self)
+        for opt_key, opt_value in self._deferred_args.items():
+            final_args[opt_key] = PreparedOptions._DEFERRED_OPTS[opt_key](opt_value)
+
+        if 'per_key_options' in final_args:
+            per_key_opts = dict(final_args['per_key_options'])
+            for key, key_opts in self._deferred_key_args.items():
+                per_key_opts[key] = dict(per_key_opts.get(key, {}))
+                for opt_key, opt_value in key_opts.items():
+                    per_key_opts[key][opt_key] = PreparedOptions._DEFERRED_OPTS[opt_key](opt_value)
+            final_args['per_key_options'] = per_key_opts
+
+        return final_args
+
+    @staticmethod
+    def split_deferred(options  # type: Dict[str, Any]
+                       ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """**INTERNAL**
+
+        Splits out (and validates) the options that must be converted per call.
+        """
+        opts = dict(options)
+        deferred = {}
+        for opt_key, transform in PreparedOptions._DEFERRED_OPTS.items():
+            opt_value = opts.pop(opt_key, None)
+            if opt_value is None:
+                continue
+            transform(opt_value)
+            deferred[opt_key] = opt_value
+
+        return opts, deferred
+
+
+class MultiOptionsBase(dict):
+    """
+    Base class for the key-value multi-operation options.
+    """
+
+    @classmethod
+    def get_valid_keys(cls) -> List[str]:
+        return []
+
+    def compile(self) -> PreparedOptions:
+        """Validates and converts these options once so they can be reused across operations.
+
+        Returns:
+            :class:`~couchbase.options.PreparedOptions`: The compiled options.
+        """
+        valid_opt_keys = self.get_valid_keys()
+        opts, deferred = PreparedOptions.split_deferred(self)
+        deferred = {k: v for k, v in deferred.items() if k in valid_opt_keys}
+        deferred_key_args = {}
+        per_key_opts = opts.pop('per_key_options', None)
+        if per_key_opts:
+            opts['per_key_options'] = {}
+            for key, key_opts in per_key_opts.items():
+                if not isinstance(key_opts, dict):
+                    raise InvalidArgumentException(message='Expected per key options to be of type dict')
+                opts['per_key_options'][key], key_deferred = PreparedOptions.split_deferred(key_opts)
+                key_deferred = {k: v for k, v in key_deferred.items() if k in valid_opt_keys}
+                if key_deferred:
+                    deferred_key_args[key] = key_deferred
+
+        final_args = get_valid_multi_args(type(self), None, opts)
+        return PreparedOptions(type(self), final_args, deferred, deferred_key_args)
+
+
 """
 
 Couchbase Python SDK Options related Enumerations
@@ -564,6 +702,11 @@ class ClusterOptionsBase(dict):
         "app_telemetry_backoff": {"app_telemetry_backoff": timedelta_as_microseconds},
         "app_telemetry_ping_interval": {"app_telemetry_ping_interval": timedelta_as_microseconds},
         "app_telemetry_ping_timeout": {"app_telemetry_ping_timeout": timedelta_as_microseconds},
+        "reconnect_after_fork": {"reconnect_after_fork": validate_bool},
+        "adaptive_timeouts": {"adaptive_timeouts": lambda x: x},
+        "enable_operation_timings": {"enable_operation_timings": validate_bool},
+        "enable_threshold_reports": {"enable_threshold_reports": validate_bool},
+        "prepared_statement_cache_size": {"prepared_statement_cache_size": validate_int},
     }
 
     @overload
@@ -611,6 +754,11 @@ class ClusterOptionsBase(dict):
         app_telemetry_backoff=None,  # type: Optional[timedelta]
         app_telemetry_ping_interval=None,  # type: Optional[timedelta]
         app_telemetry_ping_timeout=None,  # type: Optional[timedelta]
+        reconnect_after_fork=None,  # type: Optional[bool]
+        adaptive_timeouts=None,  # type: Optional[AdaptiveTimeouts]
+        enable_operation_timings=None,  # type: Optional[bool]
+        enable_threshold_reports=None,  # type: Optional[bool]
+        prepared_statement_cache_size=None,  # type: Optional[int]
     ):
         """ClusterOptions instance."""
 
@@ -705,6 +853,16 @@ class OptionsTimeoutBase(OptionsBase):
         self["timeout"] = timeout
         return self
 
+    def compile(self) -> PreparedOptions:
+        """Validates and converts these options once so they can be reused across operations.
+
+        Returns:
+            :class:`~couchbase.options.PreparedOptions`: The compiled options.
+        """
+        from couchbase.options import forward_args
+        opts, deferred = PreparedOptions.split_deferred(self)
+        return PreparedOptions(type(self), forward_args(None, opts), deferred)
+
     def span(self,
              span,  # type: Any
              ) -> OptionsTimeoutBase:
@@ -882,7 +1040,8 @@ class GetOptionsBase(OptionsTimeoutBase):
         timeout=None,  # type: Optional[timedelta]
         with_expiry=None,  # type: Optional[bool]
         project=None,  # type: Optional[Iterable[str]]
-        transcoder=None  # type: Optional[Transcoder]
+        transcoder=None,  # type: Optional[Transcoder]
+        hedge_after=None  # type: Optional[timedelta]
     ):
         pass
 
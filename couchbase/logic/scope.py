@@ -178,9 +178,11 @@ class ScopeLogic:
         query = N1QLQuery.create_query_object(statement, opt, **kwargs)
         # See cluster.query() for note on streaming timeout
         streaming_timeout = self.streaming_timeouts.get('query_timeout', None)
+        prepared_cache = self._bucket._cluster.prepared_statement_cache
         return QueryResult(N1QLRequest.generate_n1ql_request(self.connection,
                                                              query.params,
-                                                             streaming_timeout=streaming_timeout))
+                                                             streaming_timeout=streaming_timeout,
+                                                             prepared_cache=prepared_cache))
 
     def analytics_query(self,
                         statement,  # type: str
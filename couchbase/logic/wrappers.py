@@ -15,8 +15,8 @@
 
 from __future__ import annotations
 
-from copy import copy
 from functools import wraps
+from threading import Event, Lock
 
 from couchbase.constants import FMT_JSON
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
@@ -37,19 +37,60 @@ def decode_value(transcoder, value, flags, is_subdoc=False):
     if is_subdoc is False:
         return transcoder.decode_value(value, flags)
 
-    final_value = []
+    # the spec results are owned by the result, decode the values in place
+    specs = []
     for f in value:
-        if 'value' in f:
-            tmp = copy(f)
-            old = tmp.pop('value', None)
-            if old:
-                # no custom transcoder for subdoc ops, use JSON
-                tmp['value'] = transcoder.decode_value(old, FMT_JSON)
-            final_value.append(tmp)
+        if f.get('value', None):
+            specs.append(f)
         else:
-            final_value.append(f)
+            f.pop('value', None)
+
+    if specs:
+        # no custom transcoder for subdoc ops, use JSON
+        if hasattr(transcoder, 'decode_values'):
+            values = transcoder.decode_values([(f['value'], FMT_JSON) for f in specs], is_subdoc=True)
+        else:
+            values = [transcoder.decode_value(f['value'], FMT_JSON) for f in specs]
+        for f, v in zip(specs, values):
+            f['value'] = v
+
+    return value
+
+
+def attach_timings(result, timings):
+    """
+    **INTERNAL**
+
+    Makes the operation's timings available on the result built from the native result.
+    """
+    raw_result = getattr(result, 'raw_result', None)
+    if isinstance(raw_result, dict):
+        raw_result['timings'] = timings
 
-    return final_value
+
+def decode_multi_values(transcoders, result):
+    """
+    **INTERNAL**
+
+    Decodes the values of a multi-op result in place.  Transcoders that provide decode_values() (i.e. the
+    EncryptingJSONTranscoder) decode all their values at once.
+    """
+    batches = {}
+    for k, v in result.raw_result.items():
+        if k == 'all_okay' or isinstance(v, CouchbaseBaseException):
+            continue
+        tc = transcoders[k]
+        if hasattr(tc, 'decode_values'):
+            batches.setdefault(id(tc), (tc, []))[1].append(v)
+            continue
+        value = v.raw_result.get('value', None)
+        flags = v.raw_result.get('flags', None)
+        v.raw_result['value'] = decode_value(tc, value, flags)
+
+    for tc, batch in batches.values():
+        values = tc.decode_values([(v.raw_result.get('value', None), v.raw_result.get('flags', None)) for v in batch])
+        for v, value in zip(batch, values):
+            v.raw_result['value'] = value
 
 
 def decode_replicas(transcoder, result, return_cls, is_subdoc=False):
@@ -72,14 +113,126 @@ def decode_replicas(transcoder, result, return_cls, is_subdoc=False):
             yield return_cls(res)
 
 
+class HedgedRead:
+    """
+    **INTERNAL**
+
+    Tracks the requests of a hedged read: the read of the active copy and, once hedged, the read of any replica.
+    The first successful response wins.  If every request fails, the active read's error is raised.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._done = Event()
+        self._pending = 1
+        self._result = None
+        self._errors = {}
+
+    def on_ok(self, res):
+        with self._lock:
+            self._pending -= 1
+            if self._result is None:
+                self._result = res
+        self._done.set()
+
+    def on_active_err(self, exc):
+        self._on_err('active', exc)
+
+    def on_replica_err(self, exc):
+        self._on_err('replica', exc)
+
+    def _on_err(self, source, exc):
+        with self._lock:
+            self._pending -= 1
+            self._errors[source] = exc
+            finished = self._pending == 0
+        if finished:
+            self._done.set()
+
+    def hedge(self) -> bool:
+        """
+        Returns True if the read should be hedged, False if it has already completed.
+        """
+        with self._lock:
+            if self._done.is_set():
+                return False
+            self._pending += 1
+            return True
+
+    def wait(self, timeout=None) -> bool:
+        return self._done.wait(timeout)
+
+    def result(self):
+        self._done.wait()
+        if self._result is not None:
+            return self._result
+        exc = self._errors.get('active', None) or self._errors.get('replica')
+        raise ErrorMapper.build_exception(exc)
+
+
+def _start_timings(obj):
+    """
+    **INTERNAL**
+
+    Starts the timings of the operation issued by the provided object, if it records operation timings.  Returns
+    the recorder, the timings and the token to pass to :func:`_end_timings`.
+    """
+    recorder = getattr(obj, '_operation_timings', None)
+    if recorder is None:
+        return None, None, None
+    timings, token = recorder.start()
+    return recorder, timings, token
+
+
+def _end_timings(recorder, timings, token):
+    """
+    **INTERNAL**
+    """
+    if recorder is not None:
+        recorder.record(timings)
+        recorder.end(token)
+
+
+_SUBDOC_OPS = ('_lookup_in_internal', '_lookup_in_any_replica_internal', '_lookup_in_all_replicas_internal')
+_ALL_REPLICAS_OPS = ('_get_all_replicas_internal', '_lookup_in_all_replicas_internal')
+
+
+def _decode_result(fn_name, transcoder, ret, return_cls, timings):
+    """
+    **INTERNAL**
+
+    Decodes the value(s) of the native result of a blocking KV operation and builds the operation's result.
+    """
+    is_subdoc = fn_name in _SUBDOC_OPS
+
+    # special case for get_all_replicas and lookup_in_all_replicas
+    if fn_name in _ALL_REPLICAS_OPS:
+        return decode_replicas(transcoder, ret, return_cls, is_subdoc=is_subdoc)
+
+    value = ret.raw_result.get('value', None)
+    flags = ret.raw_result.get('flags', None)
+
+    ret.raw_result['value'] = decode_value(transcoder, value, flags, is_subdoc=is_subdoc)
+    if timings is not None:
+        attach_timings(ret, timings)
+    if return_cls is None:
+        return None
+    elif return_cls is True:
+        return ret
+    return return_cls(ret)
+
+
 class BlockingWrapper:
     @classmethod  # noqa: C901
     def block(cls, return_cls):  # noqa: C901
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                recorder, timings, token = _start_timings(self)
                 try:
                     ret = fn(self, *args, **kwargs)
+                    if timings is not None:
+                        timings.mark_completed()
                     if isinstance(ret, BaseCouchbaseException):
                         raise ErrorMapper.build_exception(ret)
                     if return_cls is None:
@@ -89,6 +242,8 @@ class BlockingWrapper:
                     else:
                         if ret is None:
                             raise InternalSDKException('Expected return value to be non-empty.')
+                        if timings is not None:
+                            attach_timings(ret, timings)
                         retval = return_cls(ret)
                     return retval
                 except CouchbaseException as e:
@@ -100,6 +255,8 @@ class BlockingWrapper:
                     exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
                     excptn = exc_cls(message=str(ex))
                     raise excptn from None
+                finally:
+                    _end_timings(recorder, timings, token)
 
             return wrapped_fn
         return decorator
@@ -109,37 +266,23 @@ class BlockingWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
+                recorder, timings, token = _start_timings(self)
                 try:
                     transcoder = kwargs.pop('transcoder')
                     ret = fn(self, *args, **kwargs)
+                    if timings is not None:
+                        timings.mark_completed()
                     if isinstance(ret, BaseCouchbaseException):
                         raise ErrorMapper.build_exception(ret)
-
-                    is_subdoc = fn.__name__ in [
-                        '_lookup_in_internal', '_lookup_in_any_replica_internal', '_lookup_in_all_replicas_internal'
-                    ]
-
-                    # special case for get_all_replicas and lookup_in_all_replicas
-                    if fn.__name__ in ['_get_all_replicas_internal', '_lookup_in_all_replicas_internal']:
-                        return decode_replicas(transcoder, ret, return_cls, is_subdoc=is_subdoc)
-
-                    value = ret.raw_result.get('value', None)
-                    flags = ret.raw_result.get('flags', None)
-
-                    ret.raw_result['value'] = decode_value(transcoder, value, flags, is_subdoc=is_subdoc)
-                    if return_cls is None:
-                        return None
-                    elif return_cls is True:
-                        retval = ret
-                    else:
-                        retval = return_cls(ret)
-                    return retval
+                    return _decode_result(fn.__name__, transcoder, ret, return_cls, timings)
                 except CouchbaseException as e:
                     raise e
                 except Exception as ex:
                     exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
                     excptn = exc_cls(message=str(ex))
                     raise excptn
+                finally:
+                    _end_timings(recorder, timings, token)
 
             return wrapped_fn
         return decorator
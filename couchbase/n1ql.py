@@ -16,7 +16,6 @@
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   AlreadyQueriedException,
                                   CouchbaseException,
-                                  ErrorMapper,
                                   ExceptionMap)
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.logic.n1ql import N1QLQuery  # noqa: F401
@@ -78,10 +77,14 @@ class N1QLRequest(QueryRequestLogic):
             row = next(self._streaming_result)
 
         if isinstance(row, CouchbaseBaseException):
-            raise ErrorMapper.build_exception(row)
+            ex = self._build_exception(row)
+            if self._retry_prepared():
+                return self._get_next_row()
+            raise ex
         # should only be None once query request is complete and _no_ errors found
         if row is None:
             raise StopIteration
+        self._row_streamed()
 
         return self.serializer.deserialize(row)
 
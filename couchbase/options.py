@@ -41,6 +41,7 @@ from couchbase.logic.options import Compression  # noqa: F401
 from couchbase.logic.options import IpProtocol  # noqa: F401
 from couchbase.logic.options import KnownConfigProfiles  # noqa: F401
 from couchbase.logic.options import LockMode  # noqa: F401
+from couchbase.logic.options import PreparedOptions  # noqa: F401
 from couchbase.logic.options import TLSVerifyMode  # noqa: F401
 from couchbase.logic.options import get_valid_args  # noqa: F401
 from couchbase.logic.options import get_valid_multi_args  # noqa: F401
@@ -65,6 +66,7 @@ from couchbase.logic.options import (AnalyticsOptionsBase,
                                      LookupInAllReplicasOptionsBase,
                                      LookupInAnyReplicaOptionsBase,
                                      LookupInOptionsBase,
+                                     MultiOptionsBase,
                                      MutateInOptionsBase,
                                      OptionsTimeoutBase,
                                      PingOptionsBase,
@@ -369,6 +371,11 @@ class ClusterOptions(ClusterOptionsBase):
         app_telemetry_backoff (timedelta, optional): Specifies the time to wait before attempting a websocket reconnection. Defaults to 5 seconds.
         app_telemetry_ping_interval (timedelta, optional): Specifies the time to wait between sending consecutive websocket PING commands to the server. Defaults to 30 seconds.
         app_telemetry_ping_timeout (timedelta, optional): Specifies the time allowed for the server to respond to websocket PING command. Defaults to 2 seconds.
+        reconnect_after_fork (bool, optional): Set to True to have the cluster, and any open buckets, transparently reconnect, on first use, in a child process after ``fork()`` (e.g. pre-fork servers such as gunicorn or uWSGI). Only supported by the blocking API. Defaults to False (disabled).
+        adaptive_timeouts (:class:`~couchbase.timeouts.AdaptiveTimeouts`, optional): **VOLATILE** Set to derive the timeouts of key-value operations, that are not given an explicit timeout, from observed latencies. Defaults to None (static timeouts).
+        enable_operation_timings (bool, optional): **VOLATILE** Set to True to measure the client-side latency breakdown (options parsing, encoding, C++ client and network, decoding) of key-value operations. Available on results via ``timings`` and aggregated via the cluster's ``operation_timings()``. Defaults to False (disabled).
+        enable_threshold_reports (bool, optional): **VOLATILE** Set to True to collect the threshold logging tracer's reports (the top-N slowest operations over their service's threshold and orphaned responses) as structured objects, available via the cluster's ``threshold_reports()`` and ``on_threshold_report()``. The C++ client only emits these reports through its logger, so logging must be configured via :func:`couchbase.configure_logging` at ``logging.WARNING`` or below. Defaults to False (disabled).
+        prepared_statement_cache_size (int, optional): **VOLATILE** The maximum number of statements of the cluster's :class:`~couchbase.prepared_statements.PreparedStatementCache` (populated via the cluster's ``prepare_statements()``), the least recently used statements are evicted beyond it. Defaults to 5000.
     """  # noqa: E501
 
     def apply_profile(self,
@@ -499,6 +506,10 @@ class GetOptions(GetOptionsBase):
             whole document.
         transcoder (:class:`~.transcoder.Transcoder`, optional): Specifies an explicit transcoder
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
+        hedge_after (timedelta, optional): If the active copy has not answered within this time, a
+            get_any_replica is issued alongside the get and the first successful response is returned.  Use
+            :attr:`~couchbase.result.GetResult.is_replica` to determine if a replica answered.  Ignored if
+            with_expiry or project is set.  Defaults to not hedging the get.
     """
 
 
@@ -838,7 +849,7 @@ Multi-operations Options
 """
 
 
-class GetAllReplicasMultiOptions(dict):
+class GetAllReplicasMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-get-all-replicas operation.
 
     Options can be set at a global level (i.e. for all get operations handled with this multi-get-all-replicas
@@ -875,7 +886,7 @@ class GetAllReplicasMultiOptions(dict):
         return ['timeout', 'transcoder', 'read_preference', 'per_key_options', 'return_exceptions']
 
 
-class GetAnyReplicaMultiOptions(dict):
+class GetAnyReplicaMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-get-any-replica operation.
 
     Options can be set at a global level (i.e. for all get operations handled with this multi-get-any-replica
@@ -888,6 +899,12 @@ class GetAnyReplicaMultiOptions(dict):
             to use for this specific operation. Defaults to :class:`~.transcoder.JsonTranscoder`.
         read_preference(:class:`~couchbase.replica_reads.ReadPreference`, optional): Specifies how the replica nodes
             will be selected. Defaults to no preference.
+        server_group_timeout (timedelta, optional): Only applies if read_preference is
+            :attr:`~couchbase.replica_reads.ReadPreference.SELECTED_SERVER_GROUP`.  How long to wait for the copy
+            (active or replica) in the preferred server group.  Keys the server group does not answer in time (or
+            has no copy of) are re-read from any available copy.  Use
+            :attr:`~couchbase.result.GetReplicaResult.from_preferred_server_group` to determine which copy answered.
+            If not set, keys are only read from the preferred server group.
         per_key_options (Dict[str, :class:`.GetAnyReplicaOptions`], optional): Specify
             :class:`.GetAnyReplicaOptions` per key.
         return_exceptions(bool, optional): If False, raise an Exception when encountered.  If True return the
@@ -898,6 +915,7 @@ class GetAnyReplicaMultiOptions(dict):
         self,
         transcoder=None,        # type: Optional[Transcoder]
         read_preference=None,   # type: Optional[ReadPreference]
+        server_group_timeout=None,  # type: Optional[timedelta]
         per_key_options=None,   # type: Dict[str, GetAnyReplicaOptions]
         return_exceptions=None  # type: Optional[bool]
     ):
@@ -909,10 +927,11 @@ class GetAnyReplicaMultiOptions(dict):
 
     @classmethod
     def get_valid_keys(cls):
-        return ['timeout', 'transcoder', 'read_preference', 'per_key_options', 'return_exceptions']
+        return ['timeout', 'transcoder', 'read_preference', 'server_group_timeout', 'per_key_options',
+                'return_exceptions']
 
 
-class GetMultiOptions(dict):
+class GetMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-get operation.
 
     Options can be set at a global level (i.e. for all get operations handled with this multi-get operation).
@@ -954,7 +973,7 @@ class GetMultiOptions(dict):
                 'per_key_options', 'return_exceptions']
 
 
-class ExistsMultiOptions(dict):
+class ExistsMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-exists operation.
 
     Options can be set at a global level (i.e. for all exists operations handled with this multi-exists operation).
@@ -985,7 +1004,7 @@ class ExistsMultiOptions(dict):
         return ['timeout', 'per_key_options', 'return_exceptions']
 
 
-class UpsertMultiOptions(dict):
+class UpsertMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-upsert operation.
 
     Options can be set at a global level (i.e. for all upsert operations handled with this multi-upsert operation).
@@ -1027,7 +1046,7 @@ class UpsertMultiOptions(dict):
                 'transcoder', 'per_key_options', 'return_exceptions']
 
 
-class InsertMultiOptions(dict):
+class InsertMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-insert operation.
 
     Options can be set at a global level (i.e. for all insert operations handled with this multi-insert operation).
@@ -1066,7 +1085,7 @@ class InsertMultiOptions(dict):
         return ['timeout', 'expiry', 'durability', 'transcoder', 'per_key_options', 'return_exceptions']
 
 
-class ReplaceMultiOptions(dict):
+class ReplaceMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-replace operation.
 
     Options can be set at a global level (i.e. for all replace operations handled with this multi-replace operation).
@@ -1111,7 +1130,7 @@ class ReplaceMultiOptions(dict):
                 'durability', 'transcoder', 'per_key_options', 'return_exceptions']
 
 
-class RemoveMultiOptions(dict):
+class RemoveMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-remove operation.
 
     Options can be set at a global level (i.e. for all remove operations handled with this multi-remove operation).
@@ -1151,7 +1170,7 @@ class RemoveMultiOptions(dict):
         return ['timeout', 'cas', 'durability', 'transcoder', 'per_key_options', 'return_exceptions']
 
 
-class TouchMultiOptions(dict):
+class TouchMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-touch operation.
 
     Options can be set at a global level (i.e. for all touch operations handled with this multi-touch operation).
@@ -1182,7 +1201,7 @@ class TouchMultiOptions(dict):
         return ['timeout', 'expiry', 'per_key_options', 'return_exceptions']
 
 
-class GetAndLockMultiOptions(dict):
+class GetAndLockMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-lock operation.
 
     Options can be set at a global level (i.e. for all lock operations handled with this multi-lock operation).
@@ -1218,7 +1237,7 @@ class GetAndLockMultiOptions(dict):
 LockMultiOptions = GetAndLockMultiOptions
 
 
-class UnlockMultiOptions(dict):
+class UnlockMultiOptions(MultiOptionsBase):
     """Available options to for a key-value multi-unlock operation.
 
     Options can be set at a global level (i.e. for all unlock operations handled with this multi-unlock operation).
@@ -1250,7 +1269,7 @@ class UnlockMultiOptions(dict):
         return ['timeout', 'per_key_options', 'return_exceptions']
 
 
-class IncrementMultiOptions(dict):
+class IncrementMultiOptions(MultiOptionsBase):
     """Available options to for a binary multi-increment operation.
 
     Options can be set at a global level (i.e. for all increment operations handled with this multi-increment operation).
@@ -1292,7 +1311,7 @@ class IncrementMultiOptions(dict):
                 'initial', 'span', 'per_key_options', 'return_exceptions']
 
 
-class DecrementMultiOptions(dict):
+class DecrementMultiOptions(MultiOptionsBase):
     """Available options to for a binary multi-decrement operation.
 
     Options can be set at a global level (i.e. for all decrement operations handled with this multi-decrement operation).
@@ -1334,7 +1353,7 @@ class DecrementMultiOptions(dict):
                 'initial', 'span', 'per_key_options', 'return_exceptions']
 
 
-class AppendMultiOptions(dict):
+class AppendMultiOptions(MultiOptionsBase):
     """Available options to for a binary multi-append operation.
 
     Options can be set at a global level (i.e. for all append operations handled with this multi-append operation).
@@ -1373,7 +1392,7 @@ class AppendMultiOptions(dict):
                 'span', 'per_key_options', 'return_exceptions']
 
 
-class PrependMultiOptions(dict):
+class PrependMultiOptions(MultiOptionsBase):
     """Available options to for a binary multi-prepend operation.
 
     Options can be set at a global level (i.e. for all prepend operations handled with this multi-prepend operation).
@@ -1793,9 +1812,18 @@ class Forwarder(metaclass=ABCMeta):
     def forward_args(
         self,
         arg_vars,  # type: Optional[Dict[str,Any]]
-        *options  # type: OptionsBase
+        *options,  # type: OptionsBase
+        options_type=None,  # type: Optional[type]
     ):
         # type: (...) -> OptionsBase[str,Any]
+        if options and isinstance(options[0], PreparedOptions):
+            if options_type is not None:
+                options[0].validate_options_type(options_type)
+            end_options = options[0].as_args()
+            if arg_vars:
+                end_options.update(self.forward_args(arg_vars))
+            return end_options
+
         arg_vars = copy.copy(arg_vars) if arg_vars else {}
         temp_options = (
             copy.copy(
@@ -1842,7 +1870,8 @@ class DefaultForwarder(Forwarder):
             "batch_byte_limit": {"batch_byte_limit": validate_int},
             "batch_item_limit": {"batch_item_limit": validate_int},
             "concurrency": {"concurrency": validate_int},
-            "read_preference": {"read_preference": lambda r: r.value}
+            "read_preference": {"read_preference": lambda r: r.value},
+            "hedge_after": {"hedge_after": timedelta_as_microseconds}
         }
 
 
@@ -0,0 +1,345 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import (Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase.exceptions import (CouchbaseException,
+                                  InvalidArgumentException,
+                                  QueryErrorContext)
+
+DEFAULT_MAX_SIZE = 5000
+
+# The C++ client raises errc::query::prepared_statement_failure for the query service's 4040, 4050, 4060, 4070,
+# 4080 and 4090 errors (the prepared statement is unknown to, or cannot be decoded by, the query node).
+_PREPARED_STATEMENT_FAILURE = 203
+_PREPARED_STATEMENT_ERROR_CODES = (4040, 4050, 4060, 4070, 4080, 4090)
+
+
+class PreparedStatement:
+    """**VOLATILE** This API is subject to change at any time.
+
+    A statement of the :class:`.PreparedStatementCache`.
+    """
+
+    __slots__ = ('_statement', '_query_context', '_name', '_hits')
+
+    def __init__(self,
+                 statement,  # type: str
+                 query_context,  # type: Optional[str]
+                 name,  # type: str
+                 ):
+        self._statement = statement
+        self._query_context = query_context
+        self._name = name
+        self._hits = 0
+
+    @property
+    def statement(self) -> str:
+        """
+            str: The statement, as given to the query.
+        """
+        return self._statement
+
+    @property
+    def query_context(self) -> Optional[str]:
+        """
+            Optional[str]: The query context the statement was prepared in (i.e. ```bucket`.`scope``` for scope-level
+            queries).
+        """
+        return self._query_context
+
+    @property
+    def name(self) -> str:
+        """
+            str: The name the query service gave the prepared statement.
+        """
+        return self._name
+
+    @property
+    def hits(self) -> int:
+        """
+            int: The number of queries that executed the prepared statement.
+        """
+        return self._hits
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'statement': self._statement,
+            'query_context': self._query_context,
+            'name': self._name,
+            'hits': self._hits,
+        }
+
+    def __repr__(self):
+        return f'PreparedStatement({self.as_dict()})'
+
+
+class PreparedStatementCacheStats:
+    """**VOLATILE** This API is subject to change at any time.
+
+    A snapshot of the :class:`.PreparedStatementCache`'s counters.
+    """
+
+    __slots__ = ('_hits', '_misses', '_evictions', '_size', '_max_size')
+
+    def __init__(self,
+                 hits,  # type: int
+                 misses,  # type: int
+                 evictions,  # type: int
+                 size,  # type: int
+                 max_size,  # type: int
+                 ):
+        self._hits = hits
+        self._misses = misses
+        self._evictions = evictions
+        self._size = size
+        self._max_size = max_size
+
+    @property
+    def hits(self) -> int:
+        """
+            int: The number of prepared queries (``adhoc=False``) that executed a cached prepared statement.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+            int: The number of prepared queries (``adhoc=False``) whose statement was not cached.
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """
+            int: The number of statements evicted, to respect the cache's size or because the query service no longer
+            knew the prepared statement.
+        """
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        """
+            int: The number of cached statements.
+        """
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        """
+            int: The maximum number of cached statements.
+        """
+        return self._max_size
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'size': self._size,
+            'max_size': self._max_size,
+        }
+
+    def __repr__(self):
+        return f'PreparedStatementCacheStats({self.as_dict()})'
+
+
+class PreparedStatementCache:
+    """**VOLATILE** This API is subject to change at any time.
+
+    The cluster's cache of prepared statements, populated via the cluster's ``prepare_statements()``.  A prepared
+    query (:class:`~couchbase.options.QueryOptions` ``adhoc=False``) whose statement (and query context) is cached
+    executes the prepared statement directly, skipping the query service's planning.  Other prepared queries go
+    through the C++ client's own (internal, unbounded) prepared statement cache.
+
+    The cache is bounded, the least recently used statement is evicted once ``max_size`` statements are cached.  A
+    statement is also evicted when the query service no longer knows its prepared statement, the query is then retried
+    once, before any rows are streamed, through the C++ client which prepares the statement again.
+
+    Use the cluster's ``prepared_statement_cache`` to access it.
+    """
+
+    def __init__(self,
+                 max_size=DEFAULT_MAX_SIZE,  # type: int
+                 ):
+        self._lock = Lock()
+        self._entries = OrderedDict()  # type: OrderedDict[Tuple[str, Optional[str]], PreparedStatement]
+        self._max_size = self._validate_max_size(max_size)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """
+            int: The maximum number of cached statements.  Lowering it evicts the least recently used statements.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value  # type: int
+                 ) -> None:
+        value = self._validate_max_size(value)
+        with self._lock:
+            self._max_size = value
+            self._evict_lru()
+
+    def entries(self) -> List[PreparedStatement]:
+        """Returns the cached statements, least recently used first.
+
+        Returns:
+            List[:class:`.PreparedStatement`]: The cached statements.
+        """
+        with self._lock:
+            return list(self._entries.values())
+
+    def evict(self,
+              statement,  # type: str
+              query_context=None,  # type: Optional[str]
+              ) -> bool:
+        """Evicts a statement from the cache.
+
+        Args:
+            statement (str): The statement to evict.
+            query_context (str, optional): The query context the statement was prepared in.
+
+        Returns:
+            bool: True if the statement was cached.
+        """
+        with self._lock:
+            if self._entries.pop((statement, query_context), None) is None:
+                return False
+            self._evictions += 1
+            return True
+
+    def clear(self) -> None:
+        """Evicts all of the statements from the cache.
+        """
+        with self._lock:
+            self._evictions += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> PreparedStatementCacheStats:
+        """Returns a snapshot of the cache's counters.
+
+        Returns:
+            :class:`.PreparedStatementCacheStats`: The cache's counters.
+        """
+        with self._lock:
+            return self._stats()
+
+    def _add(self,
+             statement,  # type: str
+             query_context,  # type: Optional[str]
+             name,  # type: str
+             ) -> None:
+        """**INTERNAL**
+        """
+        with self._lock:
+            key = (statement, query_context)
+            self._entries[key] = PreparedStatement(statement, query_context, name)
+            self._entries.move_to_end(key)
+            self._evict_lru()
+
+    def _apply(self,
+               query_params,  # type: Dict[str, Any]
+               ) -> Tuple[Dict[str, Any], bool, PreparedStatementCacheStats]:
+        """**INTERNAL**
+
+        Looks up the statement of a prepared query, returning the query's parameters (rewritten to execute the
+        prepared statement on a hit), whether the statement was cached and the cache's counters.
+        """
+        key = (query_params['statement'], query_params.get('query_context', None))
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                self._misses += 1
+                return query_params, False, self._stats()
+            self._entries.move_to_end(key)
+            entry._hits += 1
+            self._hits += 1
+            stats = self._stats()
+        params = dict(query_params)
+        params['statement'] = 'EXECUTE `{}`'.format(entry.name.replace('`', '``'))
+        params['adhoc'] = True
+        return params, True, stats
+
+    def _invalidate(self,
+                    statement,  # type: str
+                    query_context,  # type: Optional[str]
+                    ex,  # type: Exception
+                    ) -> bool:
+        """**INTERNAL**
+
+        Evicts the statement if the query executing its prepared statement failed because the query service no
+        longer knows it.  Returns True if that is why the query failed (the query can then be retried).
+        """
+        if not isinstance(ex, CouchbaseException):
+            return False
+        if ex.error_code != _PREPARED_STATEMENT_FAILURE:
+            ctx = ex.error_context
+            if not (isinstance(ctx, QueryErrorContext) and ctx.first_error_code in _PREPARED_STATEMENT_ERROR_CODES):
+                return False
+        self.evict(statement, query_context)
+        return True
+
+    def _stats(self) -> PreparedStatementCacheStats:
+        return PreparedStatementCacheStats(self._hits, self._misses, self._evictions, len(self._entries),
+                                           self._max_size)
+
+    def _evict_lru(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    @staticmethod
+    def _validate_max_size(value  # type: int
+                           ) -> int:
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise InvalidArgumentException(message='Expected max_size to be a non-negative int.')
+        return value
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f'PreparedStatementCache(size={len(self._entries)}, max_size={self._max_size})'
+
+
+def prepare_statement_query(statement  # type: str
+                            ) -> str:
+    """**INTERNAL**
+    """
+    return f'PREPARE {statement}'
+
+
+def prepared_statement_name(rows  # type: List[Any]
+                            ) -> str:
+    """**INTERNAL**
+
+    Extracts the name of the prepared statement from the rows of a ``PREPARE`` query.
+    """
+    name = rows[0].get('name', None) if rows and isinstance(rows[0], dict) else None
+    if not isinstance(name, str) or not name:
+        raise CouchbaseException(message='The PREPARE query did not return the name of the prepared statement.')
+    return name
@@ -16,9 +16,13 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from datetime import datetime
+from types import MappingProxyType
 from typing import (Any,
                     Dict,
+                    Iterator,
+                    List,
                     Optional,
                     Tuple,
                     Union)
@@ -36,9 +40,12 @@ from couchbase.exceptions import ErrorMapper, InvalidArgumentException
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.pycbc_core import result
 from couchbase.subdocument import parse_subdocument_content_as, parse_subdocument_exists
+from couchbase.timings import OperationTimings
 
 
 class Result:
+    __slots__ = ('_orig', '_content_cache')
+
     def __init__(
         self,
         orig,  # type: result
@@ -81,24 +88,101 @@ class Result:
         """
         return self.cas != 0
 
+    @property
+    def timings(self) -> Optional[OperationTimings]:
+        """
+            Optional[:class:`~couchbase.timings.OperationTimings`]: **VOLATILE** The client-side latency breakdown of
+            the operation.  Only available if :class:`~couchbase.options.ClusterOptions` ``enable_operation_timings``
+            is set.
+        """
+        return self._orig.raw_result.get('timings', None)
+
+    def _get_content_cache(self) -> Dict[Any, Any]:
+        try:
+            return self._content_cache
+        except AttributeError:
+            self._content_cache = {}
+            return self._content_cache
+
 
 class ContentProxy:
     """
     Used to provide access to Result content via Result.content_as[type]
+
+    ``content_as[type]`` returns a new object on each access, e.g. ``content_as[dict]`` returns a shallow copy
+    of the document.  Conversions to an immutable type (i.e. ``content_as[str]``) the content is not already an
+    instance of are cached on the result, so repeated access returns the same object.
+
+    ``content_as[type, 'view']`` returns a read-only view of the content, without copying it, if the content is
+    already of the requested type (a :class:`types.MappingProxyType` for a dict and a read-only sequence for
+    a list).  Nested values within the view are not copied and should not be modified.
     """
 
-    def __init__(self, content):
+    VIEW = 'view'
+    # conversions to a mutable type (i.e. dict or list) are never cached, each access returns a new object
+    _CACHED_TYPES = frozenset((bool, bytes, float, frozenset, int, str, tuple))
+
+    def __init__(self,
+                 content,  # type: Any
+                 cache=None,  # type: Optional[Dict[Any, Any]]
+                 ):
         self._content = content
+        self._cache = cache
+
+    def _get_view(self, type_, mode):
+        if mode != self.VIEW:
+            raise InvalidArgumentException(message=f"Unsupported content access mode: {mode}. Expected '{self.VIEW}'.")
+        if type_ is dict and type(self._content) is dict:
+            return MappingProxyType(self._content)
+        if type_ is list and type(self._content) is list:
+            return ContentListView(self._content)
+        return self._convert(type_)
+
+    def _convert(self, type_):
+        if self._cache is None or type_ not in self._CACHED_TYPES or type(self._content) is type_:
+            return type_(self._content)
+        try:
+            return self._cache[type_]
+        except KeyError:
+            converted = self._cache[type_] = type_(self._content)
+            return converted
 
     def __getitem__(self,
                     type_       # type: Any
                     ) -> Any:
         """
 
-        :param type_: the type to attempt to cast the result to
+        :param type_: the type to attempt to cast the result to, optionally followed by 'view'
+            to return a read-only view of the content rather than a copy
         :return: the content cast to the given type, if possible
         """
-        return type_(self._content)
+        if isinstance(type_, tuple):
+            return self._get_view(*type_)
+        return self._convert(type_)
+
+
+class ContentListView(Sequence):
+    """
+    A read-only view of list content returned by Result.content_as[list, 'view']
+    """
+    __slots__ = ('_content',)
+
+    def __init__(self, content):
+        self._content = content
+
+    def __getitem__(self, index):
+        return self._content[index]
+
+    def __len__(self):
+        return len(self._content)
+
+    def __eq__(self, other):
+        if isinstance(other, ContentListView):
+            other = other._content
+        return self._content == other
+
+    def __repr__(self):
+        return "ContentListView({!r})".format(self._content)
 
 
 class ContentSubdocProxy:
@@ -273,6 +357,7 @@ class PingResult(Result):
 
 
 class GetReplicaResult(Result):
+    __slots__ = ()
 
     @property
     def is_active(self) -> bool:
@@ -290,6 +375,14 @@ class GetReplicaResult(Result):
         """
         return self._orig.raw_result.get('is_replica')
 
+    @property
+    def from_preferred_server_group(self) -> Optional[bool]:
+        """
+            Optional[bool]: True if the copy in the preferred server group answered, False if the read fell
+            back to a copy outside of the preferred server group.  None if the read did not prefer a server group.
+        """
+        return self._orig.raw_result.get('from_preferred_server_group', None)
+
     @property
     def content_as(self) -> Any:
         """
@@ -301,13 +394,22 @@ class GetReplicaResult(Result):
                 value = res.content_as[dict]
 
         """
-        return ContentProxy(self.value)
+        return ContentProxy(self.value, self._get_content_cache())
 
     def __repr__(self):
         return "GetReplicaResult:{}".format(self._orig)
 
 
 class GetResult(Result):
+    __slots__ = ()
+
+    @property
+    def is_replica(self) -> bool:
+        """
+            bool: True if the result was read from a replica (i.e. a hedged get answered by a replica),
+            False otherwise.
+        """
+        return self._orig.raw_result.get('is_replica', False)
 
     @property
     def expiry_time(self) -> Optional[datetime]:
@@ -342,8 +444,13 @@ class GetResult(Result):
                 res = collection.get(key)
                 value = res.content_as[dict]
 
+            Get a read-only view of the value, without copying it::
+
+                res = collection.get(key)
+                value = res.content_as[dict, 'view']
+
         """
-        return ContentProxy(self.value)
+        return ContentProxy(self.value, self._get_content_cache())
 
     def __repr__(self):
         return "GetResult:{}".format(self._orig)
@@ -357,19 +464,20 @@ class MultiResult:
                  ):
         self._orig = orig
         self._all_ok = self._orig.raw_result.pop('all_okay', False)
-        self._results = {}
         self._result_type = result_type
+        # split the successes and exceptions once so the results/exceptions properties do not need
+        # to rebuild (and type check) a new dict on every access
+        self._results = {}
+        self._exceptions = {}
         for k, v in self._orig.raw_result.items():
             if isinstance(v, CouchbaseBaseException):
                 if not return_exceptions:
                     raise ErrorMapper.build_exception(v)
-                else:
-                    self._results[k] = ErrorMapper.build_exception(v)
+                self._exceptions[k] = ErrorMapper.build_exception(v)
+            elif isinstance(v, list):
+                self._results[k] = v
             else:
-                if isinstance(v, list):
-                    self._results[k] = v
-                else:
-                    self._results[k] = result_type(v)
+                self._results[k] = result_type(v)
 
     @property
     def all_ok(self) -> bool:
@@ -384,11 +492,48 @@ class MultiResult:
             Dict[str, Exception]: Map of keys to their respective exceptions, if the
                 operation had an exception.
         """
-        exc = {}
-        for k, v in self._results.items():
-            if not isinstance(v, self._result_type) and not isinstance(v, list):
-                exc[k] = v
-        return exc
+        return self._exceptions
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        """
+            Dict[str, Any]: Map of keys to their respective results, if the operation has a result.
+        """
+        return self._results
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """
+            Iterates over the (key, result) pairs of the successful operations.
+
+            Iterate over the results::
+
+                res = collection.get_multi(keys)
+                for key, result in res:
+                    print(f'{key}: {result.content_as[dict]}')
+        """
+        return iter(self._results.items())
+
+    def __len__(self) -> int:
+        """
+            The number of successful operations, matching the pairs iterated over.  See :attr:`exceptions` for the
+            failed operations.
+        """
+        return len(self._results)
+
+    def __bool__(self) -> bool:
+        """
+            A multi-op result is always truthy, even if all of its operations failed (i.e. ``len()`` is 0).  Use
+            :attr:`all_ok` to check if all of the operations succeeded.
+        """
+        return True
+
+    def _repr_entries(self) -> str:
+        output_results = [f'{k}:{v}' for k, v in self._results.items()]
+        output_results.extend(f'{k}:{v}' for k, v in self._exceptions.items())
+        return ", ".join(output_results)
+
+    def __repr__(self):
+        return f'{type(self).__name__}( {self._repr_entries()} )'
 
 
 class MultiGetReplicaResult(MultiResult):
@@ -399,25 +544,12 @@ class MultiGetReplicaResult(MultiResult):
         super().__init__(orig, GetReplicaResult, return_exceptions)
 
     @property
-    def results(self) -> Dict[str, GetReplicaResult]:
+    def results(self) -> Dict[str, Union[GetReplicaResult, List[GetReplicaResult]]]:
         """
             Dict[str, :class:`.GetReplicaResult`]: Map of keys to their respective :class:`.GetReplicaResult`, if the
                 operation has a result.
         """
-        res = {}
-        for k, v in self._results.items():
-            okay = (isinstance(v, GetReplicaResult) or
-                    isinstance(v, list) and all(map(lambda r: isinstance(r, GetReplicaResult), v)))
-            if okay:
-                res[k] = v
-        return res
-
-    def __repr__(self):
-        output_results = []
-        for k, v in self._results.items():
-            output_results.append(f'{k}:{v}')
-
-        return f'MultiGetReplicaResult( {", ".join(output_results)} )'
+        return self._results
 
 
 class MultiGetResult(MultiResult):
@@ -433,21 +565,11 @@ class MultiGetResult(MultiResult):
             Dict[str, :class:`.GetResult`]: Map of keys to their respective :class:`.GetResult`, if the
                 operation has a result.
         """
-        res = {}
-        for k, v in self._results.items():
-            if isinstance(v, GetResult):
-                res[k] = v
-        return res
-
-    def __repr__(self):
-        output_results = []
-        for k, v in self._results.items():
-            output_results.append(f'{k}:{v}')
-
-        return f'MultiGetResult( {", ".join(output_results)} )'
+        return self._results
 
 
 class ExistsResult(Result):
+    __slots__ = ()
 
     @property
     def exists(self) -> bool:
@@ -460,64 +582,25 @@ class ExistsResult(Result):
         return "ExistsResult:{}".format(self._orig)
 
 
-class MultiExistsResult:
+class MultiExistsResult(MultiResult):
     def __init__(self,
                  orig,  # type: result
                  return_exceptions  # type: bool
                  ):
-
-        self._orig = orig
-        self._all_ok = self._orig.raw_result.pop('all_okay', False)
-        self._results = {}
-        for k, v in self._orig.raw_result.items():
-            if isinstance(v, CouchbaseBaseException):
-                if not return_exceptions:
-                    raise ErrorMapper.build_exception(v)
-                else:
-                    self._results[k] = ErrorMapper.build_exception(v)
-            else:
-                self._results[k] = ExistsResult(v)
-
-    @property
-    def all_ok(self) -> bool:
-        """
-            bool: True if all operations succeeded, false otherwise.
-        """
-        return self._all_ok
-
-    @property
-    def exceptions(self) -> Dict[str, CouchbaseBaseException]:
-        """
-            Dict[str, Exception]: Map of keys to their respective exceptions, if the
-                operation had an exception.
-        """
-        exc = {}
-        for k, v in self._results.items():
-            if not isinstance(v, ExistsResult):
-                exc[k] = v
-        return exc
+        super().__init__(orig, ExistsResult, return_exceptions)
 
     @property
     def results(self) -> Dict[str, ExistsResult]:
         """
-            Dict[str, :class:`.MutationResult`]: Map of keys to their respective :class:`.MutationResult`, if the
+            Dict[str, :class:`.ExistsResult`]: Map of keys to their respective :class:`.ExistsResult`, if the
                 operation has a result.
         """
-        res = {}
-        for k, v in self._results.items():
-            if isinstance(v, ExistsResult):
-                res[k] = v
-        return res
-
-    def __repr__(self):
-        output_results = []
-        for k, v in self._results.items():
-            output_results.append(f'{k}:{v}')
-
-        return f'MultiExistsResult( {", ".join(output_results)} )'
+        return self._results
 
 
 class MutationResult(Result):
+    __slots__ = ('_raw_mutation_token', '_mutation_token')
+
     def __init__(self,
                  orig,  # type: result
                  ):
@@ -539,42 +622,12 @@ class MutationResult(Result):
         return "MutationResult:{}".format(self._orig)
 
 
-class MultiMutationResult:
+class MultiMutationResult(MultiResult):
     def __init__(self,
                  orig,  # type: result
                  return_exceptions  # type: bool
                  ):
-
-        self._orig = orig
-        self._all_ok = self._orig.raw_result.pop('all_okay', False)
-        self._results = {}
-        for k, v in self._orig.raw_result.items():
-            if isinstance(v, CouchbaseBaseException):
-                if not return_exceptions:
-                    raise ErrorMapper.build_exception(v)
-                else:
-                    self._results[k] = ErrorMapper.build_exception(v)
-            else:
-                self._results[k] = MutationResult(v)
-
-    @property
-    def all_ok(self) -> bool:
-        """
-            bool: True if all operations succeeded, false otherwise.
-        """
-        return self._all_ok
-
-    @property
-    def exceptions(self) -> Dict[str, CouchbaseBaseException]:
-        """
-            Dict[str, Exception]: Map of keys to their respective exceptions, if the
-                operation had an exception.
-        """
-        exc = {}
-        for k, v in self._results.items():
-            if not isinstance(v, MutationResult):
-                exc[k] = v
-        return exc
+        super().__init__(orig, MutationResult, return_exceptions)
 
     @property
     def results(self) -> Dict[str, MutationResult]:
@@ -582,24 +635,15 @@ class MultiMutationResult:
             Dict[str, :class:`.MutationResult`]: Map of keys to their respective :class:`.MutationResult`, if the
                 operation has a result.
         """
-        res = {}
-        for k, v in self._results.items():
-            if isinstance(v, MutationResult):
-                res[k] = v
-        return res
-
-    def __repr__(self):
-        output_results = []
-        for k, v in self._results.items():
-            output_results.append(f'{k}:{v}')
-
-        return f'MultiMutationResult( {", ".join(output_results)} )'
+        return self._results
 
 
 MultiResultType = Union[MultiGetResult, MultiMutationResult]
 
 
 class MutationToken:
+    __slots__ = ('_token',)
+
     def __init__(self, token  # type: Dict[str, Union[str, int]]
                  ):
         self._token = token
@@ -722,6 +766,7 @@ class LookupInReplicaResult(Result):
 
 
 class MutateInResult(MutationResult):
+    __slots__ = ()
 
     @property
     def content_as(self) -> ContentSubdocProxy:
@@ -741,6 +786,7 @@ class MutateInResult(MutationResult):
 
 
 class CounterResult(MutationResult):
+    __slots__ = ()
 
     # Uncomment and delete previous property when ready to remove cas CounterResult.
     # cas = RemoveProperty('cas')
@@ -769,61 +815,20 @@ class CounterResult(MutationResult):
         return "CounterResult:{}".format(self._orig.raw_result)
 
 
-class MultiCounterResult:
+class MultiCounterResult(MultiResult):
     def __init__(self,
                  orig,  # type: result
                  return_exceptions  # type: bool
                  ):
-
-        self._orig = orig
-        self._all_ok = self._orig.raw_result.pop('all_okay', False)
-        self._results = {}
-        for k, v in self._orig.raw_result.items():
-            if isinstance(v, CouchbaseBaseException):
-                if not return_exceptions:
-                    raise ErrorMapper.build_exception(v)
-                else:
-                    self._results[k] = ErrorMapper.build_exception(v)
-            else:
-                self._results[k] = CounterResult(v)
-
-    @property
-    def all_ok(self) -> bool:
-        """
-            bool: True if all operations succeeded, false otherwise.
-        """
-        return self._all_ok
-
-    @property
-    def exceptions(self) -> Dict[str, CouchbaseBaseException]:
-        """
-            Dict[str, Exception]: Map of keys to their respective exceptions, if the
-                operation had an exception.
-        """
-        exc = {}
-        for k, v in self._results.items():
-            if not isinstance(v, CounterResult):
-                exc[k] = v
-        return exc
+        super().__init__(orig, CounterResult, return_exceptions)
 
     @property
     def results(self) -> Dict[str, CounterResult]:
         """
-            Dict[str, :class:`.MutationResult`]: Map of keys to their respective :class:`.MutationResult`, if the
+            Dict[str, :class:`.CounterResult`]: Map of keys to their respective :class:`.CounterResult`, if the
                 operation has a result.
         """
-        res = {}
-        for k, v in self._results.items():
-            if isinstance(v, CounterResult):
-                res[k] = v
-        return res
-
-    def __repr__(self):
-        output_results = []
-        for k, v in self._results.items():
-            output_results.append(f'{k}:{v}')
-
-        return f'MultiCounterResult( {", ".join(output_results)} )'
+        return self._results
 
 
 class ClusterInfoResult:
@@ -1007,7 +1012,7 @@ class ScanResult(Result):
         if self.ids_only:
             raise InvalidArgumentException(("No content available when scan is requested with "
                                             "`ScanOptions` ids_only set to True."))
-        return ContentProxy(self.value)
+        return ContentProxy(self.value, self._get_content_cache())
 
     def __repr__(self):
         return "ScanResult:{}".format(self._orig)
@@ -1035,6 +1040,18 @@ class ScanResultIterable:
             return self.__aiter__()
         return self.__iter__()
 
+    def next_batch(self):
+        """The next batch of rows returned by the scan.
+
+        .. note::
+            Only available when using the *txcouchbase* API.
+
+        Returns:
+            Deferred[List[:class:`.ScanResult`]]: A Deferred that fires w/ the next batch of rows.  The batch is empty
+            once the scan has completed.
+        """
+        return self._request.next_batch()
+
     def cancel_scan(self):
         self._request.cancel_scan()
 
@@ -226,18 +226,17 @@ def parse_subdocument_content_as(content,  # type: List[Dict[str, Any]]
     if index > len(content) - 1 or index < 0:
         raise InvalidIndexException(f"Provided index is invalid. Index={index}.")
 
-    status = content[index].get('status', None)
+    spec = content[index]
+    status = spec.get('status', None)
     if status is None:
         raise DocumentNotFoundException(f"Could not find document. Key={key}.")
 
-    op_code = content[index].get('opcode', None)
-    if op_code == SubDocOp.EXISTS:
+    if spec.get('opcode', None) == SubDocOp.EXISTS:
         return parse_subdocument_exists(content, index, key)
     if status == 0:
-        return content[index].get('value', None)
+        return spec.get('value', None)
 
-    path = content[index].get('path', None)
-    parse_subdocument_status(status, path, key)
+    parse_subdocument_status(status, spec.get('path', None), key)
 
 
 def parse_subdocument_exists(content,  # type: List[Dict[str, Any]]
@@ -0,0 +1,1811 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+An in-process, pure-Python stand-in for the ``couchbase.pycbc_core`` C++ extension.
+
+When the ``PYCBC_FAKE_CORE`` environment variable is set, the SDK is loaded on top of this module instead of the C++
+client.  Every cluster the application connects to is then an in-memory :class:`FakeCluster` (one per set of hosts
+in the connection string), so application level throughput, timeout and backpressure tests can run without a
+network, or a server.
+
+Only the data plane the KV, sub-document, range scan and query APIs use is implemented.  Query statements are
+handled by a trivial engine (see :meth:`FakeCluster.register_query`).  The management, analytics, search, views,
+diagnostics and transactions operations fail with a ``FeatureUnavailableException``.
+
+This module must only depend on the standard library, it is imported before the rest of the SDK.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import zlib
+from copy import deepcopy
+from datetime import timedelta
+from enum import Enum
+from heapq import heappop, heappush
+from itertools import count
+from threading import (Condition,
+                       Lock,
+                       RLock,
+                       Thread)
+from time import (monotonic,
+                  sleep,
+                  time,
+                  time_ns)
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
+from uuid import uuid4
+
+CXXCBC_METADATA = json.dumps({'version': 'fake_core'})
+
+FMT_JSON = 0x02000000
+FMT_PICKLE = 0x01000001
+FMT_BYTES = 0x03000002
+FMT_UTF8 = 0x04000004
+FMT_LEGACY_MASK = 0x07
+FMT_COMMON_MASK = 0xFF000000
+
+operations = Enum('Operations', ('GET GET_PROJECTED GET_AND_LOCK GET_AND_TOUCH GET_ANY_REPLICA GET_ALL_REPLICAS '
+                                 'EXISTS TOUCH UNLOCK INSERT UPSERT REPLACE REMOVE MUTATE_IN LOOKUP_IN '
+                                 'LOOKUP_IN_ALL_REPLICAS LOOKUP_IN_ANY_REPLICA DIAGNOSTICS PING INCREMENT DECREMENT '
+                                 'APPEND PREPEND N1QL_QUERY CLUSTER_MGMT_CLUSTER_INFO KV_RANGE_SCAN KV_PREFIX_SCAN '
+                                 'KV_SAMPLING_SCAN'))
+mgmt_operations = Enum('ManagementOperations', ('CLUSTER BUCKET COLLECTION QUERY_INDEX SEARCH_INDEX USER ANALYTICS '
+                                                'VIEW_INDEX EVENTING_FUNCTION'))
+cluster_mgmt_operations = Enum('ClusterManagementOperations', 'GET_CLUSTER_INFO ENABLE_DP')
+bucket_mgmt_operations = Enum('BucketManagementOperations', ('CREATE_BUCKET UPDATE_BUCKET DROP_BUCKET GET_BUCKET '
+                                                             'GET_ALL_BUCKETS FLUSH_BUCKET BUCKET_DESCRIBE'))
+collection_mgmt_operations = Enum('CollectionManagementOperations', ('CREATE_SCOPE DROP_SCOPE GET_ALL_SCOPES '
+                                                                     'CREATE_COLLECTION DROP_COLLECTION '
+                                                                     'UPDATE_COLLECTION'))
+user_mgmt_operations = Enum('UserManagementOperations', ('UPSERT_USER GET_USER GET_ALL_USERS DROP_USER '
+                                                         'CHANGE_PASSWORD GET_ROLES UPSERT_GROUP GET_GROUP '
+                                                         'GET_ALL_GROUPS DROP_GROUP'))
+query_index_mgmt_operations = Enum('QueryIndexManagementOperations', ('CREATE_INDEX DROP_INDEX GET_ALL_INDEXES '
+                                                                      'BUILD_DEFERRED_INDEXES'))
+analytics_mgmt_operations = Enum('AnalyticsManagementOperations', ('CREATE_DATAVERSE CREATE_DATASET CREATE_INDEX '
+                                                                   'GET_ALL_DATASETS GET_ALL_INDEXES DROP_DATAVERSE '
+                                                                   'DROP_DATASET DROP_INDEX GET_PENDING_MUTATIONS '
+                                                                   'LINK_CREATE LINK_CONNECT GET_ALL_LINKS '
+                                                                   'LINK_DISCONNECT LINK_REPLACE DROP_LINK'))
+search_index_mgmt_operations = Enum('SearchIndexManagementOperations', ('UPSERT_INDEX GET_INDEX DROP_INDEX '
+                                                                        'GET_INDEX_DOCUMENT_COUNT GET_ALL_INDEXES '
+                                                                        'GET_INDEX_STATS GET_ALL_STATS FREEZE_PLAN '
+                                                                        'CONTROL_INGEST ANALYZE_DOCUMENT '
+                                                                        'CONTROL_QUERY'))
+view_index_mgmt_operations = Enum('ViewIndexManagementOperations', 'UPSERT_INDEX GET_INDEX DROP_INDEX GET_ALL_INDEXES')
+eventing_function_mgmt_operations = Enum('EventingFunctionManagementOperations', ('UPSERT_FUNCTION DEPLOY_FUNCTION '
+                                                                                  'GET_FUNCTION PAUSE_FUNCTION '
+                                                                                  'RESUME_FUNCTION UNDEPLOY_FUNCTION '
+                                                                                  'DROP_FUNCTION GET_ALL_FUNCTIONS '
+                                                                                  'GET_STATUS'))
+transaction_operations = Enum('TransactionOperations', ('GET GET_REPLICA_FROM_PREFERRED_SERVER_GROUP INSERT REPLACE '
+                                                        'REMOVE'))
+
+# the subset of couchbase.exceptions.ExceptionMap raised by the fake
+_ERRORS = {
+    7: 'temporary_failure',
+    8: 'parsing_failure',
+    9: 'cas_mismatch',
+    13: 'ambiguous_timeout',
+    14: 'unambiguous_timeout',
+    15: 'feature_not_available',
+    101: 'document_not_found',
+    103: 'document_locked',
+    105: 'document_exists',
+    113: 'path_not_found',
+    114: 'path_mismatch',
+    115: 'path_invalid',
+    119: 'value_invalid',
+    120: 'document_not_json',
+    122: 'delta_invalid',
+    123: 'path_exists',
+    131: 'document_not_locked',
+    134: 'range_scan_completed',
+}
+TEMPORARY_FAILURE = 7
+PARSING_FAILURE = 8
+CAS_MISMATCH = 9
+AMBIGUOUS_TIMEOUT = 13
+UNAMBIGUOUS_TIMEOUT = 14
+FEATURE_NOT_AVAILABLE = 15
+DOCUMENT_NOT_FOUND = 101
+DOCUMENT_LOCKED = 103
+DOCUMENT_EXISTS = 105
+DOCUMENT_NOT_JSON = 120
+DELTA_INVALID = 122
+DOCUMENT_NOT_LOCKED = 131
+RANGE_SCAN_COMPLETED = 134
+# errc::query::prepared_statement_failure, not mapped by couchbase.exceptions.ExceptionMap
+PREPARED_STATEMENT_FAILURE = 203
+
+# sub-document status -> ExceptionMap code of the error a failed mutate_in spec raises
+_SUBDOC_PATH_NOT_FOUND = 192
+_SUBDOC_PATH_MISMATCH = 193
+_SUBDOC_PATH_INVALID = 194
+_SUBDOC_VALUE_CANNOT_INSERT = 197
+_SUBDOC_DOC_NOT_JSON = 198
+_SUBDOC_DELTA_INVALID = 200
+_SUBDOC_PATH_EXISTS = 201
+_SUBDOC_STATUS_ERRORS = {
+    _SUBDOC_PATH_NOT_FOUND: 113,
+    _SUBDOC_PATH_MISMATCH: 114,
+    _SUBDOC_PATH_INVALID: 115,
+    _SUBDOC_VALUE_CANNOT_INSERT: 119,
+    _SUBDOC_DOC_NOT_JSON: 120,
+    _SUBDOC_DELTA_INVALID: 122,
+    _SUBDOC_PATH_EXISTS: 123,
+}
+
+# couchbase.subdocument.SubDocOp
+_GET_DOC = 0
+_SET_DOC = 1
+_REMOVE_DOC = 4
+_GET = 197
+_EXISTS = 198
+_DICT_ADD = 199
+_DICT_UPSERT = 200
+_REMOVE = 201
+_REPLACE = 202
+_ARRAY_PUSH_LAST = 203
+_ARRAY_PUSH_FIRST = 204
+_ARRAY_INSERT = 205
+_ARRAY_ADD_UNIQUE = 206
+_COUNTER = 207
+_GET_COUNT = 210
+
+# couchbase.subdocument.StoreSemantics
+_STORE_REPLACE = 0
+_STORE_UPSERT = 1
+_STORE_INSERT = 2
+
+# the C++ client's default KV timeout, in microseconds
+DEFAULT_KV_TIMEOUT = 2500000
+THIRTY_DAYS_IN_SECONDS = 30 * 24 * 60 * 60
+NUM_PARTITIONS = 1024
+
+_MUTATION_OPS = frozenset([operations.INSERT.value, operations.UPSERT.value, operations.REPLACE.value,
+                           operations.REMOVE.value, operations.TOUCH.value, operations.UNLOCK.value,
+                           operations.GET_AND_LOCK.value, operations.GET_AND_TOUCH.value,
+                           operations.MUTATE_IN.value, operations.INCREMENT.value, operations.DECREMENT.value,
+                           operations.APPEND.value, operations.PREPEND.value])
+# the operations that read a locked document (exists is handled before the lock is checked)
+_LOCK_IGNORING_OPS = frozenset([operations.GET.value, operations.GET_ANY_REPLICA.value,
+                                operations.GET_ALL_REPLICAS.value])
+# the operations that fail if given a CAS that does not match the document's
+_CAS_CHECKED_OPS = frozenset([operations.REPLACE.value, operations.REMOVE.value, operations.UPSERT.value])
+
+
+class exception:  # noqa: N801
+    """
+    Mirrors the C++ client's exception object.  Like the C++ client, the fake returns these objects (or passes them
+    to an operation's errback) rather than raising them.
+    """
+
+    def __init__(self,
+                 err,  # type: int
+                 message=None,  # type: Optional[str]
+                 error_context=None,  # type: Optional[Dict[str, Any]]
+                 ):
+        self._err = err
+        self._strerror = message or _ERRORS.get(err, 'fake_core_error')
+        self._error_context = error_context
+
+    def err(self) -> int:
+        return self._err
+
+    def err_category(self) -> str:
+        return 'couchbase.fake_core'
+
+    def strerror(self) -> str:
+        return self._strerror
+
+    def error_context(self) -> Optional[Dict[str, Any]]:
+        return self._error_context
+
+    def error_info(self) -> Optional[Dict[str, Any]]:
+        return None
+
+    def __repr__(self):
+        return f'exception(err={self._err}, strerror={self._strerror})'
+
+
+class result:  # noqa: N801
+    """
+    Mirrors the C++ client's result object.
+    """
+
+    __slots__ = ('raw_result',)
+
+    def __init__(self,
+                 raw_result=None,  # type: Optional[Dict[str, Any]]
+                 ):
+        self.raw_result = raw_result if raw_result is not None else {}
+
+    def err(self) -> Optional[int]:
+        return None
+
+    def get(self, *args):
+        if not 1 <= len(args) <= 2 or not isinstance(args[0], str):
+            raise TypeError('get() expects a field name and an optional default value')
+        return self.raw_result.get(*args)
+
+    def __repr__(self):
+        return f'result:{self.raw_result}'
+
+
+class mutation_token:  # noqa: N801
+    __slots__ = ('_token',)
+
+    def __init__(self, token  # type: Dict[str, Any]
+                 ):
+        self._token = token
+
+    def get(self) -> Dict[str, Any]:
+        return dict(self._token)
+
+
+class _Options:
+    """
+    Stands in for the C++ client's transaction config and options objects.
+    """
+
+    def __init__(self, **kwargs):
+        self._opts = kwargs
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._opts)
+
+
+class transaction_config(_Options):  # noqa: N801
+    pass
+
+
+class transaction_options(_Options):  # noqa: N801
+    pass
+
+
+class transaction_query_options(_Options):  # noqa: N801
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._opts.get('query_args', None) or {})
+
+
+class transaction_get_result:  # noqa: N801
+    pass
+
+
+class pycbc_logger:  # noqa: N801
+    """
+    The fake has no C++ logger, all of its methods are no-ops.
+    """
+
+    def close_logging_sink(self):
+        pass
+
+    def configure_logging_sink(self, logger, level, **kwargs):
+        pass
+
+    def dropped_records(self) -> Dict[str, int]:
+        return {'queue_full': 0, 'rate_limited': 0, 'sampled': 0}
+
+    def create_logger(self, **kwargs):
+        pass
+
+    def enable_protocol_logger(self, filename):
+        pass
+
+    def is_console_logger(self) -> bool:
+        return False
+
+    def is_file_logger(self) -> bool:
+        return False
+
+
+def shutdown_logger():
+    pass
+
+
+def _to_seconds(value  # type: Union[timedelta, float, int]
+                ) -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+def _error_code(error  # type: Union[int, type]
+                ) -> int:
+    if isinstance(error, int):
+        return error
+    from couchbase.exceptions import ExceptionMap
+    try:
+        return ExceptionMap[error.__name__].value
+    except (AttributeError, KeyError):
+        from couchbase.exceptions import InvalidArgumentException
+        raise InvalidArgumentException(message=f'No error code found for {error}.') from None
+
+
+def _op_name(op_type  # type: int
+             ) -> str:
+    return operations(op_type).name.lower()
+
+
+class LatencyProfile:
+    """**VOLATILE** This API is subject to change at any time.
+
+    The simulated latency of the operations of a :class:`FakeCluster`.  Each operation takes ``base`` plus a
+    uniformly distributed amount up to ``jitter``.  A ``spike_rate`` fraction of the operations take an additional
+    ``spike``, i.e. a GC pause or a rebalance.
+
+    Args:
+        base (timedelta, optional): Latency every operation takes. Defaults to no latency.
+        jitter (timedelta, optional): Upper bound of the random latency added to each operation. Defaults to none.
+        spike_rate (float, optional): Fraction, in the range [0, 1], of the operations that spike. Defaults to 0.
+        spike (timedelta, optional): Latency added to the operations that spike. Defaults to none.
+        op_types (Iterable[str], optional): Only apply the profile to these operation types (i.e. ``'get'``,
+            ``'upsert'``, ``'lookup_in'``, ``'n1ql_query'``). Defaults to all operations.
+        seed (int, optional): Seed for the profile's random number generator.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If any of the provided arguments are invalid.
+    """
+
+    def __init__(self,
+                 base=timedelta(0),  # type: Optional[timedelta]
+                 jitter=timedelta(0),  # type: Optional[timedelta]
+                 spike_rate=0.0,  # type: Optional[float]
+                 spike=timedelta(0),  # type: Optional[timedelta]
+                 op_types=None,  # type: Optional[Iterable[str]]
+                 seed=None,  # type: Optional[int]
+                 ):
+        if not 0 <= spike_rate <= 1:
+            from couchbase.exceptions import InvalidArgumentException
+            raise InvalidArgumentException(message='The spike_rate must be in the range [0, 1].')
+        self._base = _to_seconds(base)
+        self._jitter = _to_seconds(jitter)
+        self._spike_rate = spike_rate
+        self._spike = _to_seconds(spike)
+        self._op_types = frozenset(op_types) if op_types is not None else None
+        self._random = random.Random(seed)  # nosec
+
+    def applies_to(self, op_name  # type: str
+                   ) -> bool:
+        return self._op_types is None or op_name in self._op_types
+
+    def sample(self) -> float:
+        """
+        Returns an operation's latency, in seconds.
+        """
+        latency = self._base
+        if self._jitter:
+            latency += self._random.uniform(0, self._jitter)
+        if self._spike_rate and self._random.random() < self._spike_rate:
+            latency += self._spike
+        return latency
+
+
+class ErrorProfile:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Injects errors into the operations of a :class:`FakeCluster`.  An operation the profile applies to fails with
+    ``error`` with the probability ``rate``.  The error is returned once the operation's simulated latency has
+    elapsed.
+
+    Args:
+        error (Union[type, int]): The :class:`~couchbase.exceptions.CouchbaseException` subclass (i.e.
+            ``TemporaryFailException``), or its :class:`~couchbase.exceptions.ExceptionMap` value, to fail with.
+        rate (float, optional): Probability, in the range [0, 1], that an operation fails. Defaults to 1.
+        op_types (Iterable[str], optional): Only apply the profile to these operation types (i.e. ``'get'``,
+            ``'upsert'``, ``'lookup_in'``, ``'n1ql_query'``). Defaults to all operations.
+        keys (Iterable[str], optional): Only apply the profile to these document keys. Defaults to all keys.
+        limit (int, optional): Stop injecting errors after this many. Defaults to no limit.
+        seed (int, optional): Seed for the profile's random number generator.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If any of the provided arguments are invalid.
+    """
+
+    def __init__(self,
+                 error,  # type: Union[type, int]
+                 rate=1.0,  # type: Optional[float]
+                 op_types=None,  # type: Optional[Iterable[str]]
+                 keys=None,  # type: Optional[Iterable[str]]
+                 limit=None,  # type: Optional[int]
+                 seed=None,  # type: Optional[int]
+                 ):
+        if not 0 <= rate <= 1:
+            from couchbase.exceptions import InvalidArgumentException
+            raise InvalidArgumentException(message='The rate must be in the range [0, 1].')
+        self._err = _error_code(error)
+        self._rate = rate
+        self._op_types = frozenset(op_types) if op_types is not None else None
+        self._keys = frozenset(keys) if keys is not None else None
+        self._remaining = limit
+        self._random = random.Random(seed)  # nosec
+        self._lock = Lock()
+
+    def inject(self,
+               op_name,  # type: str
+               key,  # type: Optional[str]
+               ) -> Optional[int]:
+        """
+        Returns the error code the operation fails with, or None if the operation should not fail.
+        """
+        if self._op_types is not None and op_name not in self._op_types:
+            return None
+        if self._keys is not None and key not in self._keys:
+            return None
+        with self._lock:
+            if self._remaining == 0:
+                return None
+            if self._rate < 1 and self._random.random() >= self._rate:
+                return None
+            if self._remaining is not None:
+                self._remaining -= 1
+        return self._err
+
+
+class _Scheduler:
+    """
+    Completes the operations issued by the async APIs, once their simulated latency has elapsed, on a single
+    background thread (as the C++ client does from its IO thread).
+    """
+
+    def __init__(self):
+        self._cond = Condition()
+        self._queue = []
+        self._seq = count()
+        self._thread = None
+
+    def call_later(self,
+                   delay,  # type: float
+                   fn,  # type: Callable[..., None]
+                   *args,  # type: Any
+                   ) -> None:
+        with self._cond:
+            heappush(self._queue, (monotonic() + delay, next(self._seq), fn, args))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name='pycbc-fake-core', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = monotonic()
+                    if self._queue and self._queue[0][0] <= now:
+                        break
+                    self._cond.wait(self._queue[0][0] - now if self._queue else None)
+                _, _, fn, args = heappop(self._queue)
+            try:
+                fn(*args)
+            except Exception:  # nosec
+                # an exception raised by a callback must not stop the scheduler
+                pass
+
+
+_SCHEDULER = _Scheduler()
+
+
+class _Document:
+    __slots__ = ('value', 'flags', 'cas', 'expiry', 'xattrs', 'locked_until', 'lock_cas')
+
+    def __init__(self, value, flags, cas, expiry=0, xattrs=None):
+        self.value = value
+        self.flags = flags
+        self.cas = cas
+        self.expiry = expiry
+        self.xattrs = xattrs if xattrs is not None else {}
+        self.locked_until = 0
+        self.lock_cas = 0
+
+    def is_locked(self) -> bool:
+        return self.locked_until > monotonic()
+
+
+def _is_json(flags  # type: int
+             ) -> bool:
+    if flags & FMT_COMMON_MASK:
+        return flags & FMT_COMMON_MASK == FMT_JSON
+    return flags & FMT_LEGACY_MASK == 0
+
+
+def _absolute_expiry(expiry  # type: Optional[int]
+                     ) -> int:
+    if not expiry:
+        return 0
+    if expiry < THIRTY_DAYS_IN_SECONDS:
+        return int(time()) + expiry
+    return expiry
+
+
+_PATH_TOKEN = re.compile(r'\[(-?\d+)\]|`((?:``|[^`])*)`|([^.\[\]`]+)|(\.)')
+
+
+def _parse_path(path  # type: str
+                ) -> Optional[List[Union[str, int]]]:
+    """
+    Splits a sub-document path into its components (str for object keys, int for array indexes).  Returns None if
+    the path is invalid.
+    """
+    tokens = []
+    pos = 0
+    while pos < len(path):
+        match = _PATH_TOKEN.match(path, pos)
+        if match is None:
+            return None
+        idx, quoted, name, dot = match.groups()
+        if idx is not None:
+            tokens.append(int(idx))
+        elif quoted is not None:
+            tokens.append(quoted.replace('``', '`'))
+        elif name is not None:
+            tokens.append(name)
+        elif dot is not None and (pos == 0 or match.end() == len(path)):
+            return None
+        pos = match.end()
+    return tokens
+
+
+class _PathError(Exception):
+    def __init__(self, status):
+        super().__init__(status)
+        self.status = status
+
+
+def _get_child(container, token):
+    if isinstance(token, int):
+        if not isinstance(container, list):
+            raise _PathError(_SUBDOC_PATH_MISMATCH)
+        if not -len(container) <= token < len(container):
+            raise _PathError(_SUBDOC_PATH_NOT_FOUND)
+        return container[token]
+    if not isinstance(container, dict):
+        raise _PathError(_SUBDOC_PATH_MISMATCH)
+    if token not in container:
+        raise _PathError(_SUBDOC_PATH_NOT_FOUND)
+    return container[token]
+
+
+def _resolve(doc, tokens):
+    for token in tokens:
+        doc = _get_child(doc, token)
+    return doc
+
+
+def _resolve_parent(doc, tokens, create_parents=False):
+    parent = doc
+    for token in tokens[:-1]:
+        try:
+            parent = _get_child(parent, token)
+        except _PathError as ex:
+            if ex.status != _SUBDOC_PATH_NOT_FOUND or not create_parents or isinstance(token, int):
+                raise
+            parent[token] = {}
+            parent = parent[token]
+    return parent
+
+
+class _Keyspace:
+    __slots__ = ('conn', 'bucket', 'scope', 'collection')
+
+    def __init__(self, conn, bucket, scope, collection):
+        self.conn = conn
+        self.bucket = bucket
+        self.scope = scope
+        self.collection = collection
+
+    def error(self,
+              err,  # type: int
+              key,  # type: Optional[str]
+              message=None,  # type: Optional[str]
+              ) -> exception:
+        return exception(err, message=message, error_context={
+            'context_type': 'KeyValueErrorContext',
+            'key': key,
+            'bucket_name': self.bucket,
+            'scope_name': self.scope,
+            'collection_name': self.collection,
+            'retry_attempts': 0,
+            'retry_reasons': [],
+        })
+
+
+class FakeCluster:
+    """**VOLATILE** This API is subject to change at any time.
+
+    The in-memory state of a fake cluster: its documents, the latency and errors its operations are subject to and
+    the query responses it has been taught.  Obtain the cluster an application connects to via
+    :func:`get_fake_cluster`.  All methods are thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = RLock()
+        self._collections = {}  # type: Dict[Tuple[str, str, str], Dict[str, _Document]]
+        self._queries = []  # type: List[Tuple[Any, Any, Optional[int]]]
+        self._prepared = {}  # type: Dict[str, str]
+        self._latency = []  # type: List[LatencyProfile]
+        self._errors = []  # type: List[ErrorProfile]
+        self._max_in_flight = None
+        self._in_flight = 0
+        self._last_cas = 0
+        self._seqnos = {}  # type: Dict[Tuple[str, int], int]
+        self._partition_uuid = random.getrandbits(48)  # nosec
+        self._stats = {}  # type: Dict[str, int]
+
+    def configure(self,
+                  latency=None,  # type: Optional[Union[LatencyProfile, List[LatencyProfile]]]
+                  errors=None,  # type: Optional[Union[ErrorProfile, List[ErrorProfile]]]
+                  max_in_flight=None,  # type: Optional[int]
+                  ) -> None:
+        """Sets the latency, error injection and backpressure the cluster's operations are subject to.  Replaces
+        any previous configuration.
+
+        Args:
+            latency (Union[:class:`LatencyProfile`, List[:class:`LatencyProfile`]], optional): The latency of the
+                cluster's operations.  The first profile that applies to an operation is used.
+            errors (Union[:class:`ErrorProfile`, List[:class:`ErrorProfile`]], optional): Errors to inject.  The
+                first profile that injects an error into an operation wins.
+            max_in_flight (int, optional): Number of operations that can be in flight at once.  Operations issued
+                beyond that fail immediately with a ``TemporaryFailException``.
+        """
+        if isinstance(latency, LatencyProfile):
+            latency = [latency]
+        if isinstance(errors, ErrorProfile):
+            errors = [errors]
+        with self._lock:
+            self._latency = list(latency or [])
+            self._errors = list(errors or [])
+            self._max_in_flight = max_in_flight
+
+    def register_query(self,
+                       statement,  # type: Union[str, re.Pattern]
+                       rows=None,  # type: Optional[Union[List[Any], Callable[..., List[Any]]]]
+                       error=None,  # type: Optional[Union[type, int]]
+                       ) -> None:
+        """Teaches the cluster the response to a query statement.  Registered statements take precedence over the
+        statements the built-in engine understands:
+
+            * ``SELECT RAW i FROM ARRAY_RANGE(start, end) AS i``
+            * ``SELECT RAW META().id FROM keyspace [LIMIT n]``
+            * ``SELECT RAW COUNT(*) FROM keyspace``
+            * ``SELECT * FROM keyspace [AS alias] [LIMIT n]``
+            * ``PREPARE [name FROM] statement`` and ``EXECUTE name``, the prepared statement is any statement above
+              (see :meth:`clear_prepared_statements`)
+
+        Args:
+            statement (Union[str, re.Pattern]): The statement, compared ignoring case and whitespace, or a compiled
+                pattern the statement must match.
+            rows (Union[List[Any], Callable[..., List[Any]]], optional): The rows to return.  A callable is called
+                with the query's positional parameters (a list) and named parameters (a dict) and returns the rows.
+            error (Union[type, int], optional): Fail the query with this error (see :class:`ErrorProfile`) instead.
+        """
+        if isinstance(statement, str):
+            statement = _normalize_statement(statement)
+        err = _error_code(error) if error is not None else None
+        with self._lock:
+            self._queries.insert(0, (statement, rows, err))
+
+    def clear_prepared_statements(self) -> None:
+        """
+        Forgets the prepared statements, as a query node that restarted would.  Executing them fails with a
+        ``prepared_statement_failure``.
+        """
+        with self._lock:
+            self._prepared.clear()
+
+    def flush(self) -> None:
+        """
+        Removes all documents.
+        """
+        with self._lock:
+            self._collections.clear()
+
+    def reset(self) -> None:
+        """
+        Removes all documents, registered queries, prepared statements, profiles and stats.
+        """
+        with self._lock:
+            self._collections.clear()
+            self._queries.clear()
+            self._prepared.clear()
+            self._latency = []
+            self._errors = []
+            self._max_in_flight = None
+            self._stats.clear()
+
+    def keys(self,
+             bucket,  # type: str
+             scope='_default',  # type: Optional[str]
+             collection='_default',  # type: Optional[str]
+             ) -> List[str]:
+        """
+        Returns the (sorted) keys of the documents stored in a collection.
+        """
+        with self._lock:
+            docs = self._collections.get((bucket, scope, collection), {})
+            return sorted(k for k, d in docs.items() if not self._is_expired(d))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cluster's counters: ``ops`` (operations completed), ``errors_injected``, ``rejected`` (operations
+        rejected because ``max_in_flight`` was reached), ``timeouts`` and ``in_flight``.
+        """
+        with self._lock:
+            stats = {'ops': 0, 'errors_injected': 0, 'rejected': 0, 'timeouts': 0}
+            stats.update(self._stats)
+            stats['in_flight'] = self._in_flight
+            return stats
+
+    def _incr_stat(self, name):
+        self._stats[name] = self._stats.get(name, 0) + 1
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            if self._max_in_flight is not None and self._in_flight >= self._max_in_flight:
+                self._incr_stat('rejected')
+                return False
+            self._in_flight += 1
+            return True
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._incr_stat('ops')
+
+    def _plan(self,
+              op_name,  # type: str
+              key,  # type: Optional[str]
+              ) -> Tuple[float, Optional[int]]:
+        """
+        Returns the simulated latency (in seconds) of an operation and the error to inject, if any.
+        """
+        with self._lock:
+            latency_profiles = self._latency
+            error_profiles = self._errors
+        delay = 0.0
+        for profile in latency_profiles:
+            if profile.applies_to(op_name):
+                delay = profile.sample()
+                break
+        for profile in error_profiles:
+            err = profile.inject(op_name, key)
+            if err is not None:
+                with self._lock:
+                    self._incr_stat('errors_injected')
+                return delay, err
+        return delay, None
+
+    def _next_cas(self) -> int:
+        with self._lock:
+            self._last_cas = max(self._last_cas + 1, time_ns())
+            return self._last_cas
+
+    def _mutation_token(self, bucket, key):
+        partition = ((zlib.crc32(key.encode('utf-8')) >> 16) & 0x7fff) % NUM_PARTITIONS
+        with self._lock:
+            seqno = self._seqnos.get((bucket, partition), 0) + 1
+            self._seqnos[(bucket, partition)] = seqno
+        return mutation_token({'partition_id': partition,
+                               'partition_uuid': self._partition_uuid,
+                               'sequence_number': seqno,
+                               'bucket_name': bucket})
+
+    @staticmethod
+    def _is_expired(doc):
+        return doc.expiry and doc.expiry <= time()
+
+    def _get_docs(self, keyspace):
+        return self._collections.setdefault((keyspace.bucket, keyspace.scope, keyspace.collection), {})
+
+    def _get_doc(self, docs, key):
+        doc = docs.get(key, None)
+        if doc is not None and self._is_expired(doc):
+            del docs[key]
+            return None
+        return doc
+
+
+_FAKE_CLUSTERS = {}  # type: Dict[str, FakeCluster]
+_FAKE_CLUSTERS_LOCK = Lock()
+
+
+def _cluster_id(connstr  # type: str
+                ) -> str:
+    hosts = connstr.split('://', 1)[-1]
+    return re.split(r'[/?]', hosts, maxsplit=1)[0].lower()
+
+
+def get_fake_cluster(connstr='couchbase://localhost'  # type: Optional[str]
+                     ) -> FakeCluster:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Returns the :class:`FakeCluster` connections to the provided connection string's hosts share, creating it if
+    needed.
+
+    Args:
+        connstr (str, optional): Connection string. Defaults to ``couchbase://localhost``.
+
+    Returns:
+        :class:`FakeCluster`: The fake cluster.
+    """
+    cluster_id = _cluster_id(connstr)
+    with _FAKE_CLUSTERS_LOCK:
+        cluster = _FAKE_CLUSTERS.get(cluster_id, None)
+        if cluster is None:
+            cluster = _FAKE_CLUSTERS[cluster_id] = FakeCluster()
+        return cluster
+
+
+def reset_fake_clusters() -> None:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Discards every :class:`FakeCluster`.
+    """
+    with _FAKE_CLUSTERS_LOCK:
+        _FAKE_CLUSTERS.clear()
+
+
+class _Connection:
+    __slots__ = ('connstr', 'cluster', 'buckets')
+
+    def __init__(self, connstr):
+        self.connstr = connstr
+        self.cluster = get_fake_cluster(connstr)
+        self.buckets = set()
+
+
+def _complete(res, callback=None, errback=None):
+    if callback is None:
+        return res
+    if isinstance(res, exception):
+        _SCHEDULER.call_later(0, errback, res)
+    else:
+        _SCHEDULER.call_later(0, callback, res)
+
+
+def _op_error(keyspace,  # type: Optional[_Keyspace]
+              err,  # type: int
+              key,  # type: Optional[str]
+              ) -> exception:
+    if keyspace is not None:
+        return keyspace.error(err, key)
+    return exception(err)
+
+
+def _plan_op(cluster,  # type: FakeCluster
+             op_type,  # type: int
+             key,  # type: Optional[str]
+             op_args,  # type: Dict[str, Any]
+             ) -> Tuple[float, Optional[int]]:
+    """
+    Returns the simulated latency (in seconds) of an operation, capped at the operation's timeout, and the error to
+    inject, if any.
+    """
+    delay, err = cluster._plan(_op_name(op_type), key)
+    timeout = (op_args.get('timeout', None) or DEFAULT_KV_TIMEOUT) / 1e6
+    if delay > timeout:
+        with cluster._lock:
+            cluster._incr_stat('timeouts')
+        return timeout, AMBIGUOUS_TIMEOUT if op_type in _MUTATION_OPS else UNAMBIGUOUS_TIMEOUT
+    return delay, err
+
+
+def _dispatch(cluster,  # type: FakeCluster
+              keyspace,  # type: Optional[_Keyspace]
+              op_type,  # type: int
+              key,  # type: Optional[str]
+              op_args,  # type: Dict[str, Any]
+              execute,  # type: Callable[[], Any]
+              ) -> Any:
+    """
+    Runs an operation subject to the cluster's backpressure, latency and error profiles.  Blocks if the operation has
+    no callback, otherwise the callback (or errback) is called from the scheduler's thread.
+    """
+    callback = op_args.get('callback', None)
+    errback = op_args.get('errback', None)
+
+    if not cluster._acquire():
+        return _complete(_op_error(keyspace, TEMPORARY_FAILURE, key), callback, errback)
+
+    delay, err = _plan_op(cluster, op_type, key, op_args)
+
+    def finish():
+        try:
+            return _op_error(keyspace, err, key) if err is not None else execute()
+        finally:
+            cluster._release()
+
+    if callback is None:
+        if delay > 0:
+            sleep(delay)
+        return finish()
+
+    def deliver():
+        res = finish()
+        if isinstance(res, exception):
+            errback(res)
+        else:
+            callback(res)
+
+    _SCHEDULER.call_later(delay, deliver)
+
+
+def create_connection(connstr,  # type: str
+                      auth=None,  # type: Optional[Dict[str, Any]]
+                      options=None,  # type: Optional[Dict[str, Any]]
+                      callback=None,  # type: Optional[Callable[[Any], None]]
+                      errback=None,  # type: Optional[Callable[[Any], None]]
+                      ) -> Optional[_Connection]:
+    return _complete(_Connection(connstr), callback, errback)
+
+
+def close_connection(conn,  # type: _Connection
+                     callback=None,  # type: Optional[Callable[[Any], None]]
+                     errback=None,  # type: Optional[Callable[[Any], None]]
+                     ) -> Optional[bool]:
+    return _complete(True, callback, errback)
+
+
+def open_or_close_bucket(conn,  # type: _Connection
+                         bucket_name,  # type: str
+                         open_bucket=1,  # type: Optional[int]
+                         callback=None,  # type: Optional[Callable[[Any], None]]
+                         errback=None,  # type: Optional[Callable[[Any], None]]
+                         ) -> Optional[bool]:
+    if open_bucket:
+        conn.buckets.add(bucket_name)
+    else:
+        conn.buckets.discard(bucket_name)
+    return _complete(True, callback, errback)
+
+
+def get_connection_info(conn  # type: _Connection
+                        ) -> Dict[str, Any]:
+    return {'connstr': conn.connstr, 'buckets': sorted(conn.buckets), 'fake_core': True}
+
+
+def create_keyspace(conn,  # type: _Connection
+                    bucket,  # type: str
+                    scope,  # type: str
+                    collection_name,  # type: str
+                    ) -> _Keyspace:
+    return _Keyspace(conn, bucket, scope, collection_name)
+
+
+def _not_available(*args, **kwargs):
+    res = exception(FEATURE_NOT_AVAILABLE, message='feature_not_available_in_fake_core')
+    return _complete(res, kwargs.get('callback', None), kwargs.get('errback', None))
+
+
+diagnostics_operation = _not_available
+management_operation = _not_available
+analytics_query = _not_available
+search_query = _not_available
+view_query = _not_available
+create_transactions = _not_available
+destroy_transactions = _not_available
+create_transaction_context = _not_available
+create_new_attempt_context = _not_available
+transaction_op = _not_available
+transaction_query_op = _not_available
+transaction_commit = _not_available
+transaction_rollback = _not_available
+
+
+def _check_lock(doc,  # type: _Document
+                op_type,  # type: int
+                op_args,  # type: Dict[str, Any]
+                ) -> Optional[int]:
+    """
+    Returns the error an operation on a locked document fails with, if any.
+    """
+    if op_type == operations.UNLOCK.value:
+        return CAS_MISMATCH if op_args.get('cas', 0) != doc.lock_cas else None
+    if op_type in _MUTATION_OPS and op_args.get('cas', 0) == doc.lock_cas:
+        # a mutation w/ the CAS get_and_lock returned releases the lock
+        doc.locked_until = 0
+        return None
+    return DOCUMENT_LOCKED
+
+
+def _check_kv_op(doc,  # type: Optional[_Document]
+                 op_type,  # type: int
+                 op_args,  # type: Dict[str, Any]
+                 ) -> Optional[int]:
+    """
+    Returns the error a KV operation fails with given the document's state (existence, lock and CAS), if any.
+    """
+    if op_type == operations.INSERT.value:
+        return DOCUMENT_EXISTS if doc is not None else None
+    if doc is None:
+        return DOCUMENT_NOT_FOUND if op_type != operations.UPSERT.value else None
+    if doc.is_locked() and op_type not in _LOCK_IGNORING_OPS:
+        err = _check_lock(doc, op_type, op_args)
+        if err is not None:
+            return err
+    elif op_type == operations.UNLOCK.value:
+        return DOCUMENT_NOT_LOCKED
+    cas = op_args.get('cas', 0)
+    if cas and op_type in _CAS_CHECKED_OPS and cas not in (doc.cas, doc.lock_cas):
+        return CAS_MISMATCH
+    return None
+
+
+def _kv_get(cluster, key, doc, op_type, op_args):
+    return _get_result(key, doc, op_args, op_type)
+
+
+def _kv_get_and_lock(cluster, key, doc, op_type, op_args):
+    doc.lock_cas = doc.cas = cluster._next_cas()
+    doc.locked_until = monotonic() + op_args.get('lock_time', 15)
+    return _get_result(key, doc, op_args, op_type)
+
+
+def _kv_touch(cluster, key, doc, op_type, op_args):
+    doc.expiry = _absolute_expiry(op_args.get('expiry', 0))
+    doc.cas = cluster._next_cas()
+    if op_type == operations.TOUCH.value:
+        return result({'key': key, 'cas': doc.cas})
+    return _get_result(key, doc, op_args, op_type)
+
+
+def _kv_unlock(cluster, key, doc, op_type, op_args):
+    doc.locked_until = 0
+    return result({'key': key})
+
+
+# the KV operations that do not store (or remove) the document, all others are handled by _kv_execute itself
+_KV_HANDLERS = {
+    operations.GET.value: _kv_get,
+    operations.GET_ANY_REPLICA.value: _kv_get,
+    operations.GET_ALL_REPLICAS.value: _kv_get,
+    operations.GET_AND_LOCK.value: _kv_get_and_lock,
+    operations.GET_AND_TOUCH.value: _kv_touch,
+    operations.TOUCH.value: _kv_touch,
+    operations.UNLOCK.value: _kv_unlock,
+}
+
+
+def _kv_execute(keyspace,  # type: _Keyspace
+                key,  # type: str
+                op_type,  # type: int
+                value,  # type: Optional[Tuple[bytes, int]]
+                op_args,  # type: Dict[str, Any]
+                ) -> Any:
+    cluster = keyspace.conn.cluster
+    with cluster._lock:
+        docs = cluster._get_docs(keyspace)
+        doc = cluster._get_doc(docs, key)
+
+        if op_type == operations.EXISTS.value:
+            return result({'key': key, 'cas': doc.cas if doc else 0, 'exists': doc is not None})
+
+        err = _check_kv_op(doc, op_type, op_args)
+        if err is not None:
+            return keyspace.error(err, key)
+
+        handler = _KV_HANDLERS.get(op_type, None)
+        if handler is not None:
+            return handler(cluster, key, doc, op_type, op_args)
+
+        cas = cluster._next_cas()
+        if op_type == operations.REMOVE.value:
+            del docs[key]
+        else:
+            expiry = _absolute_expiry(op_args.get('expiry', 0))
+            if doc is not None and op_args.get('preserve_expiry', False):
+                expiry = doc.expiry
+            docs[key] = _Document(value[0], value[1], cas, expiry)
+
+    return result({'key': key, 'cas': cas, 'mutation_token': cluster._mutation_token(keyspace.bucket, key)})
+
+
+def _get_result(key, doc, op_args, op_type):
+    raw = {'key': key, 'cas': doc.cas, 'flags': doc.flags, 'value': doc.value}
+    project = op_args.get('project', None)
+    if project:
+        raw['value'] = _project(doc, project)
+    if op_args.get('with_expiry', False):
+        raw['expiry'] = doc.expiry
+    if op_type in (operations.GET_ANY_REPLICA.value, operations.GET_ALL_REPLICAS.value):
+        raw['is_replica'] = False
+    return result(raw)
+
+
+def _project(doc, paths):
+    body = json.loads(doc.value)
+    projected = {}
+    for path in paths:
+        tokens = _parse_path(path)
+        try:
+            value = _resolve(body, tokens)
+        except _PathError:
+            continue
+        target = projected
+        for token in tokens[:-1]:
+            target = target.setdefault(token, {})
+        target[tokens[-1]] = value
+    return json.dumps(projected).encode('utf-8')
+
+
+class _ReplicaIterator:
+    """
+    Stands in for the C++ client's streamed replica results: the active copy's result, followed by None.
+    """
+
+    def __init__(self, res):
+        self._results = [res, None]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._results:
+            raise StopIteration
+        return self._results.pop(0)
+
+
+def kv_keyspace_operation(keyspace,  # type: _Keyspace
+                          key,  # type: str
+                          op_type,  # type: int
+                          value,  # type: Optional[Tuple[bytes, int]]
+                          op_args,  # type: Dict[str, Any]
+                          ) -> Any:
+    def execute():
+        res = _kv_execute(keyspace, key, op_type, value, op_args)
+        if op_type == operations.GET_ALL_REPLICAS.value and not isinstance(res, exception):
+            return _ReplicaIterator(res)
+        return res
+
+    return _dispatch(keyspace.conn.cluster, keyspace, op_type, key, op_args, execute)
+
+
+def _multi_dispatch(cluster, keyspace, op_type, op_args, execute):
+    """
+    Runs the per-key operations of a multi-op concurrently, i.e. the multi-op takes as long as its slowest key.
+    """
+    planned = {}
+    responses = {}
+    delay = 0.0
+    for key, key_args in op_args.items():
+        if not cluster._acquire():
+            responses[key] = keyspace.error(TEMPORARY_FAILURE, key)
+            continue
+        key_delay, planned[key] = _plan_op(cluster, op_type, key, key_args)
+        delay = max(delay, key_delay)
+
+    if delay > 0:
+        sleep(delay)
+
+    for key, err in planned.items():
+        try:
+            responses[key] = keyspace.error(err, key) if err is not None else execute(key, op_args[key])
+        finally:
+            cluster._release()
+
+    responses['all_okay'] = all(not isinstance(r, exception) for r in responses.values())
+    return result(responses)
+
+
+def kv_multi_operation(conn,  # type: _Connection
+                       bucket,  # type: str
+                       scope,  # type: str
+                       collection_name,  # type: str
+                       op_type,  # type: int
+                       op_args,  # type: Dict[str, Dict[str, Any]]
+                       ) -> result:
+    keyspace = _Keyspace(conn, bucket, scope, collection_name)
+
+    def execute(key, key_args):
+        res = _kv_execute(keyspace, key, op_type, key_args.get('value', None), key_args)
+        if op_type == operations.GET_ALL_REPLICAS.value and not isinstance(res, exception):
+            return _ReplicaIterator(res)
+        return res
+
+    return _multi_dispatch(conn.cluster, keyspace, op_type, op_args, execute)
+
+
+def _binary_execute(keyspace,  # type: _Keyspace
+                    key,  # type: str
+                    op_type,  # type: int
+                    value,  # type: Optional[bytes]
+                    op_args,  # type: Dict[str, Any]
+                    ) -> Any:
+    cluster = keyspace.conn.cluster
+    with cluster._lock:
+        docs = cluster._get_docs(keyspace)
+        doc = cluster._get_doc(docs, key)
+        if doc is not None and doc.is_locked() and op_args.get('cas', 0) != doc.lock_cas:
+            return keyspace.error(DOCUMENT_LOCKED, key)
+        cas = op_args.get('cas', 0)
+        if cas and doc is not None and cas not in (doc.cas, doc.lock_cas):
+            return keyspace.error(CAS_MISMATCH, key)
+
+        new_cas = cluster._next_cas()
+        if op_type in (operations.APPEND.value, operations.PREPEND.value):
+            if doc is None:
+                return keyspace.error(DOCUMENT_NOT_FOUND, key)
+            doc.value = doc.value + value if op_type == operations.APPEND.value else value + doc.value
+            doc.cas = new_cas
+            raw = {'key': key, 'cas': new_cas}
+        else:
+            if doc is None:
+                initial = op_args.get('initial', None)
+                if initial is None:
+                    return keyspace.error(DOCUMENT_NOT_FOUND, key)
+                content = initial
+                docs[key] = _Document(str(content).encode('utf-8'), 0, new_cas,
+                                      _absolute_expiry(op_args.get('expiry', 0)))
+            else:
+                try:
+                    content = int(doc.value)
+                except ValueError:
+                    return keyspace.error(DELTA_INVALID, key)
+                delta = op_args.get('delta', 1)
+                if op_type == operations.INCREMENT.value:
+                    content = (content + delta) & 0xFFFFFFFFFFFFFFFF
+                else:
+                    content = max(0, content - delta)
+                doc.value = str(content).encode('utf-8')
+                doc.cas = new_cas
+            raw = {'key': key, 'cas': new_cas, 'content': content}
+
+    raw['mutation_token'] = cluster._mutation_token(keyspace.bucket, key)
+    return result(raw)
+
+
+def binary_operation(conn,  # type: _Connection
+                     bucket,  # type: str
+                     scope,  # type: str
+                     collection_name,  # type: str
+                     key,  # type: str
+                     op_type,  # type: int
+                     op_args,  # type: Dict[str, Any]
+                     value=None,  # type: Optional[bytes]
+                     ) -> Any:
+    keyspace = _Keyspace(conn, bucket, scope, collection_name)
+    return _dispatch(conn.cluster, keyspace, op_type, key, op_args,
+                     lambda: _binary_execute(keyspace, key, op_type, value, op_args))
+
+
+def binary_multi_operation(conn,  # type: _Connection
+                           bucket,  # type: str
+                           scope,  # type: str
+                           collection_name,  # type: str
+                           op_type,  # type: int
+                           op_args,  # type: Dict[str, Dict[str, Any]]
+                           ) -> result:
+    keyspace = _Keyspace(conn, bucket, scope, collection_name)
+
+    def execute(key, key_args):
+        return _binary_execute(keyspace, key, op_type, key_args.get('value', None), key_args)
+
+    return _multi_dispatch(conn.cluster, keyspace, op_type, op_args, execute)
+
+
+def _virtual_xattrs(doc):
+    return {'$document': {'CAS': f'0x{doc.cas:016x}',
+                          'exptime': doc.expiry,
+                          'flags': doc.flags,
+                          'value_bytes': len(doc.value),
+                          'deleted': False,
+                          'last_modified': str(doc.cas // 1000000000)}}
+
+
+def _lookup_target(doc, body, tokens, xattr):
+    """
+    Returns the object a lookup_in spec's path is resolved against, raises _PathError if there is none.
+    """
+    if xattr:
+        return _virtual_xattrs(doc) if tokens[0] == '$document' else doc.xattrs
+    if body is None:
+        raise _PathError(_SUBDOC_DOC_NOT_JSON)
+    return body
+
+
+def _lookup_spec(doc, body, spec):
+    op, path, xattr = spec[0], spec[1], spec[2]
+    field = {'opcode': op, 'exists': False, 'status': 0, 'path': path}
+    if op == _GET_DOC or (op == _GET and path == '' and not xattr):
+        if body is None:
+            field['status'] = _SUBDOC_DOC_NOT_JSON
+        else:
+            field['exists'] = True
+            field['value'] = doc.value
+        return field
+
+    tokens = _parse_path(path)
+    try:
+        # only get_count can be given the root of the document
+        if tokens is None or not tokens and (op != _GET_COUNT or xattr):
+            raise _PathError(_SUBDOC_PATH_INVALID)
+        value = _resolve(_lookup_target(doc, body, tokens, xattr), tokens)
+    except _PathError as ex:
+        field['status'] = ex.status
+        return field
+
+    field['exists'] = True
+    if op == _GET:
+        field['value'] = json.dumps(value).encode('utf-8')
+    elif op == _GET_COUNT:
+        if not isinstance(value, (dict, list)):
+            field['exists'] = False
+            field['status'] = _SUBDOC_PATH_MISMATCH
+        else:
+            field['value'] = str(len(value)).encode('utf-8')
+    return field
+
+
+def _lookup_in_execute(keyspace, key, spec, op_type):
+    cluster = keyspace.conn.cluster
+    with cluster._lock:
+        doc = cluster._get_doc(cluster._get_docs(keyspace), key)
+        if doc is None:
+            return keyspace.error(DOCUMENT_NOT_FOUND, key)
+        body = json.loads(doc.value) if _is_json(doc.flags) else None
+        fields = []
+        for idx, s in enumerate(spec):
+            field = _lookup_spec(doc, body, s)
+            field['original_index'] = idx
+            fields.append(field)
+        raw = {'key': key, 'cas': doc.cas, 'flags': doc.flags, 'value': fields}
+    if op_type in (operations.LOOKUP_IN_ANY_REPLICA.value, operations.LOOKUP_IN_ALL_REPLICAS.value):
+        raw['is_replica'] = False
+    return result(raw)
+
+
+def _expand_macros(value, cas, seqno):
+    if isinstance(value, str):
+        if value == '${Mutation.CAS}':
+            return f'0x{cas:016x}'
+        if value == '${Mutation.seqno}':
+            return f'0x{seqno:016x}'
+    return value
+
+
+def _add_to_array(array, op, value):
+    if op == _ARRAY_PUSH_LAST:
+        array.extend(value)
+    elif op == _ARRAY_PUSH_FIRST:
+        array[:0] = value
+    else:
+        if value in array:
+            raise _PathError(_SUBDOC_PATH_EXISTS)
+        array.append(value)
+
+
+def _apply_mutation(body, xattrs, spec, cas):  # noqa: C901
+    """
+    Applies a single mutate_in spec.  Returns the spec's value (counters only) and raises _PathError if the spec
+    fails.
+    """
+    op, path, create_parents, xattr = spec[0], spec[1], spec[2], spec[3]
+    expand_macros = len(spec) > 4 and spec[4]
+    raw_value = spec[5] if len(spec) > 5 else None
+    target = xattrs if xattr else body
+
+    if op in (_ARRAY_PUSH_LAST, _ARRAY_PUSH_FIRST, _ARRAY_INSERT):
+        value = json.loads(b'[' + raw_value + b']')
+    elif op == _COUNTER:
+        value = raw_value if isinstance(raw_value, int) else json.loads(raw_value)
+    elif raw_value is not None:
+        value = json.loads(raw_value)
+        if expand_macros:
+            value = _expand_macros(value, cas, 0)
+    else:
+        value = None
+
+    tokens = _parse_path(path)
+    if tokens is None:
+        raise _PathError(_SUBDOC_PATH_INVALID)
+
+    if not tokens:
+        # the root of the document, only the array operations are valid
+        if op in (_ARRAY_PUSH_LAST, _ARRAY_PUSH_FIRST, _ARRAY_ADD_UNIQUE) and isinstance(target, list):
+            _add_to_array(target, op, value)
+            return None
+        raise _PathError(_SUBDOC_PATH_INVALID)
+
+    parent = _resolve_parent(target, tokens, create_parents=create_parents)
+    last = tokens[-1]
+    if isinstance(last, int) and not isinstance(parent, list) or isinstance(last, str) and not isinstance(parent, dict):
+        raise _PathError(_SUBDOC_PATH_MISMATCH)
+
+    if op == _DICT_ADD:
+        if last in parent:
+            raise _PathError(_SUBDOC_PATH_EXISTS)
+        parent[last] = value
+    elif op == _DICT_UPSERT:
+        parent[last] = value
+    elif op == _REPLACE:
+        _get_child(parent, last)
+        parent[last] = value
+    elif op == _REMOVE:
+        _get_child(parent, last)
+        del parent[last]
+    elif op == _ARRAY_INSERT:
+        if not isinstance(last, int) or not 0 <= last <= len(parent):
+            raise _PathError(_SUBDOC_PATH_NOT_FOUND if isinstance(last, int) else _SUBDOC_PATH_INVALID)
+        parent[last:last] = value
+    elif op in (_ARRAY_PUSH_LAST, _ARRAY_PUSH_FIRST, _ARRAY_ADD_UNIQUE):
+        try:
+            array = _get_child(parent, last)
+        except _PathError as ex:
+            if ex.status != _SUBDOC_PATH_NOT_FOUND or not create_parents:
+                raise
+            array = parent[last] = []
+        if not isinstance(array, list):
+            raise _PathError(_SUBDOC_PATH_MISMATCH)
+        _add_to_array(array, op, value)
+    elif op == _COUNTER:
+        try:
+            current = _get_child(parent, last)
+        except _PathError as ex:
+            if ex.status != _SUBDOC_PATH_NOT_FOUND:
+                raise
+            current = 0
+        if not isinstance(current, int) or isinstance(current, bool):
+            raise _PathError(_SUBDOC_PATH_MISMATCH)
+        if not isinstance(value, int) or value == 0:
+            raise _PathError(_SUBDOC_DELTA_INVALID)
+        parent[last] = current + value
+        return str(parent[last]).encode('utf-8')
+    else:
+        raise _PathError(_SUBDOC_PATH_INVALID)
+    return None
+
+
+def _mutate_in_execute(keyspace, key, spec, op_args):  # noqa: C901
+    cluster = keyspace.conn.cluster
+    with cluster._lock:
+        docs = cluster._get_docs(keyspace)
+        doc = cluster._get_doc(docs, key)
+        semantics = op_args.get('store_semantics', _STORE_REPLACE)
+        if semantics == _STORE_INSERT and doc is not None:
+            return keyspace.error(DOCUMENT_EXISTS, key)
+        if semantics == _STORE_REPLACE and doc is None:
+            return keyspace.error(DOCUMENT_NOT_FOUND, key)
+        cas = op_args.get('cas', 0)
+        if doc is not None:
+            if doc.is_locked() and cas != doc.lock_cas:
+                return keyspace.error(DOCUMENT_LOCKED, key)
+            if cas and cas not in (doc.cas, doc.lock_cas):
+                return keyspace.error(CAS_MISMATCH, key)
+            if not _is_json(doc.flags):
+                return keyspace.error(DOCUMENT_NOT_JSON, key)
+            body = json.loads(doc.value)
+            xattrs = deepcopy(doc.xattrs)
+        else:
+            body = {}
+            xattrs = {}
+
+        new_cas = cluster._next_cas()
+        fields = []
+        remove_doc = False
+        for idx, s in enumerate(spec):
+            field = {'opcode': s[0], 'status': 0, 'path': s[1], 'original_index': idx}
+            if s[0] == _SET_DOC:
+                body = json.loads(s[5])
+            elif s[0] == _REMOVE_DOC:
+                remove_doc = True
+            else:
+                try:
+                    value = _apply_mutation(body, xattrs, s, new_cas)
+                except _PathError as ex:
+                    # mutations are atomic, the document is left untouched if any spec fails
+                    return keyspace.error(_SUBDOC_STATUS_ERRORS.get(ex.status, 115), key)
+                if value is not None:
+                    field['value'] = value
+            fields.append(field)
+
+        if remove_doc:
+            docs.pop(key, None)
+        else:
+            expiry = _absolute_expiry(op_args.get('expiry', 0))
+            if doc is not None and (op_args.get('preserve_expiry', False) or 'expiry' not in op_args):
+                expiry = doc.expiry
+            docs[key] = _Document(json.dumps(body).encode('utf-8'), FMT_JSON, new_cas, expiry, xattrs)
+
+    return result({'key': key,
+                   'cas': new_cas,
+                   'mutation_token': cluster._mutation_token(keyspace.bucket, key),
+                   'value': fields})
+
+
+def subdoc_operation(conn,  # type: _Connection
+                     bucket,  # type: str
+                     scope,  # type: str
+                     collection_name,  # type: str
+                     key,  # type: str
+                     spec,  # type: List[Tuple[Any, ...]]
+                     op_type,  # type: int
+                     op_args,  # type: Dict[str, Any]
+                     ) -> Any:
+    keyspace = _Keyspace(conn, bucket, scope, collection_name)
+
+    def execute():
+        if op_type == operations.MUTATE_IN.value:
+            return _mutate_in_execute(keyspace, key, spec, op_args)
+        res = _lookup_in_execute(keyspace, key, spec, op_type)
+        if op_type == operations.LOOKUP_IN_ALL_REPLICAS.value and not isinstance(res, exception):
+            return _ReplicaIterator(res)
+        return res
+
+    return _dispatch(conn.cluster, keyspace, op_type, key, op_args, execute)
+
+
+class _ScanIterator:
+    """
+    Stands in for the C++ client's range scan result.  Returns the scan's results, and then a
+    RangeScanCompletedException.
+    """
+
+    def __init__(self, cluster, keyspace, op_type, op_args):
+        self._cluster = cluster
+        self._keyspace = keyspace
+        self._op_type = op_type
+        self._op_args = op_args
+        self._items = None
+        self._cancelled = False
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel_scan(self) -> None:
+        self._cancelled = True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._items is None:
+            res = _dispatch(self._cluster, self._keyspace, self._op_type, None, self._op_args, self._snapshot)
+            if isinstance(res, exception):
+                self._items = []
+                return res
+            self._items = res
+        if self._cancelled or not self._items:
+            return self._keyspace.error(RANGE_SCAN_COMPLETED, None)
+        return self._items.pop(0)
+
+    def _snapshot(self):
+        cluster = self._cluster
+        op_args = self._op_args
+        with cluster._lock:
+            docs = cluster._get_docs(self._keyspace)
+            keys = sorted(k for k, d in docs.items() if not cluster._is_expired(d))
+            if self._op_type == operations.KV_PREFIX_SCAN.value:
+                prefix = op_args.get('prefix', '')
+                keys = [k for k in keys if k.startswith(prefix)]
+            elif self._op_type == operations.KV_RANGE_SCAN.value:
+                keys = [k for k in keys if _in_range(k, op_args.get('start', None), op_args.get('end', None))]
+            else:
+                rand = random.Random(op_args.get('seed', None))  # nosec
+                keys = rand.sample(keys, min(op_args.get('limit', len(keys)), len(keys)))
+
+            ids_only = op_args.get('ids_only', False)
+            items = []
+            for k in keys:
+                doc = docs[k]
+                raw = {'key': k, 'cas': doc.cas, 'flags': doc.flags, 'expiry': doc.expiry}
+                if not ids_only:
+                    raw['value'] = doc.value
+                items.append(result(raw))
+        return items
+
+
+def _in_range(key, start, end):
+    if start is not None:
+        if key < start['term'] or start.get('exclusive', False) and key == start['term']:
+            return False
+    if end is not None:
+        if key > end['term'] or end.get('exclusive', False) and key == end['term']:
+            return False
+    return True
+
+
+def kv_range_scan_operation(conn,  # type: _Connection
+                            bucket,  # type: str
+                            scope,  # type: str
+                            collection_name,  # type: str
+                            op_type,  # type: int
+                            op_args,  # type: Dict[str, Any]
+                            ) -> _ScanIterator:
+    keyspace = _Keyspace(conn, bucket, scope, collection_name)
+    return _ScanIterator(conn.cluster, keyspace, op_type, op_args)
+
+
+def _normalize_statement(statement  # type: str
+                         ) -> str:
+    return ' '.join(statement.split()).rstrip(';').lower()
+
+
+_KEYSPACE = r'((?:`[^`]+`|[\w-]+)(?:\.(?:`[^`]+`|[\w-]+)){0,2})'
+_ARRAY_RANGE_QUERY = re.compile(r'select raw (\w+) from array_range\((-?\d+),\s*(-?\d+)\) as (\w+)$')
+_META_ID_QUERY = re.compile(r'select raw meta\(\w*\)\.id from ' + _KEYSPACE + r'(?: as \w+)?(?: limit (\d+))?$')
+_COUNT_QUERY = re.compile(r'select raw count\(\*\) from ' + _KEYSPACE + r'$')
+_SELECT_ALL_QUERY = re.compile(r'select \* from ' + _KEYSPACE + r'(?: as (\w+))?(?: limit (\d+))?$')
+# matched against the statement as given, the prepared statement (and its name) are case sensitive
+_PREPARE_QUERY = re.compile(r'\s*prepare\s+(?:(\w+|`[^`]+`)\s+(?:from|as)\s+)?(.+?)[\s;]*$', re.IGNORECASE | re.DOTALL)
+_EXECUTE_QUERY = re.compile(r'\s*execute\s+(\w+|`(?:[^`]|``)+`)[\s;]*$', re.IGNORECASE)
+
+
+def _parse_keyspace(keyspace,  # type: str
+                    query_context=None,  # type: Optional[str]
+                    ) -> Tuple[str, str, str]:
+    parts = [p.strip('`') for p in re.findall(r'`[^`]+`|[^.]+', keyspace)]
+    if len(parts) == 3:
+        return tuple(parts)
+    if query_context and len(parts) == 1:
+        ctx = [p.strip('`') for p in re.findall(r'`[^`]+`|[^.:]+', query_context.split(':', 1)[-1])]
+        if len(ctx) == 2:
+            return ctx[0], ctx[1], parts[0]
+    return parts[0], '_default', '_default'
+
+
+class _QueryIterator:
+    """
+    Stands in for the C++ client's streamed query result: the rows (as JSON bytes), then None and then the query's
+    metadata.
+    """
+
+    def __init__(self, cluster, query_args, streaming_timeout):
+        self._cluster = cluster
+        self._query_args = query_args
+        self._op_args = {'timeout': query_args.get('timeout', None) or streaming_timeout or 75000000}
+        self._rows = None
+        self._results = []
+        self._start = monotonic()
+
+    def execute(self, callback=None, errback=None):
+        op_args = dict(self._op_args, callback=callback, errback=errback)
+        return _dispatch(self._cluster, None, operations.N1QL_QUERY.value, None, op_args, self._run)
+
+    def _run(self):
+        rows = _run_query(self._cluster, self._query_args)
+        if isinstance(rows, exception):
+            self._results = [rows]
+            return rows
+        encoded = [json.dumps(r).encode('utf-8') for r in rows]
+        elapsed = int((monotonic() - self._start) * 1e9)
+        metadata = {'request_id': str(uuid4()),
+                    'client_context_id': self._query_args.get('client_context_id', None) or str(uuid4()),
+                    'status': 'success',
+                    'metrics': {'elapsed_time': elapsed,
+                                'execution_time': elapsed,
+                                'result_count': len(encoded),
+                                'result_size': sum(len(r) for r in encoded)}}
+        meta_result = result({'value': {'metadata': metadata}})
+        self._results = encoded + [None, meta_result]
+        return meta_result
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._rows is None:
+            self._rows = True
+            if not self._results:
+                res = self.execute()
+                if isinstance(res, exception) and not self._results:
+                    # the query was rejected (or failed) before it ran
+                    self._results = [res]
+        if not self._results:
+            raise StopIteration
+        return self._results.pop(0)
+
+
+def _decode_params(query_args):
+    positional = [json.loads(p) for p in query_args.get('positional_parameters', None) or []]
+    named = {k.lstrip('$'): json.loads(v) for k, v in (query_args.get('named_parameters', None) or {}).items()}
+    return positional, named
+
+
+def _unquote_name(name):
+    if name.startswith('`'):
+        return name[1:-1].replace('``', '`')
+    return name
+
+
+def _run_prepared(cluster, raw_statement, query_args):
+    """
+    Runs a ``PREPARE`` or ``EXECUTE`` statement, returns None if the statement is neither.
+    """
+    match = _PREPARE_QUERY.match(raw_statement)
+    if match is not None:
+        name = _unquote_name(match.group(1)) if match.group(1) else str(uuid4())
+        with cluster._lock:
+            cluster._prepared[name] = match.group(2)
+        return [{'name': name, 'text': raw_statement}]
+
+    match = _EXECUTE_QUERY.match(raw_statement)
+    if match is None:
+        return None
+    with cluster._lock:
+        statement = cluster._prepared.get(_unquote_name(match.group(1)), None)
+    if statement is None:
+        return exception(PREPARED_STATEMENT_FAILURE, message='prepared_statement_failure')
+    return _run_query(cluster, dict(query_args, statement=statement))
+
+
+def _run_query(cluster, query_args):  # noqa: C901
+    raw_statement = query_args.get('statement', '')
+    statement = _normalize_statement(raw_statement)
+    with cluster._lock:
+        registered = list(cluster._queries)
+    for pattern, rows, err in registered:
+        if isinstance(pattern, str):
+            matched = pattern == statement
+        else:
+            matched = pattern.match(raw_statement) is not None
+        if not matched:
+            continue
+        if err is not None:
+            return exception(err)
+        if callable(rows):
+            return list(rows(*_decode_params(query_args)))
+        return list(rows or [])
+
+    rows = _run_prepared(cluster, raw_statement, query_args)
+    if rows is not None:
+        return rows
+
+    match = _ARRAY_RANGE_QUERY.match(statement)
+    if match and match.group(1) == match.group(4):
+        return list(range(int(match.group(2)), int(match.group(3))))
+
+    query_context = query_args.get('query_context', None)
+    match = _META_ID_QUERY.match(statement) or _COUNT_QUERY.match(statement) or _SELECT_ALL_QUERY.match(statement)
+    if match is None:
+        return exception(PARSING_FAILURE, message=f'fake_core_unsupported_statement: {raw_statement}')
+
+    # match the keyspace as given, the statement was lower-cased
+    ks_match = re.search(r'from\s+' + _KEYSPACE, raw_statement, re.IGNORECASE)
+    bucket, scope, collection = _parse_keyspace(ks_match.group(1), query_context)
+    with cluster._lock:
+        docs = cluster._collections.get((bucket, scope, collection), {})
+        keys = sorted(k for k, d in docs.items() if not cluster._is_expired(d))
+        if match.re is _COUNT_QUERY:
+            return [len(keys)]
+        limit = match.group(match.re.groups)
+        if limit is not None:
+            keys = keys[:int(limit)]
+        if match.re is _META_ID_QUERY:
+            return keys
+        alias = match.group(2) or collection if collection != '_default' else match.group(2) or bucket
+        return [{alias: json.loads(docs[k].value)} for k in keys if _is_json(docs[k].flags)]
+
+
+def n1ql_query(conn,  # type: _Connection
+               query_args,  # type: Dict[str, Any]
+               streaming_timeout=None,  # type: Optional[int]
+               callback=None,  # type: Optional[Callable[[Any], None]]
+               errback=None,  # type: Optional[Callable[[Any], None]]
+               ) -> _QueryIterator:
+    query = _QueryIterator(conn.cluster, query_args, streaming_timeout)
+    if callback is not None:
+        query._rows = True
+        query.execute(callback=callback, errback=errback or callback)
+    return query
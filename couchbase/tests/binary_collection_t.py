@@ -37,6 +37,8 @@ class BinaryCollectionTestSuite:
         'test_append_string_not_empty',
         'test_counter_bad_delta_value',
         'test_counter_bad_initial_value',
+        'test_counter_buffer',
+        'test_counter_buffer_missing_counters',
         'test_counter_decrement',
         'test_counter_decrement_initial_value',
         'test_counter_decrement_non_default',
@@ -112,6 +114,49 @@ class BinaryCollectionTestSuite:
         with pytest.raises(InvalidArgumentException):
             cb_env.collection.binary().decrement(key, initial=100)
 
+    def test_counter_buffer(self, cb_env):
+        key, value = cb_env.get_existing_doc_by_type('counter')
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.binary().buffered_counters(flush_threshold=0)
+        counters = cb_env.collection.binary().buffered_counters(flush_interval=None, flush_threshold=None)
+        for _ in range(10):
+            counters.increment(key)
+        counters.decrement(key, 4)
+        assert counters.pending() == {key: 6}
+        results = counters.flush()
+        assert isinstance(results[key], CounterResult)
+        assert results[key].content == value + 6
+        assert counters.pending() == {}
+
+        counters.increment(key, 2)
+        counters.close()
+        assert counters.closed is True
+        assert counters.pending() == {}
+        assert cb_env.collection.binary().increment(key).content == value + 9
+        with pytest.raises(RuntimeError):
+            counters.increment(key)
+
+    def test_counter_buffer_missing_counters(self, cb_env):
+        inc_key, dec_key, init_key = cb_env.get_multiple_existing_docs_by_type('counter_empty', 3)
+        counters = cb_env.collection.binary().buffered_counters(flush_interval=None, flush_threshold=None)
+        counters.increment(inc_key, 5)
+        counters.increment(inc_key, 3)
+        counters.decrement(dec_key, 2)
+        results = counters.flush()
+        assert results[inc_key].content == 8
+        # counters are unsigned, decrementing a missing counter stops at 0
+        assert results[dec_key].content == 0
+        counters.close()
+
+        counters = cb_env.collection.binary().buffered_counters(flush_interval=None,
+                                                                flush_threshold=None,
+                                                                initial=SignedInt64(100))
+        counters.decrement(init_key, 10)
+        counters.decrement(init_key, 5)
+        assert counters.flush()[init_key].content == 85
+        counters.close()
+        assert cb_env.collection.binary().increment(inc_key).content == 9
+
     def test_counter_decrement(self, cb_env):
         key, value = cb_env.get_existing_doc_by_type('counter')
         result = cb_env.collection.binary().decrement(key)
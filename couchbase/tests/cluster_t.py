@@ -14,11 +14,14 @@
 #  limitations under the License.
 
 import json
+import logging
+import os
 from datetime import timedelta
 from uuid import uuid4
 
 import pytest
 
+import couchbase
 from couchbase.auth import PasswordAuthenticator
 from couchbase.cluster import Cluster
 from couchbase.diagnostics import (ClusterState,
@@ -34,6 +37,7 @@ from couchbase.options import (ClusterOptions,
                                DiagnosticsOptions,
                                PingOptions)
 from couchbase.result import DiagnosticsResult, PingResult
+from couchbase.threshold_reports import ThresholdReportType, attach_threshold_report_filter
 from tests.environments import CollectionType
 from tests.test_features import EnvironmentFeatures
 
@@ -43,6 +47,8 @@ class ClusterDiagnosticsTestSuite:
         'test_diagnostics',
         'test_diagnostics_after_query',
         'test_diagnostics_as_json',
+        'test_logging_dropped_records',
+        'test_logging_invalid_sample_rates',
         'test_multiple_close_cluster',
         'test_ping',
         'test_ping_as_json',
@@ -51,6 +57,8 @@ class ClusterDiagnosticsTestSuite:
         'test_ping_report_id',
         'test_ping_restrict_services',
         'test_ping_str_services',
+        'test_reconnect_after_fork',
+        'test_threshold_reports',
     ]
 
     @pytest.fixture(scope="class")
@@ -227,6 +235,92 @@ class ClusterDiagnosticsTestSuite:
         result = cluster.ping(PingOptions(service_types=services))
         assert len(result.endpoints) >= 1
 
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='Requires os.fork()')
+    def test_reconnect_after_fork(self, cb_env):
+        conn_string = cb_env.config.get_connection_string()
+        username, pw = cb_env.config.get_username_and_pw()
+        auth = PasswordAuthenticator(username, pw)
+        cluster = Cluster.connect(conn_string, ClusterOptions(auth, reconnect_after_fork=True))
+        collection = cluster.bucket(cb_env.bucket.name).default_collection()
+        key, value = cb_env.get_new_doc()
+        collection.upsert(key, value)
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                # the fork() hook only marks the cluster, it reconnects on first use
+                if cluster._reconnect_pending is True and collection.get(key).content_as[dict] == value:
+                    exit_code = 0
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WIFEXITED(status)
+        assert os.WEXITSTATUS(status) == 0
+        # the parent's connection should be unaffected
+        assert collection.get(key).content_as[dict] == value
+        cluster.close()
+
+    def test_logging_dropped_records(self):
+        dropped = couchbase.logging_dropped_records()
+        assert set(dropped.keys()) == {'queue_full', 'rate_limited', 'sampled'}
+        assert all(isinstance(v, int) and v >= 0 for v in dropped.values())
+
+    @pytest.mark.parametrize('sample_rates', [{logging.DEBUG: 1.5},
+                                              {logging.DEBUG: -0.1},
+                                              {logging.INFO: '0.5'},
+                                              {logging.INFO: 0.5, logging.DEBUG: None}])
+    def test_logging_invalid_sample_rates(self, sample_rates):
+        if os.getenv('PYCBC_LOG_LEVEL', None):
+            pytest.skip('The console logger has been initialized via PYCBC_LOG_LEVEL.')
+        # the sample rates are validated before the couchbase++ library's logger is configured
+        with pytest.raises(InvalidArgumentException):
+            couchbase.configure_logging('couchbase.tests.sampled', sample_rates=sample_rates)
+
+    def test_threshold_reports(self, cb_env):
+        conn_string = cb_env.config.get_connection_string()
+        username, pw = cb_env.config.get_username_and_pw()
+        auth = PasswordAuthenticator(username, pw)
+        cluster = Cluster.connect(conn_string, ClusterOptions(auth, enable_threshold_reports=True))
+        with pytest.raises(InvalidArgumentException):
+            cluster.on_threshold_report('not-callable')
+        received = []
+        cluster.on_threshold_report(received.append)
+
+        # the C++ client only emits its reports through the logger configured via couchbase.configure_logging
+        logger = logging.getLogger('couchbase.tests.threshold_reports')
+        logger.propagate = False
+        attach_threshold_report_filter(logger)
+        # the reports are parsed by a filter, the logger's handlers (or logging.lastResort) still get the records
+        assert not logger.hasHandlers()
+        top = [{'operation_name': 'get', 'total_duration_us': 1200, 'last_server_duration_us': 300,
+                'total_server_duration_us': 300, 'last_operation_id': '0x2a',
+                'last_remote_socket': '127.0.0.1:11210'},
+               {'operation_name': 'upsert', 'total_duration_us': 5400}]
+        logger.warning('Operations over threshold: %s', json.dumps({'count': 3, 'service': 'kv', 'top': top}))
+        logger.warning('Orphan responses observed: %s', json.dumps({'count': 1, 'top': top[:1]}))
+        logger.warning('Some other warning')
+
+        reports = cluster.threshold_reports()
+        assert reports == received
+        assert len(reports) == 2
+        report = reports[0]
+        assert report.report_type == ThresholdReportType.THRESHOLD
+        assert report.service == 'kv'
+        assert report.count == 3
+        assert [e.operation_name for e in report.entries] == ['upsert', 'get']
+        entry = report.entries[1]
+        assert entry.total_duration == timedelta(microseconds=1200)
+        assert entry.last_server_duration == timedelta(microseconds=300)
+        assert entry.operation_id == '0x2a'
+        assert entry.remote_socket == '127.0.0.1:11210'
+        assert entry.local_socket is None
+        assert reports[1].report_type == ThresholdReportType.ORPHAN
+        assert reports[1].service is None
+        assert cluster.threshold_reports() == []
+        cluster.close()
+
 
 class ClassicClusterDiagnosticsTests(ClusterDiagnosticsTestSuite):
 
@@ -17,6 +17,7 @@ from datetime import timedelta
 
 import pytest
 
+from couchbase.batching_writer import BatchingWriter
 from couchbase.diagnostics import ServiceType
 from couchbase.exceptions import (CouchbaseException,
                                   DocumentExistsException,
@@ -51,6 +52,7 @@ from tests.test_features import EnvironmentFeatures
 class CollectionMultiTestSuite:
 
     TEST_MANIFEST = [
+        'test_batching_writer',
         'test_multi_exists_invalid_input',
         'test_multi_exists_not_exist',
         'test_multi_exists_simple',
@@ -62,8 +64,10 @@ class CollectionMultiTestSuite:
         'test_multi_get_any_replica_invalid_input',
         'test_multi_get_any_replica_simple',
         'test_multi_get_any_replica_read_preference',
+        'test_multi_get_any_replica_server_group_fallback',
         'test_multi_get_fail',
         'test_multi_get_invalid_input',
+        'test_multi_get_iter_results',
         'test_multi_get_simple',
         'test_multi_insert_fail',
         'test_multi_insert_global_opts',
@@ -84,12 +88,40 @@ class CollectionMultiTestSuite:
         'test_multi_touch_invalid_input',
         'test_multi_touch_simple',
         'test_multi_unlock_invalid_input',
+        'test_multi_upsert_compiled_opts',
         'test_multi_upsert_global_opts',
         'test_multi_upsert_invalid_input',
         'test_multi_upsert_key_opts',
         'test_multi_upsert_simple',
     ]
 
+    def test_batching_writer(self, cb_env):
+        keys_and_docs = cb_env.get_docs(2)
+        with pytest.raises(InvalidArgumentException):
+            BatchingWriter(cb_env.collection, max_batch_size=0)
+        writer = BatchingWriter(cb_env.collection, flush_interval=None, max_batch_size=None, max_batch_bytes=None)
+        futures = {}
+        for key, doc in keys_and_docs.items():
+            for i in range(5):
+                futures[key] = writer.upsert(key, dict(doc, batch_idx=i))
+        missing = writer.replace(TestEnvironment.NOT_A_KEY, {'some': 'thing'})
+        assert sorted(writer.pending()) == sorted(list(keys_and_docs.keys()) + [TestEnvironment.NOT_A_KEY])
+        writer.flush()
+        assert writer.pending() == []
+        for key, fut in futures.items():
+            assert isinstance(fut.result(), MutationResult)
+            assert cb_env.collection.get(key).content_as[dict]['batch_idx'] == 4
+        assert isinstance(missing.exception(), DocumentNotFoundException)
+
+        key = list(keys_and_docs.keys())[0]
+        fut = writer.replace(key, keys_and_docs[key])
+        writer.close()
+        assert writer.closed is True
+        assert isinstance(fut.result(), MutationResult)
+        assert cb_env.collection.get(key).content_as[dict] == keys_and_docs[key]
+        with pytest.raises(RuntimeError):
+            writer.upsert(key, keys_and_docs[key])
+
     @pytest.fixture(scope='class')
     def check_multi_node(self, num_nodes):
         if num_nodes == 1:
@@ -270,6 +302,22 @@ class CollectionMultiTestSuite:
         assert all(map(lambda r: isinstance(r, DocumentUnretrievableException), res.exceptions.values())) is True
         assert len(res.results) == 0
 
+    @pytest.mark.usefixtures("check_replicas")
+    @pytest.mark.usefixtures("check_server_groups_supported")
+    def test_multi_get_any_replica_server_group_fallback(self, cb_env):
+        keys_and_docs = cb_env.get_docs(4)
+        keys = list(keys_and_docs.keys())
+        # the test cluster does not have a preferred server group, so every key should fall back
+        res = cb_env.collection.get_any_replica_multi(
+            keys, GetAnyReplicaMultiOptions(read_preference=ReadPreference.SELECTED_SERVER_GROUP,
+                                            server_group_timeout=timedelta(seconds=1)))
+        assert isinstance(res, MultiGetReplicaResult)
+        assert res.all_ok is True
+        assert res.exceptions == {}
+        for k, v in res.results.items():
+            assert v.from_preferred_server_group is False
+            assert v.content_as[dict] == keys_and_docs[k]
+
     def test_multi_get_fail(self, cb_env):
         keys_and_docs = cb_env.FAKE_DOCS
         keys = list(keys_and_docs.keys())
@@ -277,6 +325,9 @@ class CollectionMultiTestSuite:
         assert isinstance(res, MultiGetResult)
         assert res.all_ok is False
         assert res.results == {}
+        # truthy even though all of the operations failed
+        assert len(res) == 0
+        assert bool(res) is True
         assert isinstance(res.exceptions, dict)
         assert all(map(lambda e: issubclass(type(e), CouchbaseException), res.exceptions.values())) is True
 
@@ -296,6 +347,27 @@ class CollectionMultiTestSuite:
         with pytest.raises(InvalidArgumentException):
             cb_env.collection.get_multi(keys_and_docs)
 
+    def test_multi_get_iter_results(self, cb_env):
+        keys_and_docs = cb_env.get_docs(4)
+        keys = list(keys_and_docs.keys())
+        missing_key = list(cb_env.FAKE_DOCS.keys())[0]
+        res = cb_env.collection.get_multi(keys + [missing_key])
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is False
+        # len() counts the successful operations, the same pairs iteration yields
+        assert len(res) == len(keys)
+        # the results/exceptions are split when the result is built, not on every access
+        assert res.results is res.results
+        assert res.exceptions is res.exceptions
+        assert list(res.exceptions.keys()) == [missing_key]
+        assert isinstance(res.exceptions[missing_key], DocumentNotFoundException)
+        iterated = dict(res)
+        assert set(iterated.keys()) == set(keys)
+        assert len(iterated) == len(res)
+        for k, v in res:
+            assert isinstance(v, GetResult)
+            assert v.content_as[dict] == keys_and_docs[k]
+
     def test_multi_get_simple(self, cb_env):
         keys_and_docs = cb_env.get_docs(4)
         keys = list(keys_and_docs.keys())
@@ -539,6 +611,19 @@ class CollectionMultiTestSuite:
         with pytest.raises(InvalidArgumentException):
             cb_env.collection.unlock_multi(list(keys_and_docs.keys()))
 
+    def test_multi_upsert_compiled_opts(self, cb_env):
+        opts = UpsertMultiOptions(expiry=timedelta(seconds=2)).compile()
+        for _ in range(2):
+            keys_and_docs = cb_env.get_docs(4)
+            res = cb_env.collection.upsert_multi(keys_and_docs, opts)
+            assert isinstance(res, MultiMutationResult)
+            assert res.all_ok is True
+            assert all(map(lambda r: isinstance(r, MutationResult), res.results.values())) is True
+            TestEnvironment.try_n_times(5, 3, cb_env.check_all_not_found, cb_env, list(keys_and_docs.keys()))
+
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.get_multi(list(keys_and_docs.keys()), opts)
+
     def test_multi_upsert_global_opts(self, cb_env):
         keys_and_docs = cb_env.get_docs(4)
         opts = UpsertMultiOptions(expiry=timedelta(seconds=2))
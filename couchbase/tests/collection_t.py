@@ -28,11 +28,13 @@ from couchbase.exceptions import (AmbiguousTimeoutException,
                                   DocumentNotLockedException,
                                   DocumentUnretrievableException,
                                   InvalidArgumentException,
-                                  TemporaryFailException)
+                                  TemporaryFailException,
+                                  UnAmbiguousTimeoutException)
 from couchbase.options import (GetAllReplicasOptions,
                                GetAnyReplicaOptions,
                                GetOptions,
                                InsertOptions,
+                               PreparedOptions,
                                ReplaceOptions,
                                UpsertOptions)
 from couchbase.replica_reads import ReadPreference
@@ -40,6 +42,8 @@ from couchbase.result import (ExistsResult,
                               GetReplicaResult,
                               GetResult,
                               MutationResult)
+from couchbase.timeouts import RequestBudget
+from couchbase.timings import OperationTimingsRecorder
 from tests.environments import CollectionType
 from tests.environments.test_environment import TestEnvironment
 from tests.mock_server import MockServerType
@@ -57,6 +61,7 @@ class CollectionTestSuite:
         'test_expiry_really_expires',
         'test_get',
         'test_get_after_lock',
+        'test_get_content_as_view',
         'test_get_all_replicas',
         'test_get_all_replicas_fail',
         'test_get_all_replicas_results',
@@ -69,10 +74,15 @@ class CollectionTestSuite:
         'test_get_any_replica_fail',
         'test_get_any_replica_read_preference',
         'test_get_fails',
+        'test_get_hedged',
         'test_get_options',
+        'test_get_raw_result_get',
+        'test_get_request_budget',
         'test_get_with_expiry',
         'test_insert',
         'test_insert_document_exists',
+        'test_keyspace_cached',
+        'test_operation_timings',
         'test_project',
         'test_project_bad_path',
         'test_project_project_not_list',
@@ -91,6 +101,7 @@ class CollectionTestSuite:
         'test_unlock_wrong_cas',
         'test_unlock_not_locked',
         'test_upsert',
+        'test_upsert_compiled_options',
         'test_upsert_preserve_expiry',
         'test_upsert_preserve_expiry_not_used',
     ]
@@ -209,6 +220,20 @@ class CollectionTestSuite:
         assert result.expiry_time is None
         assert result.content_as[dict] == value
 
+    def test_get_content_as_view(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        result = cb_env.collection.get(key)
+        view = result.content_as[dict, 'view']
+        assert view == value
+        with pytest.raises(TypeError):
+            view['new_field'] = 'new_value'
+        assert result.content_as[dict] is not result.content_as[dict]
+        # conversions are only cached if the converted type is immutable
+        assert result.content_as[list] is not result.content_as[list]
+        assert result.content_as[str] is result.content_as[str]
+        with pytest.raises(InvalidArgumentException):
+            result.content_as[dict, 'copy']
+
     def test_get_after_lock(self, cb_env):
         key = cb_env.get_existing_doc(key_only=True)
         orig = cb_env.collection.get_and_lock(key, timedelta(seconds=5))
@@ -363,6 +388,44 @@ class CollectionTestSuite:
         assert result.expiry_time is None
         assert result.content_as[dict] == value
 
+    def test_get_raw_result_get(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        orig = cb_env.collection.get(key)._orig
+        assert orig.get('cas') == orig.raw_result['cas']
+        assert orig.get('not-a-field') is None
+        assert orig.get('not-a-field', 0) == 0
+        # invalid arguments raise, rather than returning None
+        with pytest.raises(TypeError):
+            orig.get()
+        with pytest.raises(TypeError):
+            orig.get(1)
+        with pytest.raises(TypeError):
+            orig.get('cas', 0, 1)
+
+    def test_get_hedged(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        # hedge right away, either copy can answer
+        result = cb_env.collection.get(key, GetOptions(hedge_after=timedelta(microseconds=1)))
+        assert isinstance(result, GetResult)
+        assert isinstance(result.is_replica, bool)
+        assert result.content_as[dict] == value
+
+        with pytest.raises(DocumentNotFoundException):
+            cb_env.collection.get(TestEnvironment.NOT_A_KEY, GetOptions(hedge_after=timedelta(microseconds=1)))
+
+    def test_get_request_budget(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        with RequestBudget(timedelta(seconds=5)) as budget:
+            result = cb_env.collection.get(key)
+            assert result.content_as[dict] == value
+            assert budget.remaining < timedelta(seconds=5)
+
+        with RequestBudget(timedelta(milliseconds=1)):
+            TestEnvironment.sleep(0.01)
+            # the budget is spent, the operation should not be sent
+            with pytest.raises(UnAmbiguousTimeoutException):
+                cb_env.collection.get(key)
+
     def test_get_fails(self, cb_env):
         with pytest.raises(DocumentNotFoundException):
             cb_env.collection.get(TestEnvironment.NOT_A_KEY)
@@ -400,6 +463,52 @@ class CollectionTestSuite:
         with pytest.raises(DocumentExistsException):
             cb_env.collection.insert(key, value)
 
+    def test_keyspace_cached(self, cb_env):
+        key, value = cb_env.get_existing_doc()
+        result = cb_env.collection.get(key)
+        assert result.content_as[dict] == value
+        keyspace = cb_env.collection._get_keyspace()
+        cb_env.collection.get(key)
+        assert cb_env.collection._get_keyspace() is keyspace
+        # a new connection requires a new keyspace
+        cb_env.collection._set_connection()
+        assert cb_env.collection._keyspace is None
+        result = cb_env.collection.get(key)
+        assert result.content_as[dict] == value
+
+    def test_operation_timings(self, cb_env):
+        key, value = cb_env.get_new_doc()
+        recorder = OperationTimingsRecorder()
+        cb_env.collection._operation_timings = recorder
+        try:
+            result = cb_env.collection.upsert(key, value)
+            assert result.timings.operation == 'upsert'
+            assert result.timings.encode is not None
+            assert result.timings.total >= result.timings.core
+
+            result = cb_env.collection.get(key)
+            assert result.timings.operation == 'get'
+            assert result.timings.encode is None
+            assert result.timings.decode is not None
+
+            # a hedged get is timed as a get, even if a replica was read
+            result = cb_env.collection.get(key, GetOptions(hedge_after=timedelta(milliseconds=20)))
+            assert result.timings.operation == 'get'
+            assert result.timings.decode is not None
+
+            with pytest.raises(DocumentNotFoundException):
+                cb_env.collection.get(TestEnvironment.NOT_A_KEY)
+        finally:
+            cb_env.collection._operation_timings = None
+
+        summary = recorder.summary(reset=True)
+        assert summary['upsert']['count'] == 1
+        assert summary['get']['count'] == 3
+        assert 'encode' not in summary['get']
+        assert summary['get']['total']['max_us'] > 0
+        assert recorder.summary() == {}
+        assert cb_env.collection.get(key).timings is None
+
     def test_project(self, cb_env):
         # @TODO(jc): Why does caves not like the dealership type???
         key, value = cb_env.get_existing_doc()
@@ -617,6 +726,33 @@ class CollectionTestSuite:
         assert g_result.key == key
         assert value == g_result.content_as[dict]
 
+    def test_upsert_compiled_options(self, cb_env):
+        opts = UpsertOptions(timeout=timedelta(seconds=3), expiry=timedelta(seconds=2)).compile()
+        assert isinstance(opts, PreparedOptions)
+        keys = []
+        for _ in range(3):
+            key, value = cb_env.get_new_doc()
+            result = cb_env.collection.upsert(key, value, opts)
+            assert isinstance(result, MutationResult)
+            assert result.cas != 0
+            keys.append(key)
+
+        # kwargs still override the compiled options
+        key, value = cb_env.get_new_doc()
+        cb_env.collection.upsert(key, value, opts, expiry=timedelta(seconds=60))
+        TestEnvironment.sleep(3.0)
+        for k in keys:
+            with pytest.raises(DocumentNotFoundException):
+                cb_env.collection.get(k)
+        result = cb_env.collection.get(key)
+        assert result.content_as[dict] == value
+
+        # compiled options can only be used with the operation they were compiled for
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.get(key, opts)
+        with pytest.raises(InvalidArgumentException):
+            cb_env.collection.upsert(key, value, GetOptions(timeout=timedelta(seconds=3)).compile())
+
     @pytest.mark.usefixtures('check_preserve_expiry_supported')
     def test_upsert_preserve_expiry(self, cb_env):
         key, value = cb_env.get_existing_doc()
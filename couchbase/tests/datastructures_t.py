@@ -13,6 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 import pytest
 
 from couchbase.datastructures import (CouchbaseList,
@@ -32,7 +35,9 @@ class DatastructuresTestSuite:
         'test_list',
         'test_map',
         'test_queue',
+        'test_queue_concurrent_pop',
         'test_sets',
+        'test_sets_concurrent_remove',
     ]
 
     def test_list(self, cb_env):
@@ -177,6 +182,38 @@ class DatastructuresTestSuite:
 
         assert 0 == cb_queue.size()
 
+    def test_queue_concurrent_pop(self, cb_env):
+        key = cb_env.get_existing_doc(key_only=True)
+        cb_queue = cb_env.collection.couchbase_queue(key)
+        num_items = 20
+        for i in range(num_items):
+            cb_queue.push(i)
+
+        def pop_item(_):
+            return cb_queue.pop(timeout=timedelta(seconds=30))
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            popped = list(executor.map(pop_item, range(num_items)))
+
+        assert sorted(popped) == list(range(num_items))
+        with pytest.raises(QueueEmpty):
+            cb_queue.pop()
+
+    def test_sets_concurrent_remove(self, cb_env):
+        key = cb_env.get_existing_doc(key_only=True)
+        cb_set = cb_env.collection.couchbase_set(key)
+        num_items = 20
+        for i in range(num_items):
+            cb_set.add(i)
+
+        def remove_item(value):
+            cb_set.remove(value, timeout=timedelta(seconds=30))
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(remove_item, range(num_items)))
+
+        assert cb_set.size() == 0
+
 
 class LegacyDatastructuresTestSuite:
 
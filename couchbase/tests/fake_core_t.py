@@ -0,0 +1,270 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import subprocess
+import sys
+from datetime import timedelta
+from threading import Event
+from time import perf_counter
+
+import pytest
+
+from couchbase.exceptions import InvalidArgumentException, TemporaryFailException
+from couchbase.testing import (ErrorProfile,
+                               LatencyProfile,
+                               get_fake_cluster,
+                               reset_fake_clusters)
+from couchbase.testing import fake_core
+
+FAKE_CORE_SCRIPT = """
+from couchbase.auth import PasswordAuthenticator
+from couchbase.cluster import Cluster
+from couchbase.exceptions import DocumentNotFoundException
+from couchbase.options import ClusterOptions, QueryOptions
+from couchbase.testing import get_fake_cluster
+import couchbase.subdocument as SD
+
+cluster = Cluster('couchbase://localhost', ClusterOptions(PasswordAuthenticator('Administrator', 'password')))
+collection = cluster.bucket('default').default_collection()
+collection.upsert('fake-key', {'count': 1})
+collection.mutate_in('fake-key', [SD.increment('count', 2)])
+assert collection.get('fake-key').content_as[dict] == {'count': 3}
+try:
+    collection.get('not-a-key')
+    raise AssertionError('expected DocumentNotFoundException')
+except DocumentNotFoundException:
+    pass
+assert list(cluster.query('SELECT RAW META().id FROM default')) == ['fake-key']
+# a cached prepared statement the query service no longer knows is evicted and the query retried once
+statement = 'SELECT RAW x FROM ARRAY_RANGE(0, 3) AS x'
+cluster.prepare_statements([statement])
+get_fake_cluster('couchbase://localhost').clear_prepared_statements()
+result = cluster.query(statement, QueryOptions(adhoc=False))
+assert result.execute() == [0, 1, 2]
+assert result.metadata().prepared_cache_hit() is False
+assert len(cluster.prepared_statement_cache) == 0
+print('ok')
+"""
+
+
+class FakeCoreTestSuite:
+    TEST_MANIFEST = [
+        'test_cluster_api',
+        'test_connections_share_cluster',
+        'test_error_profile',
+        'test_error_profile_invalid',
+        'test_kv_async',
+        'test_kv_cas_mismatch',
+        'test_kv_get',
+        'test_kv_not_found',
+        'test_latency_profile_timeout',
+        'test_max_in_flight',
+        'test_query',
+        'test_query_prepared',
+        'test_subdoc_array_add_unique_root',
+        'test_subdoc_mutate_in_atomic',
+    ]
+
+    @pytest.fixture(scope='class')
+    def conn(self, test_manifest_validated):
+        if test_manifest_validated:
+            pytest.fail(f'Test manifest not validated.  Missing tests: {test_manifest_validated}.')
+
+        reset_fake_clusters()
+        yield fake_core.create_connection('couchbase://fake-core-tests')
+        reset_fake_clusters()
+
+    @pytest.fixture(name='keyspace')
+    def get_keyspace(self, conn):
+        conn.cluster.reset()
+        return fake_core.create_keyspace(conn=conn, bucket='default', scope='_default', collection_name='_default')
+
+    def _upsert(self, keyspace, key, value, **op_args):
+        return fake_core.kv_keyspace_operation(keyspace, key, fake_core.operations.UPSERT.value,
+                                               (json.dumps(value).encode('utf-8'), fake_core.FMT_JSON), op_args)
+
+    def _get(self, keyspace, key, **op_args):
+        return fake_core.kv_keyspace_operation(keyspace, key, fake_core.operations.GET.value, None, op_args)
+
+    def test_cluster_api(self):
+        env = dict(os.environ, PYCBC_FAKE_CORE='1')
+        proc = subprocess.run([sys.executable, '-c', FAKE_CORE_SCRIPT],
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE,
+                              universal_newlines=True,
+                              env=env,
+                              timeout=60)
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == 'ok'
+
+    def test_connections_share_cluster(self, conn):
+        other = fake_core.create_connection('couchbase://FAKE-CORE-TESTS?network=default')
+        assert other.cluster is conn.cluster
+        assert get_fake_cluster('couchbase://fake-core-tests') is conn.cluster
+        assert get_fake_cluster('couchbase://other-host') is not conn.cluster
+
+    def test_error_profile(self, conn, keyspace):
+        conn.cluster.configure(errors=ErrorProfile(TemporaryFailException, op_types=['get'], limit=2))
+        self._upsert(keyspace, 'fake-key', {'a': 1})
+        for _ in range(2):
+            res = self._get(keyspace, 'fake-key')
+            assert isinstance(res, fake_core.exception)
+            assert res.err() == 7
+            assert res.error_context()['key'] == 'fake-key'
+        assert self._get(keyspace, 'fake-key').raw_result['value'] == b'{"a": 1}'
+        assert conn.cluster.stats()['errors_injected'] == 2
+
+    def test_error_profile_invalid(self):
+        with pytest.raises(InvalidArgumentException):
+            ErrorProfile(TemporaryFailException, rate=1.5)
+        with pytest.raises(InvalidArgumentException):
+            ErrorProfile(ValueError)
+        with pytest.raises(InvalidArgumentException):
+            LatencyProfile(spike_rate=-1)
+
+    def test_kv_async(self, conn, keyspace):
+        conn.cluster.configure(latency=LatencyProfile(base=timedelta(milliseconds=50)))
+        done = Event()
+        results = []
+
+        def callback(res):
+            results.append(res)
+            done.set()
+
+        start = perf_counter()
+        ret = fake_core.kv_keyspace_operation(keyspace, 'fake-key', fake_core.operations.UPSERT.value,
+                                              (b'{}', fake_core.FMT_JSON), {'callback': callback, 'errback': callback})
+        assert ret is None
+        assert perf_counter() - start < 0.05
+        assert done.wait(5)
+        assert results[0].raw_result['key'] == 'fake-key'
+
+    def test_kv_cas_mismatch(self, keyspace):
+        res = self._upsert(keyspace, 'fake-key', {'a': 1})
+        cas = res.raw_result['cas']
+        assert self._upsert(keyspace, 'fake-key', {'a': 2}, cas=cas).raw_result['cas'] > cas
+        res = self._upsert(keyspace, 'fake-key', {'a': 3}, cas=cas)
+        assert isinstance(res, fake_core.exception)
+        assert res.err() == 9
+
+    def test_kv_get(self, keyspace):
+        res = self._upsert(keyspace, 'fake-key', {'a': 1})
+        assert res.raw_result['mutation_token'].get()['bucket_name'] == 'default'
+        res = self._get(keyspace, 'fake-key')
+        assert res.raw_result['value'] == b'{"a": 1}'
+        assert res.raw_result['flags'] == fake_core.FMT_JSON
+
+    def test_kv_not_found(self, keyspace):
+        res = self._get(keyspace, 'not-a-key')
+        assert isinstance(res, fake_core.exception)
+        assert res.err() == 101
+        res = fake_core.kv_keyspace_operation(keyspace, 'not-a-key', fake_core.operations.EXISTS.value, None, {})
+        assert res.raw_result['exists'] is False
+
+    def test_latency_profile_timeout(self, conn, keyspace):
+        conn.cluster.configure(latency=LatencyProfile(base=timedelta(seconds=1)))
+        start = perf_counter()
+        res = self._get(keyspace, 'fake-key', timeout=20000)
+        assert perf_counter() - start < 1
+        assert res.err() == 14
+        res = self._upsert(keyspace, 'fake-key', {}, timeout=20000)
+        assert res.err() == 13
+        assert conn.cluster.stats()['timeouts'] == 2
+
+    def test_max_in_flight(self, conn, keyspace):
+        conn.cluster.configure(latency=LatencyProfile(base=timedelta(milliseconds=100)), max_in_flight=2)
+        done = Event()
+        results = []
+
+        def callback(res):
+            results.append(res)
+            if len(results) == 3:
+                done.set()
+
+        for i in range(3):
+            fake_core.kv_keyspace_operation(keyspace, f'fake-key-{i}', fake_core.operations.UPSERT.value,
+                                            (b'{}', fake_core.FMT_JSON), {'callback': callback, 'errback': callback})
+        assert done.wait(5)
+        errors = [r for r in results if isinstance(r, fake_core.exception)]
+        assert len(errors) == 1
+        assert errors[0].err() == 7
+        assert conn.cluster.stats()['rejected'] == 1
+
+    def test_query(self, conn, keyspace):
+        conn.cluster.register_query('SELECT name FROM users WHERE id = $1',
+                                    rows=lambda positional, named: [{'name': f'user-{positional[0]}'}])
+        query = fake_core.n1ql_query(conn, {'statement': 'select name  from users where id = $1',
+                                            'positional_parameters': [b'42']})
+        rows = list(query)
+        assert rows[0] == b'{"name": "user-42"}'
+        assert rows[1] is None
+        assert rows[2].raw_result['value']['metadata']['metrics']['result_count'] == 1
+
+        rows = list(fake_core.n1ql_query(conn, {'statement': 'SELECT RAW x FROM ARRAY_RANGE(0, 3) AS x'}))
+        assert rows[:3] == [b'0', b'1', b'2']
+
+        rows = list(fake_core.n1ql_query(conn, {'statement': 'DELETE FROM default'}))
+        assert isinstance(rows[0], fake_core.exception)
+        assert rows[0].err() == 8
+
+    def test_query_prepared(self, conn, keyspace):
+        rows = list(fake_core.n1ql_query(conn, {'statement': 'PREPARE SELECT RAW x FROM ARRAY_RANGE(0, 3) AS x'}))
+        name = json.loads(rows[0])['name']
+        rows = list(fake_core.n1ql_query(conn, {'statement': f'EXECUTE `{name}`'}))
+        assert rows[:3] == [b'0', b'1', b'2']
+
+        list(fake_core.n1ql_query(conn, {'statement': 'PREPARE p1 FROM SELECT RAW x FROM ARRAY_RANGE(0, 1) AS x'}))
+        assert list(fake_core.n1ql_query(conn, {'statement': 'EXECUTE p1'}))[0] == b'0'
+
+        conn.cluster.clear_prepared_statements()
+        rows = list(fake_core.n1ql_query(conn, {'statement': 'EXECUTE p1'}))
+        assert isinstance(rows[0], fake_core.exception)
+        assert rows[0].err() == fake_core.PREPARED_STATEMENT_FAILURE
+
+    def test_subdoc_array_add_unique_root(self, conn, keyspace):
+        self._upsert(keyspace, 'fake-key', [1])
+
+        def add_unique(value):
+            spec = [(fake_core._ARRAY_ADD_UNIQUE, '', False, False, False, json.dumps(value).encode('utf-8'))]
+            return fake_core.subdoc_operation(conn=conn, bucket='default', scope='_default',
+                                              collection_name='_default', key='fake-key', spec=spec,
+                                              op_type=fake_core.operations.MUTATE_IN.value, op_args={})
+
+        assert not isinstance(add_unique(2), fake_core.exception)
+        assert add_unique(1).err() == 123
+        assert self._get(keyspace, 'fake-key').raw_result['value'] == b'[1, 2]'
+
+    def test_subdoc_mutate_in_atomic(self, conn, keyspace):
+        self._upsert(keyspace, 'fake-key', {'a': 1})
+        spec = [(fake_core._DICT_UPSERT, 'b', False, False, False, b'2'),
+                (fake_core._DICT_ADD, 'a', False, False, False, b'3')]
+        res = fake_core.subdoc_operation(conn=conn, bucket='default', scope='_default', collection_name='_default',
+                                         key='fake-key', spec=spec, op_type=fake_core.operations.MUTATE_IN.value,
+                                         op_args={})
+        assert res.err() == 123
+        assert self._get(keyspace, 'fake-key').raw_result['value'] == b'{"a": 1}'
+
+
+class ClassicFakeCoreTests(FakeCoreTestSuite):
+    @pytest.fixture(scope='class')
+    def test_manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicFakeCoreTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicFakeCoreTests) if valid_test_method(meth)]
+        compare = set(FakeCoreTestSuite.TEST_MANIFEST).difference(method_list)
+        return compare
@@ -89,6 +89,7 @@ class SubDocumentTestSuite:
         'test_lookup_in_any_replica_read_preference',
         'test_lookup_in_macros',
         'test_lookup_in_multiple_specs',
+        'test_lookup_in_multiple_specs_path_not_found',
         'test_lookup_in_one_path_not_found',
         'test_lookup_in_simple_exists',
         'test_lookup_in_simple_exists_bad_path',
@@ -680,6 +681,21 @@ class SubDocumentTestSuite:
         assert result.content_as[dict](2) == value['manufacturer']
         assert result.content_as[str](3) == value['manufacturer']['geo']['accuracy']
 
+    def test_lookup_in_multiple_specs_path_not_found(self, cb_env):
+        key, value = cb_env.get_existing_doc_by_type('vehicle')
+        result = cb_env.collection.lookup_in(key, (SD.get('manufacturer'),
+                                                   SD.get('qzzxy'),
+                                                   SD.exists('batch'),
+                                                   SD.get('manufacturer.geo.accuracy'),
+                                                   SD.get('manufacturer.geo'),))
+        assert isinstance(result, LookupInResult)
+        assert result.content_as[dict](0) == value['manufacturer']
+        with pytest.raises(PathNotFoundException):
+            result.content_as[str](1)
+        assert result.content_as[bool](2) is True
+        assert result.content_as[str](3) == value['manufacturer']['geo']['accuracy']
+        assert result.content_as[dict](4) == value['manufacturer']['geo']
+
     def test_lookup_in_one_path_not_found(self, cb_env):
         key = cb_env.get_existing_doc_by_type('vehicle', key_only=True)
         result = cb_env.collection.lookup_in(
@@ -56,11 +56,13 @@ class TransactionTestSuite:
         'test_expiration_time',
         'test_get',
         'test_get_lambda_raises_doc_not_found',
+        'test_get_multi',
         'test_get_inner_exc_doc_not_found',
         'test_get_replica_from_preferred_server_group_unretrievable',
         'test_get_replica_from_preferred_server_group_propagate_unretrievable_exc',
         'test_insert',
         'test_insert_lambda_raises_doc_exists',
+        'test_insert_multi',
         'test_insert_inner_exc_doc_exists',
         'test_max_parallelism',
         'test_metadata_collection',
@@ -83,6 +85,7 @@ class TransactionTestSuite:
         'test_remove_fail_bad_cas',
         'test_replace',
         'test_replace_fail_bad_cas',
+        'test_replace_multi',
         'test_rollback',
         'test_rollback_eating_exceptions',
         'test_scan_consistency',
@@ -288,6 +291,18 @@ class TransactionTestSuite:
 
         assert num_attempts == 1
 
+    def test_get_multi(self, cb_env):
+        keys_and_docs = dict(cb_env.get_existing_doc() for _ in range(5))
+
+        def txn_logic(ctx):
+            res = ctx.get_multi(cb_env.collection, list(keys_and_docs.keys()))
+            assert len(res) == len(keys_and_docs)
+            for k, v in res.items():
+                assert v.id == k
+                assert v.content_as[dict] == keys_and_docs[k]
+
+        cb_env.cluster.transactions.run(txn_logic)
+
     @pytest.mark.usefixtures('check_server_groups_supported')
     def test_get_replica_from_preferred_server_group_unretrievable(self, cb_env):
         key = cb_env.get_new_doc(key_only=True)
@@ -376,6 +391,18 @@ class TransactionTestSuite:
 
         assert num_attempts == 1
 
+    def test_insert_multi(self, cb_env):
+        keys_and_docs = dict(cb_env.get_new_doc() for _ in range(5))
+
+        def txn_logic(ctx):
+            res = ctx.insert_multi(cb_env.collection, keys_and_docs)
+            assert set(res.keys()) == set(keys_and_docs.keys())
+
+        cb_env.cluster.transactions.run(txn_logic)
+        for k, v in keys_and_docs.items():
+            get_result = cb_env.collection.get(k)
+            assert get_result.content_as[dict] == v
+
     def test_max_parallelism(self):
         max = 100
         cfg = TransactionQueryOptions(max_parallelism=max)
@@ -674,6 +701,23 @@ class TransactionTestSuite:
         res = cb_env.collection.get(key)
         assert res.content_as[dict] == value
 
+    def test_replace_multi(self, cb_env):
+        keys_and_docs = dict(cb_env.get_existing_doc() for _ in range(5))
+        new_value = {'some': 'thing else'}
+
+        def txn_logic(ctx):
+            get_res = ctx.get_multi(cb_env.collection, list(keys_and_docs.keys()))
+            replace_res = ctx.replace_multi([(r, new_value) for r in get_res.values()])
+            assert len(replace_res) == len(keys_and_docs)
+            for old, new in zip(get_res.values(), replace_res):
+                assert old.id == new.id
+                assert old.cas != new.cas
+
+        cb_env.cluster.transactions.run(txn_logic)
+        for k in keys_and_docs.keys():
+            result = cb_env.collection.get(k)
+            assert result.content_as[dict] == new_value
+
     def test_rollback(self, cb_env):
         key, value = cb_env.get_new_doc()
 
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import base64
 import json
 from datetime import timedelta
 from typing import Any, Tuple
@@ -20,14 +21,23 @@ from typing import Any, Tuple
 import pytest
 
 from couchbase.constants import FMT_JSON
-from couchbase.exceptions import (DocumentLockedException,
+from couchbase.encryption import (CachingKeyring,
+                                  CryptoManager,
+                                  Key,
+                                  Keyring)
+from couchbase.exceptions import (CryptoKeyNotFoundException,
+                                  DecryptionFailureException,
+                                  DocumentLockedException,
                                   DocumentNotFoundException,
                                   ValueFormatException)
 from couchbase.options import (GetAndLockOptions,
                                GetAndTouchOptions,
+                               GetMultiOptions,
                                GetOptions,
-                               ReplaceOptions)
-from couchbase.transcoder import (JSONTranscoder,
+                               ReplaceOptions,
+                               UpsertMultiOptions)
+from couchbase.transcoder import (EncryptingJSONTranscoder,
+                                  JSONTranscoder,
                                   LegacyTranscoder,
                                   RawBinaryTranscoder,
                                   RawJSONTranscoder,
@@ -52,12 +62,57 @@ class ZeroFlagsTranscoder(Transcoder):
         return json.loads(value.decode('utf-8'))
 
 
+class FakeKeyring(Keyring):
+    def __init__(self):
+        self.lookups = 0
+
+    def get_key(self, key_id):
+        self.lookups += 1
+        if key_id != 'test-key':
+            raise CryptoKeyNotFoundException(message=f'No key found for key_id {key_id}.')
+        return Key(key_id, b'test-key-bytes')
+
+
+class FakeCryptoManager(CryptoManager):
+    """Base64 'encryption', only for test purposes"""
+
+    def __init__(self):
+        self.encrypt_calls = 0
+        self.decrypt_calls = 0
+
+    def encrypt(self, plaintext, encrypter_alias=None):
+        return {'alg': 'FAKE', 'kid': encrypter_alias or 'test-key', 'ciphertext': base64.b64encode(plaintext).decode()}
+
+    def encrypt_many(self, plaintexts, encrypter_alias=None):
+        self.encrypt_calls += 1
+        return super().encrypt_many(plaintexts, encrypter_alias)
+
+    def decrypt(self, encrypted):
+        if encrypted.get('alg', None) != 'FAKE':
+            raise DecryptionFailureException(message='Unknown algorithm.')
+        return base64.b64decode(encrypted['ciphertext'])
+
+    def decrypt_many(self, encrypted):
+        self.decrypt_calls += 1
+        return super().decrypt_many(encrypted)
+
+    def mangle(self, field_name):
+        return f'encrypted${field_name}'
+
+    def demangle(self, field_name):
+        return field_name[len('encrypted$'):]
+
+    def is_mangled(self, field_name):
+        return field_name.startswith('encrypted$')
+
+
 class DefaultTranscoderTestSuite:
     TEST_MANIFEST = [
         'test_default_tc_binary_insert',
         'test_default_tc_binary_replace',
         'test_default_tc_binary_upsert',
         'test_default_tc_bytearray_upsert',
+        'test_default_tc_decode_values',
         'test_default_tc_decoding',
         'test_default_tc_flags_zero',
         'test_default_tc_json_insert',
@@ -88,6 +143,15 @@ class DefaultTranscoderTestSuite:
         with pytest.raises(ValueFormatException):
             cb_env.collection.upsert(key, bytearray(value))
 
+    def test_default_tc_decode_values(self):
+        tc = JSONTranscoder()
+        # each document is decoded on its own, a malformed document does not run into the next one
+        values = [(b'[1', FMT_JSON), (b'2],3', FMT_JSON), (b'{"a": 1}', FMT_JSON)]
+        assert tc.decode_values(values) == [b'[1', b'2],3', {'a': 1}]
+        assert tc.decode_values(values) == [tc.decode_value(v, f) for v, f in values]
+        # sub-document values are complete JSON values, parsed in a single pass
+        assert tc.decode_values([(b'[1, 2]', FMT_JSON), (b'3', FMT_JSON)], is_subdoc=True) == [[1, 2], 3]
+
     def test_default_tc_decoding(self):
         tc = JSONTranscoder()
         content = {'foo': 'bar'}
@@ -163,6 +227,98 @@ class DefaultTranscoderTestSuite:
         assert result == value
 
 
+class EncryptingTranscoderTestSuite:
+    TEST_MANIFEST = [
+        'test_caching_keyring',
+        'test_encrypting_tc_decode_values',
+        'test_encrypting_tc_decoding',
+        'test_encrypting_tc_get_multi',
+        'test_encrypting_tc_nested_fields',
+        'test_encrypting_tc_upsert',
+    ]
+
+    def test_caching_keyring(self):
+        keyring = FakeKeyring()
+        caching_keyring = CachingKeyring(keyring)
+        for _ in range(3):
+            key = caching_keyring.get_key('test-key')
+            assert key.id == 'test-key'
+        assert keyring.lookups == 1
+        caching_keyring.clear('test-key')
+        caching_keyring.get_key('test-key')
+        assert keyring.lookups == 2
+        with pytest.raises(CryptoKeyNotFoundException):
+            caching_keyring.get_key('not-a-key')
+
+    def test_encrypting_tc_decode_values(self):
+        crypto_mgr = FakeCryptoManager()
+        tc = EncryptingJSONTranscoder(crypto_mgr, ['secret', 'other_secret'])
+        docs = [{'id': i, 'secret': f'secret-{i}', 'other_secret': i} for i in range(10)]
+        encoded = [tc.encode_value(d) for d in docs]
+        # all the fields of a document are encrypted in a single pass
+        assert crypto_mgr.encrypt_calls == 10
+        decoded = tc.decode_values(encoded)
+        # all the documents are decrypted in a single pass
+        assert crypto_mgr.decrypt_calls == 1
+        assert decoded == docs
+
+    def test_encrypting_tc_decoding(self):
+        crypto_mgr = FakeCryptoManager()
+        tc = EncryptingJSONTranscoder(crypto_mgr, {'secret': 'test-key'})
+        content = {'foo': 'bar', 'secret': {'pin': 1234}}
+        value, flags = tc.encode_value(content)
+        assert flags == FMT_JSON
+        # the provided document should not be modified
+        assert content == {'foo': 'bar', 'secret': {'pin': 1234}}
+        stored = json.loads(value)
+        assert 'secret' not in stored
+        assert stored['encrypted$secret']['kid'] == 'test-key'
+        assert stored['foo'] == 'bar'
+        decoded = tc.decode_value(value, flags)
+        assert content == decoded
+        # documents w/o the encrypted fields are passed through
+        value, flags = tc.encode_value({'foo': 'bar'})
+        assert tc.decode_value(value, flags) == {'foo': 'bar'}
+
+    def test_encrypting_tc_get_multi(self, cb_env):
+        crypto_mgr = FakeCryptoManager()
+        tc = EncryptingJSONTranscoder(crypto_mgr, ['secret'])
+        keys_and_docs = {}
+        for _ in range(5):
+            key, value = cb_env.get_new_doc_by_type('json')
+            keys_and_docs[key] = dict(value, secret=f'{key}-secret')
+        res = cb_env.collection.upsert_multi(keys_and_docs, UpsertMultiOptions(transcoder=tc))
+        assert res.all_ok is True
+        res = cb_env.collection.get_multi(list(keys_and_docs.keys()), GetMultiOptions(transcoder=tc))
+        assert res.all_ok is True
+        assert crypto_mgr.decrypt_calls == 1
+        for k, v in res.results.items():
+            assert v.content_as[dict] == keys_and_docs[k]
+
+    def test_encrypting_tc_nested_fields(self):
+        crypto_mgr = FakeCryptoManager()
+        tc = EncryptingJSONTranscoder(crypto_mgr, ['address', 'address.street', 'address.zip'])
+        content = {'name': 'Jane', 'address': {'street': '123 Main St', 'zip': '12345', 'country': 'US'}}
+        value, flags = tc.encode_value(content)
+        assert content['address'] == {'street': '123 Main St', 'zip': '12345', 'country': 'US'}
+        stored = json.loads(value)
+        assert list(stored.keys()) == ['name', 'encrypted$address']
+        # street and zip are encrypted in the same pass
+        assert crypto_mgr.encrypt_calls == 2
+        assert tc.decode_value(value, flags) == content
+
+    def test_encrypting_tc_upsert(self, cb_env):
+        tc = EncryptingJSONTranscoder(FakeCryptoManager(), ['secret'])
+        key, value = cb_env.get_new_doc_by_type('json')
+        value['secret'] = 'super secret'
+        cb_env.collection.upsert(key, value, transcoder=tc)
+        res = cb_env.collection.get(key)
+        assert 'secret' not in res.content_as[dict]
+        assert 'encrypted$secret' in res.content_as[dict]
+        res = cb_env.collection.get(key, GetOptions(transcoder=tc))
+        assert res.content_as[dict] == value
+
+
 class KeyValueOpTranscoderTestSuite:
     TEST_MANIFEST = [
         'test_get',
@@ -642,6 +798,28 @@ class ClassicDefaultTranscoderTests(DefaultTranscoderTestSuite):
         cb_env.teardown(request.param)
 
 
+class ClassicEncryptingTranscoderTests(EncryptingTranscoderTestSuite):
+
+    @pytest.fixture(scope='class')
+    def test_manifest_validated(self):
+        def valid_test_method(meth):
+            attr = getattr(ClassicEncryptingTranscoderTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClassicEncryptingTranscoderTests) if valid_test_method(meth)]
+        compare = set(EncryptingTranscoderTestSuite.TEST_MANIFEST).difference(method_list)
+        return compare
+
+    @pytest.fixture(scope='class', name='cb_env', params=[CollectionType.DEFAULT, CollectionType.NAMED])
+    def couchbase_test_environment(self, cb_base_env, test_manifest_validated, request):
+        if test_manifest_validated:
+            pytest.fail(f'Test manifest not validated.  Missing tests: {test_manifest_validated}.')
+
+        cb_env = TranscoderTestEnvironment.from_environment(cb_base_env)
+        cb_env.setup(request.param)
+        yield cb_env
+        cb_env.teardown(request.param)
+
+
 class KeyValueOpTranscoderTests(KeyValueOpTranscoderTestSuite):
 
     @pytest.fixture(scope='class')
@@ -0,0 +1,317 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import weakref
+from collections import deque
+from datetime import datetime, timedelta
+from enum import Enum
+from threading import Lock
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Optional)
+
+# The C++ client's threshold logging tracer only emits its reports as warnings through its logger, prefixed with
+# these messages and followed by the report's JSON.
+_REPORT_PREFIXES = {
+    'Operations over threshold: ': 'threshold',
+    'Orphan responses observed: ': 'orphan',
+}
+
+MAX_QUEUED_REPORTS = 100
+
+_LOG = logging.getLogger(__name__)
+
+
+class ThresholdReportType(Enum):
+    """**VOLATILE** This API is subject to change at any time.
+
+    The kind of a :class:`.ThresholdReport`.
+    """
+    THRESHOLD = 'threshold'
+    ORPHAN = 'orphan'
+
+
+class ThresholdReportEntry:
+    """**VOLATILE** This API is subject to change at any time.
+
+    A single operation of a :class:`.ThresholdReport`.
+    """
+
+    __slots__ = ('_entry',)
+
+    def __init__(self, entry  # type: Dict[str, Any]
+                 ):
+        self._entry = entry
+
+    @property
+    def operation_name(self) -> Optional[str]:
+        """
+            Optional[str]: The name of the operation (i.e. ``get``, ``upsert``, ``query``).
+        """
+        return self._entry.get('operation_name', None)
+
+    @property
+    def total_duration(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: The duration of the operation, as seen by the C++ client.
+        """
+        return self._micros(self._entry.get('total_duration_us', None))
+
+    @property
+    def last_server_duration(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: The server duration of the operation's last attempt.  Only available for
+            key-value operations.
+        """
+        return self._micros(self._entry.get('last_server_duration_us', None))
+
+    @property
+    def total_server_duration(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: The server duration of all of the operation's attempts.  Only available for
+            key-value operations.
+        """
+        return self._micros(self._entry.get('total_server_duration_us', None))
+
+    @property
+    def operation_id(self) -> Optional[str]:
+        """
+            Optional[str]: The ID of the operation's last attempt (i.e. the opaque of a key-value operation).
+        """
+        return self._entry.get('last_operation_id', None)
+
+    @property
+    def local_id(self) -> Optional[str]:
+        """
+            Optional[str]: The ID of the connection the operation's last attempt was sent on.
+        """
+        return self._entry.get('last_local_id', None)
+
+    @property
+    def local_socket(self) -> Optional[str]:
+        """
+            Optional[str]: The local address of the connection the operation's last attempt was sent on.
+        """
+        return self._entry.get('last_local_socket', None)
+
+    @property
+    def remote_socket(self) -> Optional[str]:
+        """
+            Optional[str]: The remote address of the connection the operation's last attempt was sent on.
+        """
+        return self._entry.get('last_remote_socket', None)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the entry as reported by the C++ client.
+
+        Returns:
+            Dict[str, Any]: The raw entry, durations are in microseconds.
+        """
+        return dict(self._entry)
+
+    @staticmethod
+    def _micros(value) -> Optional[timedelta]:
+        if value is None:
+            return None
+        return timedelta(microseconds=value)
+
+    def __repr__(self):
+        return f'ThresholdReportEntry({self._entry})'
+
+
+class ThresholdReport:
+    """**VOLATILE** This API is subject to change at any time.
+
+    A report of the threshold logging tracer, emitted every ``tracing_threshold_queue_flush_interval`` (or
+    ``tracing_orphaned_queue_flush_interval``) if any operation went over its service's threshold (or any response
+    was orphaned).  See :class:`~couchbase.options.ClusterTracingOptions`.
+    """
+
+    __slots__ = ('_report_type', '_report', '_entries', '_timestamp')
+
+    def __init__(self,
+                 report_type,  # type: ThresholdReportType
+                 report,  # type: Dict[str, Any]
+                 timestamp,  # type: datetime
+                 ):
+        self._report_type = report_type
+        self._report = report
+        self._timestamp = timestamp
+        entries = [ThresholdReportEntry(e) for e in report.get('top', [])]
+        entries.sort(key=lambda e: e._entry.get('total_duration_us', 0), reverse=True)
+        self._entries = entries
+
+    @property
+    def report_type(self) -> ThresholdReportType:
+        """
+            :class:`.ThresholdReportType`: Whether this reports operations over threshold or orphaned responses.
+        """
+        return self._report_type
+
+    @property
+    def service(self) -> Optional[str]:
+        """
+            Optional[str]: The service of the operations (i.e. ``kv``, ``query``).  None for orphan reports.
+        """
+        return self._report.get('service', None)
+
+    @property
+    def count(self) -> int:
+        """
+            int: The number of operations sampled in the report's interval.
+        """
+        return self._report.get('count', len(self._entries))
+
+    @property
+    def entries(self) -> List[ThresholdReportEntry]:
+        """
+            List[:class:`.ThresholdReportEntry`]: The top-N slowest operations, slowest first.
+        """
+        return self._entries
+
+    @property
+    def timestamp(self) -> datetime:
+        """
+            datetime: When the report was emitted.
+        """
+        return self._timestamp
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the report as emitted by the C++ client.
+
+        Returns:
+            Dict[str, Any]: The raw report, durations are in microseconds.
+        """
+        return dict(self._report)
+
+    @classmethod
+    def from_message(cls,
+                     message,  # type: str
+                     timestamp=None,  # type: Optional[datetime]
+                     ) -> Optional[ThresholdReport]:
+        """**INTERNAL**
+
+        Parses a report out of a log message of the C++ client, returns None if the message is not a report.
+        """
+        for prefix, report_type in _REPORT_PREFIXES.items():
+            idx = message.find(prefix)
+            if idx < 0:
+                continue
+            try:
+                report = json.loads(message[idx + len(prefix):])
+            except ValueError:
+                return None
+            if not isinstance(report, dict):
+                return None
+            return cls(ThresholdReportType(report_type), report, timestamp or datetime.now())
+        return None
+
+    def __repr__(self):
+        return (f'ThresholdReport(report_type={self._report_type.value}, service={self.service}, '
+                f'count={self.count}, entries={self._entries})')
+
+
+class ThresholdReportCollector:
+    """**INTERNAL**
+
+    Queues the reports delivered to a cluster (up to ``MAX_QUEUED_REPORTS``, oldest are dropped first) and calls
+    the cluster's report callbacks.
+    """
+
+    def __init__(self, max_reports=MAX_QUEUED_REPORTS  # type: Optional[int]
+                 ):
+        self._reports = deque(maxlen=max_reports)
+        self._callbacks = []  # type: List[Callable[[ThresholdReport], None]]
+        self._lock = Lock()
+
+    def add_callback(self, callback  # type: Callable[[ThresholdReport], None]
+                     ) -> None:
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def deliver(self, report  # type: ThresholdReport
+                ) -> None:
+        with self._lock:
+            self._reports.append(report)
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(report)
+            except Exception:  # nosec
+                _LOG.exception('Threshold report callback raised an exception.')
+
+    def reports(self, clear=True  # type: Optional[bool]
+                ) -> List[ThresholdReport]:
+        with self._lock:
+            reports = list(self._reports)
+            if clear:
+                self._reports.clear()
+        return reports
+
+
+class ThresholdReportFilter(logging.Filter):
+    """**INTERNAL**
+
+    Added to the logger the C++ client logs to (see :func:`couchbase.configure_logging`), parses the threshold
+    logging tracer's reports out of its records and delivers them to the subscribed collectors.  A filter rather
+    than a handler, so the logger's handlers (or ``logging.lastResort`` if it has none) are unaffected; it never
+    filters out a record.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._collectors = weakref.WeakSet()
+
+    def subscribe(self, collector  # type: ThresholdReportCollector
+                  ) -> None:
+        self._collectors.add(collector)
+
+    def filter(self, record  # type: logging.LogRecord
+               ) -> bool:
+        if record.levelno != logging.WARNING or not self._collectors:
+            return True
+        try:
+            report = ThresholdReport.from_message(record.getMessage(), datetime.fromtimestamp(record.created))
+        except Exception:  # nosec
+            _LOG.debug('Unable to parse threshold report.', exc_info=True)
+            return True
+        if report is not None:
+            for collector in list(self._collectors):
+                collector.deliver(report)
+        return True
+
+
+_FILTER = ThresholdReportFilter()
+
+
+def attach_threshold_report_filter(logger  # type: logging.Logger
+                                   ) -> None:
+    """**INTERNAL**
+    """
+    if _FILTER not in logger.filters:
+        logger.addFilter(_FILTER)
+
+
+def subscribe_threshold_reports(collector  # type: ThresholdReportCollector
+                                ) -> None:
+    """**INTERNAL**
+    """
+    _FILTER.subscribe(collector)
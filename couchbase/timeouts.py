@@ -0,0 +1,274 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from datetime import timedelta
+from threading import Lock
+from time import perf_counter
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Optional)
+
+from couchbase.exceptions import InvalidArgumentException, UnAmbiguousTimeoutException
+
+# the core's defaults, in microseconds
+DEFAULT_KV_TIMEOUT = 2500000
+DEFAULT_KV_DURABLE_TIMEOUT = 10000000
+
+_CURRENT_BUDGET = ContextVar('pycbc_request_budget', default=None)
+
+
+class _LatencyWindow:
+    """
+    **INTERNAL**
+
+    Sliding window of the most recent latencies (in seconds) for an operation type.  The percentile is only
+    recomputed every refresh_interval samples so recording stays cheap.
+    """
+
+    def __init__(self, size, refresh_interval):
+        self._samples = [0.0] * size
+        self._size = size
+        self._refresh_interval = refresh_interval
+        self._count = 0
+        self._percentile = None
+        self._lock = Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, latency, percentile):
+        with self._lock:
+            self._samples[self._count % self._size] = latency
+            self._count += 1
+            if self._percentile is not None and self._count % self._refresh_interval != 0:
+                return
+            samples = sorted(self._samples[:min(self._count, self._size)])
+        idx = min(len(samples) - 1, int(len(samples) * percentile / 100))
+        self._percentile = samples[idx]
+
+    def percentile(self) -> Optional[float]:
+        return self._percentile
+
+
+class AdaptiveTimeouts:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Derives key-value operation timeouts from the latencies the SDK observes.  Latencies are tracked per
+    operation type (get, upsert, lookup_in, etc.) over a sliding window of recent operations.  Once enough
+    samples have been collected, an operation that was not given an explicit timeout is given ``multiplier``
+    times the observed ``percentile`` latency, bounded by ``min_timeout`` and ``max_timeout``.  Only the latencies
+    of successful operations are tracked.
+
+    Set on the cluster via :class:`~couchbase.options.ClusterOptions` ``adaptive_timeouts``.  Durable
+    operations always use the static durable timeout.
+
+    Args:
+        percentile (float, optional): The latency percentile timeouts are derived from. Defaults to 99.
+        multiplier (float, optional): The multiple of the percentile latency to use as the timeout. Defaults to 2.
+        min_timeout (timedelta, optional): Lower bound for derived timeouts. Defaults to 10 milliseconds.
+        max_timeout (timedelta, optional): Upper bound for derived timeouts. Defaults to the cluster's
+            key-value timeout.
+        window_size (int, optional): Number of recent latencies tracked per operation type. Defaults to 1000.
+        min_samples (int, optional): Number of latencies that need to be recorded for an operation type before
+            its timeout is adapted. Defaults to 100.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If any of the provided arguments are invalid.
+    """
+
+    def __init__(self,
+                 percentile=99.0,  # type: Optional[float]
+                 multiplier=2.0,  # type: Optional[float]
+                 min_timeout=timedelta(milliseconds=10),  # type: Optional[timedelta]
+                 max_timeout=None,  # type: Optional[timedelta]
+                 window_size=1000,  # type: Optional[int]
+                 min_samples=100,  # type: Optional[int]
+                 ):
+        if not 0 < percentile <= 100:
+            raise InvalidArgumentException(message='The percentile must be in the range (0, 100].')
+        if multiplier <= 0:
+            raise InvalidArgumentException(message='The multiplier must be positive.')
+        if not isinstance(min_timeout, timedelta):
+            raise InvalidArgumentException(message='Expected min_timeout to be a timedelta.')
+        if max_timeout is not None and not isinstance(max_timeout, timedelta):
+            raise InvalidArgumentException(message='Expected max_timeout to be a timedelta.')
+        if window_size < 1 or min_samples < 1:
+            raise InvalidArgumentException(message='The window_size and min_samples must be positive.')
+
+        self._percentile = percentile
+        self._multiplier = multiplier
+        self._min_timeout = int(min_timeout.total_seconds() * 1e6)
+        self._max_timeout = int(max_timeout.total_seconds() * 1e6) if max_timeout is not None else None
+        self._window_size = window_size
+        self._min_samples = min(min_samples, window_size)
+        self._windows = {}  # type: Dict[int, _LatencyWindow]
+        self._lock = Lock()
+
+    def _get_window(self, op_type):
+        window = self._windows.get(op_type, None)
+        if window is None:
+            with self._lock:
+                window = self._windows.setdefault(op_type,
+                                                  _LatencyWindow(self._window_size,
+                                                                 max(1, self._window_size // 10)))
+        return window
+
+    def record(self,
+               op_type,  # type: int
+               latency,  # type: float
+               ) -> None:
+        """**INTERNAL**
+
+        Records the latency (in seconds) of a successful operation.
+        """
+        self._get_window(op_type).record(latency, self._percentile)
+
+    def get_timeout(self,
+                    op_type,  # type: int
+                    max_timeout=DEFAULT_KV_TIMEOUT,  # type: int
+                    ) -> Optional[int]:
+        """**INTERNAL**
+
+        Returns the adapted timeout (in microseconds) for the operation type, or None if not enough latencies
+        have been recorded yet.
+        """
+        window = self._windows.get(op_type, None)
+        if window is None or window.count < self._min_samples:
+            return None
+        latency = window.percentile()
+        if latency is None:
+            return None
+        if self._max_timeout is not None:
+            max_timeout = self._max_timeout
+        timeout = int(latency * self._multiplier * 1e6)
+        return max(self._min_timeout, min(timeout, max_timeout))
+
+    def timed_callback(self,
+                       op_type,  # type: int
+                       start,  # type: float
+                       callback,  # type: Callable[[Any], None]
+                       ) -> Callable[[Any], None]:
+        """**INTERNAL**
+
+        Wraps an operation's callback to record the latency of the successful operation.
+        """
+        def wrapped_callback(res):
+            self.record(op_type, perf_counter() - start)
+            callback(res)
+
+        return wrapped_callback
+
+
+class RequestBudget:
+    """**VOLATILE** This API is subject to change at any time.
+
+    An overall time budget shared by every key-value operation issued within a ``with`` (or ``async with``)
+    block.  Each operation's timeout is capped to the budget's remaining time.  Once the budget is spent,
+    operations fail fast, without being sent, with an
+    :class:`~couchbase.exceptions.UnAmbiguousTimeoutException`.
+
+    Budgets can be nested.  A nested budget can never extend the deadline of the budget it is nested in.
+
+    Args:
+        budget (timedelta): The time the operations within the block are allowed to take.
+
+    Raises:
+        :class:`~couchbase.exceptions.InvalidArgumentException`: If the budget is not a timedelta.
+
+    Examples:
+
+        Share a 200ms budget across a chain of operations::
+
+            from datetime import timedelta
+            from couchbase.timeouts import RequestBudget
+
+            # ... other code ...
+
+            with RequestBudget(timedelta(milliseconds=200)):
+                res = collection.get('doc-key')
+                count = collection.lookup_in('doc-key', [SD.count('items')])
+                collection.upsert('doc-key-2', {'items': count.content_as[int](0)})
+
+    """
+
+    def __init__(self,
+                 budget,  # type: timedelta
+                 ):
+        if not isinstance(budget, timedelta):
+            raise InvalidArgumentException(message='Expected budget to be a timedelta.')
+        self._budget = budget
+        self._deadline = None
+        self._token = None
+
+    @staticmethod
+    def current() -> Optional[RequestBudget]:
+        """
+            Optional[:class:`.RequestBudget`]: The budget operations issued from the current context share,
+            if any.
+        """
+        return _CURRENT_BUDGET.get()
+
+    @property
+    def remaining(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: The time remaining in the budget.  None if the budget is not in use.
+        """
+        if self._deadline is None:
+            return None
+        return timedelta(seconds=max(0.0, self._deadline - perf_counter()))
+
+    def apply(self,
+              op_args,  # type: Dict[str, Any]
+              default_timeout,  # type: int
+              ) -> None:
+        """**INTERNAL**
+
+        Caps the operation's timeout to the remaining budget.  Operations issued once the budget is no longer in use
+        (i.e. from a task created within the block that outlives it) are not capped.
+        """
+        deadline = self._deadline
+        if deadline is None:
+            return
+        remaining = int((deadline - perf_counter()) * 1e6)
+        if remaining <= 0:
+            raise UnAmbiguousTimeoutException(message='The request budget has been exhausted.')
+        timeout = op_args.get('timeout', None) or default_timeout
+        if remaining < timeout:
+            op_args['timeout'] = remaining
+
+    def __enter__(self) -> RequestBudget:
+        deadline = perf_counter() + self._budget.total_seconds()
+        parent = _CURRENT_BUDGET.get()
+        if parent is not None and parent._deadline is not None:
+            deadline = min(deadline, parent._deadline)
+        self._deadline = deadline
+        self._token = _CURRENT_BUDGET.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _CURRENT_BUDGET.reset(self._token)
+        self._token = None
+        self._deadline = None
+
+    async def __aenter__(self) -> RequestBudget:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,281 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Optional,
+                    Tuple)
+
+_CURRENT_TIMINGS = ContextVar('pycbc_operation_timings', default=None)
+
+PHASES = ('options', 'encode', 'core', 'decode', 'total')
+
+
+class OperationTimings:
+    """**VOLATILE** This API is subject to change at any time.
+
+    The client-side latency breakdown of a single key-value operation.  Each phase is measured with a monotonic
+    clock and is None if the operation did not go through it (i.e. a get does not encode a value).
+
+    The phases are:
+
+        * ``options``: Parsing and validating the operation's options.
+        * ``encode``: Encoding the document's value with the transcoder.
+        * ``core``: From the request being handed to the C++ client until its response is handed back to Python.
+          This includes the C++ bridge, the network and the server.
+        * ``decode``: Decoding the document's value with the transcoder and building the result.
+        * ``total``: The whole operation, as seen by the application.
+
+    Enabled via :class:`~couchbase.options.ClusterOptions` ``enable_operation_timings``, available on results via
+    ``timings``.
+    """
+
+    __slots__ = ('_operation', '_start', '_options_parsed', '_submitted', '_completed', '_done')
+
+    def __init__(self):
+        self._operation = None
+        self._start = perf_counter()
+        self._options_parsed = None
+        self._submitted = None
+        self._completed = None
+        self._done = None
+
+    @property
+    def operation(self) -> Optional[str]:
+        """
+            Optional[str]: The name of the operation (i.e. ``get``, ``upsert``, ``lookup_in``).
+        """
+        return self._operation
+
+    @property
+    def options(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: Time spent parsing the operation's options.
+        """
+        end = self._options_parsed or self._submitted
+        return self._delta(self._start, end)
+
+    @property
+    def encode(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: Time spent encoding the document's value.
+        """
+        if self._options_parsed is None:
+            return None
+        return self._delta(self._options_parsed, self._submitted)
+
+    @property
+    def core(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: Time spent in the C++ client, the network and the server.
+        """
+        return self._delta(self._submitted or self._options_parsed or self._start, self._completed)
+
+    @property
+    def decode(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: Time spent decoding the document's value and building the result.
+        """
+        return self._delta(self._completed, self._done)
+
+    @property
+    def total(self) -> Optional[timedelta]:
+        """
+            Optional[timedelta]: Time the whole operation took.
+        """
+        return self._delta(self._start, self._done)
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Returns the phases of the operation.
+
+        Returns:
+            Dict[str, Optional[float]]: The duration, in microseconds, of each phase.
+        """
+        return {phase: self._micros(getattr(self, phase)) for phase in PHASES}
+
+    def mark_options_parsed(self) -> None:
+        """**INTERNAL**
+        """
+        self._options_parsed = perf_counter()
+
+    def mark_submitted(self,
+                       operation,  # type: str
+                       ) -> None:
+        """**INTERNAL**
+
+        Only the first hand-off is kept, i.e. a hedged get is recorded as a ``get`` even if it also reads a replica.
+        """
+        if self._submitted is not None:
+            return
+        self._operation = operation
+        self._submitted = perf_counter()
+
+    def mark_completed(self) -> None:
+        """**INTERNAL**
+        """
+        self._completed = perf_counter()
+
+    def mark_done(self) -> None:
+        """**INTERNAL**
+        """
+        self._done = perf_counter()
+
+    @staticmethod
+    def _delta(start, end) -> Optional[timedelta]:
+        if start is None or end is None:
+            return None
+        return timedelta(seconds=end - start)
+
+    @staticmethod
+    def _micros(delta) -> Optional[float]:
+        if delta is None:
+            return None
+        return delta.total_seconds() * 1e6
+
+    def __repr__(self):
+        phases = ', '.join(f'{k}={v:.1f}us' for k, v in self.as_dict().items() if v is not None)
+        return f'OperationTimings(operation={self._operation}, {phases})'
+
+
+def current_timings() -> Optional[OperationTimings]:
+    """**INTERNAL**
+
+    Returns the timings of the operation being issued from the current context, if any.
+    """
+    return _CURRENT_TIMINGS.get()
+
+
+def timed_operation(fn  # type: Callable[..., Any]
+                    ) -> Callable[..., Any]:
+    """**INTERNAL**
+
+    Starts an operation's timings when its public method is called, for operations whose public method parses the
+    options before calling the wrapped (blocking or async) operation.
+    """
+    @wraps(fn)
+    def wrapped_fn(self, *args, **kwargs):
+        recorder = self._operation_timings
+        if recorder is None:
+            return fn(self, *args, **kwargs)
+        _, token = recorder.start()
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            recorder.end(token)
+
+    return wrapped_fn
+
+
+class _PhaseStats:
+    __slots__ = ('count', 'sum', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self) -> Dict[str, float]:
+        return {'mean_us': self.sum / self.count * 1e6 if self.count else 0.0,
+                'max_us': self.max * 1e6}
+
+
+class OperationTimingsRecorder:
+    """**INTERNAL**
+
+    Starts the timings of a cluster's operations and aggregates them, per operation and phase.
+    """
+
+    def __init__(self):
+        self._stats = {}  # type: Dict[str, Tuple[int, Dict[str, _PhaseStats]]]
+        self._lock = Lock()
+
+    def start(self) -> Tuple[OperationTimings, Any]:
+        """**INTERNAL**
+
+        Returns the timings of the operation being issued from the current context, starting them if they have not
+        been started (by an outer wrapper), and the token to pass to :meth:`.end`.
+        """
+        timings = _CURRENT_TIMINGS.get()
+        if timings is not None:
+            return timings, None
+        timings = OperationTimings()
+        return timings, _CURRENT_TIMINGS.set(timings)
+
+    def end(self, token  # type: Any
+            ) -> None:
+        """**INTERNAL**
+        """
+        if token is not None:
+            _CURRENT_TIMINGS.reset(token)
+
+    def record(self, timings  # type: OperationTimings
+               ) -> None:
+        """**INTERNAL**
+
+        Completes the operation's timings and adds them to the aggregates.
+        """
+        if timings._done is not None:
+            # already recorded by an inner wrapper
+            return
+        timings.mark_done()
+        if timings._completed is None:
+            timings._completed = timings._done
+        operation = timings.operation
+        if operation is None:
+            # not a key-value operation (i.e. a cluster level operation), or it failed before being submitted
+            return
+        with self._lock:
+            entry = self._stats.get(operation, None)
+            if entry is None:
+                entry = self._stats[operation] = [0, {}]
+            entry[0] += 1
+            for phase in PHASES:
+                delta = getattr(timings, phase)
+                if delta is None:
+                    continue
+                stats = entry[1].get(phase, None)
+                if stats is None:
+                    stats = entry[1][phase] = _PhaseStats()
+                stats.record(delta.total_seconds())
+
+    def summary(self,
+                reset=False,  # type: Optional[bool]
+                ) -> Dict[str, Dict[str, Any]]:
+        """**INTERNAL**
+        """
+        with self._lock:
+            stats = self._stats
+            if reset:
+                self._stats = {}
+            summary = {}
+            for operation, (count, phases) in stats.items():
+                op_summary = {'count': count}
+                op_summary.update({phase: s.as_dict() for phase, s in phases.items()})
+                summary[operation] = op_summary
+        return summary
@@ -15,11 +15,15 @@
 
 import logging
 from functools import wraps
+from threading import Event, Lock
 from typing import (TYPE_CHECKING,
                     Any,
                     Callable,
                     Dict,
-                    Optional)
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
 
 from couchbase.exceptions import (CouchbaseException,
                                   ErrorMapper,
@@ -290,6 +294,174 @@ class AttemptContext(AttemptContextLogic):
             kwargs['transcoder'] = options.get('transcoder', None)
         return self._replace(txn_get_result, value, **kwargs)
 
+    def _stage_multi(self,
+                     fn,  # type: Callable[..., Any]
+                     ops,  # type: List[Tuple[Tuple[Any, ...], Dict[str, Any]]]
+                     ) -> List[TransactionGetResult]:
+        """
+        **INTERNAL**
+
+        Issues all the provided operations at once, using callbacks, and blocks until all of them have completed so
+        that the operations are staged concurrently within the attempt.  If any of the operations failed, the
+        first failure is raised once all the operations have completed.
+        """
+        if not ops:
+            return []
+
+        results = [None] * len(ops)  # type: List[Any]
+        remaining = [len(ops)]
+        lock = Lock()
+        done = Event()
+
+        def make_callbacks(idx, tc):
+            def on_complete(res, is_err):
+                results[idx] = self._staged_result(fn, res, is_err, tc)
+                with lock:
+                    remaining[0] -= 1
+                    if remaining[0] == 0:
+                        done.set()
+
+            return (lambda res: on_complete(res, False)), (lambda exc: on_complete(exc, True))
+
+        for idx, (args, kwargs) in enumerate(ops):
+            tc = kwargs.get('transcoder', self._transcoder)
+            kwargs['callback'], kwargs['errback'] = make_callbacks(idx, tc)
+            try:
+                fn(*args, **kwargs)
+            except Exception as ex:
+                kwargs['errback'](ex)
+
+        done.wait()
+        self._raise_first_failure(results)
+        return results
+
+    @staticmethod
+    def _staged_result(fn,  # type: Callable[..., Any]
+                       res,  # type: Any
+                       is_err,  # type: bool
+                       tc,  # type: Transcoder
+                       ) -> Any:
+        """
+        **INTERNAL**
+
+        Converts the outcome of one of the operations of :meth:`_stage_multi` into its result, or its exception.
+        """
+        if is_err is True and not res:
+            res = RuntimeError(f'unknown error calling {fn.__name__}')
+        if isinstance(res, BaseCouchbaseException):
+            return ErrorMapper.build_exception(res)
+        if is_err is False:
+            return TransactionGetResult(res, tc)
+        return res
+
+    @staticmethod
+    def _raise_first_failure(results  # type: List[Any]
+                             ) -> None:
+        """
+        **INTERNAL**
+
+        Raises the first failure of the operations of :meth:`_stage_multi`, if any.
+        """
+        for res in results:
+            if isinstance(res, CouchbaseException):
+                raise res
+            if isinstance(res, Exception):
+                raise CouchbaseException(message=str(res), context=TransactionsErrorContext())
+
+    def get_multi(self,
+                  coll,  # type: Collection
+                  keys,  # type: Iterable[str]
+                  options=None,  # type: Optional[TransactionGetOptions]
+                  **kwargs  # type: Dict[str, Any]
+                  ) -> Dict[str, TransactionGetResult]:
+        """
+        Get multiple documents within this transaction.  The documents are fetched concurrently.
+
+        Args:
+            coll (:class:`couchbase.collection.Collection`): Collection to use to find the documents.
+            keys (Iterable[str]): The keys of the documents to get.
+            options (:class:`~couchbase.options.TransactionGetOptions`): Optional parameters for the operations.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TransactionGetOptions`
+
+        Returns:
+            Dict[str, :class:`couchbase.transactions.TransactionGetResult`]: The documents, keyed by document key, in a
+                form useful for passing to other transaction operations.
+        Raises:
+            :class:`couchbase.exceptions.TransactionOperationFailed`: If any of the operations failed.  In practice,
+                there is no need to handle the exception, as the transaction will rollback regardless.
+        """
+        if 'transcoder' not in kwargs and isinstance(options, TransactionGetOptions):
+            kwargs['transcoder'] = options.get('transcoder', None)
+        if kwargs.get('transcoder', None) is None:
+            kwargs.pop('transcoder', None)
+        keys = list(keys)
+        results = self._stage_multi(super().get, [((coll, k), dict(kwargs)) for k in keys])
+        return dict(zip(keys, results))
+
+    def insert_multi(self,
+                     coll,  # type: Collection
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     options=None,  # type: Optional[TransactionInsertOptions]
+                     **kwargs  # type: Dict[str, Any]
+                     ) -> Dict[str, TransactionGetResult]:
+        """
+        Insert multiple new documents within a transaction.  The documents are staged concurrently.
+
+        Args:
+            coll (:class:`couchbase.collection.Collection`): Collection to insert the documents into.
+            keys_and_docs (Dict[str, :class:`couchbase._utils.JSONType`]): The documents to insert, keyed by document
+                key.
+            options (:class:`~couchbase.options.TransactionInsertOptions`): Optional parameters for the operations.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TransactionInsertOptions`
+
+        Returns:
+            Dict[str, :class:`couchbase.transactions.TransactionGetResult`]: The inserted documents, keyed by document
+                key, in a form useful for passing to other transaction operations.
+        Raises:
+            :class:`couchbase.exceptions.TransactionOperationFailed`: If any of the operations failed.  In practice,
+                there is no need to handle the exception, as the transaction will rollback regardless.
+        """
+        if 'transcoder' not in kwargs and isinstance(options, TransactionInsertOptions):
+            kwargs['transcoder'] = options.get('transcoder', None)
+        if kwargs.get('transcoder', None) is None:
+            kwargs.pop('transcoder', None)
+        keys = list(keys_and_docs.keys())
+        results = self._stage_multi(super().insert,
+                                    [((coll, k, keys_and_docs[k]), dict(kwargs)) for k in keys])
+        return dict(zip(keys, results))
+
+    def replace_multi(self,
+                      replacements,  # type: Iterable[Tuple[TransactionGetResult, JSONType]]
+                      options=None,  # type: Optional[TransactionReplaceOptions]
+                      **kwargs  # type: Dict[str, Any]
+                      ) -> List[TransactionGetResult]:
+        """
+        Replace the contents of multiple documents within a transaction.  The replacements are staged concurrently.
+
+        Args:
+            replacements (Iterable[Tuple[:class:`couchbase.transactions.TransactionGetResult`, :class:`couchbase._utils.JSONType`]]):
+                The documents to replace, gotten from previous calls to other transaction operations, paired with
+                their new contents.
+            options (:class:`~couchbase.options.TransactionReplaceOptions`): Optional parameters for the operations.
+            **kwargs (Dict[str, Any]): keyword arguments that can be used in place or to
+                override provided :class:`~couchbase.options.TransactionReplaceOptions`
+
+        Returns:
+           List[:class:`couchbase.transactions.TransactionGetResult`]: The replaced documents, in the same order as the
+                provided replacements, in a form useful for passing to other transaction operations.
+        Raises:
+            :class:`couchbase.exceptions.TransactionOperationFailed`: If any of the operations failed.  In practice,
+                there is no need to handle the exception, as the transaction will rollback regardless.
+        """  # noqa: E501
+        if 'transcoder' not in kwargs and isinstance(options, TransactionReplaceOptions):
+            kwargs['transcoder'] = options.get('transcoder', None)
+        if kwargs.get('transcoder', None) is None:
+            kwargs.pop('transcoder', None)
+        return self._stage_multi(super().replace,
+                                 [((txn_get_result, value), dict(kwargs)) for txn_get_result, value in replacements])
+
     @BlockingWrapper.block(None)
     def remove(self,
                txn_get_result,  # type: TransactionGetResult
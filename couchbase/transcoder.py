@@ -20,7 +20,11 @@ import pickle  # nosec
 from abc import ABC, abstractmethod
 from typing import (TYPE_CHECKING,
                     Any,
+                    Dict,
+                    Iterable,
+                    List,
                     Optional,
+                    Set,
                     Tuple,
                     Union)
 
@@ -30,10 +34,14 @@ from couchbase.constants import (FMT_BYTES,
                                  FMT_LEGACY_MASK,
                                  FMT_PICKLE,
                                  FMT_UTF8)
-from couchbase.exceptions import ValueFormatException
+from couchbase.exceptions import (CryptoException,
+                                  DecryptionFailureException,
+                                  EncryptionFailureException,
+                                  ValueFormatException)
 from couchbase.serializer import DefaultJsonSerializer
 
 if TYPE_CHECKING:
+    from couchbase.encryption import CryptoManager
     from couchbase.serializer import Serializer
 
 UNIFIED_FORMATS = (FMT_JSON, FMT_BYTES, FMT_UTF8, FMT_PICKLE)
@@ -150,6 +158,207 @@ class JSONTranscoder(Transcoder):
         else:
             raise ValueFormatException(f"Unrecognized format provided: {format}")
 
+    def decode_values(self,
+                      values,  # type: Iterable[Tuple[bytes, int]]
+                      is_subdoc=False,  # type: Optional[bool]
+                      ) -> List[Any]:
+        """Decodes the provided values.  If the values are sub-document values (each is a complete JSON value) and
+        the default serializer is used, the values are decoded with a single JSON parse.
+
+        Args:
+            values (Iterable[Tuple[bytes, int]]): The (value, flags) pairs to decode.
+            is_subdoc (bool, optional): True if the values are the values of sub-document operations.  Documents
+                are always decoded one at a time, a document that is not valid JSON is returned as bytes.
+
+        Returns:
+            List[Any]: The decoded values, in the same order as the provided values.
+        """
+        values = list(values)
+        if is_subdoc and type(self).decode_value is JSONTranscoder.decode_value:
+            docs = self._deserialize_many(values)
+            if docs is not None:
+                return docs
+        return [self.decode_value(v, f) for v, f in values]
+
+    def _deserialize_many(self,
+                          values,  # type: List[Tuple[bytes, int]]
+                          ) -> Optional[List[Any]]:
+        """**INTERNAL**
+
+        Parses the values as a single JSON array.  Only valid if each value is known to be a complete JSON value
+        (i.e. sub-document values), otherwise a value could run into the next one (i.e. ``b'[1'`` and ``b'2]'``).
+        """
+        if type(self._serializer) is not DefaultJsonSerializer or len(values) < 2:
+            return None
+        if not all(v and get_decode_format(f) in [FMT_JSON, 0, None] for v, f in values):
+            return None
+        try:
+            docs = json.loads(b''.join((b'[', b','.join([v for v, _ in values]), b']')).decode('utf-8'))
+        except Exception:
+            # fall back to decoding each value, so values that are not valid JSON are returned as bytes
+            return None
+        # a value could be a fragment that is not a single JSON value (i.e. b'1,2')
+        if len(docs) != len(values):
+            return None
+        return docs
+
+
+class EncryptingJSONTranscoder(JSONTranscoder):
+    """**VOLATILE** This API is subject to change at any time.
+
+    JSON transcoder that encrypts the provided fields of a document when encoding and decrypts them when decoding.
+
+    When encoding, each encrypted field is removed from the document and replaced with the result of
+    encrypting the field's JSON value, stored under the field's mangled name (see
+    :meth:`~couchbase.encryption.CryptoManager.mangle`).  When decoding, the mangled fields are decrypted and
+    the original field names are restored.
+
+    All the fields of a document that use the same encrypter alias are encrypted in a single call to
+    :meth:`~couchbase.encryption.CryptoManager.encrypt_many`.  All the encrypted fields of a document are decrypted
+    in a single call to :meth:`~couchbase.encryption.CryptoManager.decrypt_many`; when used for a multi-get
+    operation, the encrypted fields of all the documents are decrypted in a single call (see :meth:`decode_values`).
+
+    Args:
+        crypto_manager (:class:`~couchbase.encryption.CryptoManager`): The crypto manager used to encrypt/decrypt
+            fields.
+        encrypted_fields (Union[Iterable[str], Dict[str, Optional[str]]]): The fields to encrypt.  Nested fields are
+            specified using a dot-delimited path (i.e. ``'address.street'``).  If a dict is provided, it maps each field
+            to the alias of the encrypter to use, a ``None`` alias uses the crypto manager's default encrypter.
+        serializer (:class:`~couchbase.serializer.Serializer`, optional): Serializer to use for the document and the
+            encrypted fields' values.  Defaults to :class:`~couchbase.serializer.DefaultJsonSerializer`.
+    """
+
+    def __init__(self,
+                 crypto_manager,  # type: CryptoManager
+                 encrypted_fields,  # type: Union[Iterable[str], Dict[str, Optional[str]]]
+                 serializer=None  # type: Optional[Serializer]
+                 ):
+        super().__init__(serializer=serializer)
+        self._crypto_manager = crypto_manager
+        if not isinstance(encrypted_fields, dict):
+            encrypted_fields = {f: None for f in encrypted_fields}
+
+        # group the fields by depth, a field nested within another encrypted field needs to be encrypted before
+        # (and decrypted after) its parent
+        fields_by_depth = {}  # type: Dict[int, List[Tuple[Tuple[str, ...], Optional[str]]]]
+        for field, alias in encrypted_fields.items():
+            path = tuple(field.split('.'))
+            fields_by_depth.setdefault(len(path), []).append((path, alias))
+        self._fields = [fields_by_depth[d] for d in sorted(fields_by_depth)]
+
+    def encode_value(self,
+                     value,  # type: Any
+                     ) -> Tuple[bytes, int]:
+        if not isinstance(value, dict) or not self._fields:
+            return super().encode_value(value)
+
+        # do not modify the caller's document, only the objects along the encrypted fields' paths are copied
+        doc = dict(value)
+        copied = set()
+        for fields in reversed(self._fields):
+            by_alias = {}  # type: Dict[Optional[str], List[Tuple[dict, str, bytes]]]
+            for path, alias in fields:
+                parent = self._get_parent(doc, path, copied=copied)
+                if parent is None or path[-1] not in parent:
+                    continue
+                plaintext = self._serializer.serialize(parent.pop(path[-1]))
+                by_alias.setdefault(alias, []).append((parent, path[-1], plaintext))
+
+            for alias, pending in by_alias.items():
+                try:
+                    encrypted = self._crypto_manager.encrypt_many([p[2] for p in pending], alias)
+                except CryptoException:
+                    raise
+                except Exception as ex:
+                    raise EncryptionFailureException(message=str(ex)) from ex
+                for (parent, field, _), result in zip(pending, encrypted):
+                    parent[self._crypto_manager.mangle(field)] = result
+
+        return super().encode_value(doc)
+
+    def decode_value(self,
+                     value,  # type: bytes
+                     flags  # type: int
+                     ) -> Any:
+        doc = super().decode_value(value, flags)
+        self._decrypt_docs([doc])
+        return doc
+
+    def decode_values(self,
+                      values,  # type: Iterable[Tuple[bytes, int]]
+                      is_subdoc=False,  # type: Optional[bool]
+                      ) -> List[Any]:
+        """Decodes the provided values, decrypting the encrypted fields of all the documents in a single pass.
+
+        Args:
+            values (Iterable[Tuple[bytes, int]]): The (value, flags) pairs to decode.
+            is_subdoc (bool, optional): True if the values are the values of sub-document operations, they are then
+                parsed in a single pass.
+
+        Returns:
+            List[Any]: The decoded documents, in the same order as the provided values.
+        """
+        values = list(values)
+        docs = self._deserialize_many(values) if is_subdoc else None
+        if docs is None:
+            docs = [super(EncryptingJSONTranscoder, self).decode_value(v, f) for v, f in values]
+        self._decrypt_docs(docs)
+        return docs
+
+    def _decrypt_docs(self,
+                      docs,  # type: List[Any]
+                      ) -> None:
+        docs = [d for d in docs if isinstance(d, dict)]
+        if not docs:
+            return
+
+        for fields in self._fields:
+            self._decrypt_fields(docs, fields)
+
+    def _decrypt_fields(self,
+                        docs,  # type: List[dict]
+                        fields,  # type: List[Tuple[Tuple[str, ...], Optional[str]]]
+                        ) -> None:
+        """
+        Decrypts the provided fields (all at the same depth) of the documents in a single call to the crypto manager.
+        """
+        pending = []  # type: List[Tuple[dict, str, dict]]
+        for doc in docs:
+            for path, _ in fields:
+                parent = self._get_parent(doc, path)
+                mangled = self._crypto_manager.mangle(path[-1])
+                if parent is None or mangled not in parent:
+                    continue
+                pending.append((parent, path[-1], parent.pop(mangled)))
+
+        if not pending:
+            return
+        try:
+            plaintexts = self._crypto_manager.decrypt_many([p[2] for p in pending])
+        except CryptoException:
+            raise
+        except Exception as ex:
+            raise DecryptionFailureException(message=str(ex)) from ex
+        for (parent, field, _), plaintext in zip(pending, plaintexts):
+            parent[field] = self._serializer.deserialize(plaintext)
+
+    @staticmethod
+    def _get_parent(doc,  # type: dict
+                    path,  # type: Tuple[str, ...]
+                    copied=None  # type: Optional[Set[int]]
+                    ) -> Optional[dict]:
+        parent = doc
+        for field in path[:-1]:
+            child = parent.get(field, None)
+            if not isinstance(child, dict):
+                return None
+            if copied is not None and id(child) not in copied:
+                child = dict(child)
+                copied.add(id(child))
+                parent[field] = child
+            parent = child
+        return parent
+
 
 class RawJSONTranscoder(Transcoder):
 
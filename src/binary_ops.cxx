@@ -64,7 +64,7 @@ create_base_result_from_binary_op_response(const char* key, const T& resp)
   PyObject* pyObj_result = create_result_obj();
   result* res = reinterpret_cast<result*>(pyObj_result);
   PyObject* pyObj_tmp = PyLong_FromUnsignedLongLong(resp.cas.value());
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_CAS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::cas, pyObj_tmp)) {
     Py_XDECREF(pyObj_result);
     Py_XDECREF(pyObj_tmp);
     return nullptr;
@@ -72,7 +72,7 @@ create_base_result_from_binary_op_response(const char* key, const T& resp)
   Py_DECREF(pyObj_tmp);
 
   PyObject* pyObj_mutation_token = create_mutation_token_obj(resp.token);
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_MUTATION_TOKEN, pyObj_mutation_token)) {
+  if (-1 == result_set_field(res, result_field::mutation_token, pyObj_mutation_token)) {
     Py_XDECREF(pyObj_mutation_token);
     return nullptr;
   }
@@ -157,6 +157,28 @@ kv_operation(PyObject* self, PyObject* args, PyObject* kwargs)
   return res;
 }
 
+static PyObject*
+kv_keyspace_operation(PyObject* self, PyObject* const* args, Py_ssize_t nargs)
+{
+  PyObject* res = handle_kv_keyspace_op(self, args, nargs);
+  if (res == nullptr && PyErr_Occurred() == nullptr) {
+    pycbc_set_python_exception(
+      PycbcError::UnsuccessfulOperation, __FILE__, __LINE__, "Unable to perform KV operation.");
+  }
+  return res;
+}
+
+static PyObject*
+kv_create_keyspace(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* res = create_keyspace(self, args, kwargs);
+  if (res == nullptr && PyErr_Occurred() == nullptr) {
+    pycbc_set_python_exception(
+      PycbcError::UnsuccessfulOperation, __FILE__, __LINE__, "Unable to create keyspace.");
+  }
+  return res;
+}
+
 static PyObject*
 kv_multi_operation(PyObject* self, PyObject* args, PyObject* kwargs)
 {
@@ -352,6 +374,14 @@ static struct PyMethodDef methods[] = {
     (PyCFunction)kv_operation,
     METH_VARARGS | METH_KEYWORDS,
     "Handle all key/value operations" },
+  { "kv_keyspace_operation",
+    (PyCFunction)(void (*)(void))kv_keyspace_operation,
+    METH_FASTCALL,
+    "Handle key/value operations for a keyspace created by create_keyspace" },
+  { "create_keyspace",
+    (PyCFunction)kv_create_keyspace,
+    METH_VARARGS | METH_KEYWORDS,
+    "Create a keyspace for a collection" },
   { "kv_multi_operation",
     (PyCFunction)kv_multi_operation,
     METH_VARARGS | METH_KEYWORDS,
@@ -34,7 +34,7 @@ result*
 add_flags_and_value_to_result(const T& resp, result* res)
 {
   PyObject* pyObj_tmp = PyLong_FromUnsignedLong(resp.flags);
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_FLAGS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::flags, pyObj_tmp)) {
     Py_XDECREF(pyObj_tmp);
     return nullptr;
   }
@@ -46,7 +46,7 @@ add_flags_and_value_to_result(const T& resp, result* res)
     PyErr_SetString(PyExc_TypeError, e.what());
     return nullptr;
   }
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_VALUE, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::value, pyObj_tmp)) {
     Py_XDECREF(pyObj_tmp);
     return nullptr;
   }
@@ -61,7 +61,7 @@ add_extras_to_result<couchbase::core::operations::exists_response>(
   result* res)
 {
   PyObject* pyObj_tmp = PyBool_FromLong(static_cast<long>(resp.exists()));
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_EXISTS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::exists, pyObj_tmp)) {
     Py_XDECREF(pyObj_tmp);
     return nullptr;
   }
@@ -77,7 +77,7 @@ add_extras_to_result<couchbase::core::operations::get_projected_response>(
 {
   if (resp.expiry) {
     PyObject* pyObj_tmp = PyLong_FromUnsignedLong(resp.expiry.value());
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_EXPIRY, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::expiry, pyObj_tmp)) {
       Py_XDECREF(pyObj_tmp);
       return nullptr;
     }
@@ -147,7 +147,7 @@ create_base_result_from_get_operation_response(const char* key, const T& resp)
   result* res = reinterpret_cast<result*>(pyObj_result);
 
   PyObject* pyObj_tmp = PyLong_FromUnsignedLongLong(resp.cas.value());
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_CAS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::cas, pyObj_tmp)) {
     Py_XDECREF(pyObj_result);
     Py_XDECREF(pyObj_tmp);
     return nullptr;
@@ -156,7 +156,7 @@ create_base_result_from_get_operation_response(const char* key, const T& resp)
 
   if (nullptr != key) {
     pyObj_tmp = PyUnicode_FromString(key);
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_KEY, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::key, pyObj_tmp)) {
       Py_XDECREF(pyObj_result);
       Py_XDECREF(pyObj_tmp);
       return nullptr;
@@ -177,7 +177,7 @@ create_base_result_from_get_operation_response<
   result* res = reinterpret_cast<result*>(pyObj_result);
 
   PyObject* pyObj_tmp = PyLong_FromUnsignedLongLong(resp.cas.value());
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_CAS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::cas, pyObj_tmp)) {
     Py_XDECREF(pyObj_result);
     Py_XDECREF(pyObj_tmp);
     return nullptr;
@@ -186,7 +186,7 @@ create_base_result_from_get_operation_response<
 
   if (nullptr != key) {
     pyObj_tmp = PyUnicode_FromString(key);
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_KEY, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::key, pyObj_tmp)) {
       Py_XDECREF(pyObj_result);
       Py_XDECREF(pyObj_tmp);
       return nullptr;
@@ -633,7 +633,7 @@ create_base_result_from_mutation_operation_response(const char* key, const Respo
   PyObject* pyObj_result = create_result_obj();
   result* res = reinterpret_cast<result*>(pyObj_result);
   PyObject* pyObj_tmp = PyLong_FromUnsignedLongLong(resp.cas.value());
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_CAS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::cas, pyObj_tmp)) {
     Py_XDECREF(pyObj_tmp);
     return nullptr;
   }
@@ -641,7 +641,7 @@ create_base_result_from_mutation_operation_response(const char* key, const Respo
 
   if (nullptr != key) {
     pyObj_tmp = PyUnicode_FromString(key);
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_KEY, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::key, pyObj_tmp)) {
       Py_XDECREF(pyObj_tmp);
       return nullptr;
     }
@@ -649,7 +649,7 @@ create_base_result_from_mutation_operation_response(const char* key, const Respo
   }
 
   PyObject* pyObj_mutation_token = create_mutation_token_obj(resp.token);
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_MUTATION_TOKEN, pyObj_mutation_token)) {
+  if (-1 == result_set_field(res, result_field::mutation_token, pyObj_mutation_token)) {
     Py_XDECREF(pyObj_mutation_token);
     return nullptr;
   }
@@ -1085,54 +1085,16 @@ get_mutation_options(PyObject* op_args)
   return opts;
 }
 
-PyObject*
-handle_kv_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+static PyObject*
+execute_kv_op(connection* conn,
+              couchbase::core::document_id id,
+              Operations::OperationType op_type,
+              PyObject* pyObj_value,
+              PyObject* pyObj_op_args)
 {
-  // need these for all operations
-  PyObject* pyObj_conn = nullptr;
-  char* bucket = nullptr;
-  char* scope = nullptr;
-  char* collection = nullptr;
-  char* key = nullptr;
-  Operations::OperationType op_type = Operations::UNKNOWN;
-  PyObject* pyObj_value = nullptr;
-  PyObject* pyObj_op_args = nullptr;
   PyObject* pyObj_callback = nullptr;
   PyObject* pyObj_errback = nullptr;
 
-  static const char* kw_list[] = { "conn",  "bucket",  "scope", "collection_name", "key", "op_type",
-                                   "value", "op_args", nullptr };
-
-  const char* kw_format = "O!ssssI|OO";
-  int ret = PyArg_ParseTupleAndKeywords(args,
-                                        kwargs,
-                                        kw_format,
-                                        const_cast<char**>(kw_list),
-                                        &PyCapsule_Type,
-                                        &pyObj_conn,
-                                        &bucket,
-                                        &scope,
-                                        &collection,
-                                        &key,
-                                        &op_type,
-                                        &pyObj_value,
-                                        &pyObj_op_args);
-  if (!ret) {
-    pycbc_set_python_exception(PycbcError::InvalidArgument,
-                               __FILE__,
-                               __LINE__,
-                               "Cannot perform kv operation.  Unable to parse args/kwargs.");
-    return nullptr;
-  }
-
-  connection* conn = nullptr;
-
-  conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
-  if (nullptr == conn) {
-    pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, NULL_CONN_OBJECT);
-    return nullptr;
-  }
-
   // PyObjects that need to be around for the cxx client lambda
   // have their increment/decrement handled w/in the callback_context struct
   // struct callback_context callback_ctx = { pyObj_callback, pyObj_errback, pyObj_transcoder };
@@ -1156,7 +1118,7 @@ handle_kv_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
     case Operations::REMOVE: {
       auto opts = get_mutation_options(pyObj_op_args);
       opts.conn = conn;
-      opts.id = couchbase::core::document_id{ bucket, scope, collection, key };
+      opts.id = std::move(id);
       opts.op_type = op_type;
       if (pyObj_value != nullptr) {
         opts.value = pyObj_value;
@@ -1186,7 +1148,7 @@ handle_kv_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
     case Operations::UNLOCK: {
       auto opts = get_read_options(pyObj_op_args);
       opts.conn = conn;
-      opts.id = couchbase::core::document_id{ bucket, scope, collection, key };
+      opts.id = std::move(id);
       PyObject* pyObj_project = PyDict_GetItemString(pyObj_op_args, "project");
       if (pyObj_project != nullptr || opts.with_expiry) {
         op_type = Operations::GET_PROJECTED;
@@ -1227,6 +1189,167 @@ handle_kv_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
   return pyObj_op_response;
 }
 
+PyObject*
+handle_kv_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  // need these for all operations
+  PyObject* pyObj_conn = nullptr;
+  char* bucket = nullptr;
+  char* scope = nullptr;
+  char* collection = nullptr;
+  char* key = nullptr;
+  Operations::OperationType op_type = Operations::UNKNOWN;
+  PyObject* pyObj_value = nullptr;
+  PyObject* pyObj_op_args = nullptr;
+
+  static const char* kw_list[] = { "conn",  "bucket",  "scope", "collection_name", "key", "op_type",
+                                   "value", "op_args", nullptr };
+
+  const char* kw_format = "O!ssssI|OO";
+  int ret = PyArg_ParseTupleAndKeywords(args,
+                                        kwargs,
+                                        kw_format,
+                                        const_cast<char**>(kw_list),
+                                        &PyCapsule_Type,
+                                        &pyObj_conn,
+                                        &bucket,
+                                        &scope,
+                                        &collection,
+                                        &key,
+                                        &op_type,
+                                        &pyObj_value,
+                                        &pyObj_op_args);
+  if (!ret) {
+    pycbc_set_python_exception(PycbcError::InvalidArgument,
+                               __FILE__,
+                               __LINE__,
+                               "Cannot perform kv operation.  Unable to parse args/kwargs.");
+    return nullptr;
+  }
+
+  connection* conn = nullptr;
+
+  conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+  if (nullptr == conn) {
+    pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, NULL_CONN_OBJECT);
+    return nullptr;
+  }
+
+  return execute_kv_op(conn,
+                       couchbase::core::document_id{ bucket, scope, collection, key },
+                       op_type,
+                       pyObj_value,
+                       pyObj_op_args);
+}
+
+static void
+dealloc_keyspace(PyObject* pyObj_keyspace)
+{
+  auto ks = reinterpret_cast<keyspace*>(PyCapsule_GetPointer(pyObj_keyspace, "keyspace_"));
+  if (nullptr != ks) {
+    Py_XDECREF(ks->pyObj_conn);
+    delete ks;
+  }
+}
+
+PyObject*
+create_keyspace([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* pyObj_conn = nullptr;
+  char* bucket = nullptr;
+  char* scope = nullptr;
+  char* collection = nullptr;
+
+  static const char* kw_list[] = { "conn", "bucket", "scope", "collection_name", nullptr };
+
+  const char* kw_format = "O!sss";
+  int ret = PyArg_ParseTupleAndKeywords(args,
+                                        kwargs,
+                                        kw_format,
+                                        const_cast<char**>(kw_list),
+                                        &PyCapsule_Type,
+                                        &pyObj_conn,
+                                        &bucket,
+                                        &scope,
+                                        &collection);
+  if (!ret) {
+    pycbc_set_python_exception(PycbcError::InvalidArgument,
+                               __FILE__,
+                               __LINE__,
+                               "Cannot create keyspace.  Unable to parse args/kwargs.");
+    return nullptr;
+  }
+
+  auto conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+  if (nullptr == conn) {
+    pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, NULL_CONN_OBJECT);
+    return nullptr;
+  }
+
+  auto ks = new keyspace{ pyObj_conn, conn, bucket, scope, collection };
+  Py_INCREF(pyObj_conn);
+  return PyCapsule_New(ks, "keyspace_", dealloc_keyspace);
+}
+
+PyObject*
+handle_kv_keyspace_op([[maybe_unused]] PyObject* self, PyObject* const* args, Py_ssize_t nargs)
+{
+  // positional only:  keyspace, key, op_type, value, op_args
+  if (nargs != 5) {
+    pycbc_set_python_exception(
+      PycbcError::InvalidArgument,
+      __FILE__,
+      __LINE__,
+      "Cannot perform kv operation.  Expected keyspace, key, op_type, value and op_args.");
+    return nullptr;
+  }
+
+  auto ks = reinterpret_cast<keyspace*>(PyCapsule_GetPointer(args[0], "keyspace_"));
+  if (nullptr == ks) {
+    PyErr_Clear();
+    pycbc_set_python_exception(PycbcError::InvalidArgument, __FILE__, __LINE__, NULL_CONN_OBJECT);
+    return nullptr;
+  }
+
+  Py_ssize_t key_size = 0;
+  const char* key = PyUnicode_AsUTF8AndSize(args[1], &key_size);
+  if (nullptr == key) {
+    PyErr_Clear();
+    pycbc_set_python_exception(PycbcError::InvalidArgument,
+                               __FILE__,
+                               __LINE__,
+                               "Cannot perform kv operation.  Key must be a str.");
+    return nullptr;
+  }
+
+  auto op_type = static_cast<Operations::OperationType>(PyLong_AsUnsignedLong(args[2]));
+  if (PyErr_Occurred()) {
+    PyErr_Clear();
+    pycbc_set_python_exception(PycbcError::InvalidArgument,
+                               __FILE__,
+                               __LINE__,
+                               "Cannot perform kv operation.  Invalid op_type.");
+    return nullptr;
+  }
+
+  PyObject* pyObj_value = args[3] == Py_None ? nullptr : args[3];
+  PyObject* pyObj_op_args = args[4];
+  if (!PyDict_Check(pyObj_op_args)) {
+    pycbc_set_python_exception(PycbcError::InvalidArgument,
+                               __FILE__,
+                               __LINE__,
+                               "Cannot perform kv operation.  op_args must be a dict.");
+    return nullptr;
+  }
+
+  return execute_kv_op(ks->conn,
+                       couchbase::core::document_id{
+                         ks->bucket, ks->scope, ks->collection, std::string(key, key_size) },
+                       op_type,
+                       pyObj_value,
+                       pyObj_op_args);
+}
+
 PyObject*
 handle_kv_multi_op([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
 {
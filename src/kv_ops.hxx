@@ -18,6 +18,7 @@
 #pragma once
 
 #include <future>
+#include <string>
 
 #include "client.hxx"
 #include <core/document_id.hxx>
@@ -84,9 +85,28 @@ struct mutation_options {
   // durability_timeout
 };
 
+/**
+ * A collection's keyspace, resolved once so that KV operations do not need to
+ * parse and convert the bucket, scope and collection names on every call.
+ */
+struct keyspace {
+  // holds a reference to the connection capsule, keeps the connection alive
+  PyObject* pyObj_conn{ nullptr };
+  connection* conn{ nullptr };
+  std::string bucket;
+  std::string scope;
+  std::string collection;
+};
+
 PyObject*
 handle_kv_op(PyObject* self, PyObject* args, PyObject* kwargs);
 
+PyObject*
+create_keyspace(PyObject* self, PyObject* args, PyObject* kwargs);
+
+PyObject*
+handle_kv_keyspace_op(PyObject* self, PyObject* const* args, Py_ssize_t nargs);
+
 PyObject*
 handle_kv_multi_op(PyObject* self, PyObject* args, PyObject* kwargs);
 
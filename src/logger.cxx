@@ -31,10 +31,27 @@ pycbc_logger__configure_logging_sink__(PyObject* self, PyObject* args, PyObject*
   auto logger = reinterpret_cast<pycbc_logger*>(self);
   PyObject* pyObj_logger = nullptr;
   PyObject* pyObj_level = nullptr;
-  const char* kw_list[] = { "logger", "level", nullptr };
-  const char* kw_format = "OO";
-  if (!PyArg_ParseTupleAndKeywords(
-        args, kwargs, kw_format, const_cast<char**>(kw_list), &pyObj_logger, &pyObj_level)) {
+  int buffered = 0;
+  Py_ssize_t max_queued_records = 0;
+  Py_ssize_t flush_interval_ms = 0;
+  Py_ssize_t rate_limit = 0;
+  PyObject* pyObj_sample_rates = nullptr;
+  const char* kw_list[] = {
+    "logger",     "level",        "buffered", "max_queued_records", "flush_interval_ms",
+    "rate_limit", "sample_rates", nullptr
+  };
+  const char* kw_format = "OO|pnnnO";
+  if (!PyArg_ParseTupleAndKeywords(args,
+                                   kwargs,
+                                   kw_format,
+                                   const_cast<char**>(kw_list),
+                                   &pyObj_logger,
+                                   &pyObj_level,
+                                   &buffered,
+                                   &max_queued_records,
+                                   &flush_interval_ms,
+                                   &rate_limit,
+                                   &pyObj_sample_rates)) {
     pycbc_set_python_exception(PycbcError::InvalidArgument,
                                __FILE__,
                                __LINE__,
@@ -52,8 +69,37 @@ pycbc_logger__configure_logging_sink__(PyObject* self, PyObject* args, PyObject*
     return nullptr;
   }
 
+  pycbc_logger_sink_options sink_options{};
+  sink_options.buffered = buffered != 0;
+  if (max_queued_records > 0) {
+    sink_options.max_queued_records = static_cast<std::size_t>(max_queued_records);
+  }
+  if (flush_interval_ms > 0) {
+    sink_options.flush_interval = std::chrono::milliseconds(flush_interval_ms);
+  }
+  if (rate_limit > 0) {
+    sink_options.rate_limit = static_cast<std::size_t>(rate_limit);
+  }
+  if (pyObj_sample_rates != nullptr && PyDict_Check(pyObj_sample_rates)) {
+    PyObject* pyObj_key = nullptr;
+    PyObject* pyObj_value = nullptr;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(pyObj_sample_rates, &pos, &pyObj_key, &pyObj_value)) {
+      auto rate = PyFloat_AsDouble(pyObj_value);
+      if (rate == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        continue;
+      }
+      // the C++ client's levels are declared in the same order as spdlog's
+      auto lvl = static_cast<std::size_t>(convert_python_log_level(pyObj_key));
+      if (lvl < sink_options.sample_rates.size()) {
+        sink_options.sample_rates[lvl] = rate;
+      }
+    }
+  }
+
   if (pyObj_logger != nullptr) {
-    logger->logger_sink_ = std::make_shared<pycbc_logger_sink>(pyObj_logger);
+    logger->logger_sink_ = std::make_shared<pycbc_logger_sink>(pyObj_logger, sink_options);
   }
 
   couchbase::core::logger::configuration logger_settings;
@@ -65,6 +111,39 @@ pycbc_logger__configure_logging_sink__(PyObject* self, PyObject* args, PyObject*
   Py_RETURN_NONE;
 }
 
+PyObject*
+pycbc_logger__close_logging_sink__(PyObject* self, PyObject* Py_UNUSED(ignored))
+{
+  auto logger = reinterpret_cast<pycbc_logger*>(self);
+  if (logger->logger_sink_) {
+    // hands the queued records (if buffered) to Python's Logging module prior to returning
+    logger->logger_sink_->stop();
+  }
+  Py_RETURN_NONE;
+}
+
+PyObject*
+pycbc_logger__dropped_records__(PyObject* self, PyObject* Py_UNUSED(ignored))
+{
+  auto logger = reinterpret_cast<pycbc_logger*>(self);
+  std::uint64_t queue_full = 0;
+  std::uint64_t rate_limited = 0;
+  std::uint64_t sampled = 0;
+  if (logger->logger_sink_) {
+    const auto& dropped = logger->logger_sink_->dropped_records();
+    queue_full = dropped.queue_full.load();
+    rate_limited = dropped.rate_limited.load();
+    sampled = dropped.sampled.load();
+  }
+  return Py_BuildValue("{s:K,s:K,s:K}",
+                       "queue_full",
+                       static_cast<unsigned long long>(queue_full),
+                       "rate_limited",
+                       static_cast<unsigned long long>(rate_limited),
+                       "sampled",
+                       static_cast<unsigned long long>(sampled));
+}
+
 PyObject*
 pycbc_logger__create_logger__(PyObject* self, PyObject* args, PyObject* kwargs)
 {
@@ -164,6 +243,14 @@ static PyMethodDef pycbc_logger_methods[] = {
     (PyCFunction)pycbc_logger__configure_logging_sink__,
     METH_VARARGS | METH_KEYWORDS,
     PyDoc_STR("Configure logger's logging sink") },
+  { "close_logging_sink",
+    (PyCFunction)pycbc_logger__close_logging_sink__,
+    METH_NOARGS,
+    PyDoc_STR("Close logger's logging sink, draining its queued records") },
+  { "dropped_records",
+    (PyCFunction)pycbc_logger__dropped_records__,
+    METH_NOARGS,
+    PyDoc_STR("Get the number of records dropped by logger's logging sink") },
   { "create_logger",
     (PyCFunction)pycbc_logger__create_logger__,
     METH_VARARGS | METH_KEYWORDS,
@@ -20,9 +20,23 @@
 #include <core/logger/configuration.hxx>
 #include <core/logger/logger.hxx>
 #include <core/transactions.hxx>
+
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cmath>
+#include <condition_variable>
+#include <deque>
+#include <map>
+#include <mutex>
 #include <queue>
 #include <spdlog/details/log_msg.h>
 #include <spdlog/sinks/base_sink.h>
+#include <string>
+#include <string_view>
+#include <thread>
+#include <vector>
 
 // gh-108014 added Py_IsFinalizing() to Python 3.13.0a1
 //    PR: https://github.com/python/cpython/pull/108032/files
@@ -68,12 +82,36 @@ convert_spdlog_level(spdlog::level::level_enum lvl);
 couchbase::core::logger::level
 convert_python_log_level(PyObject* level);
 
+// Options of the pycbc_logger_sink, set via couchbase.configure_logging().
+struct pycbc_logger_sink_options {
+  // queue records and hand them to Python's Logging module in batches, from a background thread
+  bool buffered{ false };
+  // buffered only, records logged while the queue is full are dropped
+  std::size_t max_queued_records{ 10000 };
+  // buffered only, how often the queue is drained (it is also drained once half full)
+  std::chrono::milliseconds flush_interval{ 100 };
+  // max records per second per category (the source file that logged the record), 0 == unlimited
+  std::size_t rate_limit{ 0 };
+  // fraction of the records kept per level, indexed by spdlog::level::level_enum
+  std::array<double, spdlog::level::n_levels> sample_rates{ 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0 };
+};
+
+struct pycbc_logger_sink_dropped_records {
+  std::atomic<std::uint64_t> queue_full{ 0 };
+  std::atomic<std::uint64_t> rate_limited{ 0 };
+  std::atomic<std::uint64_t> sampled{ 0 };
+};
+
 // Moved to implementing a spdlog::sinks::sink instead of a base_sink.  Allows us to not
 // worry about the mutex w/in the base_sink.  The GIL is the locking mechanism that makes
 // sure logging is thread safe as we acquire the GIL prior to passing the log message to
 // Python's Logging module.
 //
-// Still probably the better way to do logging: asynchronous logger (see note below).
+// Acquiring the GIL for every record is expensive at debug/trace level, so the sink can
+// also be buffered:  records are copied into a queue and a background thread hands them to
+// Python's Logging module in batches, acquiring the GIL once per batch.  Rate limiting and
+// sampling happen before the records are queued (or forwarded), so dropped records cost
+// little more than the check.  The threshold logging tracer's reports are exempt from both.
 //
 // A third way would be to use asynchronous logger.   However the txns lib only creates synchronous
 // loggers now.   This is probably the best solution, which we can do when we merge the txn lib
@@ -82,10 +120,16 @@ convert_python_log_level(PyObject* level);
 class pycbc_logger_sink : public spdlog::sinks::sink
 {
 public:
-  pycbc_logger_sink(PyObject* pyObj_logger)
+  pycbc_logger_sink(PyObject* pyObj_logger, pycbc_logger_sink_options options = {})
     : pyObj_logger_(pyObj_logger)
+    , options_(options)
   {
     Py_INCREF(pyObj_logger_);
+    if (options_.buffered) {
+      drain_thread_ = std::thread([this]() {
+        drain_();
+      });
+    }
   }
 
   // no copy or move constructor or assignment
@@ -97,6 +141,7 @@ public:
 
   ~pycbc_logger_sink()
   {
+    stop();
     if (0 == Py_IsFinalizing()) {
       auto state = PyGILState_Ensure();
       Py_DECREF(pyObj_logger_);
@@ -106,51 +151,166 @@ public:
 
   void log(const spdlog::details::log_msg& msg) final
   {
-    if (0 == Py_IsFinalizing()) {
+    if (0 != Py_IsFinalizing() || !should_log_(msg)) {
+      return;
+    }
+    if (!options_.buffered) {
       log_it_(msg);
+      return;
     }
+    {
+      std::scoped_lock lock(queue_mutex_);
+      if (stopped_) {
+        return;
+      }
+      if (queue_.size() >= options_.max_queued_records) {
+        dropped_.queue_full++;
+        return;
+      }
+      queue_.emplace_back(msg);
+      if (queue_.size() < drain_threshold_()) {
+        return;
+      }
+    }
+    queue_cv_.notify_one();
   }
 
-  void flush() final {};
+  // spdlog flushes the sinks every second (and on shutdown), only wake up the drain thread, see
+  // stop() to drain the queue synchronously.
+  void flush() final
+  {
+    if (!options_.buffered) {
+      return;
+    }
+    {
+      std::scoped_lock lock(queue_mutex_);
+      flush_requested_ = true;
+    }
+    queue_cv_.notify_one();
+  }
 
   void set_pattern(const std::string& pattern) final {};
   void set_formatter(std::unique_ptr<spdlog::formatter> sink_formatter) final {};
 
+  // Stops the drain thread, handing the queued records to Python's Logging module first.  Safe
+  // to call with or without the GIL, must be called prior to the interpreter finalizing.
+  void stop()
+  {
+    {
+      std::scoped_lock lock(queue_mutex_);
+      if (stopped_ || !drain_thread_.joinable()) {
+        stopped_ = true;
+        return;
+      }
+      stopped_ = true;
+    }
+    queue_cv_.notify_all();
+    if (0 != PyGILState_Check()) {
+      // the drain thread needs the GIL to hand over its last batch
+      Py_BEGIN_ALLOW_THREADS drain_thread_.join();
+      Py_END_ALLOW_THREADS
+    } else {
+      drain_thread_.join();
+    }
+  }
+
+  const pycbc_logger_sink_dropped_records& dropped_records() const
+  {
+    return dropped_;
+  }
+
 protected:
+  // The threshold logging tracer's reports are rare (one per flush interval) and are parsed back
+  // out of the records by couchbase.threshold_reports, they are never sampled nor rate limited.
+  static bool is_threshold_report_(const spdlog::details::log_msg& msg)
+  {
+    if (msg.level != spdlog::level::warn) {
+      return false;
+    }
+    std::string_view payload{ msg.payload.data(), msg.payload.size() };
+    for (std::string_view prefix :
+         { "Operations over threshold: ", "Orphan responses observed: " }) {
+      if (payload.substr(0, prefix.size()) == prefix) {
+        return true;
+      }
+    }
+    return false;
+  }
+
+  bool should_log_(const spdlog::details::log_msg& msg)
+  {
+    if (is_threshold_report_(msg)) {
+      return true;
+    }
+    auto rate = options_.sample_rates[static_cast<std::size_t>(msg.level)];
+    if (rate < 1.0) {
+      // deterministic sampling, keep a record whenever the running count crosses a multiple of
+      // 1/rate
+      auto n = static_cast<double>(sample_counts_[static_cast<std::size_t>(msg.level)]++);
+      if (std::floor((n + 1) * rate) == std::floor(n * rate)) {
+        dropped_.sampled++;
+        return false;
+      }
+    }
+    if (options_.rate_limit > 0) {
+      std::string category = nullptr != msg.source.filename
+                               ? std::string{ msg.source.filename }
+                               : std::string{ msg.logger_name.data(), msg.logger_name.size() };
+      auto now = std::chrono::steady_clock::now();
+      std::scoped_lock lock(rate_limit_mutex_);
+      auto& window = rate_limit_windows_[category];
+      if (now - window.first >= std::chrono::seconds(1)) {
+        window = { now, 0 };
+      }
+      if (window.second >= options_.rate_limit) {
+        dropped_.rate_limited++;
+        return false;
+      }
+      window.second++;
+    }
+    return true;
+  }
+
+  std::size_t drain_threshold_() const
+  {
+    return std::max<std::size_t>(1, options_.max_queued_records / 2);
+  }
+
+  void drain_()
+  {
+    std::vector<log_msg_copy> batch;
+    while (true) {
+      bool stopped = false;
+      {
+        std::unique_lock lock(queue_mutex_);
+        queue_cv_.wait_for(lock, options_.flush_interval, [this]() {
+          return stopped_ || flush_requested_ || queue_.size() >= drain_threshold_();
+        });
+        batch.assign(std::make_move_iterator(queue_.begin()),
+                     std::make_move_iterator(queue_.end()));
+        queue_.clear();
+        flush_requested_ = false;
+        stopped = stopped_;
+      }
+      if (!batch.empty() && 0 == Py_IsFinalizing()) {
+        PyGILState_STATE state = PyGILState_Ensure();
+        for (const auto& msg : batch) {
+          handle_record_(msg);
+        }
+        PyGILState_Release(state);
+      }
+      batch.clear();
+      if (stopped) {
+        return;
+      }
+    }
+  }
+
   void log_it_(const spdlog::details::log_msg& msg)
   {
     PyGILState_STATE state = PyGILState_Ensure();
     try {
-
-      // static initialize the type and method once.   These 'leak' a single
-      // object, but that is fine.  Same for an empty tuple we will on each call.
-      static PyObject* pyObj_log_record_type = init_log_record_type();
-      static PyObject* pyObj_logger_handle_method = init_logger_handle_method();
-
-      // convert the log_msg_copy to a dict first...
-      auto pyObj_log_record_details = convert_log_msg(msg);
-
-      // now, create an actual LogRecord from it...
-      auto pyObj_log_record = PyObject_CallObject(pyObj_log_record_type, pyObj_log_record_details);
-      Py_DECREF(pyObj_log_record_details);
-      if (nullptr != pyObj_log_record) {
-        // we need to fixup the created time, which cannot be passed in the constructor...
-        // The created member is a float containing a float expressed as seconds since the epoch, in
-        // UTC.
-        PyObject* log_time = convert_time_to_float(msg.time);
-        PyObject_SetAttrString(pyObj_log_record, "created", log_time);
-        Py_DECREF(log_time);
-
-        // now, we want to hand this record to the logger...
-        PyObject* pyObj_args = PyTuple_Pack(1, pyObj_log_record);
-        PyObject_CallObject(pyObj_logger_handle_method, pyObj_args);
-
-        // that's it, now cleanup.
-        Py_DECREF(pyObj_log_record);
-        Py_DECREF(pyObj_args);
-      } else {
-        PyErr_Print();
-      }
+      handle_record_(msg);
       PyGILState_Release(state);
     } catch (...) {
       // There is still a possibility we hit this after the interpret has started to finalize
@@ -161,6 +321,46 @@ protected:
     }
   }
 
+  // assumes we already have the GIL
+  void handle_record_(const log_msg_copy& msg)
+  {
+    // static initialize the type and method once.   These 'leak' a single
+    // object, but that is fine.  Same for an empty tuple we will on each call.
+    static PyObject* pyObj_log_record_type = init_log_record_type();
+    static PyObject* pyObj_logger_handle_method = init_logger_handle_method();
+
+    // convert the log_msg_copy to a dict first...
+    auto pyObj_log_record_details = convert_log_msg(msg);
+
+    // now, create an actual LogRecord from it...
+    auto pyObj_log_record = PyObject_CallObject(pyObj_log_record_type, pyObj_log_record_details);
+    Py_DECREF(pyObj_log_record_details);
+    if (nullptr != pyObj_log_record) {
+      // we need to fixup the created time, which cannot be passed in the constructor...
+      // The created member is a float containing a float expressed as seconds since the epoch, in
+      // UTC.
+      PyObject* log_time = convert_time_to_float(msg.time);
+      PyObject_SetAttrString(pyObj_log_record, "created", log_time);
+      Py_DECREF(log_time);
+
+      // now, we want to hand this record to the logger...
+      PyObject* pyObj_args = PyTuple_Pack(1, pyObj_log_record);
+      PyObject* pyObj_res = PyObject_CallObject(pyObj_logger_handle_method, pyObj_args);
+      if (nullptr != pyObj_res) {
+        Py_DECREF(pyObj_res);
+      } else {
+        // do not leave the exception set for the next record of the batch
+        PyErr_Print();
+      }
+
+      // that's it, now cleanup.
+      Py_DECREF(pyObj_log_record);
+      Py_DECREF(pyObj_args);
+    } else {
+      PyErr_Print();
+    }
+  }
+
   PyObject* convert_time_to_float(std::chrono::system_clock::time_point tm)
   {
     auto duration_us = std::chrono::duration_cast<std::chrono::microseconds>(tm.time_since_epoch());
@@ -237,6 +437,18 @@ protected:
 
 private:
   PyObject* pyObj_logger_;
+  pycbc_logger_sink_options options_;
+  pycbc_logger_sink_dropped_records dropped_{};
+  std::array<std::atomic<std::uint64_t>, spdlog::level::n_levels> sample_counts_{};
+  std::mutex rate_limit_mutex_;
+  std::map<std::string, std::pair<std::chrono::steady_clock::time_point, std::size_t>>
+    rate_limit_windows_{};
+  std::mutex queue_mutex_;
+  std::condition_variable queue_cv_;
+  std::deque<log_msg_copy> queue_{};
+  bool flush_requested_{ false };
+  bool stopped_{ false };
+  std::thread drain_thread_;
 };
 
 struct pycbc_logger {
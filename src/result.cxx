@@ -33,31 +33,27 @@ result_dealloc([[maybe_unused]] result* self)
   Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
+// get(field[, default]), raises a TypeError if the arguments are invalid (prior to METH_FASTCALL
+// the parse failure was swallowed and None returned)
 static PyObject*
-result__get__(result* self, PyObject* args)
+result__get__(result* self, PyObject* const* args, Py_ssize_t nargs)
 {
-  const char* field_name = nullptr;
-  PyObject* default_value = nullptr;
-
-  if (!PyArg_ParseTuple(args, "s|O", &field_name, &default_value)) {
-    PyErr_Print();
-    PyErr_Clear();
-    Py_RETURN_NONE;
-  }
-  // PyDict_GetItem will return NULL if key doesn't exist; also suppresses errors
-  PyObject* val = PyDict_GetItemString(self->dict, field_name);
-
-  if (val == nullptr && default_value == nullptr) {
-    Py_RETURN_NONE;
+  if (nargs < 1 || nargs > 2 || !PyUnicode_Check(args[0])) {
+    PyErr_SetString(PyExc_TypeError, "get() expects a field name and an optional default value");
+    return nullptr;
   }
+  // the field name is usually an interned str w/ a cached hash, avoid converting it to/from UTF-8
+  PyObject* val = PyDict_GetItemWithError(self->dict, args[0]);
   if (val == nullptr) {
-    val = default_value;
+    if (PyErr_Occurred()) {
+      return nullptr;
+    }
+    if (nargs == 1) {
+      Py_RETURN_NONE;
+    }
+    val = args[1];
   }
   Py_INCREF(val);
-  if (default_value != nullptr) {
-    Py_XDECREF(default_value);
-  }
-
   return val;
 }
 
@@ -68,10 +64,11 @@ result__str__(result* self)
   return PyUnicode_FromFormat(format_string, self->dict);
 }
 
-static PyMethodDef result_methods[] = {
-  { "get", (PyCFunction)result__get__, METH_VARARGS, PyDoc_STR("get field in result object") },
-  { NULL, NULL, 0, NULL }
-};
+static PyMethodDef result_methods[] = { { "get",
+                                          (PyCFunction)(void (*)(void))result__get__,
+                                          METH_FASTCALL,
+                                          PyDoc_STR("get field in result object") },
+                                        { NULL, NULL, 0, NULL } };
 
 static struct PyMemberDef result_members[] = { { "raw_result",
                                                  T_OBJECT_EX,
@@ -84,7 +81,14 @@ static PyObject*
 result__new__(PyTypeObject* type, PyObject*, PyObject*)
 {
   result* self = reinterpret_cast<result*>(type->tp_alloc(type, 0));
+  if (self == nullptr) {
+    return nullptr;
+  }
   self->dict = PyDict_New();
+  if (self->dict == nullptr) {
+    Py_DECREF(self);
+    return nullptr;
+  }
   return reinterpret_cast<PyObject*>(self);
 }
 
@@ -110,7 +114,39 @@ static PyTypeObject result_type = init_result_type();
 PyObject*
 create_result_obj()
 {
-  return PyObject_CallObject(reinterpret_cast<PyObject*>(&result_type), nullptr);
+  // skip the call machinery (and argument tuple) of PyObject_CallObject
+  return result__new__(&result_type, nullptr, nullptr);
+}
+
+static PyObject* result_field_names[static_cast<std::size_t>(result_field::count)] = {};
+
+static int
+init_result_field_names()
+{
+  const char* names[] = { RESULT_VALUE,  RESULT_CAS, RESULT_FLAGS,
+                          RESULT_EXPIRY, RESULT_KEY, RESULT_MUTATION_TOKEN,
+                          RESULT_EXISTS };
+  for (std::size_t i = 0; i < static_cast<std::size_t>(result_field::count); ++i) {
+    if (result_field_names[i] == nullptr) {
+      result_field_names[i] = PyUnicode_InternFromString(names[i]);
+      if (result_field_names[i] == nullptr) {
+        return -1;
+      }
+    }
+  }
+  return 0;
+}
+
+PyObject*
+result_field_name(result_field field)
+{
+  return result_field_names[static_cast<std::size_t>(field)];
+}
+
+int
+result_set_field(result* res, result_field field, PyObject* value)
+{
+  return PyDict_SetItem(res->dict, result_field_name(field), value);
 }
 
 /* mutation_token type methods */
@@ -340,7 +376,7 @@ build_scan_item(couchbase::core::range_scan_item item)
     return pyObj_tmp;
   }
 
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_KEY, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::key, pyObj_tmp)) {
     Py_XDECREF(pyObj_result);
     pyObj_tmp = pycbc_build_exception(PycbcError::UnsuccessfulOperation,
                                       __FILE__,
@@ -351,7 +387,7 @@ build_scan_item(couchbase::core::range_scan_item item)
 
   if (item.body.has_value()) {
     pyObj_tmp = PyLong_FromUnsignedLong(item.body.value().flags);
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_FLAGS, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::flags, pyObj_tmp)) {
       Py_DECREF(pyObj_result);
       pyObj_tmp = pycbc_build_exception(PycbcError::UnsuccessfulOperation,
                                         __FILE__,
@@ -362,7 +398,7 @@ build_scan_item(couchbase::core::range_scan_item item)
     Py_DECREF(pyObj_tmp);
 
     pyObj_tmp = PyLong_FromUnsignedLong(item.body.value().expiry);
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_EXPIRY, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::expiry, pyObj_tmp)) {
       Py_DECREF(pyObj_result);
       pyObj_tmp = pycbc_build_exception(PycbcError::UnsuccessfulOperation,
                                         __FILE__,
@@ -373,7 +409,7 @@ build_scan_item(couchbase::core::range_scan_item item)
     Py_DECREF(pyObj_tmp);
 
     pyObj_tmp = PyLong_FromUnsignedLongLong(item.body.value().cas.value());
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_CAS, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::cas, pyObj_tmp)) {
       Py_DECREF(pyObj_result);
       pyObj_tmp = pycbc_build_exception(PycbcError::UnsuccessfulOperation,
                                         __FILE__,
@@ -414,7 +450,7 @@ build_scan_item(couchbase::core::range_scan_item item)
         pycbc_build_exception(PycbcError::UnsuccessfulOperation, __FILE__, __LINE__, e.what());
       return pyObj_tmp;
     }
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_VALUE, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::value, pyObj_tmp)) {
       Py_DECREF(pyObj_result);
       pyObj_tmp = pycbc_build_exception(PycbcError::UnsuccessfulOperation,
                                         __FILE__,
@@ -485,6 +521,10 @@ create_scan_iterator_obj(couchbase::core::scan_result result)
 PyObject*
 add_result_objects(PyObject* pyObj_module)
 {
+  if (init_result_field_names() < 0) {
+    return nullptr;
+  }
+
   // mutation_token_type
   if (PyType_Ready(&mutation_token_type) < 0) {
     return nullptr;
@@ -74,6 +74,10 @@ private:
   std::condition_variable cv_;
 };
 
+// The KV results keep their backing dict (raw_result) rather than fixed slots.  The Python layer
+// reads and rewrites raw_result (i.e. transcoding and subdoc decoding replace raw_result['value']),
+// so fixed slots would need every caller to change.  Per-result allocations are cut instead, see
+// create_result_obj() and result_set_field().
 struct result {
   PyObject_HEAD PyObject* dict;
 };
@@ -81,6 +85,30 @@ struct result {
 PyObject*
 create_result_obj();
 
+/**
+ * Fields set on KV results.  The field names are interned once, when the module
+ * is loaded, so building a result does not create (and intern) a new str for
+ * every field of every result.
+ */
+enum class result_field {
+  value = 0,
+  cas,
+  flags,
+  expiry,
+  key,
+  mutation_token,
+  exists,
+  count
+};
+
+// returns a borrowed reference to the interned field name
+PyObject*
+result_field_name(result_field field);
+
+// same semantics as PyDict_SetItemString (value is not stolen), returns -1 on failure
+int
+result_set_field(result* res, result_field field, PyObject* value);
+
 struct mutation_token {
   PyObject_HEAD couchbase::mutation_token* token;
 };
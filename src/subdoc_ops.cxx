@@ -143,7 +143,7 @@ add_extras_to_result<couchbase::core::operations::lookup_in_any_replica_response
         Py_XDECREF(pyObj_tmp);
         return nullptr;
       }
-      if (-1 == PyDict_SetItemString(pyObj_field, RESULT_VALUE, pyObj_tmp)) {
+      if (-1 == PyDict_SetItem(pyObj_field, result_field_name(result_field::value), pyObj_tmp)) {
         Py_XDECREF(pyObj_fields);
         Py_XDECREF(pyObj_field);
         Py_XDECREF(pyObj_tmp);
@@ -156,7 +156,7 @@ add_extras_to_result<couchbase::core::operations::lookup_in_any_replica_response
     Py_DECREF(pyObj_field);
   }
 
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_VALUE, pyObj_fields)) {
+  if (-1 == result_set_field(res, result_field::value, pyObj_fields)) {
     Py_XDECREF(pyObj_fields);
     return nullptr;
   }
@@ -236,7 +236,7 @@ add_extras_to_result<couchbase::core::operations::lookup_in_all_replicas_respons
         Py_XDECREF(pyObj_tmp);
         return nullptr;
       }
-      if (-1 == PyDict_SetItemString(pyObj_field, RESULT_VALUE, pyObj_tmp)) {
+      if (-1 == PyDict_SetItem(pyObj_field, result_field_name(result_field::value), pyObj_tmp)) {
         Py_XDECREF(pyObj_fields);
         Py_XDECREF(pyObj_field);
         Py_XDECREF(pyObj_tmp);
@@ -249,7 +249,7 @@ add_extras_to_result<couchbase::core::operations::lookup_in_all_replicas_respons
     Py_DECREF(pyObj_field);
   }
 
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_VALUE, pyObj_fields)) {
+  if (-1 == result_set_field(res, result_field::value, pyObj_fields)) {
     Py_XDECREF(pyObj_fields);
     return nullptr;
   }
@@ -322,7 +322,7 @@ add_extras_to_result<couchbase::core::operations::lookup_in_response>(
         Py_XDECREF(pyObj_tmp);
         return nullptr;
       }
-      if (-1 == PyDict_SetItemString(pyObj_field, RESULT_VALUE, pyObj_tmp)) {
+      if (-1 == PyDict_SetItem(pyObj_field, result_field_name(result_field::value), pyObj_tmp)) {
         Py_XDECREF(pyObj_fields);
         Py_XDECREF(pyObj_field);
         Py_XDECREF(pyObj_tmp);
@@ -335,7 +335,7 @@ add_extras_to_result<couchbase::core::operations::lookup_in_response>(
     Py_DECREF(pyObj_field);
   }
 
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_VALUE, pyObj_fields)) {
+  if (-1 == result_set_field(res, result_field::value, pyObj_fields)) {
     Py_XDECREF(pyObj_fields);
     return nullptr;
   }
@@ -350,7 +350,7 @@ add_extras_to_result<couchbase::core::operations::mutate_in_response>(
   result* res)
 {
   PyObject* pyObj_mutation_token = create_mutation_token_obj(resp.token);
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_MUTATION_TOKEN, pyObj_mutation_token)) {
+  if (-1 == result_set_field(res, result_field::mutation_token, pyObj_mutation_token)) {
     Py_XDECREF(pyObj_mutation_token);
     return nullptr;
   }
@@ -407,7 +407,7 @@ add_extras_to_result<couchbase::core::operations::mutate_in_response>(
         Py_XDECREF(pyObj_tmp);
         return nullptr;
       }
-      if (-1 == PyDict_SetItemString(pyObj_field, RESULT_VALUE, pyObj_tmp)) {
+      if (-1 == PyDict_SetItem(pyObj_field, result_field_name(result_field::value), pyObj_tmp)) {
         Py_XDECREF(pyObj_fields);
         Py_XDECREF(pyObj_field);
         Py_XDECREF(pyObj_tmp);
@@ -419,7 +419,7 @@ add_extras_to_result<couchbase::core::operations::mutate_in_response>(
     Py_DECREF(pyObj_field);
   }
 
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_VALUE, pyObj_fields)) {
+  if (-1 == result_set_field(res, result_field::value, pyObj_fields)) {
     Py_XDECREF(pyObj_fields);
     return nullptr;
   }
@@ -434,14 +434,14 @@ create_base_result_from_subdoc_op_response(const char* key, const T& resp)
   PyObject* pyObj_result = create_result_obj();
   result* res = reinterpret_cast<result*>(pyObj_result);
   PyObject* pyObj_tmp = PyLong_FromUnsignedLongLong(resp.cas.value());
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_CAS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::cas, pyObj_tmp)) {
     Py_XDECREF(pyObj_result);
     Py_XDECREF(pyObj_tmp);
     return nullptr;
   }
   Py_DECREF(pyObj_tmp);
 
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_FLAGS, Py_None)) {
+  if (-1 == result_set_field(res, result_field::flags, Py_None)) {
     Py_XDECREF(pyObj_result);
     Py_XDECREF(pyObj_tmp);
     return nullptr;
@@ -449,7 +449,7 @@ create_base_result_from_subdoc_op_response(const char* key, const T& resp)
 
   if (nullptr != key) {
     pyObj_tmp = PyUnicode_FromString(key);
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_KEY, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::key, pyObj_tmp)) {
       Py_XDECREF(pyObj_result);
       Py_XDECREF(pyObj_tmp);
       return nullptr;
@@ -468,14 +468,14 @@ create_base_result_from_subdoc_op_response(
   PyObject* pyObj_result = create_result_obj();
   result* res = reinterpret_cast<result*>(pyObj_result);
   PyObject* pyObj_tmp = PyLong_FromUnsignedLongLong(resp.cas.value());
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_CAS, pyObj_tmp)) {
+  if (-1 == result_set_field(res, result_field::cas, pyObj_tmp)) {
     Py_XDECREF(pyObj_result);
     Py_XDECREF(pyObj_tmp);
     return nullptr;
   }
   Py_DECREF(pyObj_tmp);
 
-  if (-1 == PyDict_SetItemString(res->dict, RESULT_FLAGS, Py_None)) {
+  if (-1 == result_set_field(res, result_field::flags, Py_None)) {
     Py_XDECREF(pyObj_result);
     Py_XDECREF(pyObj_tmp);
     return nullptr;
@@ -483,7 +483,7 @@ create_base_result_from_subdoc_op_response(
 
   if (nullptr != key) {
     pyObj_tmp = PyUnicode_FromString(key);
-    if (-1 == PyDict_SetItemString(res->dict, RESULT_KEY, pyObj_tmp)) {
+    if (-1 == result_set_field(res, result_field::key, pyObj_tmp)) {
       Py_XDECREF(pyObj_result);
       Py_XDECREF(pyObj_tmp);
       return nullptr;
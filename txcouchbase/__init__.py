@@ -13,8 +13,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from twisted.internet import asyncioreactor
+import sys
 
-from acouchbase import get_event_loop
+if 'twisted.internet.reactor' not in sys.modules:
+    # No reactor has been installed yet, default to the asyncio reactor.  KV operations, queries and the other
+    # streaming requests complete directly on the reactor (see txcouchbase.logic.CompletionQueue), so a reactor
+    # installed prior to importing txcouchbase (i.e. epollreactor) can be used for those.  The management APIs
+    # still wrap the acouchbase (asyncio) implementations and require the asyncio reactor, the management accessors
+    # (i.e. Cluster.buckets()) raise a FeatureUnavailableException if a different reactor is installed.
+    from twisted.internet import asyncioreactor
 
-asyncioreactor.install(get_event_loop())
+    from acouchbase import get_event_loop
+
+    asyncioreactor.install(get_event_loop())
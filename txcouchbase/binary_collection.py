@@ -16,16 +16,25 @@
 
 from typing import (TYPE_CHECKING,
                     Any,
+                    Dict,
+                    List,
                     Union)
 
 from twisted.internet.defer import Deferred
 
-from couchbase.result import CounterResult, MutationResult
+from couchbase.result import (CounterResult,
+                              MultiCounterResult,
+                              MultiMutationResult,
+                              MutationResult)
 
 if TYPE_CHECKING:
-    from couchbase.options import (AppendOptions,
+    from couchbase.options import (AppendMultiOptions,
+                                   AppendOptions,
+                                   DecrementMultiOptions,
                                    DecrementOptions,
+                                   IncrementMultiOptions,
                                    IncrementOptions,
+                                   PrependMultiOptions,
                                    PrependOptions)
 
 
@@ -67,3 +76,35 @@ class BinaryCollection:
         **kwargs,  # type: Any
     ) -> Deferred[MutationResult]:
         return self._collection._prepend(key, value, *opts, **kwargs)
+
+    def increment_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: IncrementMultiOptions
+        **kwargs,  # type: Any
+    ) -> Deferred[MultiCounterResult]:
+        return self._collection._increment_multi(keys, *opts, **kwargs)
+
+    def decrement_multi(
+        self,
+        keys,  # type: List[str]
+        *opts,  # type: DecrementMultiOptions
+        **kwargs,  # type: Any
+    ) -> Deferred[MultiCounterResult]:
+        return self._collection._decrement_multi(keys, *opts, **kwargs)
+
+    def append_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: AppendMultiOptions
+        **kwargs,  # type: Any
+    ) -> Deferred[MultiMutationResult]:
+        return self._collection._append_multi(keys_and_values, *opts, **kwargs)
+
+    def prepend_multi(
+        self,
+        keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+        *opts,  # type: PrependMultiOptions
+        **kwargs,  # type: Any
+    ) -> Deferred[MultiMutationResult]:
+        return self._collection._prepend_multi(keys_and_values, *opts, **kwargs)
@@ -25,6 +25,7 @@ from couchbase.result import PingResult, ViewResult
 from txcouchbase.collection import Collection
 from txcouchbase.logic import TxWrapper
 from txcouchbase.management.collections import CollectionManager
+from txcouchbase.management.logic.wrappers import check_asyncio_reactor
 from txcouchbase.scope import Scope
 from txcouchbase.views import ViewRequest
 
@@ -87,7 +88,7 @@ class Bucket(BucketLogic):
         d = Deferred()
 
         def _on_okay(_):
-            super()._destroy_connection()
+            self._destroy_connection()
             d.callback(None)
 
         def _on_err(exc):
@@ -155,6 +156,7 @@ class Bucket(BucketLogic):
 
         :return: the :class:`.management.collections.CollectionManager` for this bucket.
         """
+        check_asyncio_reactor()
         return CollectionManager(self.connection, self.loop, self.name)
 
 
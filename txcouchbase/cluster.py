@@ -47,6 +47,7 @@ from txcouchbase.bucket import Bucket
 from txcouchbase.logic import TxWrapper
 from txcouchbase.management.analytics import AnalyticsIndexManager
 from txcouchbase.management.buckets import BucketManager
+from txcouchbase.management.logic.wrappers import check_asyncio_reactor
 from txcouchbase.management.queries import QueryIndexManager
 from txcouchbase.management.search import SearchIndexManager
 from txcouchbase.management.users import UserManager
@@ -116,7 +117,7 @@ class Cluster(ClusterLogic):
         d = Deferred()
 
         def _on_okay(_):
-            super()._destroy_connection()
+            self._destroy_connection()
             d.callback(None)
 
         def _on_err(exc):
@@ -340,6 +341,7 @@ class Cluster(ClusterLogic):
         :return: A :class:`~.management.BucketManager` with which you can create or
               modify buckets on the cluster.
         """
+        check_asyncio_reactor()
         # TODO:  AlreadyShutdownException?
         return BucketManager(self.connection, self.loop)
 
@@ -349,6 +351,7 @@ class Cluster(ClusterLogic):
 
         :return: A :class:`~.management.UserManager` with which you can create or update cluster users and roles.
         """
+        check_asyncio_reactor()
         # TODO:  AlreadyShutdownException?
         return UserManager(self.connection, self.loop)
 
@@ -359,6 +362,7 @@ class Cluster(ClusterLogic):
         :return:  A :class:`~.management.queries.QueryIndexManager` with which you can
               create or modify query indexes on the cluster.
         """
+        check_asyncio_reactor()
         # TODO:  AlreadyShutdownException?
         return QueryIndexManager(self.connection, self.loop)
 
@@ -369,6 +373,7 @@ class Cluster(ClusterLogic):
         :return:  A :class:`~.management.AnalyticsIndexManager` with which you can create or modify analytics datasets,
             dataverses, etc.. on the cluster.
         """
+        check_asyncio_reactor()
         # TODO:  AlreadyShutdownException?
         return AnalyticsIndexManager(self.connection, self.loop)
 
@@ -379,6 +384,7 @@ class Cluster(ClusterLogic):
         :return:  A :class:`~.management.SearchIndexManager` with which you can create or modify analytics datasets,
             dataverses, etc.. on the cluster.
         """
+        check_asyncio_reactor()
         # TODO:  AlreadyShutdownException?
         return SearchIndexManager(self.connection, self.loop)
 
@@ -20,11 +20,14 @@ from typing import (TYPE_CHECKING,
                     Any,
                     Dict,
                     Iterable,
+                    List,
                     Union)
 
 from twisted.internet.defer import Deferred
 
+from couchbase.collection import Collection as BlockingCollection
 from couchbase.logic.collection import CollectionLogic
+from couchbase.logic.supportability import Supportability
 from couchbase.options import forward_args
 from couchbase.result import (CounterResult,
                               ExistsResult,
@@ -32,35 +35,66 @@ from couchbase.result import (CounterResult,
                               GetResult,
                               LookupInReplicaResult,
                               LookupInResult,
+                              MultiCounterResult,
+                              MultiExistsResult,
+                              MultiGetReplicaResult,
+                              MultiGetResult,
+                              MultiMutationResult,
                               MutateInResult,
-                              MutationResult)
+                              MutationResult,
+                              ScanResultIterable)
 from txcouchbase.binary_collection import BinaryCollection
+from txcouchbase.datastructures import (CouchbaseList,
+                                        CouchbaseMap,
+                                        CouchbaseQueue,
+                                        CouchbaseSet)
+from txcouchbase.kv_range_scan import RangeScanRequest
 from txcouchbase.logic import TxWrapper
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
     from couchbase._utils import JSONType
-    from couchbase.options import (AppendOptions,
+    from couchbase.kv_range_scan import ScanType
+    from couchbase.exceptions import exception as CouchbaseBaseException
+    from couchbase.options import (AppendMultiOptions,
+                                   AppendOptions,
+                                   DecrementMultiOptions,
                                    DecrementOptions,
+                                   ExistsMultiOptions,
                                    ExistsOptions,
+                                   GetAllReplicasMultiOptions,
                                    GetAllReplicasOptions,
+                                   GetAndLockMultiOptions,
                                    GetAndLockOptions,
                                    GetAndTouchOptions,
+                                   GetAnyReplicaMultiOptions,
                                    GetAnyReplicaOptions,
+                                   GetMultiOptions,
                                    GetOptions,
+                                   IncrementMultiOptions,
                                    IncrementOptions,
+                                   InsertMultiOptions,
                                    InsertOptions,
+                                   LockMultiOptions,
                                    LookupInAllReplicasOptions,
                                    LookupInAnyReplicaOptions,
                                    LookupInOptions,
                                    MutateInOptions,
+                                   PrependMultiOptions,
                                    PrependOptions,
+                                   RemoveMultiOptions,
                                    RemoveOptions,
+                                   ReplaceMultiOptions,
                                    ReplaceOptions,
+                                   ScanOptions,
+                                   TouchMultiOptions,
                                    TouchOptions,
+                                   UnlockMultiOptions,
                                    UnlockOptions,
+                                   UpsertMultiOptions,
                                    UpsertOptions)
+    from couchbase.result import MultiResultType
     from couchbase.subdocument import Spec
 
 
@@ -330,6 +364,18 @@ class Collection(CollectionLogic):
     ) -> MutateInResult:
         super().mutate_in(key, spec, *opts, **kwargs)
 
+    def scan(self, scan_type,  # type: ScanType
+             *opts,  # type: ScanOptions
+             **kwargs,  # type: Dict[str, Any]
+             ) -> ScanResultIterable:
+        final_args = forward_args(kwargs, *opts)
+        transcoder = final_args.get('transcoder', None)
+        if not transcoder:
+            final_args['transcoder'] = self.default_transcoder
+        scan_args = super().build_scan_args(scan_type, **final_args)
+        # rows are retrieved w/ ScanResultIterable.next_batch()
+        return ScanResultIterable(RangeScanRequest(**scan_args))
+
     def binary(self) -> BinaryCollection:
         return BinaryCollection(self)
 
@@ -371,6 +417,156 @@ class Collection(CollectionLogic):
     ) -> Deferred[CounterResult]:
         super().decrement(key, *opts, **kwargs)
 
+    def couchbase_list(self, key  # type: str
+                       ) -> CouchbaseList:
+        return CouchbaseList(key, self)
+
+    def couchbase_map(self, key  # type: str
+                      ) -> CouchbaseMap:
+        return CouchbaseMap(key, self)
+
+    def couchbase_set(self, key  # type: str
+                      ) -> CouchbaseSet:
+        return CouchbaseSet(key, self)
+
+    def couchbase_queue(self, key  # type: str
+                        ) -> CouchbaseQueue:
+        return CouchbaseQueue(key, self)
+
+    # The multi-ops wait on all of their operations, so they are executed in the reactor's threadpool.  The
+    # implementations are shared w/ the blocking API.
+
+    @TxWrapper.inject_threaded_call()
+    def get_multi(self,
+                  keys,  # type: List[str]
+                  *opts,  # type: GetMultiOptions
+                  **kwargs,  # type: Dict[str, Any]
+                  ) -> Deferred[MultiGetResult]:
+        return BlockingCollection.get_multi(self, keys, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def get_any_replica_multi(self,
+                              keys,  # type: List[str]
+                              *opts,  # type: GetAnyReplicaMultiOptions
+                              **kwargs,  # type: Dict[str, Any]
+                              ) -> Deferred[MultiGetReplicaResult]:
+        return BlockingCollection.get_any_replica_multi(self, keys, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def get_all_replicas_multi(self,
+                               keys,  # type: List[str]
+                               *opts,  # type: GetAllReplicasMultiOptions
+                               **kwargs,  # type: Dict[str, Any]
+                               ) -> Deferred[MultiGetReplicaResult]:
+        return BlockingCollection.get_all_replicas_multi(self, keys, *opts, **kwargs)
+
+    def lock_multi(self,
+                   keys,  # type: List[str]
+                   lock_time,  # type: timedelta
+                   *opts,  # type: LockMultiOptions
+                   **kwargs,  # type: Dict[str, Any]
+                   ) -> Deferred[MultiGetResult]:
+        Supportability.method_deprecated('lock_multi', 'get_and_lock_multi')
+        return self.get_and_lock_multi(keys, lock_time, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def get_and_lock_multi(self,
+                           keys,  # type: List[str]
+                           lock_time,  # type: timedelta
+                           *opts,  # type: GetAndLockMultiOptions
+                           **kwargs,  # type: Dict[str, Any]
+                           ) -> Deferred[MultiGetResult]:
+        return BlockingCollection.get_and_lock_multi(self, keys, lock_time, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def exists_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: ExistsMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiExistsResult]:
+        return BlockingCollection.exists_multi(self, keys, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def insert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: InsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiMutationResult]:
+        return BlockingCollection.insert_multi(self, keys_and_docs, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def upsert_multi(self,
+                     keys_and_docs,  # type: Dict[str, JSONType]
+                     *opts,  # type: UpsertMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiMutationResult]:
+        return BlockingCollection.upsert_multi(self, keys_and_docs, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def replace_multi(self,
+                      keys_and_docs,  # type: Dict[str, JSONType]
+                      *opts,  # type: ReplaceMultiOptions
+                      **kwargs,  # type: Dict[str, Any]
+                      ) -> Deferred[MultiMutationResult]:
+        return BlockingCollection.replace_multi(self, keys_and_docs, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def remove_multi(self,
+                     keys,  # type: List[str]
+                     *opts,  # type: RemoveMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[MultiMutationResult]:
+        return BlockingCollection.remove_multi(self, keys, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def touch_multi(self,
+                    keys,  # type: List[str]
+                    expiry,  # type: timedelta
+                    *opts,  # type: TouchMultiOptions
+                    **kwargs,  # type: Dict[str, Any]
+                    ) -> Deferred[MultiMutationResult]:
+        return BlockingCollection.touch_multi(self, keys, expiry, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def unlock_multi(self,
+                     keys,  # type: Union[MultiResultType, Dict[str, int]]
+                     *opts,  # type: UnlockMultiOptions
+                     **kwargs,  # type: Dict[str, Any]
+                     ) -> Deferred[Dict[str, Union[None, CouchbaseBaseException]]]:
+        return BlockingCollection.unlock_multi(self, keys, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def _append_multi(self,
+                      keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+                      *opts,  # type: AppendMultiOptions
+                      **kwargs,  # type: Dict[str, Any]
+                      ) -> Deferred[MultiMutationResult]:
+        return BlockingCollection._append_multi(self, keys_and_values, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def _prepend_multi(self,
+                       keys_and_values,  # type: Dict[str, Union[str,bytes,bytearray]]
+                       *opts,  # type: PrependMultiOptions
+                       **kwargs,  # type: Dict[str, Any]
+                       ) -> Deferred[MultiMutationResult]:
+        return BlockingCollection._prepend_multi(self, keys_and_values, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def _increment_multi(self,
+                         keys,  # type: List[str]
+                         *opts,  # type: IncrementMultiOptions
+                         **kwargs,  # type: Dict[str, Any]
+                         ) -> Deferred[MultiCounterResult]:
+        return BlockingCollection._increment_multi(self, keys, *opts, **kwargs)
+
+    @TxWrapper.inject_threaded_call()
+    def _decrement_multi(self,
+                         keys,  # type: List[str]
+                         *opts,  # type: DecrementMultiOptions
+                         **kwargs,  # type: Dict[str, Any]
+                         ) -> Deferred[MultiCounterResult]:
+        return BlockingCollection._decrement_multi(self, keys, *opts, **kwargs)
+
     @staticmethod
     def default_name():
         return "_default"
@@ -0,0 +1,647 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    Generator,
+                    List,
+                    Optional)
+
+from twisted.internet import task
+from twisted.internet.defer import Deferred, inlineCallbacks
+
+from couchbase.exceptions import (CasMismatchException,
+                                  DocumentNotFoundException,
+                                  InvalidArgumentException,
+                                  PathExistsException,
+                                  PathNotFoundException,
+                                  QueueEmpty,
+                                  UnAmbiguousTimeoutException)
+from couchbase.logic.datastructures import CasRetryBackoff
+from couchbase.options import MutateInOptions
+from couchbase.result import LookupInResult
+from couchbase.subdocument import (array_addunique,
+                                   array_append,
+                                   array_prepend,
+                                   count)
+from couchbase.subdocument import exists as subdoc_exists
+from couchbase.subdocument import get as subdoc_get
+from couchbase.subdocument import get_full as subdoc_get_full
+from couchbase.subdocument import (remove,
+                                   replace,
+                                   upsert)
+from txcouchbase.logic import TxWrapper
+
+if TYPE_CHECKING:
+    from couchbase._utils import JSONType
+    from txcouchbase.collection import Collection
+
+
+def _sleep(delay  # type: float
+           ) -> Deferred:
+    # import here so that the reactor is not installed when txcouchbase.datastructures is imported
+    from twisted.internet import reactor
+    return task.deferLater(reactor, delay, lambda: None)
+
+
+class CouchbaseList:
+    def __init__(self, key,  # type: str
+                 collection  # type: Collection
+                 ) -> None:
+        self._key = key
+        self._collection = collection
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def _get(self) -> Deferred[List]:
+        """
+        Get the entire list.
+        """
+
+        return (yield self._collection.get(self._key))
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def append(self, value  # type: JSONType
+               ) -> Deferred[None]:
+        """
+        Add an item to the end of a list.
+
+        :param value: The value to append
+        :return: None
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+            and `create` was not specified.
+
+        example::
+
+            cb.list_append('a_list', 'hello')
+            cb.list_append('a_list', 'world')
+
+        .. seealso:: :meth:`map_add`
+        """
+        op = array_append('', value)
+        yield self._collection.mutate_in(self._key, (op,))
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def prepend(self, value  # type: JSONType
+                ) -> Deferred[None]:
+        """
+        Add an item to the beginning of a list.
+
+        :param value: Value to prepend
+        :return: :class:`OperationResult`.
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+            and `create` was not specified.
+
+        This function is identical to :meth:`list_append`, except for prepending
+        rather than appending the item
+
+        .. seealso:: :meth:`list_append`, :meth:`map_add`
+        """
+        op = array_prepend('', value)
+        yield self._collection.mutate_in(self._key, (op,))
+
+    @inlineCallbacks
+    def set_at(self, index,  # type: int
+               value  # type: JSONType
+               ) -> Deferred[None]:
+        """
+        Sets an item within a list at a given position.
+
+        :param index: The position to replace
+        :param value: The value to be inserted
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        :raise: :exc:`IndexError` if the index is out of bounds
+
+        example::
+
+            cb.upsert('a_list', ['hello', 'world'])
+            cb.list_set('a_list', 1, 'good')
+            cb.get('a_list').value # => ['hello', 'good']
+
+        .. seealso:: :meth:`map_add`, :meth:`list_append`
+        """
+        try:
+            op = replace(f'[{index}]', value)
+            yield self._collection.mutate_in(self._key, (op,))
+        except PathNotFoundException:
+            raise InvalidArgumentException(message=f'Index: {index} is out of range.') from None
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def get_at(self, index  # type: int
+               ) -> Deferred[Any]:
+        """
+        Get a specific element within a list.
+
+        :param index: The index to retrieve
+        :return: value for the element
+        :raise: :exc:`IndexError` if the index does not exist
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+        try:
+            op = subdoc_get(f'[{index}]')
+            sdres = yield self._collection.lookup_in(self._key, (op,))
+            return sdres.value[0].get("value", None)
+        except PathNotFoundException:
+            raise InvalidArgumentException(message=f'Index: {index} is out of range.') from None
+
+    @inlineCallbacks
+    def remove_at(self, index  # type: int
+                  ) -> Deferred[None]:
+        """
+        Remove the element at a specific index from a list.
+
+        :param index: The index to remove
+        :param kwargs: Arguments to :meth:`mutate_in`
+        :return: :class:`OperationResult`
+        :raise: :exc:`IndexError` if the index does not exist
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+        try:
+            op = remove(f'[{index}]')
+            yield self._collection.mutate_in(self._key, (op,))
+        except PathNotFoundException:
+            raise InvalidArgumentException(message=f'Index: {index} is out of range.') from None
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def size(self) -> Deferred[int]:
+        """
+        Retrieve the number of elements in the list.
+
+        :return: The number of elements within the list
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+        op = count('')
+        sdres = yield self._collection.lookup_in(self._key, (op,))
+        return sdres.value[0].get("value", None)
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def index_of(self, value  # type: Any
+                 ) -> Deferred[int]:
+        """
+        Retrieve the index of the specified value in the list.
+
+        :param value: the value to look-up
+        :return: The index of the specified value, -1 if not found
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+
+        list_ = yield self._get()
+        for idx, val in enumerate(list_.content_as[list]):
+            if val == value:
+                return idx
+
+        return -1
+
+    @inlineCallbacks
+    def get_all(self) -> Deferred[List[Any]]:
+        """
+        Retrieves the entire list.
+
+        :return: The entire CouchbaseList
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+
+        list_ = yield self._get()
+        return list_.content_as[list]
+
+    @inlineCallbacks
+    def clear(self) -> Deferred[None]:
+        """
+        Clears the list.
+
+        :return: clears the CouchbaseList
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+        try:
+            yield self._collection.remove(self._key)
+        except DocumentNotFoundException:
+            pass
+
+
+class CouchbaseMap:
+    def __init__(self, key,  # type: str
+                 collection  # type: Collection
+                 ) -> None:
+        self._key = key
+        self._collection = collection
+
+    @TxWrapper.datastructure_op(create_type=dict)
+    @inlineCallbacks
+    def _get(self) -> Deferred[Dict]:
+        """
+        Get the entire map.
+        """
+        return (yield self._collection.get(self._key))
+
+    @TxWrapper.datastructure_op(create_type=dict)
+    @inlineCallbacks
+    def add(self, mapkey,  # type: str
+            value  # type: Any
+            ) -> Deferred[None]:
+        """
+        Set a value for a key in a map.
+
+        These functions are all wrappers around the :meth:`mutate_in` or
+        :meth:`lookup_in` methods.
+
+        :param mapkey: The key in the map to set
+        :param value: The value to use (anything serializable to JSON)
+        :raise: :cb_exc:`Document.DocumentNotFoundException` if the document does not exist.
+            and `create` was not specified
+
+        .. Initialize a map and add a value
+
+            cb.upsert('a_map', {})
+            cb.map_add('a_map', 'some_key', 'some_value')
+            cb.map_get('a_map', 'some_key').value  # => 'some_value'
+            cb.get('a_map').value  # => {'some_key': 'some_value'}
+
+        """
+        op = upsert(mapkey, value)
+        yield self._collection.mutate_in(self._key, (op,))
+
+    @TxWrapper.datastructure_op(create_type=dict)
+    @inlineCallbacks
+    def get(self, mapkey,  # type: str
+            ) -> Deferred[Any]:
+        """
+        Retrieve a value from a map.
+
+        :param key: The document ID
+        :param mapkey: Key within the map to retrieve
+        :return: :class:`~.ValueResult`
+        :raise: :exc:`IndexError` if the mapkey does not exist
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+
+        .. seealso:: :meth:`map_add` for an example
+        """
+        op = subdoc_get(mapkey)
+        sd_res = yield self._collection.lookup_in(self._key, (op,))
+        return sd_res.value[0].get("value", None)
+
+    @inlineCallbacks
+    def remove(self, mapkey  # type: str
+               ) -> Deferred[None]:
+        """
+        Remove an item from a map.
+
+        :param key: The document ID
+        :param mapkey: The key in the map
+        :param See:meth:`mutate_in` for options
+        :raise: :exc:`IndexError` if the mapkey does not exist
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+
+        .. Remove a map key-value pair:
+
+            cb.map_remove('a_map', 'some_key')
+
+        .. seealso:: :meth:`map_add`
+        """
+        try:
+            op = remove(mapkey)
+            yield self._collection.mutate_in(self._key, (op,))
+        except PathNotFoundException:
+            raise InvalidArgumentException(message=f'Key: {mapkey} is not in the map.') from None
+
+    @TxWrapper.datastructure_op(create_type=dict)
+    @inlineCallbacks
+    def size(self) -> Deferred[int]:
+        """
+        Get the number of items in the map.
+
+        :param key: The document ID of the map
+        :return int: The number of items in the map
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+
+        .. seealso:: :meth:`map_add`
+        """
+        op = count('')
+        sd_res = yield self._collection.lookup_in(self._key, (op,))
+        return sd_res.value[0].get("value", None)
+
+    @TxWrapper.datastructure_op(create_type=dict)
+    @inlineCallbacks
+    def exists(self, key  # type: Any
+               ) -> Deferred[bool]:
+        """
+        hecks whether a specific key exists in the map.
+
+        :param key: The key to check
+        :return bool: If the key exists in the map or not
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+
+        .. seealso:: :meth:`map_add`
+        """
+        op = subdoc_exists(key)
+        sd_res = yield self._collection.lookup_in(self._key, (op,))
+        return sd_res.exists(0)
+
+    @inlineCallbacks
+    def keys(self) -> Deferred[List[str]]:
+        """
+        Returns a list of all the keys which exist in the map.
+
+        :return: The keys in CouchbaseMap
+        :raise: :cb_exc:`DocumentNotFoundException` if the map does not exist
+        """
+
+        map_ = yield self._get()
+        return list(map_.content_as[dict].keys())
+
+    @inlineCallbacks
+    def values(self) -> Deferred[List[str]]:
+        """
+        Returns a list of all the values which exist in the map.
+
+        :return: The keys in CouchbaseMap
+        :raise: :cb_exc:`DocumentNotFoundException` if the map does not exist
+        """
+
+        map_ = yield self._get()
+        return list(map_.content_as[dict].values())
+
+    @inlineCallbacks
+    def get_all(self) -> Deferred[List[Any]]:
+        """
+        Retrieves the entire map.
+
+        :return: The entire CouchbaseMap
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+
+        map_ = yield self._get()
+        return map_.content_as[dict]
+
+    @inlineCallbacks
+    def clear(self) -> Deferred[None]:
+        """
+        Clears the map.
+
+        :return: clears the CouchbaseMap
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+        try:
+            yield self._collection.remove(self._key)
+        except DocumentNotFoundException:
+            pass
+
+    @inlineCallbacks
+    def items(self) -> Deferred[Generator]:
+        """
+        Provide mechanism to loop over the entire map.
+
+        :return: Generator expression for CouchbaseMap
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+
+        map_ = yield self._get()
+        return ((k, v) for k, v in map_.content_as[dict].items())
+
+
+class CouchbaseSet:
+    def __init__(self, key,  # type: str
+                 collection  # type: Collection
+                 ) -> None:
+        self._key = key
+        self._collection = collection
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def _get(self) -> Deferred[List]:
+        """
+        Get the entire set.
+        """
+        return (yield self._collection.get(self._key))
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def _get_for_update(self) -> Deferred[LookupInResult]:
+        """
+        Get the entire set (and its CAS) w/ a sub-document lookup.
+        """
+        return (yield self._collection.lookup_in(self._key, (subdoc_get_full(),)))
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def add(self, value  # type: Any
+            ) -> Deferred[None]:
+        """
+        Add an item to a set if the item does not yet exist.
+
+        :param value: Value to add
+        .. seealso:: :meth:`map_add`
+        """
+        try:
+            op = array_addunique('', value)
+            yield self._collection.mutate_in(self._key, (op,))
+            return True
+        except PathExistsException:
+            return False
+
+    @inlineCallbacks
+    def remove(self, value,  # type: Any  # noqa: C901
+               timeout=None  # type: Optional[timedelta]
+               ) -> Deferred[None]:
+        """
+        Remove an item from a set.
+
+        :param value: Value to remove
+        :param kwargs: Arguments to :meth:`mutate_in`
+        :raise: :cb_exc:`DocumentNotFoundException` if the set does not exist.
+
+        .. seealso:: :meth:`set_add`, :meth:`map_add`
+        """
+
+        backoff = CasRetryBackoff(timeout)
+        while True:
+            sd_res = yield self._get_for_update()
+            list_ = sd_res.value[0].get('value', None) or []
+            val_idx = -1
+            for idx, v in enumerate(list_):
+                if v == value:
+                    val_idx = idx
+                    break
+
+            if val_idx >= 0:
+                try:
+                    op = remove(f'[{val_idx}]')
+                    yield self._collection.mutate_in(self._key, (op,), MutateInOptions(cas=sd_res.cas))
+                    break
+                except CasMismatchException:
+                    pass
+            else:
+                break
+
+            delay = backoff.next_delay()
+            if delay is None:
+                raise UnAmbiguousTimeoutException(message=f"Unable to remove {value} from the CouchbaseSet.")
+
+            yield _sleep(delay)
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def contains(self, value  # type: Any
+                 ) -> Deferred[None]:
+        """
+        Check whether or not the CouchbaseSet contains a value
+
+        :param value: Value to remove
+        :return: True if `value` exists in the set, False otherwise
+        :raise: :cb_exc:`DocumentNotFoundException` if the set does not exist.
+
+        .. seealso:: :meth:`set_add`, :meth:`map_add`
+        """
+        sd_res = yield self._get()
+        list_ = sd_res.content_as[list]
+        return value in list_
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def size(self) -> Deferred[int]:
+        """
+        Get the number of items in the set.
+
+        :return int: The number of items in the map
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+
+        .. seealso:: :meth:`map_add`
+        """
+        op = count('')
+        sd_res = yield self._collection.lookup_in(self._key, (op,))
+        return sd_res.value[0].get("value", None)
+
+    @inlineCallbacks
+    def clear(self) -> Deferred[None]:
+        """
+        Clears the set.
+
+        :return: clears the CouchbaseSet
+        """
+        try:
+            yield self._collection.remove(self._key)
+        except DocumentNotFoundException:
+            pass
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def values(self) -> Deferred[List[Any]]:
+        """
+        Returns a list of all the values which exist in the set.
+
+        :return: The keys in CouchbaseSet
+        :raise: :cb_exc:`DocumentNotFoundException` if the map does not exist
+        """
+
+        list_ = yield self._get()
+        return list_.content_as[list]
+
+
+class CouchbaseQueue:
+    def __init__(self, key,  # type: str
+                 collection  # type: Collection
+                 ) -> None:
+        self._key = key
+        self._collection = collection
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def _get(self) -> Deferred[List]:
+        """
+        Get the entire queuee.
+        """
+        return (yield self._collection.get(self._key))
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def push(self, value  # type: JSONType
+             ) -> Deferred[None]:
+        """
+        Add an item to the queue.
+
+        :param value: Value to push onto queue
+        """
+        op = array_prepend('', value)
+        yield self._collection.mutate_in(self._key, (op,))
+
+    @inlineCallbacks
+    def pop(self, timeout=None  # type: Optional[timedelta]
+            ) -> Deferred[None]:
+        """
+        Pop an item from the queue.
+
+        :param value: Value to remove
+        :raise: :cb_exc:`DocumentNotFoundException` if the set does not exist.
+
+        .. seealso:: :meth:`set_add`, :meth:`map_add`
+        """
+
+        backoff = CasRetryBackoff(timeout)
+        while True:
+            try:
+                op = subdoc_get('[-1]')
+                sd_res = yield self._collection.lookup_in(self._key, (op,))
+                val = sd_res.value[0].get("value", None)
+
+                try:
+                    op = remove('[-1]')
+                    yield self._collection.mutate_in(self._key, (op,), MutateInOptions(cas=sd_res.cas))
+                    return val
+                except CasMismatchException:
+                    pass
+
+                delay = backoff.next_delay()
+                if delay is None:
+                    raise UnAmbiguousTimeoutException(message="Unable to pop from the CouchbaseQueue.")
+
+                yield _sleep(delay)
+            except PathNotFoundException:
+                raise QueueEmpty('No items to remove from the queue')
+
+    @TxWrapper.datastructure_op(create_type=list)
+    @inlineCallbacks
+    def size(self) -> Deferred[int]:
+        """
+        Get the number of items in the queue.
+
+        :return int: The number of items in the queue
+        :raise: :cb_exc:`DocumentNotFoundException` if the document does not exist.
+
+        .. seealso:: :meth:`map_add`
+        """
+        op = count('')
+        sd_res = yield self._collection.lookup_in(self._key, (op,))
+        return sd_res.value[0].get("value", None)
+
+    @inlineCallbacks
+    def clear(self) -> Deferred[None]:
+        """
+        Clears the queue.
+
+        :return: clears the CouchbaseQueue
+        :raise: :cb_exc:`DocumentNotFoundException` if the list does not exist
+        """
+        try:
+            yield self._collection.remove(self._key)
+        except DocumentNotFoundException:
+            pass
@@ -0,0 +1,89 @@
+#  Copyright 2016-2022. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from typing import (Any,
+                    Dict,
+                    List)
+
+from twisted.internet import threads
+from twisted.internet.defer import Deferred, succeed
+
+from couchbase.exceptions import (PYCBC_ERROR_MAP,
+                                  CouchbaseException,
+                                  ExceptionMap,
+                                  RangeScanCompletedException)
+from couchbase.logic.kv_range_scan import RangeScanRequestLogic
+from couchbase.result import ScanResult
+
+
+class RangeScanRequest(RangeScanRequestLogic):
+    DEFAULT_BATCH_SIZE = 50
+
+    def __init__(self,
+                 **kwargs,  # type: Dict[str, Any]
+                 ):
+        super().__init__(**kwargs)
+        # rows are pulled from the scan in batches so that there is a single hop to (and from) the reactor's
+        # threadpool per batch, rather than per row
+        self._batch_size = self._scan_args['op_args'].get('batch_item_limit', None) or self.DEFAULT_BATCH_SIZE
+        self._batch_d = None
+
+    def next_batch(self) -> Deferred[List[ScanResult]]:
+        if not self.started_streaming:
+            self._submit_scan()
+
+        if self._batch_d is not None:
+            # the scan iterator can only be pulled from one thread at a time, wait for the outstanding batch
+            d = Deferred()
+
+            def _on_batch(res):
+                self.next_batch().chainDeferred(d)
+                return res
+
+            self._batch_d.addBoth(_on_batch)
+            return d
+
+        if self.done_streaming:
+            return succeed([])
+
+        self._batch_d = threads.deferToThread(self._get_next_batch)
+
+        def _on_done(res):
+            self._batch_d = None
+            return res
+
+        self._batch_d.addBoth(_on_done)
+        return self._batch_d
+
+    def _get_next_batch(self) -> List[ScanResult]:
+        rows = []
+        try:
+            while len(rows) < self._batch_size:
+                row = self._get_next_row()
+                if row is None:
+                    break
+                rows.append(row)
+        # the scan is complete once we receive RangeScanCompletedException
+        except RangeScanCompletedException:
+            self._done_streaming = True
+        except CouchbaseException:
+            raise
+        except Exception as ex:
+            exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
+            raise exc_cls(str(ex)) from None
+
+        return rows
@@ -13,4 +13,4 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from .wrappers import TxWrapper  # noqa: F401
+from .wrappers import TxWrapper, get_completion_queue  # noqa: F401
@@ -15,19 +15,91 @@
 
 from __future__ import annotations
 
-from functools import partial, wraps
+from collections import deque
+from functools import wraps
+from threading import Lock
 
-from twisted.internet.defer import Deferred
+from twisted.internet import threads
+from twisted.internet.defer import Deferred, inlineCallbacks
 
-from acouchbase.logic import call_async_fn
 from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   CouchbaseException,
+                                  DocumentExistsException,
+                                  DocumentNotFoundException,
                                   ErrorMapper,
                                   ExceptionMap,
                                   MissingConnectionException)
 from couchbase.logic import decode_replicas, decode_value
 
 
+class CompletionQueue:
+    """
+    **INTERNAL**
+
+    Hands operation completions from the C++ client's IO thread to the reactor thread.  Completions are queued and
+    the reactor is only woken (``reactor.callFromThread()`` writes to the reactor's waker pipe) when the queue goes
+    from empty to non-empty, so a burst of completions is delivered w/ a single wakeup.  This works w/ any reactor,
+    the asyncio reactor is not required.
+    """
+
+    def __init__(self, reactor):
+        self._reactor = reactor
+        self._pending = deque()
+        self._lock = Lock()
+        self._scheduled = False
+
+    def submit(self, fn, arg):
+        with self._lock:
+            self._pending.append((fn, arg))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._reactor.callFromThread(self._drain)
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._scheduled = False
+                    return
+                batch = self._pending
+                self._pending = deque()
+            for fn, arg in batch:
+                fn(arg)
+
+
+_COMPLETION_QUEUE = None
+
+
+def get_completion_queue():
+    """
+    **INTERNAL**
+    """
+    global _COMPLETION_QUEUE
+    if _COMPLETION_QUEUE is None:
+        # import here so that the reactor is not installed when txcouchbase.logic is imported
+        from twisted.internet import reactor
+        _COMPLETION_QUEUE = CompletionQueue(reactor)
+    return _COMPLETION_QUEUE
+
+
+def call_tx_fn(d, self, fn, *args, **kwargs):
+    """
+    **INTERNAL**
+    """
+    try:
+        fn(self, *args, **kwargs)
+    except CouchbaseException as e:
+        d.errback(e)
+    except Exception as e:
+        if isinstance(e, (TypeError, ValueError)):
+            d.errback(e)
+        else:
+            exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
+            excptn = exc_cls(str(e))
+            d.errback(excptn)
+
+
 class TxWrapper:
 
     @classmethod
@@ -36,21 +108,22 @@ class TxWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
-                ft = self.loop.create_future()
+                d = Deferred()
+                completions = get_completion_queue()
 
                 def on_ok(res):
                     self._set_connection(res)
-                    self.loop.call_soon_threadsafe(ft.set_result, True)
+                    completions.submit(d.callback, True)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.submit(d.errback, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
 
-                call_async_fn(ft, self, fn, *args, **kwargs)
-                return Deferred.fromFuture(ft)
+                call_tx_fn(d, self, fn, *args, **kwargs)
+                return d
 
             return wrapped_fn
 
@@ -62,41 +135,52 @@ class TxWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
-                ft = self.loop.create_future()
+                d = Deferred()
+                completions = get_completion_queue()
 
                 def on_ok(_):
-                    self.loop.call_soon_threadsafe(ft.set_result, True)
+                    completions.submit(d.callback, True)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.submit(d.errback, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
 
-                call_async_fn(ft, self, fn, *args, **kwargs)
-                return Deferred.fromFuture(ft)
+                call_tx_fn(d, self, fn, *args, **kwargs)
+                return d
 
             return wrapped_fn
 
         return decorator
 
     @classmethod
-    def chain_connect_futures(cls, ft, self, fn, cft, **kwargs):
+    def chain_deferreds(cls, d, self, fn, connect_d, set_connection=False, set_cluster_connection=False, **kwargs):
         """
         **INTERNAL**
+
+        Executes the operation once the connect Deferred fires.  The connect Deferred's result is passed through as
+        other operations can be waiting on the same connection.
         """
-        if cft.cancelled():
-            ft.cancel()
-            return
 
-        exc = cft.exception()
-        if exc is not None:
-            ft.set_exception(exc)
-        else:
-            self._connection = self._cluster.connection
+        def _on_connected(res):
+            if set_cluster_connection is True:
+                self._connection = self._cluster.connection
+            if set_connection is True:
+                # the bucket will set it's connection, need to make sure
+                # the connection is set w/ the scope and collection as well
+                self._scope._set_connection()
+                self._set_connection()
             args = kwargs.pop("args", None)
-            call_async_fn(ft, self, fn, *args, **kwargs)
+            call_tx_fn(d, self, fn, *args, **kwargs)
+            return res
+
+        def _on_err(failure):
+            d.errback(failure)
+            return failure
+
+        connect_d.addCallbacks(_on_connected, _on_err)
 
     @classmethod
     def inject_bucket_open_callbacks(cls):
@@ -104,61 +188,40 @@ class TxWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
-                ft = self.loop.create_future()
+                d = Deferred()
+                completions = get_completion_queue()
 
                 def on_ok(_):
                     self._set_connected(True)
-                    self.loop.call_soon_threadsafe(ft.set_result, True)
+                    completions.submit(d.callback, True)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.submit(d.errback, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
 
                 if not self._connection:
-                    cluster_conn_ft = Deferred.asFuture(self._cluster.on_connect(), self.loop)
                     kwargs["args"] = args
-                    cluster_conn_ft.add_done_callback(
-                        partial(cls.chain_connect_futures, ft, self, fn, **kwargs))
+                    cls.chain_deferreds(d, self, fn, self._cluster.on_connect(), set_cluster_connection=True, **kwargs)
                 else:
-                    call_async_fn(ft, self, fn, *args, **kwargs)
+                    call_tx_fn(d, self, fn, *args, **kwargs)
 
-                return Deferred.fromFuture(ft)
+                return d
 
             return wrapped_fn
 
         return decorator
 
-    @classmethod
-    def chain_futures(cls, ft, self, fn, cft, set_connection=False, **kwargs):
-        """
-        **INTERNAL**
-        """
-        if cft.cancelled():
-            ft.cancel()
-            return
-
-        exc = cft.exception()
-        if exc is not None:
-            ft.set_exception(exc)
-        else:
-            if set_connection is True:
-                # the bucket will set it's connection, need to make sure
-                # the connection is set w/ the scope and collection as well
-                self._scope._set_connection()
-                self._set_connection()
-            args = kwargs.pop("args", None)
-            call_async_fn(ft, self, fn, *args, **kwargs)
-
     @classmethod   # noqa: C901
     def inject_cluster_callbacks(cls, return_cls, chain_connection=False, set_cluster_info=False):   # noqa: C901
 
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
-                ft = self.loop.create_future()
+                d = Deferred()
+                completions = get_completion_queue()
 
                 def on_ok(res):
                     if return_cls is None:
@@ -171,32 +234,30 @@ class TxWrapper:
                     if set_cluster_info is True:
                         self._cluster_info = retval
 
-                    self.loop.call_soon_threadsafe(ft.set_result, retval)
+                    completions.submit(d.callback, retval)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.submit(d.errback, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
 
                 if not self._connection:
                     if chain_connection is True:
-                        c_ft = Deferred.asFuture(self.on_connect(), self.loop)
                         # in order to keep arg passing simple, add operation args to kwargs
                         # this will keep the positional args passed to the callback only ones
-                        # in the scope of handling logic w.r.t. to handling logic between the futures
-                        # (the cluster connect future and the operation future)
+                        # in the scope of handling logic w.r.t. to handling logic between the Deferreds
+                        # (the cluster connect Deferred and the operation Deferred)
                         kwargs["args"] = args
-                        c_ft.add_done_callback(
-                            partial(cls.chain_futures, ft, self, fn, **kwargs))
+                        cls.chain_deferreds(d, self, fn, self.on_connect(), **kwargs)
                     else:
                         exc = MissingConnectionException('Not connected.  Cannot perform operation.')
-                        ft.set_exception(exc)
+                        d.errback(exc)
                 else:
-                    call_async_fn(ft, self, fn, *args, **kwargs)
+                    call_tx_fn(d, self, fn, *args, **kwargs)
 
-                return Deferred.fromFuture(ft)
+                return d
 
             return wrapped_fn
 
@@ -208,7 +269,8 @@ class TxWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
-                ft = self.loop.create_future()
+                d = Deferred()
+                completions = get_completion_queue()
 
                 def on_ok(res):
                     if return_cls is None:
@@ -218,29 +280,27 @@ class TxWrapper:
                     else:
                         retval = return_cls(res)
 
-                    self.loop.call_soon_threadsafe(ft.set_result, retval)
+                    completions.submit(d.callback, retval)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.submit(d.errback, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
 
                 if not self._connection:
-                    bucket_conn_ft = Deferred.asFuture(self._scope._connect_bucket(), self.loop)
                     # in order to keep arg passing simple, add operation args to kwargs
-                    # This allows the chain_futures callback to only worry about positional args
+                    # This allows the chain_deferreds callback to only worry about positional args
                     # outside the scope of the operation.
-                    # Since, the kwargs passed to chain_futures only apply to the operation, chain_futures
+                    # Since, the kwargs passed to chain_deferreds only apply to the operation, chain_deferreds
                     # can easily determine what it needs to pass to the original wrapped fn
                     kwargs["args"] = args
-                    bucket_conn_ft.add_done_callback(
-                        partial(cls.chain_futures, ft, self, fn, set_connection=True, **kwargs))
+                    cls.chain_deferreds(d, self, fn, self._scope._connect_bucket(), set_connection=True, **kwargs)
                 else:
-                    call_async_fn(ft, self, fn, *args, **kwargs)
+                    call_tx_fn(d, self, fn, *args, **kwargs)
 
-                return Deferred.fromFuture(ft)
+                return d
 
             return wrapped_fn
 
@@ -252,7 +312,8 @@ class TxWrapper:
         def decorator(fn):
             @wraps(fn)
             def wrapped_fn(self, *args, **kwargs):
-                ft = self.loop.create_future()
+                d = Deferred()
+                completions = get_completion_queue()
                 transcoder = kwargs.pop('transcoder')
 
                 def on_ok(res):
@@ -263,8 +324,8 @@ class TxWrapper:
 
                         # special case for get_all_replicas and lookup_in_all_replicas
                         if fn.__name__ in ['_get_all_replicas_internal', '_lookup_in_all_replicas_internal']:
-                            self.loop.call_soon_threadsafe(
-                                ft.set_result, decode_replicas(transcoder, res, return_cls, is_subdoc=is_subdoc)
+                            completions.submit(
+                                d.callback, decode_replicas(transcoder, res, return_cls, is_subdoc=is_subdoc)
                             )
                             return
 
@@ -279,36 +340,86 @@ class TxWrapper:
                             retval = res
                         else:
                             retval = return_cls(res)
-                        self.loop.call_soon_threadsafe(ft.set_result, retval)
+                        completions.submit(d.callback, retval)
                     except CouchbaseException as e:
-                        self.loop.call_soon_threadsafe(ft.set_exception, e)
+                        completions.submit(d.errback, e)
                     except Exception as ex:
                         exc_cls = PYCBC_ERROR_MAP.get(ExceptionMap.InternalSDKException.value, CouchbaseException)
                         excptn = exc_cls(message=str(ex))
-                        self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                        completions.submit(d.errback, excptn)
 
                 def on_err(exc):
                     excptn = ErrorMapper.build_exception(exc)
-                    self.loop.call_soon_threadsafe(ft.set_exception, excptn)
+                    completions.submit(d.errback, excptn)
 
                 kwargs["callback"] = on_ok
                 kwargs["errback"] = on_err
 
                 if not self._connection:
-                    bucket_conn_ft = Deferred.asFuture(self._scope._connect_bucket(), self.loop)
                     # in order to keep arg passing simple, add operation args to kwargs
-                    # This allows the chain_futures callback to only worry about positional args
+                    # This allows the chain_deferreds callback to only worry about positional args
                     # outside the scope of the operation.
-                    # Since, the kwargs passed to chain_futures only apply to the operation, chain_futures
+                    # Since, the kwargs passed to chain_deferreds only apply to the operation, chain_deferreds
                     # can easily determine what it needs to pass to the original wrapped fn
                     kwargs["args"] = args
-                    bucket_conn_ft.add_done_callback(
-                        partial(cls.chain_futures, ft, self, fn, set_connection=True, **kwargs))
+                    cls.chain_deferreds(d, self, fn, self._scope._connect_bucket(), set_connection=True, **kwargs)
+                else:
+                    call_tx_fn(d, self, fn, *args, **kwargs)
+
+                return d
+
+            return wrapped_fn
+
+        return decorator
+
+    @classmethod
+    def inject_threaded_call(cls):
+        """
+        **INTERNAL**
+
+        Runs an operation that blocks until it completes (i.e. a multi-op waits on all of its operations) in the
+        reactor's threadpool, so the reactor thread is not blocked.
+        """
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapped_fn(self, *args, **kwargs):
+                d = Deferred()
+
+                def run_in_thread(self, *args, **kwargs):
+                    threads.deferToThread(fn, self, *args, **kwargs).chainDeferred(d)
+
+                if not self._connection:
+                    # see inject_callbacks() w.r.t. adding the operation args to kwargs
+                    kwargs["args"] = args
+                    cls.chain_deferreds(d, self, run_in_thread, self._scope._connect_bucket(),
+                                        set_connection=True, **kwargs)
                 else:
-                    call_async_fn(ft, self, fn, *args, **kwargs)
+                    call_tx_fn(d, self, run_in_thread, *args, **kwargs)
 
-                return Deferred.fromFuture(ft)
+                return d
 
             return wrapped_fn
 
         return decorator
+
+    @classmethod
+    def datastructure_op(cls, create_type=None):
+        def decorator(fn):
+            @wraps(fn)
+            @inlineCallbacks
+            def wrapped_fn(self, *args, **kwargs):
+                try:
+                    return (yield fn(self, *args, **kwargs))
+                except DocumentNotFoundException:
+                    if create_type is not None:
+                        try:
+                            yield self._collection.insert(self._key, create_type())
+                        except DocumentExistsException:
+                            pass
+                        return (yield fn(self, *args, **kwargs))
+                    else:
+                        raise
+
+            return wrapped_fn
+        return decorator
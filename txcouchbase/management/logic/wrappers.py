@@ -21,7 +21,9 @@ from twisted.internet.defer import Deferred
 
 from acouchbase.logic import call_async_fn
 from couchbase._utils import Overload, OverloadType
-from couchbase.exceptions import ErrorMapper, MissingConnectionException
+from couchbase.exceptions import (ErrorMapper,
+                                  FeatureUnavailableException,
+                                  MissingConnectionException)
 from couchbase.management.logic import (ManagementType,
                                         handle_analytics_index_mgmt_response,
                                         handle_bucket_mgmt_response,
@@ -33,6 +35,22 @@ from couchbase.management.logic import (ManagementType,
                                         handle_view_index_mgmt_response)
 
 
+def check_asyncio_reactor():
+    """
+    **INTERNAL**
+
+    The management APIs wrap the acouchbase (asyncio) implementations, their results are delivered on the asyncio
+    event loop which only runs when Twisted's asyncio reactor is installed.
+    """
+    from twisted.internet import reactor
+    from twisted.internet.asyncioreactor import AsyncioSelectorReactor
+    if not isinstance(reactor, AsyncioSelectorReactor):
+        raise FeatureUnavailableException(
+            message=('The management APIs require the asyncio reactor, '
+                     f'the installed reactor is {type(reactor).__name__}.  Import txcouchbase prior to installing a '
+                     'reactor, or install twisted.internet.asyncioreactor, to use the management APIs.'))
+
+
 def build_mgmt_exception(exc, mgmt_type, error_map):
     return ErrorMapper.build_exception(exc, mapping=error_map)
 
@@ -22,6 +22,7 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   ExceptionMap)
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.logic.n1ql import QueryRequestLogic
+from txcouchbase.logic import get_completion_queue
 
 
 class N1QLRequest(QueryRequestLogic):
@@ -33,7 +34,6 @@ class N1QLRequest(QueryRequestLogic):
                  **kwargs
                  ):
         super().__init__(connection, query_params, row_factory=row_factory, **kwargs)
-        self._query_request_ftr = None
         self._query_d = None
         self._loop = loop
 
@@ -49,19 +49,18 @@ class N1QLRequest(QueryRequestLogic):
         return cls(connection, loop, query_params, row_factory=row_factory, **kwargs)
 
     def execute_query(self):
-        # if self._query_request_ftr is not None and self._query_request_ftr.done():
+        # if self._query_d is not None and self._query_d.called:
         if self.done_streaming:
             raise AlreadyQueriedException()
 
-        if self._query_request_ftr is None:
-            self._query_request_ftr = self.loop.create_future()
+        if self._query_d is None:
+            self._query_d = Deferred()
             self._submit_query(callback=self._on_query_complete)
-            self._query_d = Deferred.fromFuture(self._query_request_ftr)
 
         return self._query_d
 
     def _on_query_complete(self, result):
-        self._loop.call_soon_threadsafe(self._query_request_ftr.set_result, result)
+        get_completion_queue().submit(self._query_d.callback, result)
 
     def _get_metadata(self):
         try:
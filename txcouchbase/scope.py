@@ -29,6 +29,7 @@ from couchbase.result import (AnalyticsResult,
 from couchbase.transcoder import Transcoder
 from txcouchbase.analytics import AnalyticsRequest
 from txcouchbase.collection import Collection
+from txcouchbase.management.logic.wrappers import check_asyncio_reactor
 from txcouchbase.management.search import ScopeSearchIndexManager
 from txcouchbase.n1ql import N1QLRequest
 from txcouchbase.search import FullTextSearchRequest
@@ -45,6 +46,7 @@ class Scope:
     def __init__(self, bucket, scope_name):
         self._bucket = bucket
         self._set_connection()
+        bucket._fork_dependents.add(self)
         self._loop = bucket.loop
         self._scope_name = scope_name
 
@@ -230,6 +232,7 @@ class Scope:
             :class:`~txcouchbase.management.search.ScopeSearchIndexManager`: A :class:`~txcouchbase.management.search.ScopeSearchIndexManager` instance.
 
         """  # noqa: E501
+        check_asyncio_reactor()
         # TODO:  AlreadyShutdownException?
         return ScopeSearchIndexManager(self.connection, self.loop, self.bucket_name, self.name)
 
@@ -245,6 +248,12 @@ class Scope:
         """
         self._connection = self._bucket.connection
 
+    def _after_fork_in_child(self):
+        """
+        **INTERNAL**
+        """
+        self._connection = None
+
     @staticmethod
     def default_name():
         return "_default"
@@ -18,6 +18,7 @@ from datetime import datetime, timedelta
 from time import time
 
 import pytest
+from twisted.internet.defer import gatherResults
 
 import couchbase.subdocument as SD
 from couchbase.diagnostics import ServiceType
@@ -32,6 +33,7 @@ from couchbase.exceptions import (AmbiguousTimeoutException,
                                   DurabilityImpossibleException,
                                   InvalidArgumentException,
                                   PathNotFoundException,
+                                  QueueEmpty,
                                   TemporaryFailException)
 from couchbase.options import (GetOptions,
                                InsertOptions,
@@ -41,6 +43,8 @@ from couchbase.options import (GetOptions,
 from couchbase.result import (ExistsResult,
                               GetReplicaResult,
                               GetResult,
+                              MultiGetResult,
+                              MultiMutationResult,
                               MutationResult)
 from tests.mock_server import MockServerType
 
@@ -155,6 +159,47 @@ class CollectionTests:
         assert result.expiry_time is None
         assert result.content_as[dict] == value
 
+    def test_get_concurrent(self, cb_env, default_kvp):
+        cb = cb_env.collection
+        key = default_kvp.key
+        value = default_kvp.value
+
+        # completions are coalesced onto the reactor, make sure each Deferred still gets its own result
+        def _get_all():
+            return gatherResults([cb.get(key) for _ in range(50)], consumeErrors=True)
+
+        results = run_in_reactor_thread(_get_all)
+        assert len(results) == 50
+        assert all(map(lambda r: isinstance(r, GetResult), results)) is True
+        assert all(map(lambda r: r.content_as[dict] == value, results)) is True
+
+    def test_multi_upsert_and_get(self, cb_env, new_kvp):
+        cb = cb_env.collection
+        keys_and_docs = {f'{new_kvp.key}-{i}': new_kvp.value for i in range(4)}
+        res = run_in_reactor_thread(cb.upsert_multi, keys_and_docs)
+        assert isinstance(res, MultiMutationResult)
+        assert res.all_ok is True
+        assert set(res.results.keys()) == set(keys_and_docs.keys())
+
+        res = run_in_reactor_thread(cb.get_multi, list(keys_and_docs.keys()))
+        assert isinstance(res, MultiGetResult)
+        assert res.all_ok is True
+        for k, v in res:
+            assert v.content_as[dict] == keys_and_docs[k]
+
+        res = run_in_reactor_thread(cb.remove_multi, list(keys_and_docs.keys()))
+        assert res.all_ok is True
+
+    def test_couchbase_queue(self, cb_env, new_kvp):
+        cb_queue = cb_env.collection.couchbase_queue(new_kvp.key)
+        run_in_reactor_thread(cb_queue.push, 1)
+        run_in_reactor_thread(cb_queue.push, 2)
+        assert run_in_reactor_thread(cb_queue.size) == 2
+        assert run_in_reactor_thread(cb_queue.pop) == 1
+        assert run_in_reactor_thread(cb_queue.pop) == 2
+        with pytest.raises(QueueEmpty):
+            run_in_reactor_thread(cb_queue.pop)
+
     def test_get_options(self, cb_env, default_kvp):
         cb = cb_env.collection
         key = default_kvp.key
@@ -22,6 +22,7 @@ from couchbase.exceptions import (PYCBC_ERROR_MAP,
                                   ExceptionMap)
 from couchbase.exceptions import exception as CouchbaseBaseException
 from couchbase.logic.views import ViewRequestLogic, ViewRow
+from txcouchbase.logic import get_completion_queue
 
 
 class ViewRequest(ViewRequestLogic):
@@ -32,7 +33,6 @@ class ViewRequest(ViewRequestLogic):
                  **kwargs
                  ):
         super().__init__(connection, encoded_query, **kwargs)
-        self._query_request_ftr = None
         self._query_d = None
         self._loop = loop
 
@@ -48,19 +48,18 @@ class ViewRequest(ViewRequestLogic):
         return cls(connection, loop, encoded_query, **kwargs)
 
     def execute_view_query(self):
-        # if self._query_request_ftr is not None and self._query_request_ftr.done():
+        # if self._query_d is not None and self._query_d.called:
         if self.done_streaming:
             raise AlreadyQueriedException()
 
-        if self._query_request_ftr is None:
-            self._query_request_ftr = self.loop.create_future()
+        if self._query_d is None:
+            self._query_d = Deferred()
             self._submit_query(callback=self._on_query_complete)
-            self._query_d = Deferred.fromFuture(self._query_request_ftr)
 
         return self._query_d
 
     def _on_query_complete(self, result):
-        self._loop.call_soon_threadsafe(self._query_request_ftr.set_result, result)
+        get_completion_queue().submit(self._query_d.callback, result)
 
     def _get_metadata(self):
         try: